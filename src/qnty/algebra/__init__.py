@@ -1,6 +1,6 @@
 from .equation import Equation
 from .functions import abs_expr, cond_expr, cos, exp, ln, log10, max_expr, min_expr, range_expr, sin, sqrt, summation, sum_expr, tan, When
-from .nodes import BinaryOperation, ConditionalExpression, Constant, Expression, MatchExpression, UnaryFunction, VariableReference, wrap_operand
+from .nodes import BinaryOperation, ConditionalExpression, Constant, DimensionMismatchError, Expression, MatchExpression, Summation, UnaryFunction, VariableReference, wrap_operand
 from .select import SelectOption, SelectVariable
 from .system import EquationSystem
 
@@ -187,6 +187,8 @@ __all__ = [
     "UnaryFunction",
     "ConditionalExpression",
     "MatchExpression",
+    "Summation",
+    "DimensionMismatchError",
     # Select/Match system
     "SelectVariable",
     "SelectOption",
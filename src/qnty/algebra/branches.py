@@ -0,0 +1,231 @@
+"""
+Branch Specialization
+=====================
+
+Removes select-variable branching from expressions ahead of evaluation.
+
+A ``MatchExpression`` picks one of its cases from the current selection of a
+``SelectVariable``. For a fixed selection vector the choice is static, so the
+expression can be rewritten into its branch-free form once and compiled. The
+specialized variants are cached per selection combination, and batch
+evaluation groups rows by selection so each distinct combination is compiled
+and evaluated once.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+from ..constants.numerical import CONDITION_EVALUATION_THRESHOLD
+from .compiler import ARRAY, SCALAR, CompilationError, CompiledExpression, compile_expression
+from .nodes import BinaryOperation, ConditionalExpression, Constant, Expression, MatchExpression, Summation, UnaryFunction
+
+SelectionKey = tuple[tuple[str, Any], ...]
+
+
+def collect_select_variables(expr: Expression, found: dict[str, Any] | None = None) -> dict[str, Any]:
+    """
+    Find the select variables an expression branches on.
+
+    Args:
+        expr: Expression to scan
+        found: Optional mapping to extend
+
+    Returns:
+        Mapping of select-variable symbol to SelectVariable
+    """
+    found = {} if found is None else found
+    node_type = type(expr)
+    if node_type is MatchExpression:
+        found.setdefault(expr._select_var_symbol, expr.select_var)
+        for case in expr.cases.values():
+            collect_select_variables(case, found)
+    elif node_type is BinaryOperation:
+        collect_select_variables(expr.left, found)
+        collect_select_variables(expr.right, found)
+    elif node_type is UnaryFunction:
+        collect_select_variables(expr.operand, found)
+    elif node_type is ConditionalExpression:
+        for part in (expr.condition, expr.true_expr, expr.false_expr):
+            collect_select_variables(part, found)
+    elif node_type is Summation:
+        for term in expr.iter_terms():
+            collect_select_variables(term, found)
+    return found
+
+
+def specialize_expression(expr: Expression, selections: Mapping[str, Any]) -> Expression:
+    """
+    Rewrite an expression for a fixed selection vector.
+
+    Match expressions on a selected variable are replaced by the chosen case,
+    and conditionals whose condition becomes constant are replaced by the
+    taken branch. Select variables missing from ``selections`` are left as
+    match expressions.
+
+    Args:
+        expr: Expression to specialize
+        selections: Selected option per select-variable symbol
+
+    Returns:
+        Specialized expression (``expr`` itself when nothing changed)
+
+    Raises:
+        ValueError: If a selection has no matching case
+    """
+    node_type = type(expr)
+
+    if node_type is MatchExpression:
+        symbol = expr._select_var_symbol
+        if symbol in selections:
+            option = selections[symbol]
+            if option not in expr.cases:
+                raise ValueError(f"No case for value '{option}' in MatchExpression. Available cases: {list(expr.cases)}")
+            return specialize_expression(expr.cases[option], selections)
+        cases = {key: specialize_expression(case, selections) for key, case in expr.cases.items()}
+        if all(cases[key] is case for key, case in expr.cases.items()):
+            return expr
+        return MatchExpression(expr.select_var, cases)
+
+    if node_type is BinaryOperation:
+        left = specialize_expression(expr.left, selections)
+        right = specialize_expression(expr.right, selections)
+        if left is expr.left and right is expr.right:
+            return expr
+        return BinaryOperation(expr.operator, left, right)
+
+    if node_type is UnaryFunction:
+        operand = specialize_expression(expr.operand, selections)
+        return expr if operand is expr.operand else UnaryFunction(expr.function_name, operand)
+
+    if node_type is ConditionalExpression:
+        condition = specialize_expression(expr.condition, selections)
+        flag = _constant_value(condition)
+        if flag is not None:
+            taken = expr.true_expr if abs(flag) > CONDITION_EVALUATION_THRESHOLD else expr.false_expr
+            return specialize_expression(taken, selections)
+        true_expr = specialize_expression(expr.true_expr, selections)
+        false_expr = specialize_expression(expr.false_expr, selections)
+        if condition is expr.condition and true_expr is expr.true_expr and false_expr is expr.false_expr:
+            return expr
+        return ConditionalExpression(condition, true_expr, false_expr)
+
+    if node_type is Summation:
+        return expr.map_terms(lambda term: specialize_expression(term, selections))
+
+    return expr
+
+
+def _constant_value(expr: Expression) -> float | None:
+    """SI value of an expression that references no variables or selections, else None."""
+    if type(expr) is Constant:
+        return expr.value.value
+    if expr.get_variables() or collect_select_variables(expr):
+        return None
+    try:
+        return float(compile_expression(expr)({}))
+    except (CompilationError, ValueError, TypeError, ArithmeticError):
+        return None
+
+
+class BranchSpecializer:
+    """
+    Per-selection compiled variants of a group of expressions.
+
+    Args:
+        expressions: Expressions evaluated together (for example the sides of a problem's equations)
+        backend: Compiler backend for the variants (default: SCALAR)
+
+    Examples:
+        >>> specializer = BranchSpecializer([flange.F_S_eqn.rhs])
+        >>> specializer({"X_g2": 1.2, "X_h": 0.8})  # current selections
+        >>> specializer.evaluate_batch(columns, {"flange_type": types})  # rows grouped by selection
+    """
+
+    def __init__(self, expressions: Sequence[Expression], backend: Any = SCALAR):
+        self.expressions = list(expressions)
+        self.backend = backend
+        selects: dict[str, Any] = {}
+        for expr in self.expressions:
+            collect_select_variables(expr, selects)
+        self.selects = selects
+        self._variants: dict[SelectionKey, list[CompiledExpression]] = {}
+        self._batch_variants: dict[SelectionKey, list[CompiledExpression]] = {}
+
+    @property
+    def symbols(self) -> tuple[str, ...]:
+        """Select-variable symbols in selection-key order."""
+        return tuple(self.selects)
+
+    def current_selection(self) -> SelectionKey:
+        """Selection key built from the select variables' current values."""
+        return tuple((symbol, select.value) for symbol, select in self.selects.items())
+
+    def selection_key(self, selections: Mapping[str, Any]) -> SelectionKey:
+        """Selection key for explicit selections, falling back to current values for the rest."""
+        return tuple((symbol, selections.get(symbol, select.value)) for symbol, select in self.selects.items())
+
+    def specialize(self, key: SelectionKey | None = None) -> list[Expression]:
+        """Branch-free expressions for a selection key (default: current selection)."""
+        selections = dict(self.current_selection() if key is None else key)
+        return [specialize_expression(expr, selections) for expr in self.expressions]
+
+    def variant(self, key: SelectionKey | None = None) -> list[CompiledExpression]:
+        """Compiled branch-free expressions for a selection key, compiled on first use."""
+        return self._get_variant(self._variants, self.backend, self.current_selection() if key is None else key)
+
+    def __call__(self, values: Mapping[str, Any]) -> list[Any]:
+        """Evaluate all expressions for the current selection."""
+        return [compiled(values) for compiled in self.variant()]
+
+    def evaluate_batch(self, values: Mapping[str, Any], selections: Mapping[str, Sequence[Any]] | None = None) -> np.ndarray:
+        """
+        Evaluate many rows whose selections may differ.
+
+        Rows are grouped by selection combination; each group is evaluated with
+        one vectorized call of its specialized variant.
+
+        Args:
+            values: Symbol to array of SI values (one entry per row)
+            selections: Symbol to per-row selected option; omitted symbols use the current selection
+
+        Returns:
+            Array of shape (n_rows, n_expressions)
+        """
+        columns = {symbol: np.asarray(column, dtype=float) for symbol, column in values.items()}
+        size = len(next(iter(columns.values()))) if columns else 0
+        selections = selections or {}
+        if selections:
+            size = max(size, *(len(column) for column in selections.values()))
+
+        rows_by_key: dict[SelectionKey, list[int]] = {}
+        for row in range(size):
+            key = self.selection_key({symbol: column[row] for symbol, column in selections.items()})
+            rows_by_key.setdefault(key, []).append(row)
+
+        result = np.full((size, len(self.expressions)), np.nan)
+        for key, rows in rows_by_key.items():
+            index = np.asarray(rows)
+            group_values = {symbol: column[index] if column.ndim else column for symbol, column in columns.items()}
+            for position, compiled in enumerate(self._get_variant(self._batch_variants, ARRAY, key)):
+                with np.errstate(all="ignore"):
+                    result[index, position] = compiled(group_values)
+        return result
+
+    def _get_variant(self, cache: dict[SelectionKey, list[CompiledExpression]], backend: Any, key: SelectionKey) -> list[CompiledExpression]:
+        variant = cache.get(key)
+        if variant is None:
+            variant = [compile_expression(expr, backend) for expr in self.specialize(key)]
+            cache[key] = variant
+        return variant
+
+
+__all__ = [
+    "BranchSpecializer",
+    "SelectionKey",
+    "collect_select_variables",
+    "specialize_expression",
+]
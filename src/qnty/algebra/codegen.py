@@ -0,0 +1,142 @@
+"""
+Python Source Emitter
+=====================
+
+Renders expression trees as Python expressions over SI floats.
+
+The emitted text follows the ``SCALAR`` compiler backend (SI storage, integer
+exponents, comparisons as 1.0/0.0, the condition threshold) but needs nothing
+beyond the standard library: functions are called through ``_math`` (the
+generated module imports ``math as _math``) and variables are referenced by
+the identifiers they were given by the caller. Division is emitted as plain
+``/``, so only an exact zero denominator raises (``ZeroDivisionError``).
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+
+from ..constants.numerical import CONDITION_EVALUATION_THRESHOLD, FLOAT_EQUALITY_TOLERANCE
+from .compiler import CompilationError
+from .nodes import BinaryOperation, ConditionalExpression, Constant, Expression, MatchExpression, Summation, UnaryFunction, VariableReference
+
+_FUNCTIONS = {
+    "sin": "_math.sin",
+    "cos": "_math.cos",
+    "tan": "_math.tan",
+    "sqrt": "_math.sqrt",
+    "abs": "abs",
+    "ln": "_math.log",
+    "log10": "_math.log10",
+    "exp": "_math.exp",
+}
+
+_ARITHMETIC = {"+", "-", "*", "/"}
+_ORDERINGS = {"<", "<=", ">", ">="}
+
+
+def float_literal(value: float) -> str:
+    """Python literal that reproduces a float exactly (``repr`` round-trips)."""
+    if math.isnan(value) or math.isinf(value):
+        return f'float("{value}")'
+    return repr(float(value))
+
+
+def expression_source(expr: Expression, names: Mapping[str, str]) -> str:
+    """
+    Python source of an expression.
+
+    Args:
+        expr: Expression tree to render
+        names: Identifier to use for each variable symbol
+
+    Returns:
+        A single Python expression, fully parenthesized
+
+    Raises:
+        CompilationError: If the tree contains an unsupported node, a match without
+            a selected case, or a variable missing from ``names``
+    """
+    node_type = type(expr)
+
+    if node_type is VariableReference:
+        name = names.get(expr.name)
+        if name is None:
+            raise CompilationError(f"No value for variable '{expr.name}'")
+        return name
+
+    if node_type is Constant:
+        value = getattr(expr.value, "value", None)
+        if value is None:
+            raise CompilationError(f"Constant without value: {expr}")
+        literal = float_literal(value)
+        return f"({literal})" if literal.startswith("-") else literal
+
+    if node_type is BinaryOperation:
+        return _binary_source(expr, names)
+
+    if node_type is UnaryFunction:
+        func = _FUNCTIONS.get(expr.function_name)
+        if func is None:
+            raise CompilationError(f"Unknown function: {expr.function_name}")
+        return f"{func}({expression_source(expr.operand, names)})"
+
+    if node_type is ConditionalExpression:
+        true_source = expression_source(expr.true_expr, names)
+        false_source = expression_source(expr.false_expr, names)
+        return f"({true_source} if {_condition_source(expr.condition, names)} else {false_source})"
+
+    if node_type is MatchExpression:
+        selected = getattr(expr.select_var, "value", None)
+        if selected is None or selected not in expr.cases:
+            raise CompilationError(f"Match on '{expr._select_var_symbol}' has no selected case")
+        return expression_source(expr.cases[selected], names)
+
+    if node_type is Summation:
+        terms = [expression_source(term, names) for term in expr.iter_terms()]
+        return f"({' + '.join(terms)})" if terms else "0.0"
+
+    raise CompilationError(f"Cannot emit source for expression node of type {node_type.__name__}")
+
+
+def _binary_source(expr: BinaryOperation, names: Mapping[str, str]) -> str:
+    """Arithmetic as an operator, comparisons as a 1.0/0.0 value."""
+    op = expr.operator
+    left = expression_source(expr.left, names)
+
+    if op == "**":
+        if type(expr.right) is not Constant:
+            raise CompilationError("Only constant exponents can be emitted")
+        exponent = expr.right.value.value
+        if exponent is None or exponent != int(exponent):
+            raise CompilationError(f"Non-integer exponent: {exponent}")
+        return f"({left} ** {int(exponent)})"
+
+    right = expression_source(expr.right, names)
+    if op in _ARITHMETIC:
+        return f"({left} {op} {right})"
+    if op in _ORDERINGS or op in ("==", "!="):
+        return f"(1.0 if {_comparison_source(op, left, right)} else 0.0)"
+    raise CompilationError(f"Unknown operator: {op}")
+
+
+def _comparison_source(op: str, left: str, right: str) -> str:
+    if op == "==":
+        return f"abs({left} - {right}) < {FLOAT_EQUALITY_TOLERANCE!r}"
+    if op == "!=":
+        return f"abs({left} - {right}) >= {FLOAT_EQUALITY_TOLERANCE!r}"
+    return f"{left} {op} {right}"
+
+
+def _condition_source(condition: Expression, names: Mapping[str, str]) -> str:
+    """Boolean test of a condition; comparisons are tested directly instead of through their 1.0/0.0 value."""
+    if type(condition) is BinaryOperation and (condition.operator in _ORDERINGS or condition.operator in ("==", "!=")):
+        return _comparison_source(condition.operator, expression_source(condition.left, names), expression_source(condition.right, names))
+    return f"abs({expression_source(condition, names)}) > {CONDITION_EVALUATION_THRESHOLD!r}"
+
+
+__all__ = [
+    "expression_source",
+    "float_literal",
+]
@@ -0,0 +1,503 @@
+"""
+Expression Compiler
+===================
+
+Compiles expression trees into plain numeric closures.
+
+``Expression.evaluate`` re-derives dimensions and allocates a Quantity at every
+node. Once a problem is built, the dimensional structure of its expressions is
+fixed and the same result can be computed on bare SI floats. ``compile_expression``
+walks an expression once and returns a closure over a mapping of SI values that
+mirrors ``evaluate`` semantics (SI storage, division-by-zero guard, integer
+exponents, condition threshold) without creating any Quantity objects.
+
+Backends decide how the primitive operations are carried out: ``SCALAR`` works
+on Python floats, ``ARRAY`` on NumPy arrays so that one call evaluates a whole
+batch of inputs, and ``DUAL`` on dual numbers so that one call also yields the
+derivatives with respect to the seeded inputs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from collections.abc import Callable, Mapping
+from typing import Any
+
+import numpy as np
+
+from ..constants.numerical import CONDITION_EVALUATION_THRESHOLD, DIVISION_BY_ZERO_THRESHOLD, FLOAT_EQUALITY_TOLERANCE
+from .dual import DUAL_FUNCTIONS, Dual
+from .folding import COMMUTATIVE_OPERATORS
+from .nodes import BinaryOperation, ConditionalExpression, Constant, Expression, MatchExpression, Summation, TermSlot, UnaryFunction, VariableReference
+
+CompiledExpression = Callable[[Mapping[str, Any]], Any]
+
+
+class CompilationError(ValueError):
+    """Raised when an expression contains a node that cannot be compiled."""
+
+    pass
+
+
+class ScalarBackend:
+    """Primitive operations on Python floats, raising like Expression.evaluate."""
+
+    name = "scalar"
+    vectorized = False
+    # Whether values mix with NumPy term columns (summations reduce whole groups at once)
+    numeric = True
+
+    functions: dict[str, Callable[[Any], Any]] = {
+        "sin": math.sin,
+        "cos": math.cos,
+        "tan": math.tan,
+        "sqrt": math.sqrt,
+        "abs": abs,
+        "ln": math.log,
+        "log10": math.log10,
+        "exp": math.exp,
+    }
+
+    @staticmethod
+    def divide(left, right):
+        if abs(right) < DIVISION_BY_ZERO_THRESHOLD:
+            raise ValueError("Division by zero in compiled expression")
+        return left / right
+
+    @staticmethod
+    def power(left, right):
+        if right != int(right):
+            raise ValueError(f"Non-integer exponents not yet supported: {right}")
+        return left ** int(right)
+
+    @staticmethod
+    def compare(compare, left, right) -> float:
+        return 1.0 if compare(left, right) else 0.0
+
+    @staticmethod
+    def equal(left, right):
+        return abs(left - right) < FLOAT_EQUALITY_TOLERANCE
+
+    @staticmethod
+    def not_equal(left, right):
+        return abs(left - right) >= FLOAT_EQUALITY_TOLERANCE
+
+    @staticmethod
+    def select(condition: CompiledExpression, true_fn: CompiledExpression, false_fn: CompiledExpression, values: Mapping[str, Any]):
+        if abs(condition(values)) > CONDITION_EVALUATION_THRESHOLD:
+            return true_fn(values)
+        return false_fn(values)
+
+
+class ArrayBackend:
+    """
+    Primitive operations on NumPy arrays.
+
+    Invalid entries (division by zero, non-integer exponents) become NaN instead
+    of raising, so one bad row does not abort the whole batch.
+    """
+
+    name = "array"
+    vectorized = True
+    numeric = True
+
+    functions: dict[str, Callable[[Any], Any]] = {
+        "sin": np.sin,
+        "cos": np.cos,
+        "tan": np.tan,
+        "sqrt": np.sqrt,
+        "abs": np.abs,
+        "ln": np.log,
+        "log10": np.log10,
+        "exp": np.exp,
+    }
+
+    @staticmethod
+    def divide(left, right):
+        right = np.asarray(right, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(np.abs(right) < DIVISION_BY_ZERO_THRESHOLD, np.nan, np.divide(left, right))
+
+    @staticmethod
+    def power(left, right):
+        right = np.asarray(right, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            return np.where(right == np.trunc(right), np.power(np.asarray(left, dtype=float), right), np.nan)
+
+    @staticmethod
+    def compare(compare, left, right):
+        # Comparisons against invalid (NaN) entries stay invalid instead of reading as false
+        result = np.asarray(compare(left, right), dtype=float)
+        return np.where(np.isnan(left) | np.isnan(right), np.nan, result)
+
+    @staticmethod
+    def equal(left, right):
+        return np.abs(np.subtract(left, right)) < FLOAT_EQUALITY_TOLERANCE
+
+    @staticmethod
+    def not_equal(left, right):
+        return np.abs(np.subtract(left, right)) >= FLOAT_EQUALITY_TOLERANCE
+
+    @staticmethod
+    def select(condition: CompiledExpression, true_fn: CompiledExpression, false_fn: CompiledExpression, values: Mapping[str, Any]):
+        mask = np.abs(condition(values)) > CONDITION_EVALUATION_THRESHOLD
+        with np.errstate(all="ignore"):
+            return np.where(mask, true_fn(values), false_fn(values))
+
+
+class DualBackend(ScalarBackend):
+    """
+    Primitive operations on dual numbers (see ``algebra.dual``).
+
+    Values propagate like the scalar backend; gradients follow the chain rule.
+    Conditions select a branch on values only.
+    """
+
+    name = "dual"
+    numeric = False
+
+    functions: dict[str, Callable[[Any], Any]] = DUAL_FUNCTIONS
+
+    @staticmethod
+    def power(left, right):
+        exponent = right.value if isinstance(right, Dual) else right
+        if isinstance(right, Dual) and right.grad.any():
+            return left**right
+        if exponent != int(exponent):
+            raise ValueError(f"Non-integer exponents not yet supported: {exponent}")
+        return left ** int(exponent)
+
+
+SCALAR = ScalarBackend()
+ARRAY = ArrayBackend()
+DUAL = DualBackend()
+
+_COMPARISONS: dict[str, Callable[[Any, Any], Any]] = {
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+# Compilers for node types defined outside this module (registered via register_compiler)
+_NODE_COMPILERS: dict[type, Callable[[Any, Any], CompiledExpression]] = {}
+
+
+def register_compiler(node_type: type) -> Callable:
+    """
+    Register a compile function for an expression node type.
+
+    The function receives the node and the backend and returns a compiled closure.
+
+    Example:
+        >>> @register_compiler(MyNode)
+        ... def _compile_my_node(node, backend):
+        ...     inner = compile_expression(node.inner, backend)
+        ...     return lambda values: 2 * inner(values)
+    """
+
+    def decorator(func: Callable[[Any, Any], CompiledExpression]) -> Callable[[Any, Any], CompiledExpression]:
+        _NODE_COMPILERS[node_type] = func
+        return func
+
+    return decorator
+
+
+def compile_expression(expr: Expression, backend: Any = SCALAR) -> CompiledExpression:
+    """
+    Compile an expression into a closure over SI values.
+
+    Args:
+        expr: Expression tree to compile
+        backend: Backend providing the primitive operations (default: SCALAR)
+
+    Returns:
+        Callable mapping ``{symbol: SI value}`` to the SI value of the expression
+
+    Raises:
+        CompilationError: If the tree contains an unsupported node or an unknown constant
+    """
+    node_type = type(expr)
+
+    if node_type is VariableReference:
+        name = expr.name
+
+        def variable(values: Mapping[str, Any]):
+            return values[name]
+
+        return variable
+
+    if node_type is Constant:
+        value = getattr(expr.value, "value", None)
+        if value is None:
+            raise CompilationError(f"Constant without value: {expr}")
+
+        def constant(values: Mapping[str, Any]):
+            return value
+
+        return constant
+
+    if node_type is BinaryOperation:
+        return _compile_binary(expr, backend)
+
+    if node_type is UnaryFunction:
+        func = backend.functions.get(expr.function_name)
+        if func is None:
+            raise CompilationError(f"Unknown function: {expr.function_name}")
+        operand = compile_expression(expr.operand, backend)
+        return lambda values: func(operand(values))
+
+    if node_type is ConditionalExpression:
+        condition = compile_expression(expr.condition, backend)
+        true_fn = compile_expression(expr.true_expr, backend)
+        false_fn = compile_expression(expr.false_expr, backend)
+        select = backend.select
+        return lambda values: select(condition, true_fn, false_fn, values)
+
+    if node_type is MatchExpression:
+        return _compile_match(expr, backend)
+
+    if node_type is Summation:
+        return compile_summation(expr, backend)
+
+    if node_type is TermSlot:
+        key = expr.key
+        return lambda values: values[key]
+
+    custom = _NODE_COMPILERS.get(node_type)
+    if custom is not None:
+        return custom(expr, backend)
+
+    raise CompilationError(f"Cannot compile expression node of type {node_type.__name__}")
+
+
+def try_compile(expr: Expression, backend: Any = SCALAR) -> CompiledExpression | None:
+    """Compile an expression, returning None when it contains unsupported nodes."""
+    try:
+        return compile_expression(expr, backend)
+    except CompilationError:
+        return None
+
+
+def _compile_binary(expr: BinaryOperation, backend: Any) -> CompiledExpression:
+    """Compile arithmetic and comparison operations."""
+    op = expr.operator
+    left = compile_expression(expr.left, backend)
+    right = compile_expression(expr.right, backend)
+
+    if op == "+":
+        return lambda values: left(values) + right(values)
+    if op == "-":
+        return lambda values: left(values) - right(values)
+    if op == "*":
+        return lambda values: left(values) * right(values)
+    if op == "/":
+        divide = backend.divide
+        return lambda values: divide(left(values), right(values))
+    if op == "**":
+        if type(expr.right) is Constant:
+            exponent = expr.right.value.value
+            if exponent is None or exponent != int(exponent):
+                raise CompilationError(f"Non-integer exponent: {exponent}")
+            exponent = int(exponent)
+            return lambda values: left(values) ** exponent
+        power = backend.power
+        return lambda values: power(left(values), right(values))
+
+    compare = _COMPARISONS.get(op)
+    if op == "==":
+        compare = backend.equal
+    elif op == "!=":
+        compare = backend.not_equal
+    if compare is not None:
+        apply = backend.compare
+        return lambda values: apply(compare, left(values), right(values))
+
+    raise CompilationError(f"Unknown operator: {op}")
+
+
+def _compile_match(expr: MatchExpression, backend: Any) -> CompiledExpression:
+    """Compile a match expression; the selection is read at call time."""
+    cases = {key: compile_expression(case, backend) for key, case in expr.cases.items()}
+    select_var = expr.select_var
+
+    def match(values: Mapping[str, Any]):
+        current = getattr(select_var, "value", None)
+        case = cases.get(current)
+        if case is None:
+            raise ValueError(f"No case for value '{current}' in MatchExpression. Available cases: {list(cases)}")
+        return case(values)
+
+    return match
+
+
+def compile_summation(expr: Summation, backend: Any = SCALAR) -> CompiledExpression:
+    """
+    Compile a summation into a vectorized reduction.
+
+    Every structure group of the summation is compiled once with the ARRAY
+    backend; its constant slots are bound to the group's value columns, so one
+    call evaluates all terms of the group and sums them. With the ARRAY backend
+    the inputs may themselves be arrays (a batch), giving one sum per item.
+
+    Raises:
+        CompilationError: If the terms could not be grouped into templates
+    """
+    cached = expr._compiled.get(backend.name)
+    if cached is not None:
+        return cached
+
+    groups = expr.groups()
+    if groups is None:
+        raise CompilationError("Summation terms cannot be templated")
+
+    if not backend.numeric:
+        return _compile_summation_by_term(expr, groups, backend)
+
+    compiled_groups = []
+    for group in groups:
+        template = compile_expression(group.template, ARRAY)
+        # Terms run along axis 0; batch inputs broadcast along the remaining axes
+        shape = (group.count, 1) if backend.vectorized else (group.count,)
+        columns = {key: column.reshape(shape) for key, column in group.columns.items()}
+        compiled_groups.append((template, columns, shape))
+
+    if backend.vectorized:
+
+        def summation(values: Mapping[str, Any]):
+            total = 0.0
+            for template, columns, shape in compiled_groups:
+                with np.errstate(all="ignore"):
+                    terms = np.asarray(template({**values, **columns}), dtype=float)
+                total = total + np.broadcast_to(terms, np.broadcast_shapes(terms.shape, shape)).sum(axis=0)
+            return total
+
+    else:
+
+        def summation(values: Mapping[str, Any]):
+            total = 0.0
+            for template, columns, shape in compiled_groups:
+                with np.errstate(all="ignore"):
+                    terms = np.asarray(template({**values, **columns}), dtype=float)
+                total += float(np.broadcast_to(terms, shape).sum())
+            if math.isnan(total):
+                raise ValueError("Invalid term in summation")
+            return total
+
+    expr._compiled[backend.name] = summation
+    return summation
+
+
+def _compile_summation_by_term(expr: Summation, groups: list, backend: Any) -> CompiledExpression:
+    """Compile a summation for a non-numeric backend, evaluating the group templates term by term."""
+    compiled_groups = []
+    for group in groups:
+        template = compile_expression(group.template, backend)
+        rows = [{key: float(column[i]) for key, column in group.columns.items()} for i in range(group.count)]
+        compiled_groups.append((template, rows))
+
+    def summation(values: Mapping[str, Any]):
+        total = 0.0
+        for template, rows in compiled_groups:
+            for row in rows:
+                total = total + template({**values, **row})
+        return total
+
+    expr._compiled[backend.name] = summation
+    return summation
+
+
+def expression_fingerprint(expr: Expression, selects: list | None = None) -> str:
+    """
+    Build a stable structural fingerprint of an expression.
+
+    The fingerprint depends only on the tree shape, operators, variable symbols
+    and constant SI values (with their dimension exponents), so it is identical
+    across processes and interpreter runs. Operands of commutative operators
+    are put in canonical order, so ``a * b`` and ``b * a`` share a
+    fingerprint. Select variables referenced by match expressions are appended
+    to ``selects`` so callers can key on their current selections as well.
+
+    Args:
+        expr: Expression tree to fingerprint
+        selects: Optional list collecting select variables found in the tree
+
+    Returns:
+        Canonical prefix-notation string for the tree
+
+    Raises:
+        CompilationError: If the tree contains a node without a fingerprint
+    """
+    node_type = type(expr)
+
+    if node_type is VariableReference:
+        return f"v:{expr.name}"
+
+    if node_type is Constant:
+        quantity = expr.value
+        value = getattr(quantity, "value", None)
+        if value is None:
+            raise CompilationError(f"Constant without value: {expr}")
+        dim = getattr(quantity, "dim", None)
+        return f"c:{float(value).hex()}:{tuple(dim.exps) if dim is not None else ()}"
+
+    if node_type is BinaryOperation:
+        left_selects: list | None = None if selects is None else []
+        right_selects: list | None = None if selects is None else []
+        left = expression_fingerprint(expr.left, left_selects)
+        right = expression_fingerprint(expr.right, right_selects)
+        if expr.operator in COMMUTATIVE_OPERATORS and right < left:
+            left, right = right, left
+            left_selects, right_selects = right_selects, left_selects
+        if selects is not None:
+            selects.extend(left_selects)
+            selects.extend(right_selects)
+        return f"({expr.operator} {left} {right})"
+
+    if node_type is UnaryFunction:
+        return f"({expr.function_name} {expression_fingerprint(expr.operand, selects)})"
+
+    if node_type is ConditionalExpression:
+        parts = (expression_fingerprint(part, selects) for part in (expr.condition, expr.true_expr, expr.false_expr))
+        return f"(if {' '.join(parts)})"
+
+    if node_type is MatchExpression:
+        if selects is not None:
+            selects.append(expr.select_var)
+        cases = " ".join(f"[{key!r} {expression_fingerprint(case, selects)}]" for key, case in sorted(expr.cases.items(), key=lambda item: repr(item[0])))
+        return f"(match {getattr(expr.select_var, 'symbol', '?')} {cases})"
+
+    if node_type is Summation:
+        groups = expr.groups()
+        if groups is None:
+            raise CompilationError("Summation terms cannot be templated")
+        parts = []
+        for group in groups:
+            digest = hashlib.sha256()
+            for key in sorted(group.columns):
+                digest.update(np.ascontiguousarray(group.columns[key], dtype=float).tobytes())
+            parts.append(f"[{expression_fingerprint(group.template, selects)} {group.count} {digest.hexdigest()}]")
+        return f"(sum {' '.join(parts)})"
+
+    if node_type is TermSlot:
+        return f"s:{expr.key}"
+
+    raise CompilationError(f"Cannot fingerprint expression node of type {node_type.__name__}")
+
+
+__all__ = [
+    "ARRAY",
+    "DUAL",
+    "SCALAR",
+    "ArrayBackend",
+    "CompilationError",
+    "CompiledExpression",
+    "DualBackend",
+    "ScalarBackend",
+    "compile_expression",
+    "compile_summation",
+    "expression_fingerprint",
+    "register_compiler",
+    "try_compile",
+]
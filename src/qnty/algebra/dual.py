@@ -0,0 +1,145 @@
+"""
+Dual Numbers
+============
+
+Forward-mode automatic differentiation on SI floats.
+
+A ``Dual`` carries a value together with its gradient with respect to a fixed
+set of seeds (one NumPy array entry per seed), so a single evaluation of an
+expression yields the value and every partial derivative at once. Expressions
+are evaluated on duals through the ``DUAL`` compiler backend, which reuses the
+same compiled closures as the float backends.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import numpy as np
+
+
+class Dual:
+    """A value with its gradient with respect to the seeded inputs."""
+
+    __slots__ = ("value", "grad")
+
+    def __init__(self, value: float, grad: np.ndarray):
+        self.value = value
+        self.grad = grad
+
+    @classmethod
+    def seed(cls, value: float, index: int, size: int) -> Dual:
+        """Independent input: derivative 1 with respect to seed ``index``, 0 elsewhere."""
+        grad = np.zeros(size)
+        grad[index] = 1.0
+        return cls(value, grad)
+
+    @classmethod
+    def constant(cls, value: float, size: int) -> Dual:
+        """Input that does not depend on any seed."""
+        return cls(value, np.zeros(size))
+
+    def __repr__(self) -> str:
+        return f"Dual({self.value!r}, {self.grad!r})"
+
+    # ---- Arithmetic ----
+    def __add__(self, other: Any) -> Dual:
+        if isinstance(other, Dual):
+            return Dual(self.value + other.value, self.grad + other.grad)
+        return Dual(self.value + other, self.grad)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Any) -> Dual:
+        if isinstance(other, Dual):
+            return Dual(self.value - other.value, self.grad - other.grad)
+        return Dual(self.value - other, self.grad)
+
+    def __rsub__(self, other: Any) -> Dual:
+        return Dual(other - self.value, -self.grad)
+
+    def __neg__(self) -> Dual:
+        return Dual(-self.value, -self.grad)
+
+    def __mul__(self, other: Any) -> Dual:
+        if isinstance(other, Dual):
+            return Dual(self.value * other.value, self.grad * other.value + other.grad * self.value)
+        return Dual(self.value * other, self.grad * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Any) -> Dual:
+        if isinstance(other, Dual):
+            return Dual(self.value / other.value, (self.grad * other.value - other.grad * self.value) / (other.value * other.value))
+        return Dual(self.value / other, self.grad / other)
+
+    def __rtruediv__(self, other: Any) -> Dual:
+        return Dual(other / self.value, -other * self.grad / (self.value * self.value))
+
+    def __pow__(self, exponent: Any) -> Dual:
+        if isinstance(exponent, Dual):
+            # d(u^v) = u^v * (v' ln u + v u'/u)
+            value = self.value**exponent.value
+            return Dual(value, value * (exponent.grad * math.log(self.value) + exponent.value * self.grad / self.value))
+        if exponent == 0:
+            return Dual(1.0, self.grad * 0.0)
+        return Dual(self.value**exponent, exponent * self.value ** (exponent - 1) * self.grad)
+
+    def __rpow__(self, base: Any) -> Dual:
+        # d(a^u) = a^u * ln(a) * u'
+        value = base**self.value
+        return Dual(value, value * math.log(base) * self.grad)
+
+    def __abs__(self) -> Dual:
+        return Dual(abs(self.value), self.grad * math.copysign(1.0, self.value))
+
+    # ---- Comparisons (on values; conditions pick a branch, they are not differentiated) ----
+    def __lt__(self, other: Any) -> bool:
+        return self.value < _value(other)
+
+    def __le__(self, other: Any) -> bool:
+        return self.value <= _value(other)
+
+    def __gt__(self, other: Any) -> bool:
+        return self.value > _value(other)
+
+    def __ge__(self, other: Any) -> bool:
+        return self.value >= _value(other)
+
+    def __float__(self) -> float:
+        return float(self.value)
+
+
+def _value(operand: Any) -> float:
+    """Value part of a dual or a plain number."""
+    return operand.value if isinstance(operand, Dual) else operand
+
+
+def _lift(func, derivative):
+    """Extend a scalar function to duals using its derivative."""
+
+    def lifted(x: Any) -> Any:
+        if isinstance(x, Dual):
+            return Dual(func(x.value), derivative(x.value) * x.grad)
+        return func(x)
+
+    return lifted
+
+
+DUAL_FUNCTIONS = {
+    "sin": _lift(math.sin, math.cos),
+    "cos": _lift(math.cos, lambda x: -math.sin(x)),
+    "tan": _lift(math.tan, lambda x: 1.0 / math.cos(x) ** 2),
+    "sqrt": _lift(math.sqrt, lambda x: 0.5 / math.sqrt(x)),
+    "abs": abs,
+    "ln": _lift(math.log, lambda x: 1.0 / x),
+    "log10": _lift(math.log10, lambda x: 1.0 / (x * math.log(10.0))),
+    "exp": _lift(math.exp, math.exp),
+}
+
+
+__all__ = [
+    "DUAL_FUNCTIONS",
+    "Dual",
+]
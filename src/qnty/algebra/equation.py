@@ -8,6 +8,7 @@ Mathematical equations for qnty variables with solving capabilities.
 from __future__ import annotations
 
 import logging
+import math
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Protocol, cast
@@ -15,10 +16,15 @@ from typing import TYPE_CHECKING, Protocol, cast
 from ..core.quantity import FieldQuantity
 from ..utils.scope_discovery import ScopeDiscoveryService
 from ..utils.shared_utilities import SharedConstants, ValidationHelper
-from .nodes import BinaryOperation, Expression, VariableReference
+from .compiler import SCALAR, CompiledExpression, try_compile
+from .folding import fold_constants
+from .inversion import invert_for
+from .nodes import BinaryOperation, ConditionalExpression, Constant, DimensionMismatchError, Expression, VariableReference
 
 if TYPE_CHECKING:
+    from ..core.dimension import Dimension
     from ..core.quantity import Quantity
+    from ..solving.roots import RootResult
 
 _logger = logging.getLogger(__name__)
 
@@ -26,6 +32,23 @@ _logger = logging.getLogger(__name__)
 _SCOPE_DISCOVERY_ENABLED = False  # Disabled by default due to high overhead
 
 
+def _comparison_bounds(expr: Expression, target_var: str) -> list[float]:
+    """SI values of the constants the target variable is compared against in conditions of expr."""
+    bounds = []
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ConditionalExpression):
+            stack.extend((node.condition, node.true_expr, node.false_expr))
+        elif isinstance(node, BinaryOperation):
+            if node.operator in BinaryOperation._COMPARISON_OPS:
+                for side, other in ((node.left, node.right), (node.right, node.left)):
+                    if isinstance(side, VariableReference) and side.name == target_var and isinstance(other, Constant) and other.value.value is not None:
+                        bounds.append(float(other.value.value))
+            stack.extend((node.left, node.right))
+    return bounds
+
+
 class OperandSide(Enum):
     """Which side of a binary operation contains a variable."""
 
@@ -128,16 +151,55 @@ class Equation:
     """
     Represents a mathematical equation with left-hand side equal to right-hand side.
     Optimized with __slots__ for memory efficiency.
+
+    Dimensions are inferred once at construction (see
+    ``Expression.infer_dimension``). An inconsistency is recorded rather than
+    raised, so a class body containing a bad equation still imports, and
+    ``infer_dimensions`` raises it, with its location, before the equation is
+    solved.
     """
 
-    __slots__ = ("name", "lhs", "rhs", "_variables", "_inverter")
+    __slots__ = ("name", "lhs", "rhs", "_variables", "_inverter", "_dimension_error", "_inversions", "_compiled_inversions", "_compiled_sides", "_range_hints", "_root_searches")
 
     def __init__(self, name: str, lhs: FieldQuantity | Expression, rhs: Expression):
         self.name = name
-        self.lhs = self._to_expression(lhs)
-        self.rhs = rhs
+        # Constant subtrees are folded once here instead of on every evaluation
+        self.lhs = fold_constants(self._to_expression(lhs))
+        self.rhs = fold_constants(rhs) if isinstance(rhs, Expression) else rhs
+        self._init_state()
+        try:
+            self.infer_dimensions()
+        except DimensionMismatchError as e:
+            self._dimension_error = e
+
+    @classmethod
+    def restore(cls, name: str, lhs: Expression, rhs: Expression) -> Equation:
+        """
+        Rebuild an equation from sides that were already folded and checked.
+
+        Used when loading serialized equations: constant folding and dimension
+        inference ran when the equation was first built, so they are skipped.
+        """
+        equation = cls.__new__(cls)
+        equation.name = name
+        equation.lhs = lhs
+        equation.rhs = rhs
+        equation._init_state()
+        return equation
+
+    def _init_state(self) -> None:
+        """Reset the lazily derived state."""
         self._variables: set[str] | None = None  # Lazy initialization for better performance
         self._inverter = AlgebraicInverter(self)  # Create inverter for algebraic operations
+        self._dimension_error: DimensionMismatchError | None = None
+        # Solve plans, derived on first use: closed-form inversions and their
+        # compiled form per target, and compiled sides for a numeric root search
+        self._inversions: dict[str, Expression | None] = {}
+        self._compiled_inversions: dict[str, CompiledExpression | None] = {}
+        self._compiled_sides: dict[str, tuple[CompiledExpression, CompiledExpression] | None] = {}
+        self._range_hints: dict[str, tuple[float, float] | None] = {}
+        # Statistics of the last root search per target, reported in solving steps
+        self._root_searches: dict[str, RootResult] = {}
 
     @staticmethod
     def _to_expression(value: FieldQuantity | Expression) -> Expression:
@@ -152,6 +214,37 @@ class Equation:
             return VariableReference(value._wrapped)  # type: ignore[attr-defined]
         return cast(Expression, value)
 
+    def infer_dimensions(self) -> tuple[Dimension | None, Dimension | None]:
+        """
+        Dimension of each side, inferred statically and cached on the expression nodes.
+
+        Sides that are not yet resolved expressions (delayed expressions in a
+        class body) are skipped until the equation is rebuilt with real ones.
+
+        Returns:
+            (lhs dimension, rhs dimension); an entry is None when it cannot be inferred
+
+        Raises:
+            DimensionMismatchError: If either side combines incompatible dimensions
+        """
+        if self._dimension_error is not None:
+            raise self._dimension_error
+        lhs_dim = self.lhs.infer_dimension() if isinstance(self.lhs, Expression) else None
+        rhs_dim = self.rhs.infer_dimension() if isinstance(self.rhs, Expression) else None
+        return lhs_dim, rhs_dim
+
+    def dimensions_match(self) -> bool | None:
+        """
+        Whether both sides share a dimension, decided without evaluating them.
+
+        Returns:
+            True or False when both sides could be inferred, otherwise None
+        """
+        lhs_dim, rhs_dim = self.infer_dimensions()
+        if lhs_dim is None or rhs_dim is None:
+            return None
+        return lhs_dim == rhs_dim
+
     def _is_variable_known(self, var_name: str, variable_values: dict[str, FieldQuantity]) -> bool:
         """Check if a variable exists in variable_values and is marked as known."""
         if var_name not in variable_values:
@@ -239,6 +332,152 @@ class Equation:
         unknown_vars = self.get_unknown_variables(known_vars)
         return unknown_vars == {target_var}
 
+    def inversion_for(self, target_var: str) -> Expression | None:
+        """
+        Closed-form ``target = f(others)`` for a variable of this equation.
+
+        Derived once per target and cached on the equation.
+
+        Returns:
+            Expression equal to the target, or None when the target cannot be isolated
+        """
+        if target_var not in self._inversions:
+            self._inversions[target_var] = invert_for(self.lhs, self.rhs, target_var)
+        return self._inversions[target_var]
+
+    def _solve_by_inversion(self, target_var: str, variable_values: dict[str, FieldQuantity]) -> Quantity | None:
+        """Evaluate the cached inversion for target_var, through its compiled form when possible."""
+        inversion = self.inversion_for(target_var)
+        if inversion is None:
+            return None
+
+        if target_var not in self._compiled_inversions:
+            self._compiled_inversions[target_var] = try_compile(inversion)
+        compiled = self._compiled_inversions[target_var]
+        try:
+            if compiled is not None:
+                value = self._call_compiled(compiled, inversion.get_variables(), variable_values)
+                result = self._target_quantity(target_var, value, variable_values)
+                if result is not None:
+                    return result
+            return inversion.evaluate(variable_values)
+        except (ValueError, TypeError, ArithmeticError) as e:
+            # Leave the target to the algebraic and numeric fallbacks
+            _logger.debug(f"Inversion for '{target_var}' could not be evaluated: {e}")
+            return None
+
+    def _solve_numerically(self, target_var: str, variable_values: dict[str, FieldQuantity]) -> Quantity | None:
+        """Find target_var by a root search on the residual lhs - rhs, built from sides compiled once."""
+        sides = self.compiled_sides()
+        if sides is None:
+            return None
+
+        values = self._si_values(self.variables - {target_var}, variable_values)
+        if values is None:
+            return None
+        lhs, rhs = sides
+
+        def residual(x: float) -> float:
+            values[target_var] = x
+            return lhs(values) - rhs(values)
+
+        from ..solving.roots import find_root
+
+        target = variable_values.get(target_var)
+        bracket = self._bracket_hint(target_var, target)
+        scale = self._unit_scale(target)
+        start = getattr(target, "value", None)
+        if start is None:
+            start = 0.5 * (bracket[0] + bracket[1]) if bracket is not None else scale
+
+        result = find_root(residual, start, bracket=bracket, scale=scale)
+        if result is None:
+            return None
+        self._root_searches[target_var] = result
+        return self._target_quantity(target_var, result.root, variable_values)
+
+    def compiled_sides(self, backend=SCALAR) -> tuple[CompiledExpression, CompiledExpression] | None:
+        """
+        Both sides of the equation compiled for a backend, built once per backend.
+
+        Returns:
+            (lhs, rhs) closures over SI values, or None if either side cannot be compiled
+        """
+        if backend.name not in self._compiled_sides:
+            lhs = try_compile(self.lhs, backend) if isinstance(self.lhs, Expression) else None
+            rhs = try_compile(self.rhs, backend) if isinstance(self.rhs, Expression) and lhs is not None else None
+            self._compiled_sides[backend.name] = (lhs, rhs) if rhs is not None else None
+        return self._compiled_sides[backend.name]
+
+    def root_search(self, target_var: str) -> RootResult | None:
+        """
+        Convergence statistics of the last numeric solve for target_var.
+
+        Returns:
+            RootResult, or None if the last solve for target_var did not need a root search
+        """
+        return self._root_searches.get(target_var)
+
+    def _bracket_hint(self, target_var: str, target: FieldQuantity | None) -> tuple[float, float] | None:
+        """
+        SI range to search first for target_var.
+
+        A range set on the variable (``Quantity.search_range``) wins; otherwise
+        the span of the constant bounds the target is compared against in this
+        equation (the cases of a ``range_expr`` over the target) is used.
+        """
+        search_range = getattr(target, "_search_range", None)
+        if search_range is not None:
+            return search_range
+        if target_var not in self._range_hints:
+            bounds = _comparison_bounds(self.lhs, target_var) + _comparison_bounds(self.rhs, target_var)
+            self._range_hints[target_var] = (min(bounds), max(bounds)) if len(set(bounds)) > 1 else None
+        return self._range_hints[target_var]
+
+    @staticmethod
+    def _unit_scale(target: FieldQuantity | None) -> float:
+        """SI size of one display unit of the target, so tolerances follow the unit it is reported in."""
+        unit = getattr(target, "preferred", None)
+        if unit is None and target is not None:
+            from ..core.unit import ureg
+
+            unit = ureg.preferred_for(target.dim)
+        scale = getattr(unit, "si_factor", None)
+        return abs(scale) if scale else 1.0
+
+    def _call_compiled(self, compiled: CompiledExpression, symbols: set[str], variable_values: dict[str, FieldQuantity]) -> float | None:
+        """Call a compiled expression on SI values; None when a value is missing or the result is invalid."""
+        values = self._si_values(symbols, variable_values)
+        if values is None:
+            return None
+        try:
+            return compiled(values)
+        except (ValueError, ArithmeticError):
+            return None
+
+    @staticmethod
+    def _si_values(symbols: set[str], variable_values: dict[str, FieldQuantity]) -> dict[str, float] | None:
+        """SI values of the given variables, or None if any is missing."""
+        values = {}
+        for symbol in symbols:
+            value = getattr(variable_values.get(symbol), "value", None)
+            if value is None:
+                return None
+            values[symbol] = value
+        return values
+
+    @staticmethod
+    def _target_quantity(target_var: str, value: float | None, variable_values: dict[str, FieldQuantity]) -> Quantity | None:
+        """Wrap an SI result in a Quantity with the target variable's dimension and preferred unit."""
+        target = variable_values.get(target_var)
+        dim = getattr(target, "dim", None)
+        if value is None or dim is None or not math.isfinite(value):
+            return None
+        from ..core.quantity import Quantity
+        from ..core.unit import ureg
+
+        return Quantity(name=target_var, dim=dim, value=float(value), preferred=getattr(target, "preferred", None) or ureg.preferred_for(dim) or ureg.si_unit_for(dim))
+
     def _solve_algebraically(self, target_var: str, variable_values: dict[str, FieldQuantity]) -> Quantity | None:
         """
         Attempt to solve equation algebraically for target_var.
@@ -317,15 +556,20 @@ class Equation:
         """
         if target_var not in self.variables:
             raise ValueError(f"Variable '{target_var}' not found in equation")
+        self._root_searches.pop(target_var, None)
 
         # Case 1: Direct assignment: target = expression
         if isinstance(self.lhs, VariableReference) and self.lhs.name == target_var:
             # Direct assignment: target_var = rhs
             result_qty = self.rhs.evaluate(variable_values)
 
-        # Case 2: Try algebraic manipulation for simple cases
+        # Case 2: Closed-form inversion (cached per target), then a numeric root search
         else:
-            result_qty = self._solve_algebraically(target_var, variable_values)
+            result_qty = self._solve_by_inversion(target_var, variable_values)
+            if result_qty is None:
+                result_qty = self._solve_algebraically(target_var, variable_values)
+            if result_qty is None:
+                result_qty = self._solve_numerically(target_var, variable_values)
             if result_qty is None:
                 raise NotImplementedError(f"Cannot solve for {target_var} in equation {self}. Algebraic manipulation not supported for this equation form.")
 
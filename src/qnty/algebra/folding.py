@@ -0,0 +1,150 @@
+"""
+Constant Folding
+================
+
+Simplification pass applied once when an ``Equation`` is built.
+
+Subtrees made only of ``Constant`` nodes are evaluated a single time and
+replaced by a ``Constant`` holding the resulting Quantity, so constants with
+units (and unit-conversion factors between them) are combined up front instead
+of on every evaluation. Quantities referenced through ``VariableReference``
+are left alone, since their values can change after the equation is built.
+Arithmetic identities (``x*1``, ``x/1``, ``x+0``, ``x-0``, ``x**1``) are
+removed when they cannot change the result's dimension.
+
+Unlike ``Expression.simplify`` the pass never resolves a ``MatchExpression``
+from the current selection, since selections may change after the equation is
+built, and it keeps operand order so equations display as written.
+"""
+
+from __future__ import annotations
+
+from ..core.quantity import Quantity
+from ..utils.shared_utilities import SharedConstants
+from .nodes import BinaryOperation, ConditionalExpression, Constant, DimensionMismatchError, Expression, MatchExpression, UnaryFunction, _get_dimensionless_quantity
+
+# Operators whose folded result does not depend on operand order
+COMMUTATIVE_OPERATORS = frozenset({"+", "*"})
+
+_FOLD_ERRORS = (ValueError, TypeError, ArithmeticError, AttributeError)
+
+
+def fold_constants(expr: Expression) -> Expression:
+    """
+    Fold constant subtrees and drop identity operations.
+
+    Args:
+        expr: Expression to simplify
+
+    Returns:
+        Simplified expression (``expr`` itself when nothing changed)
+    """
+    node_type = type(expr)
+
+    if node_type is BinaryOperation:
+        left = fold_constants(expr.left)
+        right = fold_constants(expr.right)
+        if type(left) is Constant and type(right) is Constant:
+            folded = _evaluate_constant(BinaryOperation(expr.operator, left, right))
+            if folded is not None:
+                return folded
+        reduced = _drop_identity(expr.operator, left, right)
+        if reduced is not None:
+            return reduced
+        if left is expr.left and right is expr.right:
+            return expr
+        return BinaryOperation(expr.operator, left, right)
+
+    if node_type is UnaryFunction:
+        operand = fold_constants(expr.operand)
+        if type(operand) is Constant:
+            folded = _evaluate_constant(UnaryFunction(expr.function_name, operand))
+            if folded is not None:
+                return folded
+        return expr if operand is expr.operand else UnaryFunction(expr.function_name, operand)
+
+    if node_type is ConditionalExpression:
+        condition = fold_constants(expr.condition)
+        true_expr = fold_constants(expr.true_expr)
+        false_expr = fold_constants(expr.false_expr)
+        if type(condition) is Constant and condition.value.value is not None:
+            return true_expr if abs(condition.value.value) > SharedConstants.CONDITION_EVALUATION_THRESHOLD else false_expr
+        if condition is expr.condition and true_expr is expr.true_expr and false_expr is expr.false_expr:
+            return expr
+        return ConditionalExpression(condition, true_expr, false_expr)
+
+    if node_type is MatchExpression:
+        cases = {key: fold_constants(case) for key, case in expr.cases.items()}
+        if all(cases[key] is case for key, case in expr.cases.items()):
+            return expr
+        return MatchExpression(expr.select_var, cases)
+
+    return expr
+
+
+def _evaluate_constant(expr: Expression) -> Constant | None:
+    """Evaluate a variable-free node into a Constant, or None if it cannot be evaluated."""
+    try:
+        value = expr.evaluate({})
+    except _FOLD_ERRORS:
+        return None
+    if not isinstance(value, Quantity) or value.value is None:
+        return None
+    if value.dim.is_dimensionless():
+        # Same representation as a literal number, so the folded equation displays plainly
+        return Constant(_get_dimensionless_quantity(float(value.value)))
+    return Constant(value)
+
+
+def _constant_si_value(expr: Expression) -> float | None:
+    """SI value of a dimensionless Constant, else None."""
+    if type(expr) is not Constant:
+        return None
+    quantity = expr.value
+    dim = getattr(quantity, "dim", None)
+    if dim is None or not dim.is_dimensionless():
+        return None
+    return getattr(quantity, "value", None)
+
+
+def _drop_identity(operator: str, left: Expression, right: Expression) -> Expression | None:
+    """The surviving operand when ``left operator right`` is an identity operation, else None."""
+    right_value = _constant_si_value(right)
+    left_value = _constant_si_value(left)
+
+    if operator == "*":
+        if _is_one(right_value):
+            return left
+        if _is_one(left_value):
+            return right
+    elif operator == "/" or operator == "**":
+        if _is_one(right_value):
+            return left
+    elif operator in ("+", "-"):
+        # A dimensionless zero only vanishes next to a dimensionless operand;
+        # otherwise the addition is a dimension error that must still surface
+        if right_value == 0 and _is_dimensionless(left):
+            return left
+        if operator == "+" and left_value == 0 and _is_dimensionless(right):
+            return right
+    return None
+
+
+def _is_one(value: float | None) -> bool:
+    """True for 1 up to round-off, as left by conversion factors such as 12 in / 1 ft."""
+    return value is not None and abs(value - 1.0) <= SharedConstants.FLOAT_EQUALITY_TOLERANCE
+
+
+def _is_dimensionless(expr: Expression) -> bool:
+    """True when the expression is statically known to be dimensionless."""
+    try:
+        dim = expr.infer_dimension()
+    except DimensionMismatchError:
+        return False
+    return dim is not None and dim.is_dimensionless()
+
+
+__all__ = [
+    "COMMUTATIVE_OPERATORS",
+    "fold_constants",
+]
@@ -9,7 +9,7 @@ from collections.abc import Callable
 
 from ..core.quantity import FieldQuantity, Quantity
 from ..utils.shared_utilities import ContextDetectionHelper
-from .nodes import BinaryOperation, ConditionalExpression, Expression, UnaryFunction, wrap_operand
+from .nodes import BinaryOperation, ConditionalExpression, Expression, Summation, UnaryFunction, wrap_operand
 
 # Type aliases for better maintainability
 ExpressionOperand = Expression | FieldQuantity | Quantity | int | float
@@ -187,7 +187,7 @@ def summation(term_generator, *range_specs, **kwargs):
                  explicitly passing captured variables.
 
     Returns:
-        Expression representing the summation
+        Summation node; terms are generated lazily and evaluated with a vectorized reduction
 
     Examples:
         >>> import numpy as np
@@ -213,7 +213,11 @@ def summation(term_generator, *range_specs, **kwargs):
 
         return DelayedFunction("summation", term_generator, range_specs, kwargs)
 
-    # Convert range_specs to actual ranges
+    return _create_summation(term_generator, range_specs, kwargs)
+
+
+def _create_summation(term_generator, range_specs, kwargs: dict) -> Summation:
+    """Build a lazy Summation node from range specifications."""
     ranges = []
     for spec in range_specs:
         if isinstance(spec, int):
@@ -225,21 +229,11 @@ def summation(term_generator, *range_specs, **kwargs):
         else:
             raise ValueError(f"Invalid range specification: {spec}")
 
-    # Generate all terms by iterating over the Cartesian product of ranges
-    import itertools
-
-    terms = []
-    for indices in itertools.product(*ranges):
-        if kwargs:
-            # Pass both indices and captured variables
-            term = term_generator(*indices, **kwargs)
-        else:
-            # Just pass indices (closure-based)
-            term = term_generator(*indices)
-        terms.append(term)
+    if any(len(r) == 0 for r in ranges):
+        # An empty summation has no value (and no dimension), same as an empty sum_expr
+        return sum_expr()
 
-    # Use sum_expr to combine all terms
-    return sum_expr(*terms)
+    return Summation(term_generator, ranges, kwargs)
 
 
 class When:
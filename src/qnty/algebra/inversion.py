@@ -0,0 +1,166 @@
+"""
+Closed-form Inversion
+=====================
+
+Rewrites ``lhs = rhs`` into ``target = f(others)`` when the target variable
+occurs exactly once in the equation.
+
+The side holding the target is peeled one node at a time: each operation on
+the path to the target is undone on the other side (``a + t = r`` becomes
+``t = r - a``, ``sqrt(t) = r`` becomes ``t = r ** 2`` and so on). The result is
+an ordinary expression tree, so it can be cached per (equation, target) and
+compiled like any other expression. Equations where the target occurs more
+than once, or sits under a non-invertible node, have no inversion and are left
+to a numeric root search.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+
+from .nodes import BinaryOperation, Constant, Expression, Summation, UnaryFunction, VariableReference, wrap_operand
+
+
+def count_occurrences(expr: Expression, symbol: str) -> int:
+    """
+    Count the references to a variable in an expression tree.
+
+    Args:
+        expr: Expression to scan
+        symbol: Variable symbol
+
+    Returns:
+        Number of VariableReference nodes for the symbol (nodes the count
+        cannot see into, such as summations, count as two when they use it)
+    """
+    node_type = type(expr)
+    if node_type is VariableReference:
+        return 1 if expr.name == symbol else 0
+    if node_type is Constant:
+        return 0
+    if node_type is BinaryOperation:
+        return count_occurrences(expr.left, symbol) + count_occurrences(expr.right, symbol)
+    if node_type is UnaryFunction:
+        return count_occurrences(expr.operand, symbol)
+    if node_type is Summation or not isinstance(expr, Expression):
+        return 2 if symbol in _safe_variables(expr) else 0
+    # Branching nodes: the target can appear in several branches, so any use is treated as non-invertible
+    return 2 if symbol in expr.get_variables() else 0
+
+
+def invert_for(lhs: Expression, rhs: Expression, target: str) -> Expression | None:
+    """
+    Solve ``lhs = rhs`` symbolically for a variable.
+
+    Args:
+        lhs: Left-hand side
+        rhs: Right-hand side
+        target: Symbol of the variable to isolate
+
+    Returns:
+        Expression equal to the target, or None if the equation has no closed-form inversion
+    """
+    lhs_count = count_occurrences(lhs, target)
+    rhs_count = count_occurrences(rhs, target)
+    if lhs_count + rhs_count != 1:
+        return None
+    if lhs_count:
+        return isolate(lhs, target, rhs)
+    return isolate(rhs, target, lhs)
+
+
+def isolate(expr: Expression, target: str, result: Expression) -> Expression | None:
+    """
+    Isolate a variable occurring once in ``expr`` given ``expr = result``.
+
+    Args:
+        expr: Expression containing the target exactly once
+        target: Symbol of the variable to isolate
+        result: Expression the original ``expr`` equals
+
+    Returns:
+        Expression equal to the target, or None if a node on the path cannot be inverted
+    """
+    while True:
+        node_type = type(expr)
+        if node_type is VariableReference:
+            return result if expr.name == target else None
+
+        if node_type is BinaryOperation:
+            in_left = count_occurrences(expr.left, target) > 0
+            inverter = (_LEFT_INVERSES if in_left else _RIGHT_INVERSES).get(expr.operator)
+            if inverter is None:
+                return None
+            other = expr.right if in_left else expr.left
+            result = inverter(result, other)
+            if result is None:
+                return None
+            expr = expr.left if in_left else expr.right
+            continue
+
+        if node_type is UnaryFunction:
+            inverter = _FUNCTION_INVERSES.get(expr.function_name)
+            if inverter is None:
+                return None
+            result = inverter(result)
+            expr = expr.operand
+            continue
+
+        return None
+
+
+def _invert_left_power(result: Expression, exponent: Expression) -> Expression | None:
+    """``t ** n = r`` for a constant exponent n."""
+    if type(exponent) is not Constant:
+        return None
+    n = exponent.value.value
+    if n == 1:
+        return result
+    if n == 2:
+        return UnaryFunction("sqrt", result)
+    if n == -1:
+        return BinaryOperation("/", wrap_operand(1), result)
+    if n == 0.5:
+        return BinaryOperation("**", result, wrap_operand(2))
+    return None
+
+
+# Inverse of ``t op other = r`` for a target on the left of the operator
+_LEFT_INVERSES: dict[str, Callable[[Expression, Expression], Expression | None]] = {
+    "+": lambda r, other: BinaryOperation("-", r, other),
+    "-": lambda r, other: BinaryOperation("+", r, other),
+    "*": lambda r, other: BinaryOperation("/", r, other),
+    "/": lambda r, other: BinaryOperation("*", r, other),
+    "**": _invert_left_power,
+}
+
+# Inverse of ``other op t = r`` for a target on the right of the operator
+_RIGHT_INVERSES: dict[str, Callable[[Expression, Expression], Expression | None]] = {
+    "+": lambda r, other: BinaryOperation("-", r, other),
+    "-": lambda r, other: BinaryOperation("-", other, r),
+    "*": lambda r, other: BinaryOperation("/", r, other),
+    "/": lambda r, other: BinaryOperation("/", other, r),
+    "**": lambda r, base: BinaryOperation("/", UnaryFunction("ln", r), UnaryFunction("ln", base)),
+}
+
+# Inverse of ``f(t) = r`` for one-to-one functions
+_FUNCTION_INVERSES: dict[str, Callable[[Expression], Expression]] = {
+    "sqrt": lambda r: BinaryOperation("**", r, wrap_operand(2)),
+    "exp": lambda r: UnaryFunction("ln", r),
+    "ln": lambda r: UnaryFunction("exp", r),
+    # 10 ** r, written with exp because powers only take integer exponents
+    "log10": lambda r: UnaryFunction("exp", BinaryOperation("*", r, wrap_operand(math.log(10)))),
+}
+
+
+def _safe_variables(expr) -> set[str]:
+    get_variables = getattr(expr, "get_variables", None)
+    return get_variables() if callable(get_variables) else set()
+
+
+__all__ = [
+    "count_occurrences",
+    "invert_for",
+    "isolate",
+]
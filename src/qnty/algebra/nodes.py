@@ -5,12 +5,17 @@ Expression AST Nodes
 Core abstract syntax tree nodes for mathematical expressions.
 """
 
+import itertools
 import math
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+import numpy as np
 
 from ..core import u
+from ..core.dimension import BACKEND, Dimension
+from ..core.dimension_catalog import D as DIMENSIONLESS
 from ..core.quantity import FieldQuantity, Quantity
-from ..utils.caching.manager import get_cache_manager
 from ..utils.protocols import register_expression_type, register_variable_type
 from ..utils.scope_discovery import ScopeDiscoveryService
 from ..utils.shared_utilities import (
@@ -28,6 +33,40 @@ def _create_binary_operation(operator: str, left: "Expression", right) -> "Binar
 # Use shared validation helper
 _has_valid_value = ValidationHelper.has_valid_value
 
+# Marker for nodes whose dimension has not been inferred yet (None means "cannot be inferred")
+_UNINFERRED = object()
+
+
+class DimensionMismatchError(TypeError):
+    """
+    Dimensionally inconsistent expression found by static dimension inference.
+
+    Attributes:
+        location: The offending sub-expression (or equation), as text
+    """
+
+    def __init__(self, message: str, location: str = ""):
+        super().__init__(message)
+        self.location = location
+
+
+def _describe_dimension(dimension: Dimension) -> str:
+    """Readable form of a dimension for error messages: its SI unit symbol, falling back to exponents."""
+    if dimension.is_dimensionless():
+        return "dimensionless"
+    from ..core.unit import ureg
+
+    si_unit = ureg.si_unit_for(dimension)
+    return f"[{si_unit.symbol}]" if si_unit is not None else f"Dim{dimension.exps}"
+
+
+def _dimension_sqrt(dimension: Dimension) -> Dimension | None:
+    """Square root of a dimension, or None when an exponent is odd."""
+    if any(exp % 2 for exp in dimension.exps):
+        return None
+    exps = tuple(exp // 2 for exp in dimension.exps)
+    return Dimension(exps, BACKEND.encode(exps))
+
 
 class Expression(ABC):
     """Abstract base class for mathematical expressions."""
@@ -54,6 +93,33 @@ class Expression(ABC):
     def __str__(self) -> str:
         pass
 
+    def infer_dimension(self) -> Dimension | None:
+        """
+        Dimension of the expression's result, derived from the tree without evaluating it.
+
+        Computed once per node and cached, so checking a whole tree is a
+        one-time pass. Nodes are immutable after construction, which keeps the
+        cached value valid.
+
+        Returns:
+            The result Dimension, or None when it cannot be determined statically
+
+        Raises:
+            DimensionMismatchError: If a sub-expression combines incompatible dimensions
+        """
+        dimension = getattr(self, "_inferred_dim", _UNINFERRED)
+        if dimension is _UNINFERRED:
+            dimension = self._infer_dimension()
+            try:
+                self._inferred_dim = dimension
+            except AttributeError:
+                pass  # Node type without a cache slot
+        return dimension
+
+    def _infer_dimension(self) -> Dimension | None:
+        """Node-specific dimension rule; unknown node types cannot be inferred."""
+        return None
+
     def _discover_variables_from_scope(self) -> dict[str, "FieldQuantity"]:
         """Automatically discover variables from the calling scope using centralized service."""
         # Skip if auto-evaluation is disabled
@@ -194,13 +260,14 @@ OperandType = Expression | FieldQuantity | Quantity | int | float
 class VariableReference(Expression):
     """Reference to a variable in an expression with performance optimizations."""
 
-    __slots__ = ("variable", "_cached_name", "_last_symbol")
+    __slots__ = ("variable", "_cached_name", "_last_symbol", "_inferred_dim")
 
     def __init__(self, variable: "FieldQuantity"):
         self.variable = variable
         # Cache the name resolution to avoid repeated lookups
         self._cached_name = None
         self._last_symbol = None
+        self._inferred_dim = _UNINFERRED
 
     @property
     def name(self) -> str:
@@ -253,6 +320,9 @@ class VariableReference(Expression):
     def get_variables(self) -> set[str]:
         return {self.name}
 
+    def _infer_dimension(self) -> Dimension | None:
+        return getattr(self.variable, "dim", None)
+
     def simplify(self) -> "Expression":
         return self
 
@@ -263,10 +333,11 @@ class VariableReference(Expression):
 class Constant(Expression):
     """Constant value in an expression."""
 
-    __slots__ = ("value",)
+    __slots__ = ("value", "_inferred_dim")
 
     def __init__(self, value: "Quantity"):
         self.value = value
+        self._inferred_dim = _UNINFERRED
 
     def evaluate(self, variable_values: dict[str, "FieldQuantity"]) -> "Quantity":
         del variable_values  # Suppress unused variable warning
@@ -275,6 +346,12 @@ class Constant(Expression):
     def get_variables(self) -> set[str]:
         return set()
 
+    def _infer_dimension(self) -> Dimension | None:
+        dimension = getattr(self.value, "dim", None)
+        if dimension is not None and dimension.is_dimensionless() and getattr(self.value, "value", None) == 0:
+            return None  # A bare 0 stands in for zero of any dimension (e.g. an unused match branch)
+        return dimension
+
     def simplify(self) -> "Expression":
         return self
 
@@ -285,7 +362,7 @@ class Constant(Expression):
 class BinaryOperation(Expression):
     """Binary operation between two expressions."""
 
-    __slots__ = ("operator", "left", "right")
+    __slots__ = ("operator", "left", "right", "_inferred_dim")
 
     # Operator dispatch table for better performance
     _ARITHMETIC_OPS = {"+", "-", "*", "/", "**"}
@@ -295,32 +372,21 @@ class BinaryOperation(Expression):
         self.operator = operator
         self.left = left
         self.right = right
+        self._inferred_dim = _UNINFERRED
 
     def evaluate(self, variable_values: dict[str, "FieldQuantity"]) -> "Quantity":
-        """Evaluate the binary operation with caching and error handling."""
+        """Evaluate the binary operation with error handling."""
         try:
-            return self._evaluate_with_caching(variable_values)
+            left_val, right_val = self._evaluate_operands(variable_values)
+            dimension = self._inferred_dim
+            if (self.operator == "*" or self.operator == "/") and dimension is not _UNINFERRED and dimension is not None and _has_valid_value(left_val) and _has_valid_value(right_val):
+                # Both operand dimensions are known statically, so only the values need combining
+                value = left_val.value * right_val.value if self.operator == "*" else left_val.value / right_val.value
+                return Quantity(name=f"{value}", dim=dimension, value=value)
+            return self._dispatch_operation(left_val, right_val)
         except Exception as e:
             return self._handle_evaluation_error(e)
 
-    def _evaluate_with_caching(self, variable_values: dict[str, "FieldQuantity"]) -> "Quantity":
-        """Core evaluation logic with caching support."""
-        # Check cache for constant expressions
-        cached_result = self._try_get_cached_result()
-        if cached_result is not None:
-            return cached_result
-
-        # Evaluate operands
-        left_val, right_val = self._evaluate_operands(variable_values)
-
-        # Dispatch operation
-        result = self._dispatch_operation(left_val, right_val)
-
-        # Cache result for constant expressions
-        self._try_cache_result(result)
-
-        return result
-
     def _evaluate_operands(self, variable_values: dict[str, "FieldQuantity"]) -> tuple["Quantity", "Quantity"]:
         """Evaluate both operands and return as tuple."""
         left_val = self.left.evaluate(variable_values)
@@ -341,28 +407,6 @@ class BinaryOperation(Expression):
             raise
         raise ValueError(f"Error evaluating binary operation '{self}': {error}") from error
 
-    def _try_get_cached_result(self) -> "Quantity | None":
-        """Attempt to retrieve a cached result for constant expressions."""
-        if not self._is_constant_expression():
-            return None
-
-        cache_manager = get_cache_manager()
-        cache_key = self._generate_cache_key()
-        return cache_manager.get_expression_result(cache_key)
-
-    def _try_cache_result(self, result: "Quantity") -> None:
-        """Attempt to cache the result for constant expressions."""
-        if not self._is_constant_expression():
-            return
-
-        cache_manager = get_cache_manager()
-        cache_key = self._generate_cache_key()
-        cache_manager.cache_expression_result(cache_key, result)
-
-    def _is_constant_expression(self) -> bool:
-        """Check if both operands are constants."""
-        return _is_constant_fast(self.left) and _is_constant_fast(self.right)
-
     def _is_dimensionless(self, quantity) -> bool:
         """Check if a quantity is dimensionless."""
         return _DimensionUtils.is_dimensionless(quantity)
@@ -380,13 +424,6 @@ class BinaryOperation(Expression):
         """Get the effective unit for a quantity, handling both old and new Quantity objects."""
         return _DimensionUtils.get_effective_unit(quantity)
 
-    def _generate_cache_key(self) -> str:
-        """Generate a cache key for constant expressions."""
-        # Safe to cast since _is_constant_expression() already verified types
-        left_const = self.left
-        right_const = self.right
-        return f"{id(self)}_{self.operator}_{id(left_const.value)}_{id(right_const.value)}"  # type: ignore[attr-defined]
-
     def _dispatch_operation(self, left_val: "Quantity", right_val: "Quantity") -> "Quantity":
         """Dispatch to the appropriate operation handler with fast lookup."""
         # Ultra-fast path: delegate to Quantity arithmetic when both operands are concrete
@@ -563,6 +600,47 @@ class BinaryOperation(Expression):
     def get_variables(self) -> set[str]:
         return self.left.get_variables() | self.right.get_variables()
 
+    def _infer_dimension(self) -> Dimension | None:
+        left_dim = _infer_operand_dimension(self.left)
+        right_dim = _infer_operand_dimension(self.right)
+        operator = self.operator
+
+        if operator in ("+", "-"):
+            if left_dim is not None and right_dim is not None and left_dim != right_dim:
+                action = "addition" if operator == "+" else "subtraction"
+                raise DimensionMismatchError(
+                    f"Dimension mismatch in {action} '{self}': {_describe_dimension(left_dim)} and {_describe_dimension(right_dim)}", str(self)
+                )
+            return left_dim if left_dim is not None else right_dim
+        if operator == "*":
+            return None if left_dim is None or right_dim is None else left_dim * right_dim
+        if operator == "/":
+            return None if left_dim is None or right_dim is None else left_dim / right_dim
+        if operator == "**":
+            return self._infer_power_dimension(left_dim, right_dim)
+        if operator in self._COMPARISON_OPS:
+            # Comparing against a dimensionless value is allowed when that value is zero,
+            # which is only known at evaluation time
+            if left_dim is not None and right_dim is not None and left_dim != right_dim and not (left_dim.is_dimensionless() or right_dim.is_dimensionless()):
+                raise DimensionMismatchError(
+                    f"Dimension mismatch in comparison '{self}': {_describe_dimension(left_dim)} and {_describe_dimension(right_dim)}", str(self)
+                )
+            return DIMENSIONLESS
+        return None
+
+    def _infer_power_dimension(self, base_dim: Dimension | None, exponent_dim: Dimension | None) -> Dimension | None:
+        """Dimension of ``left ** right``; only a constant integer exponent scales a dimensional base."""
+        if exponent_dim is not None and not exponent_dim.is_dimensionless():
+            raise DimensionMismatchError(f"Dimension mismatch in power '{self}': exponent has dimension {_describe_dimension(exponent_dim)}", str(self))
+        if base_dim is None or base_dim.is_dimensionless():
+            return base_dim
+        if type(self.right) is not Constant:
+            return None
+        exponent = getattr(self.right.value, "value", None)
+        if not isinstance(exponent, int | float) or exponent != int(exponent):
+            return None
+        return base_dim ** int(exponent)
+
     def simplify(self) -> Expression:
         """Simplify the binary operation with optimized constant folding."""
         left_simplified = self.left.simplify()
@@ -594,11 +672,12 @@ class BinaryOperation(Expression):
 class UnaryFunction(Expression):
     """Unary mathematical function expression."""
 
-    __slots__ = ("function_name", "operand")
+    __slots__ = ("function_name", "operand", "_inferred_dim")
 
     def __init__(self, function_name: str, operand: Expression):
         self.function_name = function_name
         self.operand = operand
+        self._inferred_dim = _UNINFERRED
 
     def evaluate(self, variable_values: dict[str, "FieldQuantity"]) -> "Quantity":
         operand_val = self.operand.evaluate(variable_values)
@@ -641,6 +720,14 @@ class UnaryFunction(Expression):
     def get_variables(self) -> set[str]:
         return self.operand.get_variables()
 
+    def _infer_dimension(self) -> Dimension | None:
+        operand_dim = _infer_operand_dimension(self.operand)
+        if self.function_name == "abs":
+            return operand_dim
+        if self.function_name == "sqrt":
+            return None if operand_dim is None else _dimension_sqrt(operand_dim)
+        return DIMENSIONLESS
+
     def simplify(self) -> Expression:
         simplified_operand = self.operand.simplify()
         if _is_constant_fast(simplified_operand):
@@ -669,12 +756,13 @@ class UnaryFunction(Expression):
 class ConditionalExpression(Expression):
     """Conditional expression: if condition then true_expr else false_expr."""
 
-    __slots__ = ("condition", "true_expr", "false_expr")
+    __slots__ = ("condition", "true_expr", "false_expr", "_inferred_dim")
 
     def __init__(self, condition: Expression, true_expr: Expression, false_expr: Expression):
         self.condition = condition
         self.true_expr = true_expr
         self.false_expr = false_expr
+        self._inferred_dim = _UNINFERRED
 
     def evaluate(self, variable_values: dict[str, "FieldQuantity"]) -> "Quantity":
         condition_val = self.condition.evaluate(variable_values)
@@ -689,6 +777,10 @@ class ConditionalExpression(Expression):
     def get_variables(self) -> set[str]:
         return self.condition.get_variables() | self.true_expr.get_variables() | self.false_expr.get_variables()
 
+    def _infer_dimension(self) -> Dimension | None:
+        _infer_operand_dimension(self.condition)
+        return _common_branch_dimension((self.true_expr, self.false_expr))
+
     def simplify(self) -> Expression:
         simplified_condition = self.condition.simplify()
         simplified_true = self.true_expr.simplify()
@@ -725,7 +817,7 @@ class MatchExpression(Expression):
     }
     """
 
-    __slots__ = ("select_var", "cases", "_select_var_symbol")
+    __slots__ = ("select_var", "cases", "_select_var_symbol", "_inferred_dim")
 
     def __init__(self, select_var, cases: dict):
         """
@@ -737,6 +829,7 @@ class MatchExpression(Expression):
         self.cases = cases
         # Cache the symbol to avoid repeated lookups
         self._select_var_symbol = getattr(select_var, "symbol", str(select_var))
+        self._inferred_dim = _UNINFERRED
 
     def evaluate(self, variable_values: dict[str, "FieldQuantity"]) -> "Quantity":
         # Get the current value of the select variable
@@ -758,6 +851,9 @@ class MatchExpression(Expression):
             variables.update(expr.get_variables())
         return variables
 
+    def _infer_dimension(self) -> Dimension | None:
+        return _common_branch_dimension(tuple(self.cases.values()))
+
     def simplify(self) -> Expression:
         # Simplify all case expressions
         simplified_cases = {key: expr.simplify() for key, expr in self.cases.items()}
@@ -773,6 +869,320 @@ class MatchExpression(Expression):
         return ExpressionFormatter.format_match_expression(self)  # type: ignore[arg-type]
 
 
+class TermSlot(Expression):
+    """
+    Placeholder for a per-term constant in a summation template.
+
+    Summation replaces the constants of structurally identical terms with slots
+    so that one compiled template evaluates every term from a column of values.
+    """
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: str):
+        self.key = key
+
+    def evaluate(self, variable_values: dict[str, "FieldQuantity"]) -> "Quantity":
+        raise ValueError(f"Summation slot '{self.key}' can only be evaluated through a compiled template")
+
+    def get_variables(self) -> set[str]:
+        return set()
+
+    def simplify(self) -> "Expression":
+        return self
+
+    def __str__(self) -> str:
+        return f"<{self.key}>"
+
+
+class SummationGroup:
+    """Terms of a summation that share one structure, differing only in their constants."""
+
+    __slots__ = ("signature", "template", "representative", "columns", "count")
+
+    def __init__(self, signature: str, template: Expression, representative: Expression, columns: dict[str, np.ndarray], count: int):
+        self.signature = signature
+        self.template = template
+        self.representative = representative
+        self.columns = columns
+        self.count = count
+
+
+class Summation(Expression):
+    """
+    Lazy sum of terms generated over a grid of integer indices.
+
+    Instead of expanding every term into a chain of BinaryOperation nodes, the
+    node keeps the generator, its index ranges and captured arguments. On first
+    use the terms are generated once and grouped by structure; each group keeps
+    a single template whose constants (coefficients such as ``M[i, j]`` and
+    exponents such as ``i``) become columns of a NumPy array. Evaluation then
+    computes every group with one vectorized pass and reduces it. Terms that
+    cannot be templated are summed one at a time by streaming the generator.
+    """
+
+    __slots__ = ("term_generator", "ranges", "kwargs", "term_transform", "_groups", "_variables", "_dim", "_planned", "_compiled", "_inferred_dim")
+
+    # Above this many distinct term structures the grouping buys nothing over streaming
+    MAX_GROUPS = 64
+
+    # Attributes that determine the terms; assigning any of them discards the plan
+    _TERM_ATTRIBUTES = frozenset(("term_generator", "ranges", "kwargs", "term_transform"))
+
+    def __init__(
+        self,
+        term_generator: Callable[..., object],
+        ranges: list[range],
+        kwargs: dict | None = None,
+        term_transform: Callable[[Expression], Expression] | None = None,
+    ):
+        self.term_generator = term_generator
+        self.ranges = list(ranges)
+        self.kwargs = kwargs or {}
+        self.term_transform = term_transform
+
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        if name in Summation._TERM_ATTRIBUTES:
+            self._reset_plan()
+
+    def _reset_plan(self) -> None:
+        """Forget the term groups, variables, dimension and compiled closures."""
+        self._groups: list[SummationGroup] | None = None
+        self._variables: set[str] | None = None
+        self._dim = None
+        self._planned = False
+        self._compiled: dict[str, Callable] = {}
+        self._inferred_dim = _UNINFERRED
+
+    @property
+    def term_count(self) -> int:
+        """Number of terms in the summation."""
+        return math.prod(len(r) for r in self.ranges)
+
+    def iter_terms(self):
+        """Generate the terms one at a time."""
+        for indices in itertools.product(*self.ranges):
+            term = self.term_generator(*indices, **self.kwargs) if self.kwargs else self.term_generator(*indices)
+            term = wrap_operand(term)
+            if self.term_transform is not None:
+                term = self.term_transform(term)
+            yield term
+
+    def map_terms(self, transform: Callable[[Expression], Expression]) -> "Summation":
+        """
+        Return a summation whose generated terms are passed through ``transform``.
+
+        Used by tree rewrites (reference fixing, namespacing) that cannot reach
+        into the generator itself.
+        """
+        previous = self.term_transform
+        composed = transform if previous is None else (lambda term: transform(previous(term)))
+        # A new node, so the terms are planned and compiled afresh
+        return Summation(self.term_generator, self.ranges, self.kwargs, composed)
+
+    def groups(self) -> list[SummationGroup] | None:
+        """Structure groups of the terms, or None when the terms cannot be templated."""
+        if not self._planned:
+            self._plan()
+        return self._groups
+
+    def _plan(self) -> None:
+        """Generate the terms once, grouping them by structure and collecting their variables."""
+        self._planned = True
+        variables: set[str] = set()
+        groups: dict[str, tuple[Expression, Expression, list[list[float]]]] = {}
+        templated = True
+
+        for term in self.iter_terms():
+            variables |= term.get_variables()
+            if not templated:
+                continue
+            constants: list[float] = []
+            signature: list[str] = []
+            try:
+                template = _extract_term_slots(term, constants, signature)
+            except (TypeError, ValueError):
+                templated = False
+                continue
+            key = " ".join(signature)
+            group = groups.get(key)
+            if group is None:
+                if len(groups) >= self.MAX_GROUPS:
+                    templated = False
+                    continue
+                group = groups[key] = (template, term, [])
+            group[2].append(constants)
+
+        self._variables = variables
+        if not templated:
+            self._groups = None
+            return
+
+        self._groups = []
+        for signature, (template, representative, rows) in groups.items():
+            values = np.asarray(rows, dtype=float).reshape(len(rows), -1)
+            columns = {f"__slot{index}": values[:, index] for index in range(values.shape[1])}
+            self._groups.append(SummationGroup(signature, template, representative, columns, len(rows)))
+
+    def evaluate(self, variable_values: dict[str, "FieldQuantity"]) -> "Quantity":
+        groups = self.groups()
+        if groups is not None:
+            values = {}
+            for symbol in self.get_variables():
+                var = variable_values.get(symbol)
+                value = getattr(var, "value", None)
+                if value is None:
+                    break
+                values[symbol] = value
+            else:
+                total = self._evaluate_groups(groups, values, variable_values)
+                if total is not None:
+                    return total
+        return self._evaluate_streaming(variable_values)
+
+    def _evaluate_groups(self, groups: list[SummationGroup], values: dict[str, float], variable_values: dict[str, "FieldQuantity"]) -> "Quantity | None":
+        """Vectorized evaluation; None when a term is invalid so streaming can report the error."""
+        from .compiler import CompilationError, compile_summation
+
+        try:
+            total = compile_summation(self)(values)
+        except (CompilationError, ValueError, KeyError):
+            return None
+
+        if self._dim is None:
+            self._dim = self.infer_dimension() or self._result_dimension(groups, variable_values)
+
+        from ..core.unit import ureg
+
+        return Quantity(name="summation", dim=self._dim, value=total, preferred=ureg.si_unit_for(self._dim))
+
+    def _result_dimension(self, groups: list[SummationGroup], variable_values: dict[str, "FieldQuantity"]):
+        """Dimension of the sum; every group must agree (checked once, as in a chain of additions)."""
+        dim = None
+        for group in groups:
+            group_dim = group.representative.evaluate(variable_values).dim
+            if dim is not None and group_dim != dim:
+                raise ValueError(f"Cannot add quantities with different dimensions in summation: {dim} and {group_dim}")
+            dim = group_dim
+        return dim
+
+    def _evaluate_streaming(self, variable_values: dict[str, "FieldQuantity"]) -> "Quantity":
+        """Accumulate the terms one at a time without building an expression chain."""
+        total = None
+        for term in self.iter_terms():
+            value = term.evaluate(variable_values)
+            total = value if total is None else total + value
+        if total is None:
+            raise ValueError("Summation has no terms")
+        return total
+
+    def get_variables(self) -> set[str]:
+        if not self._planned:
+            self._plan()
+        return set(self._variables or ())
+
+    def _infer_dimension(self) -> Dimension | None:
+        groups = self.groups()
+        if groups is None:
+            # Untemplated terms are only checked when they are added up
+            return _infer_operand_dimension(next(self.iter_terms(), None))
+        dimension = None
+        for group in groups:
+            group_dim = group.representative.infer_dimension()
+            if dimension is not None and group_dim is not None and group_dim != dimension:
+                raise DimensionMismatchError(
+                    f"Dimension mismatch in summation '{self}': terms have {_describe_dimension(dimension)} and {_describe_dimension(group_dim)}", str(group.representative)
+                )
+            if dimension is None:
+                dimension = group_dim
+        return dimension
+
+    def simplify(self) -> "Expression":
+        return self
+
+    def __str__(self) -> str:
+        terms = self.iter_terms()
+        first = next(terms)
+        if self.term_count == 1:
+            return str(first)
+        return f"sum({first} + ... {self.term_count} terms)"
+
+
+def _infer_operand_dimension(operand) -> Dimension | None:
+    """Inferred dimension of an operand that may not be an Expression (e.g. a delayed expression)."""
+    if isinstance(operand, Expression):
+        return operand.infer_dimension()
+    return None
+
+
+def _common_branch_dimension(branches: tuple) -> Dimension | None:
+    """
+    Dimension shared by alternative branches of a node.
+
+    Only the taken branch is evaluated, so branches that disagree are not an
+    error; the node's dimension is then unknown.
+    """
+    common = None
+    for branch in branches:
+        branch_dim = _infer_operand_dimension(branch)
+        if branch_dim is None:
+            continue
+        if common is not None and branch_dim != common:
+            return None
+        common = branch_dim
+    return common
+
+
+def _extract_term_slots(expr: Expression, constants: list[float], signature: list[str]) -> Expression:
+    """
+    Copy a term with its constants replaced by TermSlot placeholders.
+
+    Args:
+        expr: Term to templatize
+        constants: Receives the SI value of each replaced constant, in slot order
+        signature: Receives structural tokens; terms with equal signatures share a template
+
+    Raises:
+        TypeError: If the term contains a node that cannot be templated
+    """
+    node_type = type(expr)
+
+    if node_type is Constant:
+        value = getattr(expr.value, "value", None)
+        if value is None:
+            raise TypeError(f"Constant without value: {expr}")
+        dim = getattr(expr.value, "dim", None)
+        signature.append(f"c{tuple(dim.exps) if dim is not None else ()}")
+        constants.append(float(value))
+        return TermSlot(f"__slot{len(constants) - 1}")
+
+    if node_type is VariableReference:
+        signature.append(f"v:{expr.name}")
+        return expr
+
+    if node_type is BinaryOperation:
+        signature.append(f"({expr.operator}")
+        left = _extract_term_slots(expr.left, constants, signature)
+        right = _extract_term_slots(expr.right, constants, signature)
+        signature.append(")")
+        return BinaryOperation(expr.operator, left, right)
+
+    if node_type is UnaryFunction:
+        signature.append(f"({expr.function_name}")
+        operand = _extract_term_slots(expr.operand, constants, signature)
+        signature.append(")")
+        return UnaryFunction(expr.function_name, operand)
+
+    if node_type is ConditionalExpression:
+        signature.append("(if")
+        parts = [_extract_term_slots(part, constants, signature) for part in (expr.condition, expr.true_expr, expr.false_expr)]
+        signature.append(")")
+        return ConditionalExpression(*parts)
+
+    raise TypeError(f"Cannot template summation term of type {node_type.__name__}")
+
+
 # Utility functions for expression creation
 
 # Cache for common types to avoid repeated type checks
@@ -956,7 +1366,7 @@ def wrap_operand(operand: "OperandType") -> Expression:
 # Register expression and variable types with the TypeRegistry for optimal performance
 
 # Register expression types
-for expr_type in [Expression, BinaryOperation, VariableReference, Constant, UnaryFunction, ConditionalExpression, MatchExpression]:
+for expr_type in [Expression, BinaryOperation, VariableReference, Constant, UnaryFunction, ConditionalExpression, MatchExpression, Summation]:
     register_expression_type(expr_type)
 
 # Register variable types - do this at module level to ensure it happens early
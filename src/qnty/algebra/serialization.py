@@ -0,0 +1,463 @@
+"""
+Expression Serialization
+========================
+
+Compact, versioned, pickle-free binary format for expression trees and
+equations, so compiled artifacts can be shipped to worker processes or stored
+on disk and loaded without rebuilding a Problem.
+
+Layout (little-endian)::
+
+    header      magic b"QNTX", format version (u16), payload kind (u8)
+    strings     count (u16), then per entry: length (u16) + UTF-8 bytes
+    dimensions  count (u16), then per entry: 7 base exponents (i8)
+    units       count (u16), then per entry: name, symbol (string index),
+                dimension index, SI factor and offset (f64)
+    variables   count (u16), then per entry: symbol, name, dimension, unit,
+                flags (u8), value, search range low/high (f64)
+    body        payload of the given kind (prefix-order node stream)
+
+Symbols, operators, function names, dimensions and units are written once in
+their table and referenced by index; constants are stored as raw float64 SI
+values. Every variable reference to the same symbol loads as a reference to
+one shared placeholder Quantity carrying the symbol, dimension, preferred
+unit, value and search range it was written with.
+
+A ``match`` on a select variable is written as the branch currently selected,
+and a summation as the list of its generated terms (it loads as a summation
+over that list, so it still compiles as one vectorized reduction).
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from collections.abc import Iterable
+
+from ..core.dimension import BACKEND, N_BASE, Dimension
+from ..core.quantity import Quantity
+from ..core.unit import Unit, ureg
+from .equation import Equation
+from .nodes import BinaryOperation, ConditionalExpression, Constant, Expression, MatchExpression, Summation, UnaryFunction, VariableReference
+
+FORMAT_MAGIC = b"QNTX"
+
+# Bump when the layout changes; payloads written by other versions are rejected
+FORMAT_VERSION = 1
+
+# Payload kinds
+KIND_EXPRESSION = 1
+KIND_EQUATIONS = 2
+KIND_SOLVE_PLAN = 3
+
+# Node opcodes
+_OP_VARIABLE = 0
+_OP_CONSTANT = 1
+_OP_BINARY = 2
+_OP_UNARY = 3
+_OP_CONDITIONAL = 4
+_OP_SUMMATION = 5
+
+# Table index meaning "absent" (e.g. a variable without a preferred unit)
+_NONE = 0xFFFF
+_MAX_TABLE_SIZE = _NONE
+
+# Variable flags
+_HAS_VALUE = 1
+_HAS_RANGE = 2
+
+_HEADER = struct.Struct("<4sHB")
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_DIMENSION = struct.Struct(f"<{N_BASE}b")
+_UNIT = struct.Struct("<HHHdd")
+_VARIABLE = struct.Struct("<HHHHBddd")
+_CONSTANT = struct.Struct("<dHH")
+
+
+class SerializationError(ValueError):
+    """Raised when an object cannot be written or a payload cannot be read."""
+
+
+class _Table:
+    """Insertion-ordered index of table entries."""
+
+    __slots__ = ("entries", "index")
+
+    def __init__(self):
+        self.entries: list = []
+        self.index: dict = {}
+
+    def add(self, key, entry=None) -> int:
+        position = self.index.get(key)
+        if position is None:
+            position = len(self.entries)
+            if position >= _MAX_TABLE_SIZE:
+                raise SerializationError(f"Too many table entries (limit {_MAX_TABLE_SIZE})")
+            self.index[key] = position
+            self.entries.append(key if entry is None else entry)
+        return position
+
+
+class Encoder:
+    """
+    Writes expressions, equations and plain integers into one payload.
+
+    Tables are filled while the body is written and emitted ahead of it by
+    ``to_bytes``.
+
+    Example:
+        >>> encoder = Encoder()
+        >>> encoder.expression(expr)
+        >>> data = encoder.to_bytes(KIND_EXPRESSION)
+    """
+
+    def __init__(self):
+        self._strings = _Table()
+        self._dimensions = _Table()
+        self._units = _Table()
+        self._variables = _Table()
+        self._body: list[bytes] = []
+
+    # ---- Tables ----
+    def string(self, value: str) -> int:
+        """Index of a string in the string table."""
+        return self._strings.add(value)
+
+    def dimension(self, dim: Dimension) -> int:
+        """Index of a dimension in the dimension table."""
+        return self._dimensions.add(tuple(dim.exps))
+
+    def unit(self, unit: Unit | None) -> int:
+        """Index of a unit in the unit table (``_NONE`` for no unit)."""
+        if unit is None:
+            return _NONE
+        key = (unit.name, unit.symbol, tuple(unit.dim.exps), unit.si_factor, unit.si_offset)
+        entry = (self.string(unit.name), self.string(unit.symbol), self.dimension(unit.dim), float(unit.si_factor), float(unit.si_offset))
+        return self._units.add(key, entry)
+
+    def variable(self, symbol: str, quantity: Quantity) -> int:
+        """Index of a variable; the first quantity written for a symbol describes it."""
+        position = self._variables.index.get(symbol)
+        if position is not None:
+            return position
+        value = quantity.value
+        search_range = getattr(quantity, "_search_range", None)
+        flags = (_HAS_VALUE if value is not None else 0) | (_HAS_RANGE if search_range is not None else 0)
+        low, high = search_range if search_range is not None else (0.0, 0.0)
+        entry = (
+            self.string(symbol),
+            self.string(quantity.name),
+            self.dimension(quantity.dim),
+            self.unit(quantity.preferred),
+            flags,
+            float(value) if value is not None else 0.0,
+            float(low),
+            float(high),
+        )
+        return self._variables.add(symbol, entry)
+
+    # ---- Body ----
+    def uint(self, value: int) -> None:
+        """Write an unsigned 32-bit integer."""
+        self._body.append(_U32.pack(value))
+
+    def name(self, value: str) -> None:
+        """Write a string as its table index."""
+        self._body.append(_U16.pack(self.string(value)))
+
+    def expression(self, expr: Expression) -> None:
+        """
+        Write an expression tree in prefix order.
+
+        Raises:
+            SerializationError: For nodes without a portable form (a match on an
+                unselected option, summation terms that cannot be generated, or
+                unknown node types)
+        """
+        body = self._body
+        node_type = type(expr)
+
+        if node_type is VariableReference:
+            body.append(_U8.pack(_OP_VARIABLE) + _U16.pack(self.variable(expr.name, expr.variable)))
+        elif node_type is Constant:
+            value = expr.value
+            body.append(_U8.pack(_OP_CONSTANT) + _CONSTANT.pack(float(value.value), self.dimension(value.dim), self.unit(value.preferred)))
+        elif node_type is BinaryOperation:
+            body.append(_U8.pack(_OP_BINARY) + _U16.pack(self.string(expr.operator)))
+            self.expression(expr.left)
+            self.expression(expr.right)
+        elif node_type is UnaryFunction:
+            body.append(_U8.pack(_OP_UNARY) + _U16.pack(self.string(expr.function_name)))
+            self.expression(expr.operand)
+        elif node_type is ConditionalExpression:
+            body.append(_U8.pack(_OP_CONDITIONAL))
+            self.expression(expr.condition)
+            self.expression(expr.true_expr)
+            self.expression(expr.false_expr)
+        elif node_type is MatchExpression:
+            selected = getattr(expr.select_var, "value", None)
+            if selected is None or selected not in expr.cases:
+                raise SerializationError(f"Match on '{expr._select_var_symbol}' has no selected case to serialize")
+            self.expression(expr.cases[selected])
+        elif node_type is Summation:
+            try:
+                terms = list(expr.iter_terms())
+            except Exception as e:
+                raise SerializationError(f"Summation terms cannot be generated: {e}") from e
+            body.append(_U8.pack(_OP_SUMMATION) + _U32.pack(len(terms)))
+            for term in terms:
+                self.expression(term)
+        else:
+            raise SerializationError(f"Cannot serialize expression node {node_type.__name__}")
+
+    def equation(self, equation: Equation) -> None:
+        """Write an equation as its name and both sides."""
+        if not isinstance(equation.rhs, Expression):
+            raise SerializationError(f"Equation '{equation.name}' has an unresolved right-hand side")
+        if equation._dimension_error is not None:
+            raise SerializationError(f"Equation '{equation.name}' is dimensionally inconsistent: {equation._dimension_error}")
+        self.name(equation.name)
+        self.expression(equation.lhs)
+        self.expression(equation.rhs)
+
+    def equations(self, equations: Iterable[Equation]) -> None:
+        """Write a counted list of equations."""
+        equations = list(equations)
+        self.uint(len(equations))
+        for equation in equations:
+            self.equation(equation)
+
+    # ---- Output ----
+    def to_bytes(self, kind: int) -> bytes:
+        """Assemble header, tables and body into one payload."""
+        parts = [_HEADER.pack(FORMAT_MAGIC, FORMAT_VERSION, kind)]
+
+        parts.append(_U16.pack(len(self._strings.entries)))
+        for value in self._strings.entries:
+            encoded = value.encode("utf-8")
+            if len(encoded) > 0xFFFF:
+                raise SerializationError("String too long to serialize")
+            parts.append(_U16.pack(len(encoded)) + encoded)
+
+        parts.append(_U16.pack(len(self._dimensions.entries)))
+        parts.extend(_DIMENSION.pack(*exps) for exps in self._dimensions.entries)
+
+        parts.append(_U16.pack(len(self._units.entries)))
+        parts.extend(_UNIT.pack(*entry) for entry in self._units.entries)
+
+        parts.append(_U16.pack(len(self._variables.entries)))
+        parts.extend(_VARIABLE.pack(*entry) for entry in self._variables.entries)
+
+        parts.extend(self._body)
+        return b"".join(parts)
+
+
+class Decoder:
+    """
+    Reads a payload written by ``Encoder``.
+
+    The header and tables are read on construction; the body is consumed by
+    calling the reader methods in the order the values were written.
+
+    Raises:
+        SerializationError: If the payload is not in this format, has another
+            version or kind, or is truncated
+    """
+
+    def __init__(self, data: bytes, kind: int):
+        self._data = memoryview(data)
+        self._offset = 0
+        try:
+            magic, version, found_kind = self._unpack(_HEADER)
+            if magic != FORMAT_MAGIC:
+                raise SerializationError("Not a qnty expression payload")
+            if version != FORMAT_VERSION:
+                raise SerializationError(f"Unsupported format version {version} (expected {FORMAT_VERSION})")
+            if found_kind != kind:
+                raise SerializationError(f"Payload holds kind {found_kind}, expected {kind}")
+            self._read_tables()
+        except struct.error as e:
+            raise SerializationError(f"Truncated payload: {e}") from e
+
+    @property
+    def variables(self) -> dict[str, Quantity]:
+        """Placeholder quantities of every variable in the payload, keyed by symbol."""
+        return {quantity.symbol: quantity for quantity in self._variables}
+
+    def _unpack(self, layout: struct.Struct) -> tuple:
+        values = layout.unpack_from(self._data, self._offset)
+        self._offset += layout.size
+        return values
+
+    def _read_tables(self) -> None:
+        (count,) = self._unpack(_U16)
+        strings = []
+        for _ in range(count):
+            (length,) = self._unpack(_U16)
+            end = self._offset + length
+            if end > len(self._data):
+                raise SerializationError("Truncated payload: string table")
+            strings.append(str(self._data[self._offset : end], "utf-8"))
+            self._offset = end
+        self._strings = strings
+
+        (count,) = self._unpack(_U16)
+        dimensions = []
+        for _ in range(count):
+            exps = self._unpack(_DIMENSION)
+            dimensions.append(Dimension(exps, BACKEND.encode(exps)))
+        self._dimensions = dimensions
+
+        (count,) = self._unpack(_U16)
+        units = []
+        for _ in range(count):
+            name, symbol, dim, si_factor, si_offset = self._unpack(_UNIT)
+            units.append(_restore_unit(strings[name], strings[symbol], dimensions[dim], si_factor, si_offset))
+        self._units = units
+
+        (count,) = self._unpack(_U16)
+        variables = []
+        for _ in range(count):
+            symbol, name, dim, unit, flags, value, low, high = self._unpack(_VARIABLE)
+            quantity = Quantity(
+                name=strings[name],
+                dim=dimensions[dim],
+                value=value if flags & _HAS_VALUE else None,
+                preferred=None if unit == _NONE else units[unit],
+                _symbol=strings[symbol],
+                _search_range=(low, high) if flags & _HAS_RANGE else None,
+            )
+            variables.append(quantity)
+        self._variables = variables
+
+    def uint(self) -> int:
+        """Read an unsigned 32-bit integer."""
+        try:
+            return self._unpack(_U32)[0]
+        except struct.error as e:
+            raise SerializationError(f"Truncated payload: {e}") from e
+
+    def name(self) -> str:
+        """Read a string written by ``Encoder.name``."""
+        try:
+            return self._strings[self._unpack(_U16)[0]]
+        except (struct.error, IndexError) as e:
+            raise SerializationError(f"Corrupt payload: {e}") from e
+
+    def variable(self, index: int) -> Quantity:
+        """Placeholder quantity of the variable at a table index."""
+        return self._variables[index]
+
+    def expression(self) -> Expression:
+        """Read one expression tree."""
+        try:
+            return self._read_node()
+        except (struct.error, IndexError, RecursionError) as e:
+            raise SerializationError(f"Corrupt payload: {e}") from e
+
+    def _read_node(self) -> Expression:
+        data = self._data
+        opcode = data[self._offset]
+        self._offset += 1
+
+        if opcode == _OP_VARIABLE:
+            (index,) = self._unpack(_U16)
+            return VariableReference(self._variables[index])
+        if opcode == _OP_CONSTANT:
+            value, dim, unit = self._unpack(_CONSTANT)
+            return Constant(Quantity(name=repr(value), dim=self._dimensions[dim], value=value, preferred=None if unit == _NONE else self._units[unit]))
+        if opcode == _OP_BINARY:
+            (operator,) = self._unpack(_U16)
+            left = self._read_node()
+            return BinaryOperation(self._strings[operator], left, self._read_node())
+        if opcode == _OP_UNARY:
+            (function,) = self._unpack(_U16)
+            return UnaryFunction(self._strings[function], self._read_node())
+        if opcode == _OP_CONDITIONAL:
+            condition = self._read_node()
+            true_expr = self._read_node()
+            return ConditionalExpression(condition, true_expr, self._read_node())
+        if opcode == _OP_SUMMATION:
+            (count,) = self._unpack(_U32)
+            terms = [self._read_node() for _ in range(count)]
+            return Summation(terms.__getitem__, [range(count)])
+        raise SerializationError(f"Unknown opcode {opcode} at offset {self._offset - 1}")
+
+    def equation(self) -> Equation:
+        """Read one equation."""
+        name = self.name()
+        lhs = self.expression()
+        return Equation.restore(name, lhs, self.expression())
+
+    def equations(self) -> list[Equation]:
+        """Read a counted list of equations."""
+        return [self.equation() for _ in range(self.uint())]
+
+    def finish(self) -> None:
+        """Check that the whole payload was consumed."""
+        if self._offset != len(self._data):
+            raise SerializationError(f"{len(self._data) - self._offset} trailing bytes after payload")
+
+
+def _restore_unit(name: str, symbol: str, dim: Dimension, si_factor: float, si_offset: float) -> Unit:
+    """The registered unit when it matches, otherwise an equivalent unregistered one (e.g. a composed unit)."""
+    unit = ureg.resolve(name, dim=dim) or ureg.resolve(symbol, dim=dim)
+    if unit is not None and math.isclose(unit.si_factor, si_factor, rel_tol=1e-15) and unit.si_offset == si_offset:
+        return unit
+    return Unit(name=name, symbol=symbol, dim=dim, si_factor=si_factor, si_offset=si_offset)
+
+
+# ========== CONVENIENCE FUNCTIONS ==========
+
+
+def dump_expression(expr: Expression) -> bytes:
+    """
+    Serialize an expression tree.
+
+    Example:
+        >>> data = dump_expression(2 * S * t / D)
+        >>> load_expression(data)
+    """
+    encoder = Encoder()
+    encoder.expression(expr)
+    return encoder.to_bytes(KIND_EXPRESSION)
+
+
+def load_expression(data: bytes) -> Expression:
+    """Deserialize an expression written by ``dump_expression``."""
+    decoder = Decoder(data, KIND_EXPRESSION)
+    expr = decoder.expression()
+    decoder.finish()
+    return expr
+
+
+def dump_equations(equations: Iterable[Equation]) -> bytes:
+    """Serialize a list of equations; variables shared between them stay shared on load."""
+    encoder = Encoder()
+    encoder.equations(equations)
+    return encoder.to_bytes(KIND_EQUATIONS)
+
+
+def load_equations(data: bytes) -> list[Equation]:
+    """Deserialize equations written by ``dump_equations``."""
+    decoder = Decoder(data, KIND_EQUATIONS)
+    equations = decoder.equations()
+    decoder.finish()
+    return equations
+
+
+__all__ = [
+    "FORMAT_VERSION",
+    "KIND_EQUATIONS",
+    "KIND_EXPRESSION",
+    "KIND_SOLVE_PLAN",
+    "Decoder",
+    "Encoder",
+    "SerializationError",
+    "dump_equations",
+    "dump_expression",
+    "load_equations",
+    "load_expression",
+]
@@ -32,6 +32,7 @@ class Quantity(Generic[D]):
     preferred: Unit[D] | None = None
     _symbol: str | None = None
     _output_unit: Unit[D] | None = None
+    _search_range: tuple[float, float] | None = None
 
     def __post_init__(self):
         """Auto-detect symbol from variable assignment if not set."""
@@ -180,9 +181,24 @@ class Quantity(Generic[D]):
             unit = resolved
 
         # Create new instance with output unit set, preserving all other attributes
-        new_q = Quantity(name=self.name, dim=self.dim, value=self.value, preferred=self.preferred, _symbol=self._symbol, _output_unit=unit)
+        new_q = Quantity(name=self.name, dim=self.dim, value=self.value, preferred=self.preferred, _symbol=self._symbol, _output_unit=unit, _search_range=self._search_range)
         return new_q
 
+    def search_range(self, lower: float, upper: float, unit: Unit[D] | str | None = None) -> Quantity[D]:
+        """Set the range a numeric solve should search first when this quantity is the unknown."""
+        if unit is None:
+            unit = self.preferred or ureg.si_unit_for(self.dim)
+        elif isinstance(unit, str):
+            resolved = ureg.resolve(unit, dim=self.dim)
+            if resolved is None:
+                raise ValueError(f"Unknown unit '{unit}'")
+            unit = resolved
+
+        bounds = sorted(unit.si_factor * bound + unit.si_offset for bound in (lower, upper)) if unit is not None else sorted((lower, upper))
+        return Quantity(
+            name=self.name, dim=self.dim, value=self.value, preferred=self.preferred, _symbol=self._symbol, _output_unit=self._output_unit, _search_range=(bounds[0], bounds[1])
+        )
+
     def to(self, unit: Unit[D] | str) -> Quantity[D]:
         """Direct conversion method for maximum performance."""
         if isinstance(unit, str):
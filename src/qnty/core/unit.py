@@ -319,6 +319,25 @@ class UnitRegistry:
 ureg = UnitRegistry()
 
 
+def resolve_unit(unit: Unit | str | None, dim: Dimension | None = None) -> Unit | None:
+    """
+    Resolve a unit given by name or symbol; Unit objects and None pass through.
+
+    Args:
+        unit: Unit, unit name/symbol, or None
+        dim: If given, names are only matched against units of this dimension
+
+    Raises:
+        ValueError: If a name does not match any unit (of the given dimension)
+    """
+    if not isinstance(unit, str):
+        return unit
+    resolved = ureg.resolve(unit, dim=dim)
+    if resolved is None:
+        raise ValueError(f"Unknown unit '{unit}'")
+    return resolved
+
+
 # --------------------------
 # Public "u" namespace (dot access to concrete units)
 # --------------------------
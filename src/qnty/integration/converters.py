@@ -54,7 +54,7 @@ def vector_to_dto(
             output_unit = "N"  # Default
 
     # Get coordinates in SI (internal storage)
-    coords_si = vec._coords.copy()
+    coords_si = (vec.u_si, vec.v_si, vec.w_si)
 
     # Convert to output unit
     target_unit = ureg.resolve(output_unit)
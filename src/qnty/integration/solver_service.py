@@ -184,9 +184,9 @@ def _solve_equilibrium(input_dto: ProblemInputDTO) -> SolutionDTO:
 
     if all_known:
         # Verify equilibrium by summing components
-        sum_u = sum(v._coords[0] for v in vectors)
-        sum_v = sum(v._coords[1] for v in vectors)
-        sum_w = sum(v._coords[2] for v in vectors)
+        sum_u = sum(v.u_si for v in vectors)
+        sum_v = sum(v.v_si for v in vectors)
+        sum_w = sum(v.w_si for v in vectors)
 
         tolerance = 1e-6
         is_equilibrium = (
@@ -271,9 +271,9 @@ def _solve_component_method(input_dto: ProblemInputDTO) -> SolutionDTO:
 
     for vec in vectors:
         # Get components in output unit
-        u = vec._coords[0] / si_factor
-        v = vec._coords[1] / si_factor
-        w = vec._coords[2] / si_factor
+        u = vec.u_si / si_factor
+        v = vec.v_si / si_factor
+        w = vec.w_si / si_factor
 
         total_u += u
         total_v += v
@@ -45,6 +45,7 @@ from .solving import (
     NamespaceMapper,
     SafeExpressionEvaluator,
 )
+from .truss import TrussProblem
 from .validation import ValidationMixin
 
 # ========== INTEGRATED PROBLEM CLASS ==========
@@ -126,6 +127,7 @@ __all__ = [
     "PositionVectorProblem",
     "RectangularVectorProblem",
     "CartesianVectorProblem",
+    "TrussProblem",
     # Mixins
     "ValidationMixin",
     "CompositionMixin",
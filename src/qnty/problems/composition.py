@@ -14,7 +14,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from ..algebra import BinaryOperation, ConditionalExpression, Constant, Equation, VariableReference
+from ..algebra import BinaryOperation, ConditionalExpression, Constant, Equation, Summation, VariableReference
 from ..algebra.nodes import Expression, wrap_operand
 from ..core.quantity import FieldQuantity
 from ..core.quantity_catalog import Dimensionless
@@ -649,46 +649,14 @@ class DelayedFunction(Expression, ArithmeticOperationsMixin):
                 result = BinaryOperation("+", result, wrap_operand(arg))
             return result
         elif self.func_name == "summation":
-            import itertools
-
-            from ..algebra.nodes import BinaryOperation, wrap_operand
+            from ..algebra.functions import _create_summation
 
             # summation(term_generator, range_specs, kwargs)
             # Args are: term_generator, tuple of range_specs, dict of kwargs
             term_generator = resolved_args[0]
             range_specs = resolved_args[1] if len(resolved_args) > 1 else ()
             kwargs = resolved_args[2] if len(resolved_args) > 2 else {}
-
-            # Convert range_specs to actual ranges
-            ranges = []
-            for spec in range_specs:
-                if isinstance(spec, int):
-                    ranges.append(range(spec))
-                elif isinstance(spec, tuple):
-                    ranges.append(range(*spec))
-                elif isinstance(spec, range):
-                    ranges.append(spec)
-                else:
-                    raise ValueError(f"Invalid range specification: {spec}")
-
-            # Generate all terms
-            terms = []
-            for indices in itertools.product(*ranges):
-                if kwargs:
-                    # Pass both indices and captured variables
-                    term = term_generator(*indices, **kwargs)
-                else:
-                    # Just pass indices (closure-based)
-                    term = term_generator(*indices)
-                terms.append(term)
-
-            # Sum all terms
-            if len(terms) == 0:
-                return None
-            result = wrap_operand(terms[0])
-            for term in terms[1:]:
-                result = BinaryOperation("+", result, wrap_operand(term))
-            return result
+            return _create_summation(term_generator, range_specs, kwargs)
         elif self.func_name == "range_expr":
             from ..algebra.nodes import ConditionalExpression, wrap_operand
 
@@ -1302,6 +1270,7 @@ class CompositionMixin:
             BinaryOperation: self._namespace_binary_operation,
             ConditionalExpression: self._namespace_conditional_expression,
             Constant: self._namespace_constant_if_needed,
+            Summation: self._namespace_summation,
         }
 
         # Check direct type matches first
@@ -1376,6 +1345,10 @@ class CompositionMixin:
 
         return ConditionalExpression(wrap_operand(namespaced_condition), wrap_operand(namespaced_true_expr), wrap_operand(namespaced_false_expr))
 
+    def _namespace_summation(self, expr: Summation, symbol_mapping: dict[str, str]) -> Summation:
+        """Namespace a Summation by namespacing each term as it is generated."""
+        return expr.map_terms(lambda term: self._namespace_expression(term, symbol_mapping))
+
     def _namespace_expression_for_lhs(self, expr, symbol_mapping: dict[str, str]) -> FieldQuantity | None:
         """
         Create a namespaced version of an expression for LHS, returning Variable objects.
@@ -10,11 +10,14 @@ from __future__ import annotations
 import math
 from typing import Any
 
+import numpy as np
+
 from ..core.quantity import Quantity
 from ..solving.component_solver import ComponentSolver
 from ..spatial import _Vector, _Vector
 from ..spatial.point import _Point
-from ..spatial.vectors import _VectorWithUnknowns, create_vector_cartesian, create_vector_from_points
+from ..spatial.point_cloud import PointCloud
+from ..spatial.vectors import _VectorWithUnknowns, create_vector_cartesian
 from ..spatial.vector_between import VectorBetween
 from .problem import Problem
 
@@ -259,28 +262,39 @@ class PositionVectorProblem(Problem):
         self.forces[name] = resultant
 
     def _create_position_vectors(self) -> None:
-        """Create position vectors from force specifications."""
-        for force_name, spec in self.force_specs.items():
-            from_name = spec["from"]
-            to_name = spec["to"]
-
-            if from_name not in self.points:
-                raise ValueError(f"Point '{from_name}' not found for force '{force_name}'")
-            if to_name not in self.points:
-                raise ValueError(f"Point '{to_name}' not found for force '{force_name}'")
-
-            from_point = self.points[from_name]
-            to_point = self.points[to_name]
-
-            # Convert to _Point if needed
-            if hasattr(from_point, "to_cartesian"):
-                from_point = from_point.to_cartesian()
-            if hasattr(to_point, "to_cartesian"):
-                to_point = to_point.to_cartesian()
+        """Create position vectors from force specifications, all in one array subtraction."""
+        if not self.force_specs:
+            return
 
-            # Create position vector
-            pv_name = f"r_{from_name}{to_name}"
-            r = create_vector_from_points(from_point, to_point, name=pv_name)
+        # Pack every referenced point once, then subtract index pairs in bulk
+        index: dict[str, int] = {}
+        points: list[_Point] = []
+        pairs: list[tuple[int, int]] = []
+        for force_name, spec in self.force_specs.items():
+            pair = []
+            for point_name in (spec["from"], spec["to"]):
+                if point_name not in self.points:
+                    raise ValueError(f"Point '{point_name}' not found for force '{force_name}'")
+                if point_name not in index:
+                    point = self.points[point_name]
+                    # Convert to _Point if needed
+                    index[point_name] = len(points)
+                    points.append(point.to_cartesian() if hasattr(point, "to_cartesian") else point)
+                pair.append(index[point_name])
+            pairs.append((pair[0], pair[1]))
+
+        ends = np.array(pairs)
+        try:
+            vectors = PointCloud.from_points(points).position_vectors(ends[:, 0], ends[:, 1])
+        except ValueError:
+            raise ValueError("Points must have same dimension for position vectors") from None
+
+        for spec, r, (start, end) in zip(self.force_specs.values(), vectors, pairs, strict=True):
+            pv_name = f"r_{spec['from']}{spec['to']}"
+            r.name = pv_name
+            r._unit = points[start]._unit or points[end]._unit
+            r._from_point = points[start]
+            r._to_point = points[end]
             self.position_vectors[pv_name] = r
 
     def _create_forces_from_specs(self) -> None:
@@ -9,17 +9,34 @@ This module combines the core Problem functionality including:
 
 from __future__ import annotations
 
+import hashlib
+import random
+import re
 from collections.abc import Callable
 from copy import copy, deepcopy
+from pathlib import Path
+from types import ModuleType
 from typing import Any, cast
 
+import numpy as np
+
+from qnty.solving.codegen import load_module, module_source
 from qnty.solving.order import Order
+from qnty.solving.plan import SolvePlan
+from qnty.solving.residuals import VERIFICATION_MODES, VERIFY_CHANGED_ONLY, VERIFY_FULL, VERIFY_OFF, VERIFY_SAMPLED, ResidualEvaluator, ResidualReport, select_verification_indices
+from qnty.solving.sensitivity import Jacobian, forward_derivatives
 from qnty.solving.solvers import SolverManager
+from qnty.solving.uncertainty import DEFAULT_CHUNK_SIZE, DEFAULT_PERCENTILES, Distribution, UncertaintyResult, propagate
 from qnty.utils.logging import get_logger
 
-from ..algebra import BinaryOperation, Constant, Equation, EquationSystem, VariableReference
+from ..algebra import BinaryOperation, Constant, DimensionMismatchError, Equation, EquationSystem, SelectVariable, Summation, VariableReference
+from ..algebra.branches import BranchSpecializer, SelectionKey
+from ..algebra.compiler import CompilationError, expression_fingerprint
+from ..algebra.nodes import _describe_dimension
 from ..core.quantity import Quantity
+from ..core.unit import ureg
 from ..core.unit_catalog import DimensionlessUnits
+from ..utils.caching.solution_cache import SolutionCache
 from ..utils.shared_utilities import SharedConstants, ValidationHelper
 from .solving import EquationReconstructor
 from .validation import ValidationMixin
@@ -36,6 +53,13 @@ MSG_SOLUTION_VERIFIED = "Solution verified successfully"
 MSG_SOLUTION_FAILED = "Solution verification failed"
 MSG_SOLVING_FAILED = "Solving failed: {message}"
 
+# Verification defaults
+VERIFICATION_SAMPLE_SIZE_DEFAULT = 10
+VERIFICATION_SEED = 0
+
+# Part of every solution cache key; bump when solving semantics change
+SOLUTION_CACHE_KEY_VERSION = "qnty-solution-1"
+
 
 # Custom Exceptions
 class VariableNotFoundError(KeyError):
@@ -97,8 +121,17 @@ class Problem(ValidationMixin):
         is_solved (bool): Whether the problem has been successfully solved
         solution (dict[str, Variable]): Solved variable values
         sub_problems (dict[str, Problem]): Integrated sub-problems
+        verification_mode (str): Residual check after solving: "full", "changed-only", "sampled" or "off"
+        solution_cache (SolutionCache | None): Opt-in memoization of solve() results
     """
 
+    # Verification policy applied after solve() and update()
+    verification_mode: str = VERIFY_FULL
+    verification_sample_size: int = VERIFICATION_SAMPLE_SIZE_DEFAULT
+
+    # Opt-in memoization of solve(); assign a SolutionCache on the class or instance
+    solution_cache: SolutionCache | None = None
+
     def __init__(self, name: str | None = None, description: str = ""):
         # Handle subclass mode (class-level name/description) vs explicit name
         self.name = name or getattr(self.__class__, "name", self.__class__.__name__)
@@ -117,6 +150,20 @@ class Problem(ValidationMixin):
         self.solution: dict[str, Quantity] = {}
         self.solving_history: list[dict[str, Any]] = []
 
+        # Verification state
+        self._last_verification: ResidualReport | None = None
+        self._residual_evaluator: ResidualEvaluator | None = None
+        self._verified_values: dict[str, float | None] = {}
+        self._verification_rng = random.Random(VERIFICATION_SEED)
+
+        # Solution cache state
+        self._structure_fingerprint: tuple[list[Equation], str, list[Any]] | None = None
+        self._cached_rule_warnings: list[dict[str, Any]] | None = None
+
+        # Branch-free equation sets per select-variable combination
+        self._branch_specializer: BranchSpecializer | None = None
+        self._specialized_equations: dict[SelectionKey, list[Equation]] = {}
+
         # Performance optimization caches
         self._known_variables_cache: dict[str, Quantity] | None = None
         self._unknown_variables_cache: dict[str, Quantity] | None = None
@@ -157,6 +204,7 @@ class Problem(ValidationMixin):
     def _invalidate_caches(self) -> None:
         """Invalidate performance caches when variables change."""
         self._cache_dirty = True
+        self._cached_rule_warnings = None
 
     def _update_variable_caches(self) -> None:
         """Update the variable caches for performance."""
@@ -283,6 +331,8 @@ class Problem(ValidationMixin):
             cloned_var.preferred = variable.preferred
         if hasattr(variable, "_output_unit") and variable._output_unit is not None:
             cloned_var._output_unit = variable._output_unit
+        if getattr(variable, "_search_range", None) is not None:
+            cloned_var._search_range = variable._search_range
 
         return cloned_var
 
@@ -335,6 +385,7 @@ class Problem(ValidationMixin):
                 self._set_variable_unknown(symbol)
             else:
                 raise VariableNotFoundError(MSG_VARIABLE_NOT_FOUND.format(symbol=symbol, name=self.name))
+        self.dependency_graph.mark_unknown(*symbols)
         self.is_solved = False
         self._invalidate_caches()
         return self
@@ -350,6 +401,8 @@ class Problem(ValidationMixin):
                 # Value and preferred unit are already set above, quantity is now known
             else:
                 raise VariableNotFoundError(MSG_VARIABLE_NOT_FOUND.format(symbol=symbol, name=self.name))
+        self.dependency_graph.mark_known(*(symbol for symbol, quantity in symbol_values.items() if quantity.value is not None))
+        self.dependency_graph.mark_unknown(*(symbol for symbol, quantity in symbol_values.items() if quantity.value is None))
         self.is_solved = False
         self._invalidate_caches()
         return self
@@ -376,6 +429,7 @@ class Problem(ValidationMixin):
                 # Only mark as unknown if it was previously solved (known)
                 if var.is_known:
                     self._set_variable_unknown(dependent_symbol)
+                    self.dependency_graph.mark_unknown(dependent_symbol)
                     # Recursively invalidate variables that depend on this one
                     self.invalidate_dependents(dependent_symbol)
 
@@ -606,6 +660,9 @@ class Problem(ValidationMixin):
                     return VariableReference(self.variables[new_symbol])
             return expr
 
+        elif isinstance(expr, Summation):
+            return expr.map_terms(lambda term: self._substitute_variables_in_expression(term, substitutions))
+
         elif isinstance(expr, BinaryOperation):
             new_left = self._substitute_variables_in_expression(expr.left, substitutions)
             new_right = self._substitute_variables_in_expression(expr.right, substitutions)
@@ -854,6 +911,10 @@ class Problem(ValidationMixin):
 
             return expr
 
+        elif isinstance(expr, Summation):
+            # Terms are generated lazily, so the fix is applied to each term as it is produced
+            return expr.map_terms(self._fix_expression_variables)
+
         elif isinstance(expr, BinaryOperation):
             # Recursively fix left and right operands
             fixed_left = self._fix_expression_variables(expr.left)
@@ -941,9 +1002,14 @@ class Problem(ValidationMixin):
             # NOTE: Commented out as it corrupts valid assignment equations like 'branch_P = P'
             # self._final_variable_reference_fix()
 
-            # Build dependency graph
+            # Build dependency graph (also on a cache hit, so update() can walk it)
             self._build_dependency_graph()
 
+            # Serve memoized results without running the solver
+            cache_key = self._solution_cache_key()
+            if cache_key is not None and self._restore_cached_solution(cache_key):
+                return self.solution
+
             # Use solver manager to solve the system
             solve_result = self.solver_manager.solve(self.equations, self.variables, self.dependency_graph, max_iterations, tolerance)
 
@@ -957,52 +1023,524 @@ class Problem(ValidationMixin):
 
                 # Verify solution
                 self.solution = self.variables
-                verification_passed = self.verify_solution()
+                verification_passed = self._run_verification(self.verification_mode, self._changed_since_verification())
 
                 # Mark as solved based on solver result and verification
                 if verification_passed:
                     self.is_solved = True
                     self.logger.info(MSG_SOLUTION_VERIFIED)
-                    return self.solution
                 else:
                     self.logger.warning(MSG_SOLUTION_FAILED)
-                    return self.solution
+
+                if cache_key is not None:
+                    self._store_cached_solution(cache_key)
+                return self.solution
             else:
                 raise SolverError(MSG_SOLVING_FAILED.format(message=solve_result.message))
 
-        except SolverError:
+        except (SolverError, DimensionMismatchError):
             raise
         except Exception as e:
             self.logger.error(f"Solving failed: {e}")
             raise SolverError(f"Unexpected error during solving: {e}") from e
 
+    def update(self, **changed_values: Quantity) -> dict[str, Any]:
+        """
+        Change known inputs and re-solve only the unknowns that depend on them.
+
+        Starting from the changed symbols, the dependency graph built by the last
+        solve is walked (the same walk invalidate_dependents performs) to find the
+        affected unknowns. Those are recomputed in solving order and only the
+        equations they touch are re-verified. When the problem has not been solved
+        yet, or the targeted re-solve cannot complete, a full solve is performed.
+
+        Args:
+            **changed_values: New values for known input variables, keyed by symbol
+
+        Returns:
+            dict mapping variable symbols to solved Variable objects
+
+        Raises:
+            VariableNotFoundError: If a symbol does not exist in the problem
+            ValueError: If a symbol is solved for by the problem or a value is unknown
+            DimensionMismatchError: If a value's dimension differs from the variable's
+
+        Example:
+            >>> problem.solve()
+            >>> problem.update(P=Pressure("P").set(120).psi)
+        """
+        for symbol, quantity in changed_values.items():
+            if symbol not in self.variables:
+                raise VariableNotFoundError(MSG_VARIABLE_NOT_FOUND.format(symbol=symbol, name=self.name))
+            if not self._original_variable_states.get(symbol, True):
+                raise ValueError(f"Variable '{symbol}' is solved for by the problem and cannot be updated as an input")
+            if quantity.value is None:
+                raise ValueError(f"Cannot update '{symbol}' with an unknown value")
+            expected = self.variables[symbol].dim
+            if quantity.dim != expected:
+                raise DimensionMismatchError(f"Cannot update '{symbol}': expected {_describe_dimension(expected)}, got {_describe_dimension(quantity.dim)}", location=symbol)
+
+        was_solved = self.is_solved
+        for symbol, quantity in changed_values.items():
+            self._update_variable_value(symbol, quantity.value, getattr(quantity, "preferred", None))
+        self._invalidate_caches()
+
+        if not was_solved:
+            return self.solve()
+
+        # Affected unknowns, in the order the last solve would visit them
+        affected = self._collect_dependents(set(changed_values))
+        plan = [symbol for symbol in self.dependency_graph.get_solving_order(self.dependency_graph.known_variables) if symbol in affected]
+        if len(plan) != len(affected):
+            return self.solve()
+
+        for symbol in plan:
+            self._set_variable_unknown(symbol)
+
+        solve_result = self.solver_manager.solve_targets(plan, self.equations, self.variables, self.dependency_graph, TOLERANCE_DEFAULT)
+        if not solve_result.success:
+            self.logger.debug(f"Targeted re-solve failed, falling back to full solve: {solve_result.message}")
+            return self.solve()
+
+        self._update_variables_with_solution({symbol: solve_result.variables[symbol] for symbol in plan})
+        self.solving_history.extend(solve_result.steps)
+        self._sync_variables_to_instance_attributes()
+        self.solution = self.variables
+
+        # Only equations touching the changed inputs or recomputed unknowns can have moved
+        mode = self.verification_mode if self.verification_mode in (VERIFY_SAMPLED, VERIFY_OFF) else VERIFY_CHANGED_ONLY
+        self.is_solved = self._run_verification(mode, affected | set(changed_values))
+        self.logger.info(MSG_SOLUTION_VERIFIED if self.is_solved else MSG_SOLUTION_FAILED)
+        return self.solution
+
+    def sensitivities(self, wrt: list[str], of: list[str] | None = None) -> Jacobian:
+        """
+        Derivatives of the solved variables with respect to known inputs.
+
+        The solved equations are replayed once on dual numbers seeded at the
+        inputs (forward-mode automatic differentiation), instead of re-solving
+        the problem once per input. Every equation is differentiated implicitly,
+        so unknowns found by inversion or by a root search are handled alike.
+        The problem is solved first if it has not been.
+
+        Args:
+            wrt: Known input symbols to differentiate with respect to
+            of: Solved symbols to report (default: every unknown of the problem)
+
+        Returns:
+            Jacobian with one row per ``of`` symbol and one column per ``wrt`` symbol;
+            ``jacobian["t", "P"]`` is a Quantity in the derived unit (e.g. in/psi)
+
+        Raises:
+            VariableNotFoundError: If a symbol does not exist in the problem
+            ValueError: If a ``wrt`` symbol is not a known input, an ``of`` symbol is
+                not solved for, or an equation on the path cannot be differentiated
+
+        Example:
+            >>> jacobian = problem.sensitivities(wrt=["P", "S"])
+            >>> print(jacobian["t", "P"])
+        """
+        unknowns = [symbol for symbol, known in self._original_variable_states.items() if not known]
+        of = list(unknowns) if of is None else list(of)
+        for symbol in [*wrt, *of]:
+            if symbol not in self.variables:
+                raise VariableNotFoundError(MSG_VARIABLE_NOT_FOUND.format(symbol=symbol, name=self.name))
+        for symbol in wrt:
+            if not self._original_variable_states.get(symbol, True):
+                raise ValueError(f"Variable '{symbol}' is solved for by the problem, not a known input")
+        for symbol in of:
+            if self._original_variable_states.get(symbol, True):
+                raise ValueError(f"Variable '{symbol}' is a known input, not solved for by the problem")
+
+        self._ensure_solved()
+        steps = self._solving_steps(of)
+        values = {symbol: variable.value for symbol, variable in self.variables.items() if variable.value is not None}
+        duals = forward_derivatives(steps, values, wrt)
+        matrix = np.array([duals[symbol].grad[: len(wrt)] for symbol in of]).reshape(len(of), len(wrt))
+        return Jacobian(of=of, wrt=list(wrt), matrix=matrix, variables=dict(self.variables))
+
+    def propagate(
+        self, distributions: dict[str, Distribution], samples: int = 10_000, seed: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE, percentiles: tuple[float, ...] = DEFAULT_PERCENTILES
+    ) -> UncertaintyResult:
+        """
+        Monte Carlo propagation of input uncertainty to every solved variable.
+
+        Samples of the given inputs are drawn in chunks and solved as arrays
+        through the compiled equations (no Problem instance per sample); inputs
+        without a distribution keep their current value. Statistics are
+        accumulated per chunk, so memory is bounded by ``chunk_size``.
+
+        Args:
+            distributions: Distribution per known input symbol, e.g. ``{"P": Normal(1000, 50, unit="psi")}``
+            samples: Number of samples to draw
+            seed: Seed for reproducible results
+            chunk_size: Samples solved per vectorized pass
+            percentiles: Percentiles (0-100) to report
+
+        Returns:
+            UncertaintyResult with statistics per unknown, the probability that each rule fails
+            and the errors of rules that could not be evaluated
+
+        Raises:
+            VariableNotFoundError: If a symbol does not exist in the problem
+            ValueError: If a symbol is not a known input or an equation cannot be evaluated on arrays
+
+        Example:
+            >>> result = problem.propagate({"P": Normal(1000, 50, unit="psi")}, samples=100_000, seed=1)
+            >>> result["t"].percentiles[95.0]
+        """
+        for symbol in distributions:
+            if symbol not in self.variables:
+                raise VariableNotFoundError(MSG_VARIABLE_NOT_FOUND.format(symbol=symbol, name=self.name))
+            if not self._original_variable_states.get(symbol, True):
+                raise ValueError(f"Variable '{symbol}' is solved for by the problem, not a known input")
+
+        self._ensure_solved()
+        rule_set = self.rule_set()
+        return propagate(
+            self._solving_steps(), self.variables, distributions, samples, seed=seed, chunk_size=chunk_size, percentiles=percentiles, rule_set=rule_set if len(rule_set) else None
+        )
+
+    def solve_plan(self) -> SolvePlan:
+        """
+        The solved structure of the problem, detached from the Problem.
+
+        The plan lists each unknown with the equation that determines it, in
+        solving order, and every variable with its current value. It can be
+        written with ``SolvePlan.to_bytes`` and loaded in a worker process
+        without rebuilding the problem.
+
+        Example:
+            >>> data = problem.solve_plan().to_bytes()
+            >>> plan = SolvePlan.from_bytes(data)  # e.g. in a worker
+            >>> plan.unknowns
+        """
+        return SolvePlan(steps=self._solving_steps(), variables=dict(self.variables))
+
+    def to_python_source(self) -> str:
+        """
+        Source of a standalone Python module that solves this problem.
+
+        The module holds a straight-line function over SI floats following the
+        solve plan (closed forms where available, an embedded root search
+        otherwise), with unit conversion factors inlined, and needs only the
+        standard library. Inputs default to their current values.
+
+        Returns:
+            Python module source
+
+        Raises:
+            ValueError: If an unknown cannot be determined from the known inputs
+            CompilationError: If an equation contains nodes that cannot be emitted
+
+        Example:
+            >>> Path("pipe_wall.py").write_text(problem.to_python_source())
+        """
+        unknowns = [symbol for symbol, known in self._original_variable_states.items() if not known]
+        steps = self._solving_steps(unknowns)
+        return module_source(SolvePlan(steps=steps, variables=dict(self.variables)), title=self.name)
+
+    def compile_module(self, path: str | Path | None = None) -> ModuleType:
+        """
+        Generate and import the standalone module of ``to_python_source``.
+
+        Args:
+            path: Optional ``.py`` file to keep the module in; it is rewritten only
+                when the source changes, so importlib's bytecode cache stays valid
+
+        Returns:
+            The imported module; call ``module.solve(...)`` or ``module.solve_si(...)``
+
+        Example:
+            >>> module = problem.compile_module("cache/pipe_wall.py")
+            >>> module.solve(P=1200.0)["t"]
+        """
+        name = "qnty_generated_" + re.sub(r"\W", "_", type(self).__name__).lower()
+        return load_module(self.to_python_source(), name, path)
+
+    def _ensure_solved(self) -> None:
+        """Solve the problem unless every unknown already has a value."""
+        if any(self.variables[symbol].value is None for symbol, known in self._original_variable_states.items() if not known):
+            self.solve()
+
+    def _solving_steps(self, required: list[str] | None = None) -> list[tuple[str, Equation]]:
+        """
+        Replay the solve symbolically: each unknown with the equation that determines it, in solving order.
+
+        Args:
+            required: Unknowns that must be determined (raises otherwise)
+
+        Returns:
+            (symbol, equation) pairs starting from the originally known inputs
+        """
+        unknowns = [symbol for symbol, known in self._original_variable_states.items() if not known]
+        known = {symbol for symbol, is_known in self._original_variable_states.items() if is_known}
+        ordered = [symbol for symbol in self.dependency_graph.get_solving_order(set(known)) if symbol not in known]
+        remaining = ordered + [symbol for symbol in unknowns if symbol not in ordered]
+        steps = []
+        while remaining:
+            solvable = []
+            for symbol in remaining:
+                equation = self.dependency_graph.get_equation_for_variable(symbol, known)
+                if equation is None:
+                    equation = next((eq for eq in self.equations if eq.can_solve_for(symbol, known)), None)
+                if equation is not None:
+                    steps.append((symbol, equation))
+                    known.add(symbol)
+                    solvable.append(symbol)
+            if not solvable:
+                break
+            remaining = [symbol for symbol in remaining if symbol not in known]
+
+        undetermined = [symbol for symbol in required or [] if symbol not in known]
+        if undetermined:
+            raise ValueError(f"No equation determines {undetermined} from the known inputs")
+        return steps
+
+    # ========== BRANCH SPECIALIZATION ==========
+
+    def get_branch_specializer(self) -> BranchSpecializer:
+        """
+        Get the branch specializer for the equation right-hand sides.
+
+        The specializer is rebuilt when the equation list changes; its compiled
+        variants are cached per selection combination.
+        """
+        specializer = self._branch_specializer
+        equations = [eq.rhs for eq in self.equations]
+        if specializer is None or len(specializer.expressions) != len(equations) or not all(a is b for a, b in zip(specializer.expressions, equations, strict=True)):
+            specializer = BranchSpecializer(equations)
+            self._branch_specializer = specializer
+            self._specialized_equations = {}
+        return specializer
+
+    def specialized_equations(self, **selections: Any) -> list[Equation]:
+        """
+        Get the equations with select-variable branches resolved.
+
+        Every match expression is replaced by the case for the given (or currently
+        selected) options, giving a branch-free equation set that is cached per
+        selection combination.
+
+        Args:
+            **selections: Selected option per select-variable symbol; others use their current value
+
+        Returns:
+            Equations in the same order as ``equations``
+
+        Example:
+            >>> problem.specialized_equations(gasket_type=GasketType.self_energized)
+        """
+        specializer = self.get_branch_specializer()
+        key = specializer.selection_key(selections)
+        equations = self._specialized_equations.get(key)
+        if equations is None:
+            equations = [
+                eq if rhs is eq.rhs else Equation(eq.name, eq.lhs, rhs)
+                for eq, rhs in zip(self.equations, specializer.specialize(key), strict=True)
+            ]
+            self._specialized_equations[key] = equations
+        return equations
+
+    # ========== SOLUTION CACHE ==========
+
+    def _solution_cache_key(self) -> str | None:
+        """
+        Compute the content address of the current solve request.
+
+        The key hashes the problem class, the verification mode and sample size,
+        the structure of every equation, each variable's SI value and preferred unit, and the
+        current selection of every select variable.
+
+        Returns:
+            Hex digest, or None when caching is disabled or the structure cannot be fingerprinted
+        """
+        if self.solution_cache is None:
+            return None
+
+        fingerprint = self._get_structure_fingerprint()
+        if fingerprint is None:
+            return None
+        structure, selects = fingerprint
+
+        digest = hashlib.sha256()
+        cls = type(self)
+        for part in (SOLUTION_CACHE_KEY_VERSION, f"{cls.__module__}.{cls.__qualname__}", self.verification_mode, str(self.verification_sample_size), structure):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        for symbol in sorted(self.variables):
+            var = self.variables[symbol]
+            value = "?" if var.value is None else float(var.value).hex()
+            unit = getattr(var.preferred, "name", "")
+            digest.update(f"{symbol}={value}:{unit}\0".encode())
+        for select in selects:
+            digest.update(f"{select.symbol}={select.value!r}\0".encode())
+        return digest.hexdigest()
+
+    def _get_structure_fingerprint(self) -> tuple[str, list[Any]] | None:
+        """Fingerprint the equations (cached while the equation list is unchanged) and collect select variables."""
+        cached = self._structure_fingerprint
+        if cached is None or len(cached[0]) != len(self.equations) or not all(a is b for a, b in zip(cached[0], self.equations, strict=True)):
+            selects: list[Any] = []
+            try:
+                parts = [f"{expression_fingerprint(eq.lhs, selects)}={expression_fingerprint(eq.rhs, selects)}" for eq in self.equations]
+            except CompilationError as e:
+                self.logger.debug(f"Solution cache disabled: {e}")
+                return None
+            for owner in (*type(self).__mro__, self):
+                selects.extend(value for value in vars(owner).values() if isinstance(value, SelectVariable))
+            unique_selects = list({id(select): select for select in selects}.values())
+            cached = (list(self.equations), hashlib.sha256("\n".join(parts).encode()).hexdigest(), unique_selects)
+            self._structure_fingerprint = cached
+        return cached[1], cached[2]
+
+    def _restore_cached_solution(self, key: str) -> bool:
+        """
+        Restore variables, solving history, verification report and rule warnings from the solution cache.
+
+        Returns:
+            True on a cache hit
+        """
+        assert self.solution_cache is not None
+        payload = self.solution_cache.get(key)
+        if payload is None:
+            return False
+
+        for symbol, (value, unit_name) in payload["variables"].items():
+            var = self.variables.get(symbol)
+            if var is None:
+                continue
+            unit = ureg.resolve(unit_name, dim=var.dim) if unit_name else None
+            self._update_variable_value(symbol, value, unit)
+        self._invalidate_caches()
+
+        self.solving_history = [dict(step) for step in payload["history"]]
+        self._sync_variables_to_instance_attributes()
+        self.solution = self.variables
+        self.is_solved = payload["is_solved"]
+        self._cached_rule_warnings = [dict(warning) for warning in payload["warnings"]]
+        report = payload["verification"]
+        self._last_verification = None if report is None else ResidualReport.from_payload(report)
+        self._verified_values = {} if report is None else {symbol: var.value for symbol, var in self.variables.items()}
+        self.logger.debug("Solution restored from cache")
+        return True
+
+    def _store_cached_solution(self, key: str) -> None:
+        """Record the current solution, solving history, verification report and rule warnings in the solution cache."""
+        assert self.solution_cache is not None
+        warnings = self.validate()
+        payload = {
+            "variables": {symbol: [var.value, getattr(var.preferred, "name", None)] for symbol, var in self.variables.items()},
+            "history": [dict(step) for step in self.solving_history],
+            "warnings": [dict(warning) for warning in warnings],
+            "is_solved": self.is_solved,
+            "verification": None if self._last_verification is None else self._last_verification.to_payload(),
+        }
+        try:
+            self.solution_cache.put(key, payload)
+        except ValueError as e:
+            self.logger.debug(f"Solution not cached: {e}")
+
+    def _collect_dependents(self, symbols: set[str]) -> set[str]:
+        """
+        Collect the originally-unknown variables reachable from the given symbols.
+
+        Args:
+            symbols: Symbols whose values changed
+
+        Returns:
+            Set of dependent symbols that must be recomputed
+        """
+        graph = self.dependency_graph.graph
+        dependents: set[str] = set()
+        pending = list(symbols)
+        while pending:
+            for dependent_symbol in graph.get(pending.pop(), ()):
+                if dependent_symbol not in dependents and not self._original_variable_states.get(dependent_symbol, True):
+                    dependents.add(dependent_symbol)
+                    pending.append(dependent_symbol)
+        return dependents
+
     def _build_dependency_graph(self):
-        """Build the dependency graph for solving order determination."""
-        # Reset the dependency graph
-        self.dependency_graph = Order()
+        """
+        Bring the dependency graph up to date for solving order determination.
 
-        # Get known variables
+        The existing graph is reused whenever the equation list has only grown
+        since it was built: new equations are appended and variables whose
+        known/unknown state changed are updated incrementally. The graph is
+        rebuilt from scratch only when equations were replaced or removed.
+        """
         known_vars = self.get_known_symbols()
+        graph_equations = self.dependency_graph.equations
 
-        # Add dependencies from equations
-        for equation in self.equations:
+        is_extension = len(graph_equations) <= len(self.equations) and all(a is b for a, b in zip(graph_equations, self.equations, strict=False))
+        if not is_extension:
+            self.dependency_graph = Order()
+            graph_equations = []
+
+        self.dependency_graph.update_known_variables(known_vars)
+        for equation in self.equations[len(graph_equations) :]:
+            if isinstance(equation, Equation):
+                equation.infer_dimensions()
             self.dependency_graph.add_equation(equation, known_vars)
 
     def verify_solution(self, tolerance: float = TOLERANCE_DEFAULT) -> bool:
-        """Verify that all equations are satisfied."""
+        """Verify that all equations are satisfied, recording the residuals for verification_report()."""
+        return self._run_verification(VERIFY_FULL, None, tolerance)
+
+    def verification_report(self) -> ResidualReport | None:
+        """
+        Get the residual report of the most recent verification.
+
+        Returns:
+            ResidualReport with the residual vector and per-equation norms, or None if nothing was verified
+        """
+        return self._last_verification
+
+    def _run_verification(self, mode: str, changed: set[str] | None, tolerance: float = TOLERANCE_DEFAULT) -> bool:
+        """
+        Check equation residuals according to a verification mode.
+
+        Args:
+            mode: "full", "changed-only", "sampled" or "off"
+            changed: Symbols whose values changed since the last verification (None for all)
+            tolerance: Absolute residual tolerance in SI units
+
+        Returns:
+            True if every checked equation is satisfied
+        """
+        if mode not in VERIFICATION_MODES:
+            raise ValueError(f"Unknown verification mode '{mode}'. Expected one of {VERIFICATION_MODES}")
         if not self.equations:
+            self._last_verification = None
             return True
 
         try:
-            for equation in self.equations:
-                if not equation.check_residual(self.variables, tolerance):
-                    self.logger.debug(f"Equation verification failed: {equation}")
-                    return False
-            return True
+            evaluator = self._get_residual_evaluator()
+            candidates = list(range(len(evaluator.equations))) if changed is None else evaluator.indices_for_variables(changed)
+            indices = select_verification_indices(mode, evaluator, candidates, self.verification_sample_size, self._verification_rng)
+            report = evaluator.evaluate(self.variables, indices, tolerance, mode)
         except Exception as e:
             self.logger.debug(f"Solution verification error: {e}")
             return False
 
+        self._last_verification = report
+        self._verified_values = {symbol: var.value for symbol, var in self.variables.items()}
+        for name, residual in report.failures.items():
+            self.logger.debug(f"Equation verification failed: {name} (residual {residual:.6g})")
+        return report.passed
+
+    def _get_residual_evaluator(self) -> ResidualEvaluator:
+        """Return the residual evaluator for the current equations, rebuilding it when they change."""
+        if self._residual_evaluator is None or not self._residual_evaluator.matches(self.equations):
+            self._residual_evaluator = ResidualEvaluator(self.equations)
+        return self._residual_evaluator
+
+    def _changed_since_verification(self) -> set[str]:
+        """Symbols whose values differ from the last verified state."""
+        missing = object()
+        return {symbol for symbol, var in self.variables.items() if self._verified_values.get(symbol, missing) != var.value}
+
     def analyze_system(self) -> dict[str, Any]:
         """Analyze the equation system for solvability, cycles, etc."""
         try:
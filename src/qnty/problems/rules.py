@@ -8,10 +8,14 @@ warnings, and validation rules at the problem level rather than variable level.
 from __future__ import annotations
 
 import traceback
-from dataclasses import dataclass
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
 from typing import Any, Literal
 
+import numpy as np
+
 from ..algebra import Expression
+from ..algebra.compiler import ARRAY, SCALAR, CompiledExpression, try_compile
 from ..core.quantity import FieldQuantity, Quantity
 
 # Constants for warning types
@@ -31,6 +35,10 @@ DEFAULT_SEVERITY = SEVERITY_WARNING
 # Threshold for boolean conversion
 BOOLEAN_THRESHOLD = 0.5
 
+# Compact severity encoding used by RuleSet results (-1 means "not triggered")
+SEVERITY_CODES = {SEVERITY_INFO: 0, SEVERITY_WARNING: 1, SEVERITY_ERROR: 2}
+SEVERITY_NONE = -1
+
 
 @dataclass
 class Rules:
@@ -149,10 +157,209 @@ class Rules:
             "check_name": self.name,
             "condition": str(self.condition),
             "debug_info": f"Expression type: {type(self.condition)}, Variables: {list(variables.keys())}",
-            "traceback": traceback.format_exc(),
+            "traceback": "".join(traceback.format_exception(exception)),
         }
 
 
+@dataclass
+class RuleResults:
+    """
+    Outcome of evaluating a RuleSet.
+
+    Arrays have shape ``(n_rules,)`` for a single evaluation and
+    ``(n_items, n_rules)`` for a batch.
+
+    Attributes:
+        rules: Rules in evaluation order
+        triggered: True where a rule condition holds
+        failed: True where a rule could not be evaluated
+        errors: Error warning dicts keyed by rule index (single) or (item, rule index) (batch)
+    """
+
+    rules: list[Rules]
+    triggered: np.ndarray
+    failed: np.ndarray
+    errors: dict[Any, dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def severity(self) -> np.ndarray:
+        """Severity code of each triggered rule (failed rules count as ERROR), SEVERITY_NONE elsewhere."""
+        codes = np.array([SEVERITY_CODES.get(rule.severity, SEVERITY_CODES[SEVERITY_WARNING]) for rule in self.rules], dtype=np.int8)
+        severity = np.where(self.triggered, codes, SEVERITY_NONE).astype(np.int8)
+        severity[self.failed] = SEVERITY_CODES[SEVERITY_ERROR]
+        return severity
+
+    @property
+    def max_severity(self) -> np.ndarray | int:
+        """Highest severity code per item (or for the single evaluation)."""
+        severity = self.severity
+        if severity.size == 0:
+            return SEVERITY_NONE if severity.ndim == 1 else np.full(severity.shape[0], SEVERITY_NONE, dtype=np.int8)
+        result = severity.max(axis=-1)
+        return int(result) if severity.ndim == 1 else result
+
+    def warnings(self, item: int | None = None) -> list[dict[str, Any]]:
+        """
+        Warning dicts in the format produced by Rules.evaluate.
+
+        Args:
+            item: Batch row to report (required for batch results)
+        """
+        if self.triggered.ndim == 2:
+            if item is None:
+                raise ValueError("item is required for batch results")
+            triggered, failed = self.triggered[item], self.failed[item]
+            errors = {index: error for (row, index), error in self.errors.items() if row == item}
+        else:
+            triggered, failed, errors = self.triggered, self.failed, self.errors
+
+        warnings = []
+        for index, rule in enumerate(self.rules):
+            if failed[index]:
+                warnings.append(errors.get(index) or rule._create_error_dict(ValueError("Rule condition evaluated to an invalid value"), {}))
+            elif triggered[index]:
+                warnings.append(rule._create_warning_dict(warning_type=rule.warning_type, severity=rule.severity, message=rule.message))
+        return warnings
+
+
+class RuleSet:
+    """
+    All rules of a problem compiled into one fused evaluator.
+
+    Each condition is compiled once for scalar evaluation and once for batch
+    evaluation over NumPy arrays of SI values, so screening many solved
+    instances costs one vectorized pass per rule instead of one expression
+    walk per rule and item. Conditions the compiler does not support keep
+    using Rules.evaluate.
+
+    Example:
+        >>> rule_set = RuleSet.for_problem_class(PipeProblem)
+        >>> results = rule_set.evaluate_batch(solved_problems)
+        >>> results.triggered.sum(axis=0)  # how often each rule fired
+    """
+
+    def __init__(self, rules: Iterable[Rules]):
+        self.rules = list(rules)
+        self._scalar: list[CompiledExpression | None] = [try_compile(rule.condition, SCALAR) for rule in self.rules]
+        self._array: list[CompiledExpression | None] = [try_compile(rule.condition, ARRAY) for rule in self.rules]
+
+    @classmethod
+    def for_problem_class(cls, problem_class: type) -> RuleSet:
+        """Build the rule set of a Problem subclass from its class-level rules (cached per class)."""
+        cached = problem_class.__dict__.get("_compiled_rule_set")
+        if cached is None:
+            checks = getattr(problem_class, "_class_checks", None) or {}
+            cached = cls(check for check in checks.values() if isinstance(check, Rules))
+            problem_class._compiled_rule_set = cached
+        return cached
+
+    @property
+    def names(self) -> list[str | None]:
+        """Rule names in evaluation order."""
+        return [rule.name for rule in self.rules]
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def __deepcopy__(self, memo: dict) -> RuleSet:
+        # Compiled rules are immutable and shared between problem copies
+        return self
+
+    def evaluate(self, variables: Mapping[str, FieldQuantity]) -> RuleResults:
+        """
+        Evaluate every rule against one set of variables.
+
+        Args:
+            variables: Problem variables keyed by symbol
+
+        Returns:
+            RuleResults with one entry per rule
+        """
+        count = len(self.rules)
+        triggered = np.zeros(count, dtype=bool)
+        failed = np.zeros(count, dtype=bool)
+        errors: dict[Any, dict[str, Any]] = {}
+        values = {symbol: var.value for symbol, var in variables.items()}
+
+        for index, (rule, compiled) in enumerate(zip(self.rules, self._scalar, strict=True)):
+            try:
+                result = None
+                if compiled is not None:
+                    try:
+                        result = compiled(values) > BOOLEAN_THRESHOLD
+                    except KeyError:
+                        # A variable missing from ``variables``: the expression tree falls back to the bound quantity
+                        result = None
+                triggered[index] = rule._evaluate_expression(rule.condition, dict(variables)) if result is None else result
+            except Exception as e:
+                failed[index] = True
+                errors[index] = rule._create_error_dict(e, dict(variables))
+
+        return RuleResults(self.rules, triggered, failed, errors)
+
+    def evaluate_batch(self, items: Mapping[str, Any] | Sequence[Any]) -> RuleResults:
+        """
+        Evaluate every rule for many instances at once.
+
+        Args:
+            items: Either solved Problem instances, or a mapping of symbol to an
+                array of SI values (one entry per item)
+
+        Returns:
+            RuleResults with arrays of shape (n_items, n_rules)
+        """
+        problems: Sequence[Any] | None = None
+        if isinstance(items, Mapping):
+            columns = {symbol: np.asarray(values, dtype=float) for symbol, values in items.items()}
+            size = len(next(iter(columns.values()))) if columns else 0
+        else:
+            problems = items
+            size = len(problems)
+            symbols = set().union(*(problem.variables for problem in problems)) if problems else set()
+            columns = {symbol: np.array([_si_value(problem, symbol) for problem in problems], dtype=float) for symbol in symbols}
+
+        triggered = np.zeros((size, len(self.rules)), dtype=bool)
+        failed = np.zeros((size, len(self.rules)), dtype=bool)
+        errors: dict[Any, dict[str, Any]] = {}
+
+        for index, (rule, compiled) in enumerate(zip(self.rules, self._array, strict=True)):
+            if compiled is not None:
+                try:
+                    with np.errstate(all="ignore"):
+                        result = np.broadcast_to(np.asarray(compiled(columns), dtype=float), (size,))
+                    triggered[:, index] = result > BOOLEAN_THRESHOLD
+                    failed[:, index] = np.isnan(result)
+                    continue
+                except Exception as e:
+                    if problems is None:
+                        failed[:, index] = True
+                        # Same failure for every row; format the traceback once
+                        error = rule._create_error_dict(e, columns)
+                        for row in range(size):
+                            errors[(row, index)] = error
+                        continue
+
+            # Generic path, one item at a time
+            for row in range(size):
+                variables = problems[row].variables if problems is not None else {}
+                try:
+                    if problems is None:
+                        raise ValueError("Rule condition cannot be compiled for array evaluation")
+                    triggered[row, index] = rule._evaluate_expression(rule.condition, variables)
+                except Exception as e:
+                    failed[row, index] = True
+                    errors[(row, index)] = rule._create_error_dict(e, variables)
+
+        return RuleResults(self.rules, triggered, failed, errors)
+
+
+def _si_value(problem: Any, symbol: str) -> float:
+    """SI value of a problem variable, NaN when missing or unknown."""
+    var = problem.variables.get(symbol)
+    value = getattr(var, "value", None)
+    return np.nan if value is None else value
+
+
 def add_rule(condition: Expression, message: str, warning_type: str = DEFAULT_WARNING_TYPE, severity: Literal["INFO", "WARNING", "ERROR"] = DEFAULT_SEVERITY, name: str | None = None) -> Rules:
     """
     Create a new engineering problem check.
@@ -190,4 +397,4 @@ def add_rule(condition: Expression, message: str, warning_type: str = DEFAULT_WA
     return Rules(condition=condition, message=message, warning_type=warning_type, severity=severity, name=name)
 
 
-__all__ = ["add_rule", "Rules"]
+__all__ = ["add_rule", "RuleResults", "RuleSet", "Rules", "SEVERITY_CODES", "SEVERITY_NONE"]
@@ -0,0 +1,313 @@
+"""
+TrussProblem class for solving pin-jointed trusses by the method of joints.
+
+Joints are ``_Point`` objects and members connect pairs of joints. The joint
+equilibrium equations of the whole truss are assembled into one sparse system
+and solved together by ``TrussSolver``, so trusses with thousands of members
+solve in a fraction of a second.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ..core.dimension_catalog import dim
+from ..core.unit import Unit, resolve_unit
+from ..solving.truss_solver import TrussResults, TrussSolver
+from ..spatial import _Vector
+from ..spatial.point import _Point
+from .problem import Problem
+
+
+class TrussProblem(Problem):
+    """
+    Specialized Problem for member forces and reactions of pin-jointed trusses.
+
+    Every member is a two-force member, in tension or compression. Each joint
+    gives ΣFx = 0 and ΣFy = 0 (and ΣFz = 0 for a space truss), and the
+    equations of all joints are solved at once as a sparse linear system.
+    Statically indeterminate trusses are solved too; the relative axial
+    stiffness of the members then distributes the redundant forces.
+
+    Supports restrain joints along axes: "xy" for a pin, "y" for a roller on a
+    horizontal surface, "pin" for every axis.
+
+    Examples:
+        >>> class RoofTruss(TrussProblem):
+        ...     A = _Point(0, 0, unit="m")
+        ...     B = _Point(2, 2, unit="m")
+        ...     C = _Point(4, 0, unit="m")
+        ...     members = [("A", "B"), ("B", "C"), ("A", "C")]
+        ...     supports = {"A": "xy", "C": "y"}
+        ...     loads = {"B": _Vector(0, -10, 0, unit="lbf")}
+        ...
+        >>> results = RoofTruss().solve()
+        >>> results.force("AB")
+
+        >>> # Or programmatically, with connectivity as joint indices
+        >>> problem = TrussProblem("Bridge", unit="lbf")
+        >>> problem.add_joints(joints)
+        >>> problem.add_members(np.array([[0, 1], [1, 2], [0, 2]]))
+        >>> problem.add_support("A", "xy")
+        >>> problem.add_loads(["B"], [[0, -10]], unit="lbf")
+        >>> results = problem.solve()
+        >>> results.forces_in("lbf")
+    """
+
+    def __init__(self, name: str | None = None, description: str = "", unit: Unit | str = "N", method: str = "auto"):
+        """
+        Initialize TrussProblem.
+
+        Args:
+            name: Problem name
+            description: Problem description
+            unit: Display unit of the member forces and reactions
+            method: Sparse factorization used by ``TrussSolver``
+        """
+        super().__init__(name=name, description=description)
+        self.unit = resolve_unit(unit, dim.force)
+        self.solver = TrussSolver(method)
+        self.solution_steps: list[dict[str, Any]] = []
+        self.results: TrussResults | None = None
+
+        self._joint_index: dict[str, int] = {}
+        self._coordinates: list[tuple[float, float, float]] = []
+        self._ends: list[NDArray[np.intp]] = []
+        self._member_names: list[str] = []
+        self._axial_stiffness: list[NDArray[np.float64]] = []
+        self._restraints: dict[int, tuple[bool, bool, bool]] = {}
+        self._loads: dict[int, NDArray[np.float64]] = {}
+
+        # Extract class-level joints, members, supports and loads
+        self._extract_truss_elements()
+
+    def _extract_truss_elements(self) -> None:
+        """Add ``_Point`` class attributes as joints, in definition order, then the rest."""
+        attributes: dict[str, Any] = {}
+        for klass in reversed(self.__class__.__mro__):
+            attributes.update(vars(klass))
+        for attr_name, attr in attributes.items():
+            if not attr_name.startswith("_") and isinstance(attr, _Point):
+                self.add_joint(attr_name, attr)
+
+        members = attributes.get("members")
+        if members is not None:
+            self.add_members(members)
+        for joint, restraint in (attributes.get("supports") or {}).items():
+            self.add_support(joint, restraint)
+        for joint, force in (attributes.get("loads") or {}).items():
+            self.add_load(joint, force)
+
+    # ---- Model definition ----
+    @property
+    def joint_names(self) -> list[str]:
+        """Joint names, in the order they were added."""
+        return list(self._joint_index)
+
+    @property
+    def member_names(self) -> list[str]:
+        """Member names, in the order they were added."""
+        return list(self._member_names)
+
+    def add_joint(self, name: str, point: _Point) -> None:
+        """
+        Add a joint at a known point.
+
+        Raises:
+            ValueError: If the name is taken or the point is unknown
+        """
+        if name in self._joint_index:
+            raise ValueError(f"Joint '{name}' already exists")
+        if point.is_unknown:
+            raise ValueError(f"Joint '{name}' must be at a known point")
+        self._joint_index[name] = len(self._coordinates)
+        self._coordinates.append((point._x, point._y, point._z))
+
+    def add_joints(self, joints: Mapping[str, _Point]) -> None:
+        """Add several joints, in mapping order."""
+        for name, point in joints.items():
+            self.add_joint(name, point)
+
+    def add_member(self, start: str, end: str, name: str | None = None, axial_stiffness: float = 1.0) -> None:
+        """
+        Add a member between two joints.
+
+        Args:
+            start: Joint at one end
+            end: Joint at the other end
+            name: Member name (default: the joint names, e.g. "AB")
+            axial_stiffness: Relative axial stiffness (EA), for indeterminate trusses
+        """
+        self.add_members([(start, end)], names=None if name is None else [name], axial_stiffness=axial_stiffness)
+
+    def add_members(self, connectivity: ArrayLike, names: Sequence[str] | None = None, axial_stiffness: ArrayLike = 1.0) -> None:
+        """
+        Add many members at once.
+
+        Args:
+            connectivity: Pairs of joint names, or an integer array of shape (M, 2)
+                holding joint indices in the order the joints were added
+            names: Member names (default: the joint names, e.g. "AB", or "J1-J2"
+                when the joint names are longer than one character)
+            axial_stiffness: Relative axial stiffness (EA) of every member, or one for all
+
+        Raises:
+            ValueError: If a joint is unknown or the names do not match the members
+        """
+        pairs = np.asarray(connectivity)
+        if pairs.dtype.kind in "iu":
+            ends = pairs.astype(np.intp).reshape(-1, 2)
+            if ends.size and (ends.min() < 0 or ends.max() >= len(self._coordinates)):
+                raise ValueError(f"Joint indices must be between 0 and {len(self._coordinates) - 1}")
+        else:
+            try:
+                ends = np.array([self._joint_index[joint] for joint in pairs.ravel().tolist()], dtype=np.intp).reshape(-1, 2)
+            except KeyError as error:
+                raise ValueError(f"Unknown joint {error}") from None
+        if np.any(ends[:, 0] == ends[:, 1]):
+            raise ValueError("A member must connect two different joints")
+
+        if names is None:
+            joints = self.joint_names
+            names = [f"{joints[i]}{joints[j]}" if len(joints[i]) == len(joints[j]) == 1 else f"{joints[i]}-{joints[j]}" for i, j in ends.tolist()]
+        elif len(names) != len(ends):
+            raise ValueError(f"Expected {len(ends)} member names, got {len(names)}")
+
+        self._ends.append(ends)
+        self._member_names.extend(names)
+        self._axial_stiffness.append(np.broadcast_to(np.asarray(axial_stiffness, dtype=float), (len(ends),)).copy())
+
+    def add_support(self, joint: str, restraint: str = "pin") -> None:
+        """
+        Support a joint.
+
+        Args:
+            joint: Joint name
+            restraint: Restrained axes as letters ("xy", "y", "xyz") or "pin" for all
+
+        Raises:
+            ValueError: If the joint or the restraint is unknown
+        """
+        if restraint != "pin" and (not restraint or set(restraint) - set("xyz")):
+            raise ValueError(f"Unknown support restraint '{restraint}'; use axis letters such as 'xy' or 'pin'")
+        self._restraints[self._index(joint)] = tuple(restraint == "pin" or axis in restraint for axis in "xyz")  # type: ignore[assignment]
+
+    def add_load(self, joint: str, force: _Vector) -> None:
+        """
+        Apply a force at a joint; loads at the same joint add up.
+
+        Raises:
+            ValueError: If the joint is unknown or the vector is not a force
+        """
+        if force._dim != dim.force:
+            raise ValueError(f"Load at joint '{joint}' must be a force vector")
+        index = self._index(joint)
+        self._loads[index] = self._loads.get(index, np.zeros(3)) + (force._x, force._y, force._z)
+
+    def add_loads(self, joints: Sequence[str], components: ArrayLike, unit: Unit | str = "N") -> None:
+        """
+        Apply many joint loads given as components in one force unit.
+
+        Args:
+            joints: Joint names
+            components: Load components, shape (K, 2) or (K, 3)
+            unit: Unit of the components
+
+        Raises:
+            ValueError: If the shapes do not match or a joint is unknown
+        """
+        loads = np.array(components, dtype=float, ndmin=2) * resolve_unit(unit, dim.force).si_factor
+        if loads.shape[1] not in (2, 3) or len(loads) != len(joints):
+            raise ValueError(f"Expected components of shape ({len(joints)}, 2) or ({len(joints)}, 3), got {loads.shape}")
+        for joint, load in zip(joints, loads, strict=True):
+            index = self._index(joint)
+            self._loads[index] = self._loads.get(index, np.zeros(3))
+            self._loads[index][: len(load)] += load
+
+    def _index(self, joint: str) -> int:
+        try:
+            return self._joint_index[joint]
+        except KeyError:
+            raise ValueError(f"Unknown joint '{joint}'") from None
+
+    # ---- Solving ----
+    def solve(self, max_iterations: int = 100, tolerance: float = 1e-10) -> TrussResults:  # type: ignore[override]
+        """
+        Solve for all member forces and support reactions.
+
+        Args:
+            max_iterations: Not used (for compatibility with parent class)
+            tolerance: Not used (for compatibility with parent class)
+
+        Returns:
+            Member forces (tension positive) and reactions
+
+        Raises:
+            ValueError: If the truss has no members or is unstable
+        """
+        if not self._ends:
+            raise ValueError("Truss has no members")
+        count = len(self._coordinates)
+        coordinates = np.array(self._coordinates)
+        ends = np.concatenate(self._ends)
+        restrained = np.zeros((count, 3), dtype=bool)
+        loads = np.zeros((count, 3))
+        if self._restraints:
+            restrained[list(self._restraints)] = list(self._restraints.values())
+        if self._loads:
+            loads[list(self._loads)] = list(self._loads.values())
+
+        forces, reactions = self.solver.solve(coordinates, ends, restrained, loads, np.concatenate(self._axial_stiffness))
+
+        joints = self.joint_names
+        supports = sorted(self._restraints)
+        self.results = TrussResults(
+            members=tuple(self._member_names),
+            forces=forces,
+            supports=tuple(joints[index] for index in supports),
+            reactions=reactions[supports],
+            unit=self.unit,
+        )
+        self.solution_steps = self._solution_steps(len(ends))
+        self.is_solved = True
+        return self.results
+
+    def _solution_steps(self, member_count: int) -> list[dict[str, Any]]:
+        """Summary steps; the full member table is in ``results``."""
+        results, system = self.results, self.solver.system
+        assert results is not None and system is not None
+        sums = "ΣFx = 0, ΣFy = 0" if system.dimensions == 2 else "ΣFx = 0, ΣFy = 0, ΣFz = 0"
+        factor = self.unit.si_factor
+        symbol = self.unit.symbol
+        tension = int(np.argmax(results.forces))
+        compression = int(np.argmin(results.forces))
+        return [
+            {
+                "method": "Method of Joints (Sparse Equilibrium)",
+                "description": f"Assembling joint equilibrium for {len(self._coordinates)} joints and {member_count} members",
+                "equations": [f"{sums} at every joint", f"{system.size} equations in the joint displacements, {len(system.values)} matrix entries"],
+            },
+            {
+                "description": "Member forces (tension positive)",
+                "results": [
+                    f"Largest tension: F_{results.members[tension]} = {results.forces[tension] / factor:.3f} {symbol}",
+                    f"Largest compression: F_{results.members[compression]} = {results.forces[compression] / factor:.3f} {symbol}",
+                ],
+            },
+            {
+                "description": "Support reactions",
+                "results": [
+                    f"{joint}: Rx = {rx / factor:.3f} {symbol}, Ry = {ry / factor:.3f} {symbol}, Rz = {rz / factor:.3f} {symbol}"
+                    for joint, (rx, ry, rz) in zip(results.supports, results.reactions, strict=True)
+                ],
+            },
+        ]
+
+    def __str__(self) -> str:
+        """String representation."""
+        status = "SOLVED" if self.is_solved else "UNSOLVED"
+        return f"TrussProblem('{self.name}', joints={len(self._coordinates)}, members={len(self._member_names)}, {status})"
@@ -18,6 +18,7 @@ from collections.abc import Callable
 from typing import Any, Protocol
 
 from ..utils.shared_utilities import SafeExecutionMixin, SharedConstants
+from .rules import RuleResults, Rules, RuleSet
 
 # Use shared constants
 MSG_VALIDATION_CHECK_FAILED = SharedConstants.MSG_VALIDATION_CHECK_FAILED
@@ -109,7 +110,13 @@ class ValidationMixin(SafeExecutionMixin):
 
     def validate(self) -> list[dict[str, Any]]:
         """Run all validation checks and return any warnings."""
-        validation_warnings: list[dict[str, Any]] = []
+        # Warnings restored together with a cached solution stay valid until a variable changes
+        cached_warnings = getattr(self, "_cached_rule_warnings", None)
+        if cached_warnings is not None:
+            return [dict(warning) for warning in cached_warnings]
+
+        # Class-level rules run through the fused evaluator
+        validation_warnings: list[dict[str, Any]] = self.evaluate_rules().warnings()
 
         for validation_check in self.validation_checks:
             if not callable(validation_check):
@@ -131,6 +138,19 @@ class ValidationMixin(SafeExecutionMixin):
 
         return validation_warnings
 
+    def rule_set(self) -> RuleSet:
+        """Get the compiled rule set shared by all instances of this problem class."""
+        return RuleSet.for_problem_class(type(self))
+
+    def evaluate_rules(self) -> RuleResults:
+        """
+        Evaluate all class-level rules in one pass.
+
+        Returns:
+            RuleResults with a triggered flag and severity code per rule
+        """
+        return self.rule_set().evaluate(self.variables)
+
     def get_warnings(self) -> list[dict[str, Any]]:
         """Get all warnings from the problem."""
 
@@ -169,8 +189,10 @@ class ValidationMixin(SafeExecutionMixin):
             self.logger.debug(MSG_NO_CLASS_CHECKS)
             return
 
-        # Create validation functions from Check objects
+        # Create validation functions from Check objects; Rules are evaluated by rule_set()
         for check_name, check_obj in class_checks.items():
+            if isinstance(check_obj, Rules):
+                continue
             if not self._safe_check_attribute(check_obj, "evaluate", check_callable=True):
                 self.logger.warning(MSG_MISSING_EVALUATE_METHOD.format(check_name=check_name))
                 continue
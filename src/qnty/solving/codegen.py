@@ -0,0 +1,371 @@
+"""
+Standalone Python modules generated from solve plans.
+
+A solved problem reduces to straight-line arithmetic: each unknown is either
+assigned directly, taken from a closed-form inversion, or found by a root
+search on one equation, in solving order. ``module_source`` writes that
+sequence out as the body of a plain Python function over SI floats, with the
+unit conversion factors of every input and output inlined as literals, so
+the result runs without qnty or NumPy installed.
+
+The generated module exposes::
+
+    solve_si(**inputs)  SI floats in, dict of SI floats out
+    solve(**inputs)     the same in the display unit of each variable (see UNITS)
+    INPUTS, OUTPUTS     symbols in parameter / solving order
+    UNITS               display unit symbol per variable
+
+Numeric steps use a compact copy of the ``roots`` search (hint scan and
+Brent's method, then secant, then bracket expansion), emitted only when the
+plan needs it.
+"""
+
+from __future__ import annotations
+
+import builtins
+import importlib.util
+import keyword
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+from types import ModuleType
+
+from ..algebra import Equation, VariableReference
+from ..algebra.codegen import expression_source, float_literal
+from ..core.quantity import Quantity
+from ..core.unit import Unit, ureg
+from .plan import SolvePlan
+from .roots import BRACKET_GROWTH, BRACKET_SCAN_SEGMENTS, MAX_BRACKET_EXPANSIONS, MAX_ROOT_ITERATIONS, ROOT_UNIT_TOLERANCE
+
+# Bump when the layout of generated modules changes
+GENERATED_SOURCE_VERSION = 1
+
+_ROOT_HELPERS = '''
+
+def _residual(function, x):
+    try:
+        value = function(x)
+    except (ValueError, ArithmeticError):
+        return None
+    return value if _math.isfinite(value) else None
+
+
+def _opposite(fa, fb):
+    return (fa > 0) != (fb > 0) or fa == 0.0 or fb == 0.0
+
+
+def _brent(function, a, b, xtol):
+    fa, fb = _residual(function, a), _residual(function, b)
+    if fa is None or fb is None or not _opposite(fa, fb):
+        return None
+    if fa == 0.0:
+        return a
+    bound = max(abs(fa), abs(fb))
+    c, fc = b, fb
+    d = e = b - a
+    for _ in range({max_iterations}):
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 2.0 * _EPSILON * abs(b) + 0.5 * (xtol + 4.0 * _EPSILON * abs(b))
+        midpoint = 0.5 * (c - b)
+        if abs(midpoint) <= tol or fb == 0.0:
+            return None if abs(fb) > bound else b
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p = 2.0 * midpoint * s
+                q = 1.0 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * midpoint * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2.0 * p < min(3.0 * midpoint * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = midpoint
+        else:
+            d = e = midpoint
+        a, fa = b, fb
+        b += d if abs(d) > tol else _math.copysign(tol, midpoint)
+        fb = _residual(function, b)
+        if fb is None:
+            return None
+    return None
+
+
+def _scan(function, lower, upper):
+    f_lower, f_upper = _residual(function, lower), _residual(function, upper)
+    if f_lower is not None and f_upper is not None and _opposite(f_lower, f_upper):
+        return lower, upper
+    width = (upper - lower) / {scan_segments}
+    a, fa = lower, f_lower
+    for i in range(1, {scan_segments} + 1):
+        b = upper if i == {scan_segments} else lower + i * width
+        fb = f_upper if i == {scan_segments} else _residual(function, b)
+        if fa is not None and fb is not None and _opposite(fa, fb):
+            return a, b
+        a, fa = b, fb
+    return None
+
+
+def _secant(function, x0, x1, xtol):
+    f0, f1 = _residual(function, x0), _residual(function, x1)
+    for _ in range({max_iterations}):
+        if f0 is None or f1 is None or f1 == f0:
+            return None
+        if f1 == 0.0:
+            return x1
+        x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
+        if abs(x2 - x1) <= xtol + 4.0 * _EPSILON * abs(x2):
+            return x2
+        x0, f0, x1, f1 = x1, f1, x2, _residual(function, x2)
+    return None
+
+
+def _expand(function, x0, step):
+    f0 = _residual(function, x0)
+    if f0 is None:
+        return None
+    step = max(abs(x0) * 0.1, step)
+    for _ in range({max_expansions}):
+        for x in (x0 + step, x0 - step):
+            fx = _residual(function, x)
+            if fx is not None and _opposite(f0, fx):
+                return (x0, x) if x > x0 else (x, x0)
+        step *= {growth!r}
+    return None
+
+
+def _root(function, x0, bracket, scale, name):
+    xtol = {tolerance!r} * scale
+    if bracket is not None:
+        found = _scan(function, *bracket)
+        root = _brent(function, *found, xtol) if found is not None else None
+        if root is not None:
+            return root
+    root = _secant(function, x0, x0 + 0.01 * (abs(x0) if x0 != 0.0 else scale), xtol)
+    if root is not None:
+        return root
+    found = _expand(function, x0, scale)
+    root = _brent(function, *found, xtol) if found is not None else None
+    if root is None:
+        raise ValueError("No root found for " + name)
+    return root
+'''
+
+
+def module_source(plan: SolvePlan, title: str = "Problem") -> str:
+    """
+    Source of a standalone module that solves a plan.
+
+    Args:
+        plan: Solve plan; every input an equation reads must have a value
+        title: Name used in the module docstring
+
+    Returns:
+        Python source depending only on the standard library
+
+    Raises:
+        ValueError: If an equation reads a variable that is neither a valued input
+            nor solved by an earlier step
+        CompilationError: If an equation contains nodes that cannot be emitted
+    """
+    names = _identifiers(plan.variables)
+    solved = set(plan.unknowns)
+    used = set().union(*(equation.variables for _, equation in plan.steps)) if plan.steps else set()
+    inputs = [symbol for symbol in plan.variables if symbol in used and symbol not in solved]
+    for symbol in inputs:
+        if plan.variables[symbol].value is None:
+            raise ValueError(f"Input '{symbol}' has no value")
+
+    body: list[str] = []
+    known = set(inputs)
+    needs_root = False
+    for index, (symbol, equation) in enumerate(plan.steps):
+        missing = sorted(equation.variables - known - {symbol})
+        if missing:
+            raise ValueError(f"Equation '{equation.name}' needs {missing} before '{symbol}' can be computed")
+        explicit = _explicit_form(symbol, equation)
+        if explicit is not None:
+            body.append(f"    {names[symbol]} = {expression_source(explicit, names)}")
+        else:
+            needs_root = True
+            body.extend(_root_step(index, symbol, equation, plan.variables[symbol], names))
+        known.add(symbol)
+
+    units = {symbol: _display_unit(plan.variables[symbol]) for symbol in [*inputs, *plan.unknowns]}
+    lines = [
+        '"""',
+        f"{title}, generated by qnty.",
+        "",
+        "Computes the unknowns from the known inputs following the problem's solve",
+        "plan. Only the standard library is needed.",
+        "",
+        "    solve_si(**inputs)  SI floats in, dict of SI floats out",
+        "    solve(**inputs)     values in the units listed in UNITS",
+        '"""',
+        "",
+        "import math as _math",
+        "",
+        f"QNTY_SOURCE_VERSION = {GENERATED_SOURCE_VERSION}",
+        f"INPUTS = {tuple(inputs)!r}",
+        f"OUTPUTS = {tuple(plan.unknowns)!r}",
+        f"UNITS = {_dict_literal({symbol: unit.symbol if unit is not None else '' for symbol, unit in units.items()})}",
+    ]
+    if needs_root:
+        lines.append(f"_EPSILON = {sys.float_info.epsilon!r}")
+        lines.append(
+            _ROOT_HELPERS.format(
+                max_iterations=MAX_ROOT_ITERATIONS,
+                scan_segments=BRACKET_SCAN_SEGMENTS,
+                max_expansions=MAX_BRACKET_EXPANSIONS,
+                growth=BRACKET_GROWTH,
+                tolerance=ROOT_UNIT_TOLERANCE,
+            ).rstrip()
+        )
+
+    si_parameters = ", ".join(f"{names[symbol]}={float_literal(plan.variables[symbol].value)}" for symbol in inputs)
+    lines += [
+        "",
+        "",
+        f"def solve_si({si_parameters}):",
+        '    """Unknowns from known inputs, all in SI units."""',
+        *body,
+        f"    return {_dict_literal({symbol: names[symbol] for symbol in plan.unknowns}, quote_values=False)}",
+    ]
+
+    display_parameters = ", ".join(f"{names[symbol]}={float_literal(_to_display(plan.variables[symbol].value, units[symbol]))}" for symbol in inputs)
+    conversions = ", ".join(f"{names[symbol]}={_to_si_source(names[symbol], units[symbol])}" for symbol in inputs)
+    outputs = {symbol: _from_si_source(f"_si[{symbol!r}]", units[symbol]) for symbol in plan.unknowns}
+    lines += [
+        "",
+        "",
+        f"def solve({display_parameters}):",
+        '    """Unknowns from known inputs, in the units listed in UNITS."""',
+        f"    _si = solve_si({conversions})",
+        f"    return {_dict_literal(outputs, quote_values=False)}",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def load_module(source: str, name: str, path: str | Path | None = None) -> ModuleType:
+    """
+    Import generated source as a module.
+
+    Args:
+        source: Module source, e.g. from ``module_source``
+        name: Module name
+        path: Optional ``.py`` file to write the source to and import from; the
+            file is only rewritten when its content changes, so the bytecode
+            cached next to it by importlib stays valid across processes
+
+    Returns:
+        The imported module (not registered in ``sys.modules``)
+    """
+    if path is None:
+        spec = importlib.util.spec_from_loader(name, loader=None)
+        module = importlib.util.module_from_spec(spec)
+        exec(compile(source, f"<{name}>", "exec"), module.__dict__)
+        return module
+
+    path = Path(path)
+    if not path.exists() or path.read_text(encoding="utf-8") != source:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source, encoding="utf-8")
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot import generated module from {path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ========== HELPERS ==========
+
+
+def _identifiers(variables: Mapping[str, Quantity]) -> dict[str, str]:
+    """Python identifier per symbol; symbols that are not safe local names are renamed ``_v<n>``."""
+    names = {}
+    for index, symbol in enumerate(variables):
+        safe = symbol.isidentifier() and not keyword.iskeyword(symbol) and not symbol.startswith("_") and not hasattr(builtins, symbol)
+        names[symbol] = symbol if safe else f"_v{index}"
+    return names
+
+
+def _explicit_form(symbol: str, equation: Equation):
+    """Expression giving the unknown directly (assignment or closed-form inversion), if any."""
+    if isinstance(equation.lhs, VariableReference) and equation.lhs.name == symbol and symbol not in equation.rhs.get_variables():
+        return equation.rhs
+    return equation.inversion_for(symbol)
+
+
+def _root_step(index: int, symbol: str, equation: Equation, variable: Quantity, names: Mapping[str, str]) -> list[str]:
+    """Residual function and root search for an unknown with no closed form."""
+    residual = f"_residual_{index}"
+    lhs, rhs = expression_source(equation.lhs, names), expression_source(equation.rhs, names)
+    bracket = equation._bracket_hint(symbol, variable)
+    scale = equation._unit_scale(variable)
+    start = variable.value
+    if start is None:
+        start = 0.5 * (bracket[0] + bracket[1]) if bracket is not None else scale
+    bracket_source = f"({float_literal(bracket[0])}, {float_literal(bracket[1])})" if bracket is not None else "None"
+    return [
+        "",
+        f"    def {residual}({names[symbol]}):",
+        f"        return {lhs} - {rhs}",
+        "",
+        f"    {names[symbol]} = _root({residual}, {float_literal(start)}, {bracket_source}, {float_literal(scale)}, {symbol!r})",
+    ]
+
+
+def _display_unit(variable: Quantity) -> Unit | None:
+    """Unit a variable is reported in, as in ``Quantity.__str__``."""
+    return variable._output_unit or variable.preferred or ureg.preferred_for(variable.dim) or ureg.si_unit_for(variable.dim)
+
+
+def _to_display(value: float, unit: Unit | None) -> float:
+    """Display value of an SI value, shortened when the shorter literal converts back exactly."""
+    if unit is None:
+        return value
+    display = (value - unit.si_offset) / unit.si_factor
+    shortened = float(f"{display:.15g}")
+    return shortened if shortened * unit.si_factor + unit.si_offset == value else display
+
+
+def _to_si_source(name: str, unit: Unit | None) -> str:
+    """Inline conversion of a display value to SI."""
+    if unit is None or (unit.si_factor == 1.0 and unit.si_offset == 0.0):
+        return name
+    if unit.si_offset == 0.0:
+        return f"{name} * {float_literal(unit.si_factor)}"
+    return f"{name} * {float_literal(unit.si_factor)} + {float_literal(unit.si_offset)}"
+
+
+def _from_si_source(value: str, unit: Unit | None) -> str:
+    """Inline conversion of an SI value to its display unit."""
+    if unit is None or (unit.si_factor == 1.0 and unit.si_offset == 0.0):
+        return value
+    if unit.si_offset == 0.0:
+        return f"{value} / {float_literal(unit.si_factor)}"
+    return f"({value} - {float_literal(unit.si_offset)}) / {float_literal(unit.si_factor)}"
+
+
+def _dict_literal(items: Mapping[str, str], quote_values: bool = True) -> str:
+    entries = ", ".join(f"{key!r}: {value!r}" if quote_values else f"{key!r}: {value}" for key, value in items.items())
+    return "{" + entries + "}"
+
+
+__all__ = [
+    "GENERATED_SOURCE_VERSION",
+    "load_module",
+    "module_source",
+]
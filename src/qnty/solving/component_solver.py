@@ -19,12 +19,100 @@ This method is preferred over geometric/trigonometric methods when:
 """
 
 import math
+from collections.abc import Callable
+from dataclasses import dataclass
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ..core.dimension_catalog import dim
 from ..core.quantity import Quantity
+from ..core.unit import Unit, resolve_unit
 from ..spatial import _Vector
 from ..spatial.vector import _Vector
 
 
+@dataclass(frozen=True)
+class LoadCaseResults:
+    """
+    Resultants of K load cases solved together by ``ComponentSolver.solve_cases``.
+
+    All arrays are in SI units (N and radians), one row per load case.
+
+    Attributes:
+        names: Force names, in column order
+        force_components: Components of every force, shape (K, n, 3)
+        components: Resultant components ΣFx, ΣFy, ΣFz, shape (K, 3)
+        magnitude: Resultant magnitudes, shape (K,)
+        angle: Resultant angles CCW from +x, shape (K,)
+        direction_cosines: cos α, cos β, cos γ of the resultants, shape (K, 3)
+        unit: Display unit of the magnitudes
+    """
+
+    names: tuple[str, ...]
+    force_components: NDArray[np.float64]
+    components: NDArray[np.float64]
+    magnitude: NDArray[np.float64]
+    angle: NDArray[np.float64]
+    direction_cosines: NDArray[np.float64]
+    unit: Unit
+
+    def __len__(self) -> int:
+        return len(self.magnitude)
+
+    def magnitude_in(self, unit: Unit | str) -> NDArray[np.float64]:
+        """Resultant magnitudes in the given force unit."""
+        return self.magnitude / resolve_unit(unit, dim.force).si_factor
+
+    def angle_in(self, unit: Unit | str = "degree") -> NDArray[np.float64]:
+        """Resultant angles (CCW from +x) in the given angle unit."""
+        return self.angle / resolve_unit(unit, dim.D).si_factor
+
+    def direction_angles(self) -> NDArray[np.float64]:
+        """Coordinate direction angles α, β, γ in radians, shape (K, 3)."""
+        return np.arccos(np.clip(self.direction_cosines, -1.0, 1.0))
+
+    def solution_steps(self, case: int) -> list[dict]:
+        """Component-method steps for one load case, formatted on request."""
+        force_components = [tuple(float(c) for c in row) for row in self.force_components[case]]
+        sum_x, sum_y, sum_z = (float(c) for c in self.components[case])
+        return _resultant_steps(self.names, force_components, sum_x, sum_y, sum_z, float(self.magnitude[case]))
+
+
+def _resultant_steps(
+    names: tuple[str, ...] | list[str], force_components: list[tuple[float, float, float]], sum_x: float, sum_y: float, sum_z: float, magnitude: float
+) -> list[dict]:
+    """Solution steps of the component method for a resultant."""
+    steps: list[dict] = [{"method": "Component Method (Scalar Notation)", "description": "Resolving forces into x and y components"}]
+    steps.append({"components": [f"{name}: Fx = {fx:.3f} N, Fy = {fy:.3f} N" for name, (fx, fy, _fz) in zip(names, force_components, strict=True)]})
+
+    if abs(sum_z) > 1e-10:
+        steps.append({"description": "Summing force components algebraically (3D)", "equations": [f"→+ ΣFx = {sum_x:.3f} N", f"↑+ ΣFy = {sum_y:.3f} N", f"↗+ ΣFz = {sum_z:.3f} N"]})
+        cosines = [max(-1.0, min(1.0, c / magnitude)) if magnitude else 0.0 for c in (sum_x, sum_y, sum_z)]
+        alpha_deg, beta_deg, gamma_deg = (math.degrees(math.acos(c)) for c in cosines)
+        steps.append(
+            {
+                "description": "Calculating resultant magnitude and direction angles",
+                "equations": [
+                    f"FR = √(ΣFx² + ΣFy² + ΣFz²) = √({sum_x:.3f}² + {sum_y:.3f}² + {sum_z:.3f}²) = {magnitude:.3f} N",
+                    f"α = cos⁻¹(ΣFx/FR) = cos⁻¹({sum_x:.3f}/{magnitude:.3f}) = {alpha_deg:.2f}°",
+                    f"β = cos⁻¹(ΣFy/FR) = cos⁻¹({sum_y:.3f}/{magnitude:.3f}) = {beta_deg:.2f}°",
+                    f"γ = cos⁻¹(ΣFz/FR) = cos⁻¹({sum_z:.3f}/{magnitude:.3f}) = {gamma_deg:.2f}°",
+                ],
+            }
+        )
+    else:
+        steps.append({"description": "Summing force components algebraically", "equations": [f"→+ ΣFx = {sum_x:.3f} N", f"↑+ ΣFy = {sum_y:.3f} N"]})
+        angle_deg = math.degrees(math.atan2(sum_y, sum_x))
+        steps.append(
+            {
+                "description": "Calculating resultant magnitude and direction",
+                "equations": [f"FR = √(ΣFx² + ΣFy²) = √({sum_x:.3f}² + {sum_y:.3f}²) = {magnitude:.3f} N", f"θ = tan⁻¹(ΣFy/ΣFx) = tan⁻¹({sum_y:.3f}/{sum_x:.3f}) = {angle_deg:.2f}°"],
+            }
+        )
+    return steps
+
+
 class ComponentSolver:
     """
     Solves 2D/3D force equilibrium problems using the component/Cartesian method.
@@ -32,11 +120,32 @@ class ComponentSolver:
     This is the standard engineering mechanics approach using:
     - Scalar notation: ΣFx = 0, ΣFy = 0
     - Cartesian vectors: F = {Fx i + Fy j + Fz k}
+
+    Solution steps for reports are only formatted when ``get_solution_steps``
+    (or ``solution_steps``) is read; solving just records how to build them.
     """
 
     def __init__(self):
         """Initialize the component solver."""
-        self.solution_steps: list[dict] = []
+        self._solution_steps: list[dict] = []
+        self._pending_steps: Callable[[], list[dict]] | None = None
+
+    @property
+    def solution_steps(self) -> list[dict]:
+        """Solution steps of the last solve, formatted on first access."""
+        if self._pending_steps is not None:
+            self._solution_steps = self._pending_steps()
+            self._pending_steps = None
+        return self._solution_steps
+
+    @solution_steps.setter
+    def solution_steps(self, steps: list[dict]) -> None:
+        self._solution_steps = steps
+        self._pending_steps = None
+
+    def _defer_steps(self, build: Callable[[], list[dict]]) -> None:
+        """Record how to build the solution steps of the current solve."""
+        self._pending_steps = build
 
     def _resolve_force_relative_angles(self, forces_dict: dict[str, _Vector], resolve_unknown_refs: bool = False) -> None:
         """
@@ -395,64 +504,29 @@ class ComponentSolver:
         from ..core.dimension_catalog import dim
         from ..core.unit import ureg
 
-        self.solution_steps = []
-
         # Step 1: Resolve each force into components
-        self.solution_steps.append({"method": "Component Method (Scalar Notation)", "description": "Resolving forces into x and y components"})
-
-        components_breakdown = []
-        for force in known_forces:
-            fx, fy, fz = self.resolve_force_components(force)
-
-            # Get angle in degrees for display
-            if force.angle and force.angle.value is not None:
-                angle_deg = math.degrees(force.angle.value)
-            else:
-                angle_deg = math.degrees(math.atan2(fy, fx))
-
-            components_breakdown.append(f"{force.name}: Fx = {fx:.3f} N, Fy = {fy:.3f} N")
-
-        self.solution_steps.append({"components": components_breakdown})
+        force_components = [self.resolve_force_components(force) for force in known_forces]
 
         # Step 2: Sum components
-        sum_x, sum_y, sum_z = self.sum_components(known_forces)
+        sum_x = sum(c[0] for c in force_components)
+        sum_y = sum(c[1] for c in force_components)
+        sum_z = sum(c[2] for c in force_components)
 
         # Detect if this is a 3D problem (any z-component non-zero)
         is_3d = abs(sum_z) > 1e-10
 
-        if is_3d:
-            self.solution_steps.append({"description": "Summing force components algebraically (3D)", "equations": [f"→+ ΣFx = {sum_x:.3f} N", f"↑+ ΣFy = {sum_y:.3f} N", f"↗+ ΣFz = {sum_z:.3f} N"]})
-        else:
-            self.solution_steps.append({"description": "Summing force components algebraically", "equations": [f"→+ ΣFx = {sum_x:.3f} N", f"↑+ ΣFy = {sum_y:.3f} N"]})
-
         # Step 3: Calculate resultant magnitude
         magnitude = self.calculate_resultant_magnitude(sum_x, sum_y, sum_z)
 
+        names = [force.name for force in known_forces]
+        self._defer_steps(lambda: _resultant_steps(names, force_components, sum_x, sum_y, sum_z, magnitude))
+
         # Step 4: Calculate resultant direction
         result_unit = ureg.resolve(force_unit if force_unit else "N", dim=dim.force)
         degree_unit = ureg.resolve("degree", dim=dim.D)
 
         if is_3d:
-            # 3D: Calculate direction angles α, β, γ
-            alpha_rad, beta_rad, gamma_rad = self.calculate_direction_angles_3d(sum_x, sum_y, sum_z, magnitude)
-            alpha_deg = math.degrees(alpha_rad)
-            beta_deg = math.degrees(beta_rad)
-            gamma_deg = math.degrees(gamma_rad)
-
-            self.solution_steps.append(
-                {
-                    "description": "Calculating resultant magnitude and direction angles",
-                    "equations": [
-                        f"FR = √(ΣFx² + ΣFy² + ΣFz²) = √({sum_x:.3f}² + {sum_y:.3f}² + {sum_z:.3f}²) = {magnitude:.3f} N",
-                        f"α = cos⁻¹(ΣFx/FR) = cos⁻¹({sum_x:.3f}/{magnitude:.3f}) = {alpha_deg:.2f}°",
-                        f"β = cos⁻¹(ΣFy/FR) = cos⁻¹({sum_y:.3f}/{magnitude:.3f}) = {beta_deg:.2f}°",
-                        f"γ = cos⁻¹(ΣFz/FR) = cos⁻¹({sum_z:.3f}/{magnitude:.3f}) = {gamma_deg:.2f}°",
-                    ],
-                }
-            )
-
             # Create 3D ForceVector using components
-            mag_qty = Quantity(name="F_R_magnitude", dim=dim.force, value=magnitude, preferred=result_unit)
             x_qty = Quantity(name="F_R_x", dim=dim.force, value=sum_x, preferred=result_unit)
             y_qty = Quantity(name="F_R_y", dim=dim.force, value=sum_y, preferred=result_unit)
             z_qty = Quantity(name="F_R_z", dim=dim.force, value=sum_z, preferred=result_unit)
@@ -462,14 +536,6 @@ class ComponentSolver:
         else:
             # 2D: Calculate angle θ from +x axis
             angle_rad = self.calculate_resultant_angle_2d(sum_x, sum_y)
-            angle_deg = math.degrees(angle_rad)
-
-            self.solution_steps.append(
-                {
-                    "description": "Calculating resultant magnitude and direction",
-                    "equations": [f"FR = √(ΣFx² + ΣFy²) = √({sum_x:.3f}² + {sum_y:.3f}²) = {magnitude:.3f} N", f"θ = tan⁻¹(ΣFy/ΣFx) = tan⁻¹({sum_y:.3f}/{sum_x:.3f}) = {angle_deg:.2f}°"],
-                }
-            )
 
             # Create Quantities in SI units
             mag_qty = Quantity(name="F_R_magnitude", dim=dim.force, value=magnitude)
@@ -518,12 +584,7 @@ class ComponentSolver:
         from ..core.dimension_catalog import dim
         from ..core.unit import ureg
 
-        self.solution_steps = []
-
-        # Step 1: Get known components and angles
-        self.solution_steps.append({"method": "Constrained Equilibrium Method", "description": "Solving for unknown magnitudes with known directions"})
-
-        # Sum known forces
+        # Step 1: Sum known forces
         sum_known_x, sum_known_y, _ = self.sum_components(known_forces)
 
         # Get angles (in radians) - validate they exist
@@ -535,16 +596,6 @@ class ComponentSolver:
         theta_unknown = unknown_force.angle.value
         theta_R = unknown_resultant.angle.value
 
-        self.solution_steps.append(
-            {
-                "description": "Setting up equilibrium equations",
-                "equations": [
-                    f"ΣFx: {sum_known_x:.3f} + |F_unknown|*cos({math.degrees(theta_unknown):.1f}°) = |FR|*cos({math.degrees(theta_R):.1f}°)",
-                    f"ΣFy: {sum_known_y:.3f} + |F_unknown|*sin({math.degrees(theta_unknown):.1f}°) = |FR|*sin({math.degrees(theta_R):.1f}°)",
-                ],
-            }
-        )
-
         # Solve system of linear equations:
         # sum_known_x + |F_u| * cos(θ_u) = |FR| * cos(θ_R)
         # sum_known_y + |F_u| * sin(θ_u) = |FR| * sin(θ_R)
@@ -564,7 +615,19 @@ class ComponentSolver:
         except np.linalg.LinAlgError as err:
             raise ValueError("Cannot solve constrained equilibrium - system is singular. The unknown force and resultant may be parallel.") from err
 
-        self.solution_steps.append({"description": "Solved for magnitudes", "results": [f"|F_unknown| = {mag_unknown:.3f} N", f"|FR| = {mag_R:.3f} N"]})
+        self._defer_steps(
+            lambda: [
+                {"method": "Constrained Equilibrium Method", "description": "Solving for unknown magnitudes with known directions"},
+                {
+                    "description": "Setting up equilibrium equations",
+                    "equations": [
+                        f"ΣFx: {sum_known_x:.3f} + |F_unknown|*cos({math.degrees(theta_unknown):.1f}°) = |FR|*cos({math.degrees(theta_R):.1f}°)",
+                        f"ΣFy: {sum_known_y:.3f} + |F_unknown|*sin({math.degrees(theta_unknown):.1f}°) = |FR|*sin({math.degrees(theta_R):.1f}°)",
+                    ],
+                },
+                {"description": "Solved for magnitudes", "results": [f"|F_unknown| = {mag_unknown:.3f} N", f"|FR| = {mag_R:.3f} N"]},
+            ]
+        )
 
         # Create solved forces
         result_unit = ureg.resolve(force_unit if force_unit else "N", dim=dim.force)
@@ -615,24 +678,14 @@ class ComponentSolver:
         from ..core.dimension_catalog import dim
         from ..core.unit import ureg
 
-        self.solution_steps = []
-
         # Step 1: Get resultant components
-        self.solution_steps.append({"method": "Reverse Component Method", "description": "Solving for unknown force given known resultant"})
-
         R_x, R_y, R_z = self.resolve_force_components(known_resultant)
 
         # Step 2: Sum known forces
-        sum_known_x, sum_known_y, sum_known_z = self.sum_components(known_forces)
-
-        components_breakdown = []
-        for force in known_forces:
-            fx, fy, fz = self.resolve_force_components(force)
-            components_breakdown.append(f"{force.name}: Fx = {fx:.3f} N, Fy = {fy:.3f} N")
-
-        self.solution_steps.append({"components": components_breakdown})
-
-        self.solution_steps.append({"description": "Resultant components", "equations": [f"F_R: Fx = {R_x:.3f} N, Fy = {R_y:.3f} N"]})
+        force_components = [self.resolve_force_components(force) for force in known_forces]
+        sum_known_x = sum(c[0] for c in force_components)
+        sum_known_y = sum(c[1] for c in force_components)
+        sum_known_z = sum(c[2] for c in force_components)
 
         # Step 3: Calculate unknown force components
         # F_unknown = F_R - Sum(known forces)
@@ -640,37 +693,56 @@ class ComponentSolver:
         unknown_y = R_y - sum_known_y
         unknown_z = R_z - sum_known_z
 
-        self.solution_steps.append(
-            {
-                "description": "Solving for unknown force components",
-                "equations": [
-                    f"F_unknown_x = F_R_x - ΣF_known_x = {R_x:.3f} - {sum_known_x:.3f} = {unknown_x:.3f} N",
-                    f"F_unknown_y = F_R_y - ΣF_known_y = {R_y:.3f} - {sum_known_y:.3f} = {unknown_y:.3f} N",
-                ],
-            }
-        )
-
         # Step 4: Calculate magnitude and angle
         magnitude = self.calculate_resultant_magnitude(unknown_x, unknown_y, unknown_z)
 
         # Check if this is a 3D problem (non-zero z-component)
-        is_3d = abs(unknown_z) > 1e-6 or abs(R_z) > 1e-6 or any(abs(self.resolve_force_components(f)[2]) > 1e-6 for f in known_forces)
+        is_3d = abs(unknown_z) > 1e-6 or abs(R_z) > 1e-6 or any(abs(c[2]) > 1e-6 for c in force_components)
 
         result_unit = ureg.resolve(force_unit if force_unit else "N", dim=dim.force)
         degree_unit = ureg.resolve("degree", dim=dim.D)
 
-        if is_3d:
-            # 3D problem - create force with x, y, z components
-            self.solution_steps.append(
+        names = [force.name for force in known_forces]
+
+        def build_steps() -> list[dict]:
+            steps = [
+                {"method": "Reverse Component Method", "description": "Solving for unknown force given known resultant"},
+                {"components": [f"{name}: Fx = {fx:.3f} N, Fy = {fy:.3f} N" for name, (fx, fy, _fz) in zip(names, force_components, strict=True)]},
+                {"description": "Resultant components", "equations": [f"F_R: Fx = {R_x:.3f} N, Fy = {R_y:.3f} N"]},
                 {
-                    "description": "Calculating unknown force magnitude and direction (3D)",
+                    "description": "Solving for unknown force components",
                     "equations": [
-                        f"F_unknown = √(Fx² + Fy² + Fz²) = √({unknown_x:.3f}² + {unknown_y:.3f}² + {unknown_z:.3f}²) = {magnitude:.3f} N",
+                        f"F_unknown_x = F_R_x - ΣF_known_x = {R_x:.3f} - {sum_known_x:.3f} = {unknown_x:.3f} N",
+                        f"F_unknown_y = F_R_y - ΣF_known_y = {R_y:.3f} - {sum_known_y:.3f} = {unknown_y:.3f} N",
                     ],
-                }
-            )
+                },
+            ]
+            if is_3d:
+                steps.append(
+                    {
+                        "description": "Calculating unknown force magnitude and direction (3D)",
+                        "equations": [
+                            f"F_unknown = √(Fx² + Fy² + Fz²) = √({unknown_x:.3f}² + {unknown_y:.3f}² + {unknown_z:.3f}²) = {magnitude:.3f} N",
+                        ],
+                    }
+                )
+            else:
+                angle_deg = math.degrees(math.atan2(unknown_y, unknown_x))
+                steps.append(
+                    {
+                        "description": "Calculating unknown force magnitude and direction",
+                        "equations": [
+                            f"F_unknown = √(Fx² + Fy²) = √({unknown_x:.3f}² + {unknown_y:.3f}²) = {magnitude:.3f} N",
+                            f"θ = tan⁻¹(Fy/Fx) = tan⁻¹({unknown_y:.3f}/{unknown_x:.3f}) = {angle_deg:.2f}°",
+                        ],
+                    }
+                )
+            return steps
+
+        self._defer_steps(build_steps)
 
-            # Create component Quantities in SI units
+        if is_3d:
+            # 3D problem - create force with x, y, z components in SI units
             x_qty = Quantity(name=f"{unknown_force_name}_x", dim=dim.force, value=unknown_x, preferred=result_unit)
             y_qty = Quantity(name=f"{unknown_force_name}_y", dim=dim.force, value=unknown_y, preferred=result_unit)
             z_qty = Quantity(name=f"{unknown_force_name}_z", dim=dim.force, value=unknown_z, preferred=result_unit)
@@ -680,17 +752,6 @@ class ComponentSolver:
         else:
             # 2D problem - create force with magnitude and angle
             angle_rad = self.calculate_resultant_angle_2d(unknown_x, unknown_y)
-            angle_deg = math.degrees(angle_rad)
-
-            self.solution_steps.append(
-                {
-                    "description": "Calculating unknown force magnitude and direction",
-                    "equations": [
-                        f"F_unknown = √(Fx² + Fy²) = √({unknown_x:.3f}² + {unknown_y:.3f}²) = {magnitude:.3f} N",
-                        f"θ = tan⁻¹(Fy/Fx) = tan⁻¹({unknown_y:.3f}/{unknown_x:.3f}) = {angle_deg:.2f}°",
-                    ],
-                }
-            )
 
             # Create Quantities in SI units
             mag_qty = Quantity(name=f"{unknown_force_name}_magnitude", dim=dim.force, value=magnitude, preferred=result_unit)
@@ -701,6 +762,130 @@ class ComponentSolver:
 
         return unknown_force
 
+    def solve_cases(
+        self, force_matrix: ArrayLike, forces: list[_Vector], force_unit: str | None = None, angle_unit: str = "degree"
+    ) -> LoadCaseResults:
+        """
+        Calculate the resultants of many load cases that share one force system.
+
+        The forces fix the topology: names, angle references (``wrt``) and
+        force-relative angles. Each load case only supplies new magnitudes and
+        angles, and all cases are resolved and summed at once with array math.
+
+        Args:
+            force_matrix: Array of shape (K, n, 2) holding [magnitude, angle] for
+                each of the n forces in each of the K cases (a single (n, 2) case
+                is accepted). Angles are measured in each force's own reference;
+                for a force defined relative to another force the angle is the
+                offset from that force. NaN keeps the force's own value, and a
+                row of NaNs keeps its components (including z).
+            forces: The n known forces, in column order
+            force_unit: Unit of the magnitudes (default: unit of the first force, or N)
+            angle_unit: Unit of the angles (default "degree")
+
+        Returns:
+            LoadCaseResults with resultant magnitudes, angles and direction cosines
+
+        Raises:
+            ValueError: If the matrix shape does not match the forces, a force is
+                unknown, or a NaN entry has no value to fall back on
+
+        Examples:
+            >>> F1 = _Vector(magnitude=100, angle=30, unit="N", name="F_1")
+            >>> F2 = _Vector(magnitude=200, angle=120, unit="N", name="F_2")
+            >>> cases = solver.solve_cases(np.random.rand(5000, 2, 2) * [300, 360], [F1, F2])
+            >>> cases.magnitude_in("N").max()
+        """
+        matrix = np.array(force_matrix, dtype=float)
+        if matrix.ndim == 2:
+            matrix = matrix[np.newaxis]
+        if matrix.ndim != 3 or matrix.shape[1:] != (len(forces), 2):
+            raise ValueError(f"Expected a force matrix of shape (K, {len(forces)}, 2), got {matrix.shape}")
+
+        if force_unit is None:
+            first = forces[0].magnitude if forces else None
+            force_unit = first.preferred.symbol if first is not None and first.preferred is not None else "N"
+        result_unit = resolve_unit(force_unit, dim.force)
+        angle_factor = resolve_unit(angle_unit, dim.D).si_factor
+
+        magnitudes = matrix[:, :, 0] * result_unit.si_factor
+        angles = matrix[:, :, 1] * angle_factor
+
+        index = {force.name: j for j, force in enumerate(forces)}
+        standard_angles: dict[int, NDArray[np.float64]] = {}
+
+        def standard_angle(j: int, visiting: frozenset[int] = frozenset()) -> NDArray[np.float64]:
+            """Angles of force j CCW from +x for every case, resolving references first."""
+            if j in standard_angles:
+                return standard_angles[j]
+            force = forces[j]
+            column = angles[:, j]
+            missing = np.isnan(column)
+            if force._relative_to_force is not None:
+                ref = index.get(force._relative_to_force)
+                if ref is None:
+                    raise ValueError(f"Force {force.name} references unknown force {force._relative_to_force}")
+                if ref in visiting:
+                    raise ValueError(f"Force {force.name} has a circular relative angle reference")
+                offset = np.where(missing, force._relative_angle or 0.0, column)
+                result = standard_angle(ref, visiting | {j}) + offset
+            else:
+                reference = force.angle_reference
+                result = reference.to_standard_array(column) if reference is not None else column % (2 * math.pi)
+                if missing.any():
+                    default = force.angle.value if force.angle is not None and force.angle.value is not None else math.nan
+                    result = np.where(missing, default, result)
+            standard_angles[j] = result
+            return result
+
+        force_components = np.zeros(matrix.shape[:2] + (3,))
+        for j, force in enumerate(forces):
+            if not force.is_known:
+                raise ValueError(f"solve_cases needs known forces; {force.name} is unknown")
+
+            # Rows of NaNs keep the stored components, unless those wait on a relative angle
+            fixed = np.isnan(matrix[:, j, 0]) & np.isnan(matrix[:, j, 1]) & (force._relative_to_force is None)
+            column = magnitudes[:, j]
+            if np.isnan(column).any():
+                default = force.magnitude.value if force.magnitude is not None and force.magnitude.value is not None else math.nan
+                column = np.where(np.isnan(column), default, column)
+
+            theta = standard_angle(j)
+            fx, fy = column * np.cos(theta), column * np.sin(theta)
+            if np.isnan(fx[~fixed]).any() or np.isnan(fy[~fixed]).any():
+                raise ValueError(f"Force {force.name} has no magnitude or angle to use for NaN entries")
+            force_components[:, j, 0] = np.where(fixed, force._x, fx)
+            force_components[:, j, 1] = np.where(fixed, force._y, fy)
+            force_components[:, j, 2] = np.where(fixed, force._z, 0.0)
+
+        components = force_components.sum(axis=1)
+        magnitude = np.sqrt(np.einsum("ij,ij->i", components, components))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cosines = np.where(magnitude[:, None] > 0, components / magnitude[:, None], 0.0)
+
+        results = LoadCaseResults(
+            names=tuple(force.name for force in forces),
+            force_components=force_components,
+            components=components,
+            magnitude=magnitude,
+            angle=np.arctan2(components[:, 1], components[:, 0]),
+            direction_cosines=cosines,
+            unit=result_unit,
+        )
+
+        def build_steps() -> list[dict]:
+            if len(results) == 0:
+                return [{"method": "Component Method (Load Cases)", "description": "0 load cases"}]
+            governing = int(np.argmax(magnitude))
+            summary = {
+                "method": "Component Method (Load Cases)",
+                "description": f"{len(results)} load cases; governing case {governing} with FR = {magnitude[governing]:.3f} N",
+            }
+            return [summary, *results.solution_steps(governing)]
+
+        self._defer_steps(build_steps)
+        return results
+
     def get_solution_steps(self) -> list[dict]:
         """Get the solution steps for report generation."""
         return self.solution_steps
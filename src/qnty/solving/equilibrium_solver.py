@@ -0,0 +1,371 @@
+"""
+Unified solver for 2D force equilibrium with unknown magnitudes and angles.
+
+Every planar statics problem with two unknowns reduces to the same small
+nonlinear system. Each force contributes s·M·(cos θ, sin θ), with s = +1
+for applied forces and s = -1 for the resultant, and the sum must vanish:
+
+    ΣFx = Σ s·M·cos θ = 0
+    ΣFy = Σ s·M·sin θ = 0
+
+Any magnitude M or angle θ may be unknown, and an angle may be tied to
+another force's angle by a fixed offset (θ = θ_ref + δ). The solver:
+
+1. Derives closed-form starting points for every solution branch. Writing
+   each force as a complex number, the system is linear in the magnitudes.
+   One unknown angle meets a line (circle–line intersection) or solves a
+   quadratic, and two unknown angles close a triangle (law of cosines).
+2. Polishes each start with Newton / Gauss-Newton steps using the analytic
+   Jacobian, so rounding is removed and least-squares problems converge.
+3. Returns the distinct converged solutions in a fixed branch order.
+
+Starting points are exact for the configurations met in statics problems,
+so Newton typically stops after one step. There are no search loops.
+"""
+
+from __future__ import annotations
+
+import cmath
+import math
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class EquilibriumTerm:
+    """
+    One force in the equilibrium equations.
+
+    Attributes:
+        name: Force name
+        magnitude: Magnitude in SI units, or None if unknown
+        angle: Angle CCW from +x in radians, or None if unknown
+        sign: +1 for applied forces, -1 for the resultant they add up to
+        relative_to: Name of the force this angle is measured from (angle = θ_ref + offset)
+        offset: Angle offset from ``relative_to`` in radians
+    """
+
+    name: str
+    magnitude: float | None
+    angle: float | None
+    sign: float = 1.0
+    relative_to: str | None = None
+    offset: float = 0.0
+
+
+@dataclass(frozen=True)
+class EquilibriumSolution:
+    """
+    One solution branch of an equilibrium system.
+
+    Attributes:
+        magnitudes: Magnitude of every force (SI units); may be negative
+        angles: Angle of every force, CCW from +x in radians
+        unknowns: Names of the solved unknowns, e.g. ("F_1.magnitude", "F_R.angle")
+        branch: Index of the analytic starting point that led here
+        iterations: Newton iterations used
+        residual: Norm of (ΣFx, ΣFy) at the solution
+    """
+
+    magnitudes: dict[str, float]
+    angles: dict[str, float]
+    unknowns: tuple[str, ...] = field(default=())
+    branch: int = 0
+    iterations: int = 0
+    residual: float = 0.0
+
+
+class EquilibriumSolver:
+    """
+    Solve ΣF = 0 in the plane for unknown magnitudes and angles.
+
+    Examples:
+        >>> terms = [
+        ...     EquilibriumTerm("F_1", 450.0, None),
+        ...     EquilibriumTerm("F_2", 700.0, math.radians(195)),
+        ...     EquilibriumTerm("F_R", None, math.radians(90), sign=-1.0),
+        ... ]
+        >>> for solution in EquilibriumSolver().solve(terms):
+        ...     print(solution.magnitudes["F_R"], solution.angles["F_1"])
+    """
+
+    def __init__(self, tolerance: float = 1e-10, max_iterations: int = 25):
+        """
+        Args:
+            tolerance: Convergence tolerance on the residual, relative to the force scale
+            max_iterations: Newton iterations allowed per starting point
+        """
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+
+    def solve(self, terms: list[EquilibriumTerm]) -> list[EquilibriumSolution]:
+        """
+        Find every solution branch of the equilibrium equations.
+
+        Args:
+            terms: The forces, with unknowns set to None
+
+        Returns:
+            Distinct solutions in branch order, empty if the forces cannot close
+
+        Raises:
+            ValueError: If there are more than two unknowns, or a relative angle
+                refers to an unknown force name or forms a cycle
+        """
+        system = _System(terms)
+        if len(system.variables) > 2:
+            names = ", ".join(system.unknown_names())
+            raise ValueError(f"Cannot solve: {len(system.variables)} unknowns ({names}) with 2 equilibrium equations")
+
+        scale = max(1.0, sum(abs(term.magnitude) for term in terms if term.magnitude is not None))
+        solutions: list[EquilibriumSolution] = []
+        for branch, start in enumerate(system.starting_points()):
+            values, iterations, residual = self._newton(system, start)
+            if residual > self.tolerance * scale:
+                continue
+            solution = system.solution(values, branch, iterations, residual)
+            if not any(_same(solution, other, scale) for other in solutions):
+                solutions.append(solution)
+        return solutions
+
+    def _newton(self, system: _System, start: list[float]) -> tuple[list[float], int, float]:
+        """Newton / Gauss-Newton iterations from one starting point."""
+        values = list(start)
+        residual = system.residual(values)
+        for iteration in range(self.max_iterations + 1):
+            norm = abs(residual)
+            if norm <= self.tolerance * system.scale * 1e-3 or not system.variables:
+                return values, iteration, norm
+            if iteration == self.max_iterations:
+                break
+            columns = system.jacobian(values)
+            step = _least_squares_step(columns, residual)
+            if step is None:
+                break
+            values = [v + s for v, s in zip(values, step, strict=True)]
+            new_residual = system.residual(values)
+            if abs(new_residual) >= norm:
+                break
+            residual = new_residual
+        return values, iteration, abs(residual)
+
+
+class _System:
+    """Equilibrium terms with their unknowns numbered as variables."""
+
+    def __init__(self, terms: list[EquilibriumTerm]):
+        self.terms = terms
+        self.index = {term.name: j for j, term in enumerate(terms)}
+        # Variables: ("m", j) for an unknown magnitude, ("a", j) for an unknown base angle
+        self.variables: list[tuple[str, int]] = []
+        for j, term in enumerate(terms):
+            if term.magnitude is None:
+                self.variables.append(("m", j))
+            if term.angle is None and term.relative_to is None:
+                self.variables.append(("a", j))
+        self.scale = max(1.0, sum(abs(term.magnitude) for term in terms if term.magnitude is not None))
+
+        # Every angle is root angle + offset; the root is a known angle or an angle variable
+        self.roots: list[tuple[int | None, float]] = [self._root(j, frozenset()) for j in range(len(terms))]
+
+    def _root(self, j: int, visiting: frozenset[int]) -> tuple[int | None, float]:
+        """(angle variable index or None, offset or absolute angle) for term j."""
+        term = self.terms[j]
+        if term.relative_to is not None:
+            ref = self.index.get(term.relative_to)
+            if ref is None:
+                raise ValueError(f"Force {term.name} references unknown force {term.relative_to}")
+            if ref in visiting:
+                raise ValueError(f"Force {term.name} has a circular relative angle reference")
+            variable, base = self._root(ref, visiting | {j})
+            return variable, base + term.offset
+        if term.angle is None:
+            return self.variables.index(("a", j)), 0.0
+        return None, term.angle
+
+    def unknown_names(self) -> list[str]:
+        return [f"{self.terms[j].name}.{'magnitude' if kind == 'm' else 'angle'}" for kind, j in self.variables]
+
+    def _unpack(self, values: list[float]) -> tuple[list[float], list[float]]:
+        """Magnitudes and angles of every term for the given variable values."""
+        magnitudes = [term.magnitude if term.magnitude is not None else 0.0 for term in self.terms]
+        for (kind, j), value in zip(self.variables, values, strict=True):
+            if kind == "m":
+                magnitudes[j] = value
+        angles = [(values[variable] if variable is not None else 0.0) + base for variable, base in self.roots]
+        return magnitudes, angles
+
+    def residual(self, values: list[float]) -> complex:
+        """ΣFx + i·ΣFy."""
+        magnitudes, angles = self._unpack(values)
+        return sum((term.sign * m * cmath.exp(1j * a) for term, m, a in zip(self.terms, magnitudes, angles, strict=True)), 0j)
+
+    def jacobian(self, values: list[float]) -> list[complex]:
+        """Derivative of the residual with respect to each variable, as complex columns."""
+        magnitudes, angles = self._unpack(values)
+        columns = []
+        for v, (kind, j) in enumerate(self.variables):
+            if kind == "m":
+                columns.append(self.terms[j].sign * cmath.exp(1j * angles[j]))
+            else:
+                columns.append(
+                    sum(
+                        (1j * term.sign * magnitudes[k] * cmath.exp(1j * angles[k]) for k, term in enumerate(self.terms) if self.roots[k][0] == v),
+                        0j,
+                    )
+                )
+        return columns
+
+    def starting_points(self) -> list[list[float]]:
+        """
+        Closed-form starting points, one per solution branch.
+
+        Terms are grouped into fixed terms (known angle) and rotating groups
+        (angle tied to an angle variable). With z = e^{iθ} this gives
+        Σ g_v·z_v + Σ t_k·e_k + K = 0, where K collects fully known terms.
+        """
+        angle_vars = [v for v, (kind, _j) in enumerate(self.variables) if kind == "a"]
+        known = 0j  # K
+        fixed_magnitudes: list[tuple[int, complex]] = []  # (variable, e_k) for unknown magnitudes along known angles
+        rotating: dict[int, complex] = dict.fromkeys(angle_vars, 0j)  # g_v from known magnitudes
+        rotating_magnitudes: list[tuple[int, int, complex]] = []  # (angle variable, magnitude variable, h)
+
+        for j, term in enumerate(self.terms):
+            variable, base = self.roots[j]
+            direction = term.sign * cmath.exp(1j * base)
+            magnitude_var = self.variables.index(("m", j)) if term.magnitude is None else None
+            if variable is None and magnitude_var is None:
+                known += direction * term.magnitude
+            elif variable is None:
+                fixed_magnitudes.append((magnitude_var, direction))
+            elif magnitude_var is None:
+                rotating[variable] += direction * term.magnitude
+            else:
+                rotating_magnitudes.append((variable, magnitude_var, direction))
+
+        n = len(self.variables)
+        starts: list[list[float]] = []
+
+        def start(assignments: dict[int, float]) -> None:
+            starts.append([assignments.get(v, 0.0) for v in range(n)])
+
+        if not angle_vars:
+            # Linear in the magnitudes: one least-squares solution
+            if fixed_magnitudes:
+                step = _least_squares_step([e for _v, e in fixed_magnitudes], known)
+                if step is not None:
+                    start({v: s for (v, _e), s in zip(fixed_magnitudes, step, strict=True)})
+            else:
+                start({})
+            return starts
+
+        if len(angle_vars) == 1 and not rotating_magnitudes and len(fixed_magnitudes) == 1:
+            # g·e^{iθ} + t·e + K = 0: the tip of g·e^{iθ} lies on the line -K + t·e (circle–line)
+            (v,) = angle_vars
+            g, (m_var, e) = rotating[v], fixed_magnitudes[0]
+            if abs(g) > 0 and abs(e) > 0:
+                unit = e / abs(e)
+                distance = -(known * unit.conjugate()).imag / abs(g)
+                phase = cmath.phase(unit) - cmath.phase(g)
+                for alpha in _branches_asin(distance):
+                    theta = phase + alpha
+                    t = -((g * cmath.exp(1j * theta) + known) * unit.conjugate()).real / abs(e)
+                    start({v: theta, m_var: t})
+                return starts
+
+        if len(angle_vars) == 1 and len(rotating_magnitudes) == 1 and not fixed_magnitudes:
+            # (g + t·h)·e^{iθ} = -K: |g + t·h| = |K| is a quadratic in t
+            (v,) = angle_vars
+            g = rotating[v]
+            _v, m_var, h = rotating_magnitudes[0]
+            a = abs(h) ** 2
+            b = 2 * (g * h.conjugate()).real
+            c = abs(g) ** 2 - abs(known) ** 2
+            discriminant = b * b - 4 * a * c
+            if a > 0:
+                root = math.sqrt(max(discriminant, 0.0))
+                for t in ((-b + root) / (2 * a), (-b - root) / (2 * a)):
+                    coefficient = g + t * h
+                    theta = cmath.phase(-known) - cmath.phase(coefficient) if abs(coefficient) > 0 else 0.0
+                    start({v: theta, m_var: t})
+                return starts
+
+        if len(angle_vars) == 2 and not rotating_magnitudes and not fixed_magnitudes:
+            # |g1|·e^{iψ1} + |g2|·e^{iψ2} = -K: a triangle with known sides (law of cosines)
+            v1, v2 = angle_vars
+            g1, g2, closing = rotating[v1], rotating[v2], -known
+            if abs(g1) > 0 and abs(g2) > 0 and abs(closing) > 0:
+                cosine = (abs(closing) ** 2 + abs(g1) ** 2 - abs(g2) ** 2) / (2 * abs(g1) * abs(closing))
+                alpha = math.acos(max(-1.0, min(1.0, cosine)))
+                for psi1 in (cmath.phase(closing) + alpha, cmath.phase(closing) - alpha):
+                    psi2 = cmath.phase(closing - abs(g1) * cmath.exp(1j * psi1))
+                    start({v1: psi1 - cmath.phase(g1), v2: psi2 - cmath.phase(g2)})
+                return starts
+
+        # Anything else: angles spread around the closing direction, magnitudes by least squares
+        base = cmath.phase(-known) if abs(known) > 0 else 0.0
+        offsets = [k * math.pi / 2 for k in range(4)]
+        grids = [[base + o] for o in offsets] if len(angle_vars) == 1 else [[base + o1, base + o2] for o1 in offsets for o2 in offsets]
+        magnitude_vars = [v for v, (kind, _j) in enumerate(self.variables) if kind == "m"]
+        for grid in grids:
+            assignments = dict(zip(angle_vars, grid, strict=True))
+            if magnitude_vars:
+                values = [assignments.get(v, 0.0) for v in range(n)]
+                columns = self.jacobian(values)
+                step = _least_squares_step([columns[v] for v in magnitude_vars], self.residual(values))
+                if step is not None:
+                    assignments.update(zip(magnitude_vars, step, strict=True))
+            start(assignments)
+        return starts
+
+    def solution(self, values: list[float], branch: int, iterations: int, residual: float) -> EquilibriumSolution:
+        magnitudes, angles = self._unpack(values)
+        return EquilibriumSolution(
+            magnitudes={term.name: m for term, m in zip(self.terms, magnitudes, strict=True)},
+            angles={term.name: a for term, a in zip(self.terms, angles, strict=True)},
+            unknowns=tuple(self.unknown_names()),
+            branch=branch,
+            iterations=iterations,
+            residual=residual,
+        )
+
+
+def _branches_asin(value: float) -> tuple[float, ...]:
+    """Both solutions of sin(α) = value in (-π/2, 3π/2), or the clipped one if |value| ≥ 1."""
+    if abs(value) >= 1.0:
+        return (math.copysign(math.pi / 2, value),)
+    alpha = math.asin(value)
+    return (alpha, math.pi - alpha)
+
+
+def _least_squares_step(columns: list[complex], residual: complex) -> list[float] | None:
+    """Solve J·δ = -r for complex columns (each a 2-row column of J)."""
+    if len(columns) == 2:
+        (a, c), (b, d) = (columns[0].real, columns[0].imag), (columns[1].real, columns[1].imag)
+        det = a * d - b * c
+        if abs(det) > 1e-14 * max(1.0, abs(a * d), abs(b * c)):
+            rx, ry = -residual.real, -residual.imag
+            return [(d * rx - b * ry) / det, (a * ry - c * rx) / det]
+    if not columns:
+        return None
+    matrix = np.array([[col.real for col in columns], [col.imag for col in columns]])
+    step, *_ = np.linalg.lstsq(matrix, np.array([-residual.real, -residual.imag]), rcond=None)
+    return [float(s) for s in step]
+
+
+def _same(a: EquilibriumSolution, b: EquilibriumSolution, scale: float) -> bool:
+    """Whether two solutions give the same forces."""
+    for name, magnitude in a.magnitudes.items():
+        force_a = magnitude * cmath.exp(1j * a.angles[name])
+        force_b = b.magnitudes[name] * cmath.exp(1j * b.angles[name])
+        if abs(force_a - force_b) > 1e-8 * scale:
+            return False
+    return True
+
+
+__all__ = [
+    "EquilibriumSolution",
+    "EquilibriumSolver",
+    "EquilibriumTerm",
+]
@@ -57,6 +57,23 @@ class SolverManager:
         # No solver could handle the problem
         return SolveResult(variables=variables, steps=[], success=False, message="No solver could handle this problem", method="NoSolver")
 
+    def solve_targets(self, targets: list[str], equations: list[Equation], variables: dict[str, FieldQuantity], dependency_graph: Order, tolerance: float = 1e-10) -> SolveResult:
+        """
+        Re-solve a known subset of unknowns in dependency order.
+
+        Args:
+            targets: Unknown variables to solve, in dependency order
+            equations: List of equations in the system
+            variables: Dictionary of all variables
+            dependency_graph: Dependency graph supplying solver equations
+            tolerance: Convergence tolerance
+
+        Returns:
+            SolveResult containing the re-solved variables
+        """
+        iterative = next(solver for solver in self.solvers if isinstance(solver, IterativeSolver))
+        return iterative.solve_targets(targets, equations, variables, dependency_graph, tolerance)
+
     def _try_solver(self, solver: BaseSolver, equations: list[Equation], variables: dict[str, FieldQuantity], dependency_graph: Order | None, max_iterations: int, tolerance: float) -> SolveResult:
         """
         Try a specific solver and log results appropriately.
@@ -8,6 +8,12 @@ class Order:
     """
     Manages dependencies between variables in a system of equations.
     Uses topological sorting to determine the correct solving order.
+
+    The graph is maintained incrementally: each equation's contribution (the
+    variables it can solve for and the edges it induces) is recorded, so adding
+    an equation or flipping a variable between known and unknown only recomputes
+    the equations that reference it. Solving orders and strongly connected
+    components are cached and recomputed only when the affected edges change.
     """
 
     def __init__(self):
@@ -20,20 +26,125 @@ class Order:
         # Equations that can solve for each variable
         self.solvers = defaultdict(list)  # variable -> [equations that can solve it]
 
+        # Incremental maintenance state
+        self._equations: list[Equation] = []
+        self._positions: dict[Equation, int] = {}
+        self._next_position = 0
+        self._equation_vars: dict[Equation, set[str]] = {}
+        self._contributions: dict[Equation, tuple[frozenset[str], tuple[str, ...], tuple[tuple[str, str], ...]]] = {}
+        self._equations_by_variable: defaultdict[str, list[Equation]] = defaultdict(list)
+        self._edge_counts: dict[tuple[str, str], int] = {}
+        self._dependencies: defaultdict[str, set[str]] = defaultdict(set)  # dependent -> {dependency_sources}
+        self._known_vars: frozenset[str] = frozenset()
+
+        # Derived-result caches, invalidated by structural changes
+        self._order_cache: dict[frozenset[str], list[str]] = {}
+        self._cycles_cache: list[list[str]] | None = None
+        self._components: dict[str, frozenset[str]] | None = None
+        self._dirty_vertices: set[str] = set()
+
+    @property
+    def equations(self) -> list[Equation]:
+        """Equations currently represented in the graph, in insertion order."""
+        return list(self._equations)
+
+    @property
+    def known_variables(self) -> frozenset[str]:
+        """Known-variable set the equation contributions were last computed against."""
+        return self._known_vars
+
     def add_equation(self, equation: Equation, known_vars: set[str]):
-        """Add an equation to the dependency graph."""
+        """
+        Add an equation to the dependency graph.
+
+        A known_vars set that differs from the current one is applied to the
+        equations already in the graph first (see update_known_variables).
+        """
         eq_vars = equation.get_all_variables()
-        unknown_vars = equation.get_unknown_variables(known_vars)
+        self.update_known_variables(known_vars)
 
         # Update variables set
         self.variables.update(eq_vars)
 
-        # Analyze equation structure to determine dependencies and solvers
-        lhs_vars = self._extract_variables_from_side(equation.lhs)
-        rhs_vars = self._extract_variables_from_side(equation.rhs)
+        if equation in self._contributions:
+            return
 
-        # Handle different equation patterns
-        self._process_equation_dependencies(equation, lhs_vars, rhs_vars, unknown_vars, eq_vars, known_vars)
+        self._positions[equation] = self._next_position
+        self._next_position += 1
+        self._equations.append(equation)
+        self._equation_vars[equation] = eq_vars
+        for var in eq_vars:
+            self._equations_by_variable[var].append(equation)
+
+        self._apply_contribution(equation, self._compute_contribution(equation, eq_vars, self._known_vars))
+
+    def remove_equation(self, equation: Equation) -> bool:
+        """
+        Remove an equation and the dependencies it contributed.
+
+        Args:
+            equation: The equation to remove (matched by identity)
+
+        Returns:
+            True if the equation was part of the graph
+        """
+        if equation not in self._contributions:
+            return False
+
+        self._retract_contribution(equation)
+        self._equations = [eq for eq in self._equations if eq is not equation]
+        del self._positions[equation]
+        for var in self._equation_vars.pop(equation):
+            remaining = [eq for eq in self._equations_by_variable[var] if eq is not equation]
+            if remaining:
+                self._equations_by_variable[var] = remaining
+            else:
+                del self._equations_by_variable[var]
+                if not self.graph.get(var) and not self._dependencies.get(var):
+                    self.variables.discard(var)
+                    self._dirty_vertices.add(var)
+        self._invalidate_derived()
+        return True
+
+    def update_known_variables(self, known_vars: set[str]) -> int:
+        """
+        Bring the graph in line with a new known-variable set.
+
+        Only equations that reference a variable whose known/unknown status
+        changed are re-analyzed; everything else keeps its recorded contribution.
+
+        Args:
+            known_vars: Variables that are now known
+
+        Returns:
+            Number of equations whose contribution was recomputed
+        """
+        known = frozenset(known_vars)
+        changed = known ^ self._known_vars
+        self._known_vars = known
+        if not changed:
+            return 0
+
+        affected: dict[Equation, None] = {}
+        for var in changed:
+            for equation in self._equations_by_variable.get(var, ()):
+                affected[equation] = None
+
+        recomputed = 0
+        for equation in affected:
+            eq_vars = self._equation_vars[equation]
+            contribution = self._compute_contribution(equation, eq_vars, known)
+            if self._replace_contribution(equation, contribution):
+                recomputed += 1
+        return recomputed
+
+    def mark_known(self, *variables: str) -> int:
+        """Flip variables to known, updating only the equations that reference them."""
+        return self.update_known_variables(self._known_vars | set(variables))
+
+    def mark_unknown(self, *variables: str) -> int:
+        """Flip variables to unknown, updating only the equations that reference them."""
+        return self.update_known_variables(self._known_vars - set(variables))
 
     def add_dependency(self, dependency_source: str, dependent_variable: str):
         """
@@ -41,10 +152,16 @@ class Order:
         This means dependency_source must be solved before dependent_variable.
         """
         if dependent_variable != dependency_source:  # Avoid self-dependencies
+            edge = (dependency_source, dependent_variable)
+            self._edge_counts[edge] = self._edge_counts.get(edge, 0) + 1
+
             # Add to graph
             if dependent_variable not in self.graph[dependency_source]:
                 self.graph[dependency_source].append(dependent_variable)
                 self.in_degree[dependent_variable] += 1
+                self._dependencies[dependent_variable].add(dependency_source)
+                self._dirty_vertices.update(edge)
+                self._invalidate_derived()
 
             # Ensure both variables are tracked
             self.variables.add(dependency_source)
@@ -52,15 +169,157 @@ class Order:
 
     def remove_dependency(self, dependency_source: str, dependent_variable: str):
         """Remove a dependency between variables."""
-        if dependent_variable in self.graph[dependency_source]:
-            self.graph[dependency_source].remove(dependent_variable)
+        self._edge_counts.pop((dependency_source, dependent_variable), None)
+        self._unlink(dependency_source, dependent_variable)
+
+    def _release_dependency(self, dependency_source: str, dependent_variable: str):
+        """Drop one equation's reference to an edge, unlinking it when no equation needs it."""
+        edge = (dependency_source, dependent_variable)
+        count = self._edge_counts.get(edge, 0) - 1
+        if count > 0:
+            self._edge_counts[edge] = count
+            return
+        self._edge_counts.pop(edge, None)
+        self._unlink(dependency_source, dependent_variable)
+
+    def _unlink(self, dependency_source: str, dependent_variable: str):
+        """Remove an edge from the adjacency structures."""
+        dependents = self.graph.get(dependency_source)
+        if dependents and dependent_variable in dependents:
+            dependents.remove(dependent_variable)
             self.in_degree[dependent_variable] -= 1
+            self._dependencies[dependent_variable].discard(dependency_source)
+            self._dirty_vertices.update((dependency_source, dependent_variable))
+            self._invalidate_derived()
+
+    def _invalidate_derived(self):
+        """Drop cached solving orders and cycle listings after a structural change."""
+        self._order_cache.clear()
+        self._cycles_cache = None
+
+    def _compute_contribution(self, equation: Equation, eq_vars: set[str], known_vars: set[str] | frozenset[str]) -> tuple[frozenset[str], tuple[str, ...], tuple[tuple[str, str], ...]]:
+        """
+        Determine which variables an equation solves for and which edges it induces.
+
+        Returns:
+            Tuple of (known variables of the equation, solvable variables, dependency edges)
+        """
+        unknown_vars = eq_vars - known_vars
+        lhs_vars = self._extract_variables_from_side(equation.lhs)
+        rhs_vars = self._extract_variables_from_side(equation.rhs)
+
+        solves: list[str] = []
+        edges: list[tuple[str, str]] = []
+
+        # If LHS is a single variable, it depends on all variables in RHS
+        if len(lhs_vars) == 1:
+            lhs_var = next(iter(lhs_vars))
+            if lhs_var in unknown_vars:
+                solves.append(lhs_var)
+            # Add dependencies: LHS variable depends on all RHS variables
+            edges.extend((rhs_var, lhs_var) for rhs_var in rhs_vars if rhs_var != lhs_var)
+
+        # If RHS is a single variable, it depends on all variables in LHS
+        elif len(rhs_vars) == 1:
+            rhs_var = next(iter(rhs_vars))
+            if rhs_var in unknown_vars:
+                solves.append(rhs_var)
+            # Add dependencies: RHS variable depends on all LHS variables
+            edges.extend((lhs_var, rhs_var) for lhs_var in lhs_vars if lhs_var != rhs_var)
+
+        # For more complex cases, use can_solve_for check
+        else:
+            for unknown_var in sorted(unknown_vars):
+                if equation.can_solve_for(unknown_var, known_vars):
+                    solves.append(unknown_var)
+                # Add dependencies: unknown_var depends on all other variables in equation
+                edges.extend((other_var, unknown_var) for other_var in eq_vars if other_var != unknown_var)
+
+        return frozenset(eq_vars & known_vars), tuple(solves), tuple(edges)
+
+    def _apply_contribution(self, equation: Equation, contribution: tuple[frozenset[str], tuple[str, ...], tuple[tuple[str, str], ...]]):
+        """Record an equation's contribution and add its solvers and edges."""
+        self._contributions[equation] = contribution
+        _, solves, edges = contribution
+        for var in solves:
+            self._insert_solver(var, equation)
+        for source, dependent in edges:
+            self.add_dependency(source, dependent)
+
+    def _retract_contribution(self, equation: Equation):
+        """Remove the solvers and edges an equation previously contributed."""
+        _, solves, edges = self._contributions.pop(equation)
+        for var in solves:
+            remaining = [eq for eq in self.solvers.get(var, []) if eq is not equation]
+            if remaining:
+                self.solvers[var] = remaining
+            else:
+                self.solvers.pop(var, None)
+        for source, dependent in edges:
+            self._release_dependency(source, dependent)
+        self._order_cache.clear()
+
+    def _replace_contribution(self, equation: Equation, contribution: tuple[frozenset[str], tuple[str, ...], tuple[tuple[str, str], ...]]) -> bool:
+        """
+        Swap an equation's recorded contribution, touching only the solvers and edges that differ.
+
+        Returns:
+            True if the graph structure changed
+        """
+        _, old_solves, old_edges = self._contributions[equation]
+        _, new_solves, new_edges = contribution
+        self._contributions[equation] = contribution
+        if old_solves == new_solves and old_edges == new_edges:
+            return False
+
+        for var in set(old_solves) - set(new_solves):
+            remaining = [eq for eq in self.solvers.get(var, []) if eq is not equation]
+            if remaining:
+                self.solvers[var] = remaining
+            else:
+                self.solvers.pop(var, None)
+        for var in new_solves:
+            if var not in old_solves:
+                self._insert_solver(var, equation)
+
+        old_edge_set, new_edge_set = set(old_edges), set(new_edges)
+        for source, dependent in old_edges:
+            if (source, dependent) not in new_edge_set:
+                self._release_dependency(source, dependent)
+        for source, dependent in new_edges:
+            if (source, dependent) not in old_edge_set:
+                self.add_dependency(source, dependent)
+        self._order_cache.clear()
+        return True
+
+    def _insert_solver(self, var: str, equation: Equation):
+        """Insert a solver equation keeping equation insertion order, as a full rebuild would."""
+        solvers = self.solvers[var]
+        self._order_cache.clear()
+        position = self._positions[equation]
+        if not solvers or self._positions[solvers[-1]] < position:
+            solvers.append(equation)
+            return
+        for i, existing in enumerate(solvers):
+            if self._positions[existing] > position:
+                solvers.insert(i, equation)
+                return
+        solvers.append(equation)
 
     def get_solving_order(self, known_vars: set[str]) -> list[str]:
         """
         Get the order in which variables should be solved using topological sort.
         Returns list of variables in solving order.
         """
+        key = frozenset(known_vars)
+        cached = self._order_cache.get(key)
+        if cached is None:
+            cached = self._compute_solving_order(known_vars)
+            self._order_cache[key] = cached
+        return list(cached)
+
+    def _compute_solving_order(self, known_vars: set[str]) -> list[str]:
+        """Topological sort behind get_solving_order."""
         # Create a copy of in_degree for this computation
         temp_in_degree = self.in_degree.copy()
         temp_graph = defaultdict(list)
@@ -151,6 +410,12 @@ class Order:
         Detect cycles in the dependency graph.
         Returns list of cycles (each cycle is a list of variables).
         """
+        if self._cycles_cache is None:
+            self._cycles_cache = self._find_cycles()
+        return [list(cycle) for cycle in self._cycles_cache]
+
+    def _find_cycles(self) -> list[list[str]]:
+        """Depth-first search behind detect_cycles."""
         WHITE, GRAY, BLACK = 0, 1, 2
         color = defaultdict(int)
         cycles = []
@@ -222,19 +487,17 @@ class Order:
         solvable = []
 
         for var in self.variables:
-            if var not in known_vars:
+            if var not in known_vars and var in self.solvers:
                 # Check if all dependencies of this variable are known
-                dependencies_known = True
-                for dep_source in self.graph:
-                    if var in self.graph[dep_source] and dep_source not in known_vars:
-                        dependencies_known = False
-                        break
-
-                if dependencies_known and var in self.solvers:
+                if self._dependencies.get(var, set()) <= known_vars:
                     solvable.append(var)
 
         return solvable
 
+    def get_dependencies(self, var: str) -> set[str]:
+        """Get the variables that must be solved before the given variable."""
+        return set(self._dependencies.get(var, ()))
+
     def get_equation_for_variable(self, var: str, known_vars: set[str]) -> Equation | None:
         """Get an equation that can solve for the given variable."""
         if var not in self.solvers:
@@ -247,12 +510,65 @@ class Order:
 
         return None
 
+    def get_equations_for_variables(self, variables: set[str]) -> list[Equation]:
+        """Get the equations referencing any of the given variables, in insertion order."""
+        selected = {equation for var in variables for equation in self._equations_by_variable.get(var, ())}
+        return [equation for equation in self._equations if equation in selected]
+
     def get_strongly_connected_components(self) -> list[set[str]]:
         """
         Find strongly connected components in the dependency graph.
         Variables in the same SCC must be solved simultaneously.
+
+        Components are cached per vertex. After edge changes only the weakly
+        connected regions around the touched vertices are re-run through Tarjan's
+        algorithm, since a component can never span two such regions.
         """
-        # Tarjan's algorithm for finding SCCs
+        if self._components is None:
+            self._components = {}
+            self._dirty_vertices.clear()
+            for component in self._tarjan(self.variables):
+                for node in component:
+                    self._components[node] = component
+        elif self._dirty_vertices:
+            region = self._weakly_connected_region(self._dirty_vertices)
+            for node in self._dirty_vertices - self.variables:
+                self._components.pop(node, None)
+            self._dirty_vertices.clear()
+            for node in region:
+                self._components.pop(node, None)
+            for component in self._tarjan(region):
+                for node in component:
+                    self._components[node] = component
+
+        # Filter out single-node components (unless they have self-loops)
+        significant_components = []
+        seen: set[frozenset[str]] = set()
+        for node in self.variables:
+            component = self._components.get(node)
+            if component is None or component in seen:
+                continue
+            seen.add(component)
+            if len(component) > 1 or node in self.graph.get(node, ()):
+                significant_components.append(set(component))
+
+        return significant_components
+
+    def _weakly_connected_region(self, seeds: set[str]) -> set[str]:
+        """Collect every vertex reachable from the seeds ignoring edge direction."""
+        region = set()
+        frontier = [node for node in seeds if node in self.variables]
+        while frontier:
+            node = frontier.pop()
+            if node in region:
+                continue
+            region.add(node)
+            frontier.extend(n for n in self.graph.get(node, ()) if n not in region)
+            frontier.extend(n for n in self._dependencies.get(node, ()) if n not in region)
+        return region
+
+    def _tarjan(self, nodes: set[str]) -> list[frozenset[str]]:
+        """Tarjan's algorithm restricted to the given vertices."""
         index_counter = [0]
         stack = []
         lowlinks = {}
@@ -267,7 +583,9 @@ class Order:
             stack.append(node)
             on_stack[node] = True
 
-            for neighbor in self.graph[node]:
+            for neighbor in self.graph.get(node, ()):
+                if neighbor not in nodes:
+                    continue
                 if neighbor not in index:
                     strongconnect(neighbor)
                     lowlinks[node] = min(lowlinks[node], lowlinks[neighbor])
@@ -282,23 +600,13 @@ class Order:
                     component.add(w)
                     if w == node:
                         break
-                components.append(component)
+                components.append(frozenset(component))
 
-        for node in self.variables:
+        for node in nodes:
             if node not in index:
                 strongconnect(node)
 
-        # Filter out single-node components (unless they have self-loops)
-        significant_components = []
-        for component in components:
-            if len(component) > 1:
-                significant_components.append(component)
-            elif len(component) == 1:
-                node = next(iter(component))
-                if node in self.graph[node]:  # Self-loop
-                    significant_components.append(component)
-
-        return significant_components
+        return components
 
     def analyze_system(self, known_vars: set[str]) -> dict[str, Any]:
         """
@@ -349,48 +657,6 @@ class Order:
         else:
             return set()
 
-    def _process_equation_dependencies(self, equation: Equation, lhs_vars: set[str], rhs_vars: set[str], unknown_vars: set[str], eq_vars: set[str], known_vars: set[str]):
-        """
-        Process dependencies and solvers for an equation based on its structure.
-
-        Args:
-            equation: The equation to process
-            lhs_vars: Variables on left-hand side
-            rhs_vars: Variables on right-hand side
-            unknown_vars: Unknown variables in the equation
-            eq_vars: All variables in the equation
-            known_vars: Set of known variables
-        """
-        # If LHS is a single variable, it depends on all variables in RHS
-        if len(lhs_vars) == 1:
-            lhs_var = next(iter(lhs_vars))
-            if lhs_var in unknown_vars:
-                self.solvers[lhs_var].append(equation)
-            # Add dependencies: LHS variable depends on all RHS variables
-            for rhs_var in rhs_vars:
-                if rhs_var != lhs_var:
-                    self.add_dependency(rhs_var, lhs_var)
-
-        # If RHS is a single variable, it depends on all variables in LHS
-        elif len(rhs_vars) == 1:
-            rhs_var = next(iter(rhs_vars))
-            if rhs_var in unknown_vars:
-                self.solvers[rhs_var].append(equation)
-            # Add dependencies: RHS variable depends on all LHS variables
-            for lhs_var in lhs_vars:
-                if lhs_var != rhs_var:
-                    self.add_dependency(lhs_var, rhs_var)
-
-        # For more complex cases, use can_solve_for check
-        else:
-            for unknown_var in unknown_vars:
-                if equation.can_solve_for(unknown_var, known_vars):
-                    self.solvers[unknown_var].append(equation)
-                # Add dependencies: unknown_var depends on all other variables in equation
-                for other_var in eq_vars:
-                    if other_var != unknown_var:
-                        self.add_dependency(other_var, unknown_var)
-
     def _find_truly_unsolvable_variables(self, all_unknown: set[str]) -> list[str]:
         """
         Find variables that have no solver equations.
@@ -0,0 +1,88 @@
+"""
+Solve plans: the solved structure of a problem, detached from the Problem.
+
+A plan lists each unknown with the equation that determines it, in solving
+order, together with every variable of the problem (inputs carry their
+values). It holds no solver state, so it can be serialized with the binary
+expression format and replayed in another process, e.g. by ``propagate`` or
+``forward_derivatives``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from ..algebra import Equation
+from ..algebra.serialization import KIND_SOLVE_PLAN, Decoder, Encoder
+from ..core.quantity import Quantity
+
+
+@dataclass
+class SolvePlan:
+    """
+    Unknowns of a problem with the equations that determine them.
+
+    Attributes:
+        steps: (solved symbol, equation it is solved from), in solving order
+        variables: Every variable of the problem keyed by symbol
+    """
+
+    steps: list[tuple[str, Equation]]
+    variables: dict[str, Quantity]
+
+    @property
+    def unknowns(self) -> list[str]:
+        """Symbols solved by the plan, in solving order."""
+        return [symbol for symbol, _ in self.steps]
+
+    @property
+    def inputs(self) -> list[str]:
+        """Symbols the plan takes as given."""
+        solved = set(self.unknowns)
+        return [symbol for symbol in self.variables if symbol not in solved]
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the plan in the binary expression format.
+
+        Equations used by several steps are written once.
+        """
+        encoder = Encoder()
+        for symbol, variable in self.variables.items():
+            encoder.variable(symbol, variable)
+
+        equations: list[Equation] = []
+        positions: dict[int, int] = {}
+        for _, equation in self.steps:
+            if id(equation) not in positions:
+                positions[id(equation)] = len(equations)
+                equations.append(equation)
+        encoder.equations(equations)
+
+        encoder.uint(len(self.steps))
+        for symbol, equation in self.steps:
+            encoder.name(symbol)
+            encoder.uint(positions[id(equation)])
+        return encoder.to_bytes(KIND_SOLVE_PLAN)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> SolvePlan:
+        """
+        Load a plan written by ``to_bytes``.
+
+        Raises:
+            SerializationError: If the payload is not a solve plan of this format version
+        """
+        decoder = Decoder(data, KIND_SOLVE_PLAN)
+        equations = decoder.equations()
+        steps = []
+        for _ in range(decoder.uint()):
+            symbol = decoder.name()
+            steps.append((symbol, equations[decoder.uint()]))
+        decoder.finish()
+        return cls(steps=steps, variables=decoder.variables)
+
+
+__all__ = [
+    "SolvePlan",
+]
@@ -0,0 +1,240 @@
+"""
+Fused residual evaluation for solution verification.
+
+Verifying a solution through ``Equation.check_residual`` evaluates both sides of
+every equation through the Quantity machinery. ``ResidualEvaluator`` compiles
+each equation once into SI-float closures and computes all requested residuals
+in a single pass, returning a ``ResidualReport`` with the residual vector and
+per-equation norms.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from ..algebra import Equation
+from ..algebra.compiler import CompiledExpression, try_compile
+from ..core.quantity import FieldQuantity
+from ..utils.shared_utilities import SharedConstants
+
+# Verification modes accepted by Problem.verification_mode
+VERIFY_FULL = "full"
+VERIFY_CHANGED_ONLY = "changed-only"
+VERIFY_SAMPLED = "sampled"
+VERIFY_OFF = "off"
+VERIFICATION_MODES = (VERIFY_FULL, VERIFY_CHANGED_ONLY, VERIFY_SAMPLED, VERIFY_OFF)
+
+
+@dataclass
+class ResidualReport:
+    """
+    Residuals of a verification pass.
+
+    Attributes:
+        equations: Names of all equations in the system, in order
+        residuals: Absolute residual |lhs - rhs| in SI units per equation (NaN if not checked)
+        scales: max(|lhs|, |rhs|) per equation, used for relative norms (NaN if not checked)
+        checked: Mask of the equations evaluated in this pass
+        tolerance: Absolute tolerance a residual must stay below
+        mode: Verification mode that produced the report
+    """
+
+    equations: list[str]
+    residuals: np.ndarray
+    scales: np.ndarray
+    checked: np.ndarray
+    tolerance: float
+    mode: str = VERIFY_FULL
+    errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def passed(self) -> bool:
+        """True when every checked residual is below tolerance."""
+        checked = self.residuals[self.checked]
+        return bool(np.all(checked < self.tolerance))
+
+    @property
+    def relative_residuals(self) -> np.ndarray:
+        """Residuals scaled by the magnitude of the equation sides (floored at 1)."""
+        with np.errstate(invalid="ignore"):
+            return self.residuals / np.maximum(self.scales, 1.0)
+
+    @property
+    def failures(self) -> dict[str, float]:
+        """Checked equations whose residual is not below tolerance, with their residuals."""
+        failed = self.checked & ~(self.residuals < self.tolerance)
+        return {self.equations[i]: float(self.residuals[i]) for i in np.flatnonzero(failed)}
+
+    def norm(self, ord: float | None = None) -> float:
+        """Norm of the checked residual vector (Euclidean by default)."""
+        checked = self.residuals[self.checked]
+        if checked.size == 0:
+            return 0.0
+        return float(np.linalg.norm(checked, ord=ord))
+
+    def as_dict(self) -> dict[str, float]:
+        """Residual per checked equation name."""
+        return {self.equations[i]: float(self.residuals[i]) for i in np.flatnonzero(self.checked)}
+
+    def to_payload(self) -> dict[str, Any]:
+        """Plain JSON-compatible form of the report, e.g. for the solution cache."""
+        return {
+            "equations": list(self.equations),
+            "residuals": self.residuals.tolist(),
+            "scales": self.scales.tolist(),
+            "checked": self.checked.tolist(),
+            "tolerance": self.tolerance,
+            "mode": self.mode,
+            "errors": dict(self.errors),
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> ResidualReport:
+        """Rebuild a report from the form produced by to_payload()."""
+        return cls(
+            equations=list(payload["equations"]),
+            residuals=np.array(payload["residuals"], dtype=float),
+            scales=np.array(payload["scales"], dtype=float),
+            checked=np.array(payload["checked"], dtype=bool),
+            tolerance=payload["tolerance"],
+            mode=payload["mode"],
+            errors=dict(payload["errors"]),
+        )
+
+
+class ResidualEvaluator:
+    """
+    Computes equation residuals for a fixed list of equations in one pass.
+
+    Each side of each equation is compiled once. Equations with nodes the
+    compiler does not support fall back to the generic evaluation path.
+    Dimensional compatibility of the two sides is structural, so it is checked
+    once per equation through the generic path and then remembered.
+    """
+
+    def __init__(self, equations: list[Equation]):
+        self.equations = list(equations)
+        self.names = [getattr(eq, "name", str(eq)) for eq in self.equations]
+        self._compiled: list[tuple[CompiledExpression, CompiledExpression] | None] = []
+        for eq in self.equations:
+            lhs = try_compile(eq.lhs)
+            rhs = try_compile(eq.rhs) if lhs is not None else None
+            self._compiled.append((lhs, rhs) if rhs is not None else None)
+        self._dimensions_ok: list[bool | None] = [None] * len(self.equations)
+
+    def matches(self, equations: list[Equation]) -> bool:
+        """True if this evaluator was built for exactly these equation objects."""
+        return len(equations) == len(self.equations) and all(a is b for a, b in zip(equations, self.equations, strict=True))
+
+    def indices_for_variables(self, symbols: set[str]) -> list[int]:
+        """Indices of the equations that reference any of the given symbols."""
+        return [i for i, eq in enumerate(self.equations) if eq.get_all_variables() & symbols]
+
+    def evaluate(
+        self,
+        variables: dict[str, FieldQuantity],
+        indices: list[int] | None = None,
+        tolerance: float = SharedConstants.SOLVER_DEFAULT_TOLERANCE,
+        mode: str = VERIFY_FULL,
+    ) -> ResidualReport:
+        """
+        Compute residuals for the selected equations.
+
+        Args:
+            variables: Problem variables, keyed by symbol
+            indices: Equations to check (default: all)
+            tolerance: Absolute residual tolerance
+            mode: Verification mode recorded on the report
+
+        Returns:
+            ResidualReport for this pass
+        """
+        count = len(self.equations)
+        residuals = np.full(count, np.nan)
+        scales = np.full(count, np.nan)
+        checked = np.zeros(count, dtype=bool)
+        errors: dict[str, str] = {}
+        values = {symbol: var.value for symbol, var in variables.items()}
+
+        for i in range(count) if indices is None else indices:
+            checked[i] = True
+            compiled = self._compiled[i]
+            try:
+                if compiled is None or not self._dimensions_compatible(i, variables):
+                    residuals[i], scales[i] = self._generic_residual(i, variables)
+                    continue
+                lhs_value = compiled[0](values)
+                rhs_value = compiled[1](values)
+                residuals[i] = abs(lhs_value - rhs_value)
+                scales[i] = max(abs(lhs_value), abs(rhs_value))
+            except (ValueError, TypeError, KeyError, ArithmeticError, AttributeError) as e:
+                residuals[i] = math.inf
+                errors[self.names[i]] = str(e)
+
+        return ResidualReport(self.names, residuals, scales, checked, tolerance, mode, errors)
+
+    def _dimensions_compatible(self, index: int, variables: dict[str, FieldQuantity]) -> bool:
+        """Check (once) that both sides of an equation share a dimension."""
+        known = self._dimensions_ok[index]
+        if known is None:
+            eq = self.equations[index]
+            known = eq.dimensions_match()
+            if known is None:
+                known = eq._are_dimensionally_compatible(eq.lhs.evaluate(variables), eq.rhs.evaluate(variables))
+            self._dimensions_ok[index] = known
+        return known
+
+    def _generic_residual(self, index: int, variables: dict[str, FieldQuantity]) -> tuple[float, float]:
+        """Residual through the Quantity evaluation path (inf when sides are incompatible)."""
+        eq = self.equations[index]
+        lhs_value = eq.lhs.evaluate(variables)
+        rhs_value = eq.rhs.evaluate(variables)
+        if not eq._are_dimensionally_compatible(lhs_value, rhs_value) or lhs_value.value is None or rhs_value.value is None:
+            return math.inf, math.nan
+        return abs(lhs_value.value - rhs_value.value), max(abs(lhs_value.value), abs(rhs_value.value))
+
+
+def select_verification_indices(mode: str, evaluator: ResidualEvaluator, candidates: list[int], sample_size: int, rng: Any) -> list[int]:
+    """
+    Pick the equations to verify for a mode.
+
+    Args:
+        mode: One of VERIFICATION_MODES
+        evaluator: Evaluator the indices refer to
+        candidates: Equations whose inputs changed since the last verification
+        sample_size: Number of equations checked in sampled mode
+        rng: random.Random used for sampling
+
+    Returns:
+        Sorted equation indices to check
+
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    if mode == VERIFY_FULL:
+        return list(range(len(evaluator.equations)))
+    if mode == VERIFY_CHANGED_ONLY:
+        return sorted(candidates)
+    if mode == VERIFY_SAMPLED:
+        if len(candidates) <= sample_size:
+            return sorted(candidates)
+        return sorted(rng.sample(candidates, sample_size))
+    if mode == VERIFY_OFF:
+        return []
+    raise ValueError(f"Unknown verification mode '{mode}'. Expected one of {VERIFICATION_MODES}")
+
+
+__all__ = [
+    "VERIFICATION_MODES",
+    "VERIFY_CHANGED_ONLY",
+    "VERIFY_FULL",
+    "VERIFY_OFF",
+    "VERIFY_SAMPLED",
+    "ResidualEvaluator",
+    "ResidualReport",
+    "select_verification_indices",
+]
@@ -0,0 +1,326 @@
+"""
+Scalar root search for single-unknown equations.
+
+Used when an equation cannot be inverted in closed form (the unknown appears
+more than once, e.g. ``t`` in ``D - 2*t*Y``). The residual is a plain function
+of one SI float, normally built from compiled expression closures, so the
+search itself does no Quantity arithmetic and is cheap enough for batch sweeps.
+
+The search brackets a sign change (from a caller-supplied hint when there is
+one, otherwise by stepping outwards from a starting point) and narrows it with
+Brent's method. An unbracketed secant iteration is tried first when no hint is
+given, since it usually converges in a handful of evaluations.
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+# Absolute tolerance on a root, as a fraction of one display unit of the unknown
+ROOT_UNIT_TOLERANCE = 1e-15
+
+# Growth factor and number of attempts when expanding a bracket outwards
+BRACKET_GROWTH = 2.0
+MAX_BRACKET_EXPANSIONS = 60
+
+# Sub-intervals sampled when a bracket hint has no sign change at its ends
+BRACKET_SCAN_SEGMENTS = 16
+
+MAX_ROOT_ITERATIONS = 100
+
+_EPSILON = sys.float_info.epsilon
+
+
+@dataclass(frozen=True, slots=True)
+class RootResult:
+    """Outcome and convergence statistics of a root search."""
+
+    root: float
+    iterations: int
+    evaluations: int
+    method: str
+    bracket: tuple[float, float] | None = None
+
+    def as_dict(self) -> dict[str, object]:
+        """Statistics as a plain dict, for solving steps and reports."""
+        return {
+            "root": self.root,
+            "iterations": self.iterations,
+            "evaluations": self.evaluations,
+            "method": self.method,
+            "bracket": self.bracket,
+        }
+
+
+class _Residual:
+    """Residual wrapper returning None where the function is undefined, and counting evaluations."""
+
+    __slots__ = ("function", "evaluations")
+
+    def __init__(self, function: Callable[[float], float]):
+        self.function = function
+        self.evaluations = 0
+
+    def __call__(self, x: float) -> float | None:
+        self.evaluations += 1
+        try:
+            value = self.function(x)
+        except (ValueError, ArithmeticError):
+            return None
+        return value if math.isfinite(value) else None
+
+
+def _tolerance(x: float, xtol: float) -> float:
+    """Convergence width at x: the absolute tolerance plus a few ulps of |x|."""
+    return xtol + 4.0 * _EPSILON * abs(x)
+
+
+def _opposite_signs(fa: float, fb: float) -> bool:
+    return (fa > 0) != (fb > 0) or fa == 0.0 or fb == 0.0
+
+
+def secant(function: Callable[[float], float], x0: float, x1: float, xtol: float = ROOT_UNIT_TOLERANCE) -> RootResult | None:
+    """
+    Secant iteration from two starting points.
+
+    Returns:
+        The root with its statistics, or None if the iteration fails to converge
+    """
+    residual = function if isinstance(function, _Residual) else _Residual(function)
+    start = residual.evaluations
+    f0, f1 = residual(x0), residual(x1)
+    for iteration in range(1, MAX_ROOT_ITERATIONS + 1):
+        if f0 is None or f1 is None or f1 == f0:
+            return None
+        if f1 == 0.0:
+            return RootResult(x1, iteration, residual.evaluations - start, "secant")
+        x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
+        if abs(x2 - x1) <= _tolerance(x2, xtol):
+            return RootResult(x2, iteration, residual.evaluations - start, "secant")
+        x0, f0, x1, f1 = x1, f1, x2, residual(x2)
+    return None
+
+
+def find_bracket(function: Callable[[float], float], x0: float, step: float = 1.0) -> tuple[float, float] | None:
+    """
+    Expand outwards from x0 until the residual changes sign.
+
+    Args:
+        function: Residual of one SI float
+        x0: Centre of the search
+        step: Initial half-width of the search (grown geometrically)
+
+    Returns:
+        (a, b) with residuals of opposite sign, or None if no sign change was found
+    """
+    residual = function if isinstance(function, _Residual) else _Residual(function)
+    f0 = residual(x0)
+    if f0 is None:
+        return None
+    step = max(abs(x0) * 0.1, step)
+    for _ in range(MAX_BRACKET_EXPANSIONS):
+        for x in (x0 + step, x0 - step):
+            fx = residual(x)
+            if fx is not None and _opposite_signs(f0, fx):
+                return (x0, x) if x > x0 else (x, x0)
+        step *= BRACKET_GROWTH
+    return None
+
+
+def scan_bracket(function: Callable[[float], float], lower: float, upper: float, segments: int = BRACKET_SCAN_SEGMENTS) -> tuple[float, float] | None:
+    """
+    Sign-changing sub-interval of a hinted range.
+
+    The ends are tried first; otherwise the range is sampled on an even grid
+    and the first sub-interval with a sign change is returned.
+
+    Returns:
+        (a, b) with residuals of opposite sign, or None if the samples never change sign
+    """
+    residual = function if isinstance(function, _Residual) else _Residual(function)
+    if lower > upper:
+        lower, upper = upper, lower
+    f_lower, f_upper = residual(lower), residual(upper)
+    if f_lower is not None and f_upper is not None and _opposite_signs(f_lower, f_upper):
+        return (lower, upper)
+
+    width = (upper - lower) / segments
+    a, fa = lower, f_lower
+    for i in range(1, segments + 1):
+        b = upper if i == segments else lower + i * width
+        fb = f_upper if i == segments else residual(b)
+        if fa is not None and fb is not None and _opposite_signs(fa, fb):
+            return (a, b)
+        a, fa = b, fb
+    return None
+
+
+def brent(function: Callable[[float], float], a: float, b: float, xtol: float = ROOT_UNIT_TOLERANCE) -> RootResult | None:
+    """
+    Root inside a sign-changing bracket by Brent's method.
+
+    Combines inverse quadratic interpolation and secant steps with bisection,
+    so it keeps the bracket's guaranteed convergence while usually converging
+    superlinearly.
+
+    Args:
+        function: Residual of one SI float
+        a: One end of the bracket
+        b: Other end of the bracket
+        xtol: Absolute tolerance on the root (in SI units)
+
+    Returns:
+        The root with its statistics, or None if the bracket is invalid or holds a pole
+    """
+    residual = function if isinstance(function, _Residual) else _Residual(function)
+    start = residual.evaluations
+    bracket = (min(a, b), max(a, b))
+    fa, fb = residual(a), residual(b)
+    if fa is None or fb is None or not _opposite_signs(fa, fb):
+        return None
+    if fa == 0.0:
+        return RootResult(a, 0, residual.evaluations - start, "brent", bracket)
+
+    # A sign change across a pole also narrows to a point; the residual there is not small
+    bound = max(abs(fa), abs(fb))
+    c, fc = b, fb
+    d = e = b - a
+    for iteration in range(1, MAX_ROOT_ITERATIONS + 1):
+        if (fb > 0) == (fc > 0):
+            # Keep the root between b and c
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol = 2.0 * _EPSILON * abs(b) + 0.5 * _tolerance(b, xtol)
+        midpoint = 0.5 * (c - b)
+        if abs(midpoint) <= tol or fb == 0.0:
+            if abs(fb) > bound:
+                return None
+            return RootResult(b, iteration, residual.evaluations - start, "brent", bracket)
+
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secant step
+                p = 2.0 * midpoint * s
+                q = 1.0 - s
+            else:
+                # Inverse quadratic interpolation
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * midpoint * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2.0 * p < min(3.0 * midpoint * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = midpoint
+        else:
+            d = e = midpoint
+
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, midpoint)
+        fb = residual(b)
+        if fb is None:
+            return None
+    return None
+
+
+def find_root(function: Callable[[float], float], x0: float = 1.0, bracket: tuple[float, float] | None = None, scale: float = 1.0) -> RootResult | None:
+    """
+    Root of a scalar function near x0.
+
+    With a bracket hint the hinted range is searched first. Otherwise a secant
+    iteration is tried from x0, then a bracket is grown around x0 and narrowed
+    with Brent's method.
+
+    Args:
+        function: Residual of one SI float
+        x0: Starting point (for example the variable's previous value)
+        bracket: Optional (lower, upper) range expected to hold the root
+        scale: Size of one display unit in SI; sets the absolute tolerance and the first bracket step
+
+    Returns:
+        The root with its statistics, or None if none was found
+    """
+    residual = _Residual(function)
+    xtol = ROOT_UNIT_TOLERANCE * scale
+
+    if bracket is not None:
+        found = scan_bracket(residual, *bracket)
+        if found is not None:
+            result = brent(residual, *found, xtol=xtol)
+            if result is not None:
+                return _with_total_evaluations(result, residual)
+
+    x1 = x0 + 0.01 * (abs(x0) if x0 != 0.0 else scale)
+    result = secant(residual, x0, x1, xtol=xtol)
+    if result is not None:
+        return _with_total_evaluations(result, residual)
+
+    found = find_bracket(residual, x0, step=scale)
+    if found is None:
+        return None
+    result = brent(residual, *found, xtol=xtol)
+    return _with_total_evaluations(result, residual) if result is not None else None
+
+
+def secant_array(function: Callable[[np.ndarray], np.ndarray], x0: np.ndarray, scale: float = 1.0) -> np.ndarray:
+    """
+    Element-wise secant iteration over a batch of independent residuals.
+
+    ``function`` maps an array of candidate roots to the array of residuals,
+    one per item, so each iteration is a single vectorized call.
+
+    Args:
+        function: Vectorized residual
+        x0: Starting point per item
+        scale: Size of one display unit in SI (sets the absolute tolerance)
+
+    Returns:
+        Root per item, NaN where the iteration did not converge
+    """
+    xtol = ROOT_UNIT_TOLERANCE * scale
+    x0 = np.array(x0, dtype=float)
+    x1 = x0 + 0.01 * np.where(x0 != 0.0, np.abs(x0), scale)
+    converged = np.zeros(x0.shape, dtype=bool)
+    with np.errstate(all="ignore"):
+        f0, f1 = function(x0), function(x1)
+        for _ in range(MAX_ROOT_ITERATIONS):
+            slope = f1 - f0
+            usable = (slope != 0.0) & np.isfinite(slope) & ~converged
+            x2 = np.where(usable, x1 - f1 * (x1 - x0) / np.where(usable, slope, 1.0), x1)
+            converged |= (f1 == 0.0) | (usable & (np.abs(x2 - x1) <= xtol + 4.0 * _EPSILON * np.abs(x2)))
+            if converged.all() or not usable.any():
+                x1 = np.where(converged, x2, x1)
+                break
+            x0, f0 = np.where(converged, x0, x1), np.where(converged, f0, f1)
+            x1 = np.where(converged & ~usable, x1, x2)
+            f1 = function(x1)
+    return np.where(converged & np.isfinite(x1), x1, np.nan)
+
+
+def _with_total_evaluations(result: RootResult, residual: _Residual) -> RootResult:
+    """Report every evaluation spent by the search, including failed attempts and bracketing."""
+    return RootResult(result.root, result.iterations, residual.evaluations, result.method, result.bracket)
+
+
+__all__ = [
+    "RootResult",
+    "brent",
+    "find_bracket",
+    "find_root",
+    "scan_bracket",
+    "secant",
+    "secant_array",
+]
@@ -0,0 +1,117 @@
+"""
+Sensitivities of a solved system by forward-mode automatic differentiation.
+
+Finite differencing a solved problem needs one extra solve per input. Here the
+derivatives are carried alongside the SI values instead: every input of
+interest is seeded as a dual number and the solved equations are replayed in
+solving order through their ``DUAL``-compiled sides.
+
+Each equation ``F(t, ...) = lhs - rhs = 0`` is differentiated implicitly,
+``dt/dx = -(dF/dx) / (dF/dt)``, so the result does not depend on how the
+unknown was found (direct assignment, closed-form inversion or a numeric root
+search) and one replay gives the whole Jacobian.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from ..algebra import Equation
+from ..algebra.compiler import DUAL
+from ..algebra.dual import Dual
+from ..core.quantity import Quantity
+from ..core.unit import Unit, ureg
+from ..core.unit_catalog import DimensionlessUnits
+
+
+@dataclass
+class Jacobian:
+    """
+    Derivatives of solved variables with respect to known inputs.
+
+    Attributes:
+        of: Symbols of the differentiated (solved) variables, one row each
+        wrt: Symbols of the inputs, one column each
+        matrix: Derivatives in SI units, shape ``(len(of), len(wrt))``
+    """
+
+    of: list[str]
+    wrt: list[str]
+    matrix: np.ndarray
+    variables: Mapping[str, Quantity] = field(default_factory=dict, repr=False)
+
+    def __getitem__(self, key: tuple[str, str]) -> Quantity:
+        """Derivative d(of)/d(wrt) as a Quantity with the derived unit, e.g. ``jacobian["t", "P"]``."""
+        of, wrt = key
+        value = float(self.matrix[self.of.index(of), self.wrt.index(wrt)])
+        of_var, wrt_var = self.variables[of], self.variables[wrt]
+        dim = of_var.dim / wrt_var.dim
+        return Quantity(name=f"d{of}/d{wrt}", dim=dim, value=value, preferred=_derivative_unit(of_var, wrt_var, dim))
+
+    def to_dict(self) -> dict[str, dict[str, Quantity]]:
+        """All derivatives as ``{of: {wrt: Quantity}}``."""
+        return {of: {wrt: self[of, wrt] for wrt in self.wrt} for of in self.of}
+
+
+def _derivative_unit(of_var: Quantity, wrt_var: Quantity, dim) -> Unit | None:
+    """Unit of d(of)/d(wrt) composed from the variables' preferred units where possible."""
+    of_unit, wrt_unit = of_var.preferred, wrt_var.preferred
+    if dim.is_dimensionless():
+        return DimensionlessUnits.dimensionless
+    if of_unit is not None and wrt_var.dim.is_dimensionless():
+        return of_unit
+    if of_unit is not None and wrt_unit is not None and not of_var.dim.is_dimensionless():
+        return of_unit / wrt_unit
+    return ureg.si_unit_for(dim)
+
+
+def forward_derivatives(steps: Sequence[tuple[str, Equation]], values: Mapping[str, float], wrt: Sequence[str]) -> dict[str, Dual]:
+    """
+    Propagate derivatives through solved equations.
+
+    Args:
+        steps: (solved symbol, equation it was solved from), in solving order
+        values: SI value of every variable, solved ones included
+        wrt: Input symbols to differentiate with respect to
+
+    Returns:
+        Dual per variable; ``grad[i]`` is the derivative with respect to ``wrt[i]``
+        (the last gradient entry is scratch space and always 0)
+
+    Raises:
+        ValueError: If an equation cannot be compiled for dual numbers or does
+            not depend on its unknown at the solution
+    """
+    size = len(wrt) + 1
+    target_slot = len(wrt)
+    seeds = {symbol: index for index, symbol in enumerate(wrt)}
+    duals = {symbol: Dual.seed(value, seeds[symbol], size) if symbol in seeds else Dual.constant(value, size) for symbol, value in values.items()}
+
+    for symbol, equation in steps:
+        sides = equation.compiled_sides(DUAL)
+        if sides is None:
+            raise ValueError(f"Equation '{equation.name}' cannot be differentiated")
+        lhs, rhs = sides
+
+        # Seed the unknown in the scratch slot to get dF/dt alongside dF/dx
+        duals[symbol] = Dual.seed(values[symbol], target_slot, size)
+        residual = lhs(duals) - rhs(duals)
+        d_target = residual.grad[target_slot] if isinstance(residual, Dual) else 0.0
+        if d_target == 0.0 or not math.isfinite(d_target):
+            raise ValueError(f"Equation '{equation.name}' does not determine '{symbol}' locally; its derivative is undefined")
+
+        grad = -residual.grad / d_target
+        grad[target_slot] = 0.0
+        duals[symbol] = Dual(values[symbol], grad)
+
+    return duals
+
+
+__all__ = [
+    "Jacobian",
+    "forward_derivatives",
+]
@@ -90,6 +90,11 @@ class BaseSolver(ABC):
             step["equation_name"] = getattr(equation_obj, "name", variable)
             step["equation_str"] = str(equation_obj)
 
+            # Convergence statistics when the variable came from a numeric root search
+            root_search = equation_obj.root_search(variable) if hasattr(equation_obj, "root_search") else None
+            if root_search is not None:
+                step["root_search"] = root_search.as_dict()
+
             # Try to create substituted equation with actual values
             if variables_state:
                 try:
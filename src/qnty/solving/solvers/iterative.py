@@ -87,6 +87,35 @@ class IterativeSolver(BaseSolver):
 
         return SolveResult(variables=working_vars, steps=self.steps, success=success, message=message, method="IterativeSolver", iterations=iteration + 1)
 
+    def solve_targets(self, targets: list[str], equations: list[Equation], variables: dict[str, FieldQuantity], dependency_graph: Order, tolerance: float = 1e-10) -> SolveResult:
+        """
+        Re-solve only the given variables, in the given order.
+
+        Every variable outside ``targets`` is treated as fixed, so a caller that
+        already knows which unknowns are affected by an input change can skip the
+        full iterative sweep.
+
+        Args:
+            targets: Unknown variables to solve, in dependency order
+            equations: Equations of the system (fallback when the graph has no solver)
+            variables: Dictionary of all variables; targets should be unknown
+            dependency_graph: Dependency graph supplying solver equations
+            tolerance: Residual tolerance for per-step verification
+
+        Returns:
+            SolveResult with the updated working variables
+        """
+        self.steps = []
+        working_vars = dict(variables.items())
+        known_vars = self._get_known_variables(working_vars) - set(targets)
+
+        for var_symbol in targets:
+            solved = self._solve_single_variable(var_symbol, equations, working_vars, known_vars, dependency_graph, 0, tolerance)
+            if not solved or var_symbol not in known_vars:
+                return self._create_error_result(working_vars, f"Failed to solve for {var_symbol}", 1)
+
+        return SolveResult(variables=working_vars, steps=self.steps, success=True, message="Targets solved", method="IterativeSolver", iterations=1)
+
     def _find_directly_solvable_variables(self, equations: list[Equation], working_vars: dict[str, FieldQuantity], known_vars: set[str]) -> list[str]:
         """Find variables that can be directly solved from equations."""
         solvable = []
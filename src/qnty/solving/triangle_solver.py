@@ -10,19 +10,317 @@ for fast, exact solutions with step-by-step solution tracking.
 
 This method is preferred for problems with 2-3 forces where geometric
 relationships can be visualized as triangles or parallelograms.
+
+For parametric studies, ``solve_triangles`` and the two-force case methods
+solve N triangles per call with array math and format steps only on request.
 """
 
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
+from numpy.typing import ArrayLike, NDArray
 
+from ..core.dimension_catalog import dim
 from ..core.quantity import Quantity
+from ..core.unit import resolve_unit
 from ..spatial import _Vector
 from ..spatial.vector import _Vector
 
+# Tolerance for degenerate triangles and the boundary of the ambiguous case
+_EPS = 1e-12
+
+
+@dataclass(frozen=True)
+class TriangleResults:
+    """
+    N triangles solved together by ``TriangleSolver.solve_triangles``.
+
+    Side i is opposite angle i. Sides keep the unit they were given in;
+    angles are in radians. Rows that do not form a triangle, or do not fix
+    one, are NaN and excluded from ``valid``.
+
+    Attributes:
+        sides: Sides a, b, c, shape (N, 3)
+        angles: Angles A, B, C, shape (N, 3)
+        case: Case of every row: "SSS", "SAS", "SSA", "ASA", "AAS", or "" if undetermined
+        valid: Rows that form a triangle
+        ambiguous: SSA rows with a second triangle
+        alternate_sides: Sides of the second SSA triangle, NaN where there is none
+        alternate_angles: Angles of the second SSA triangle, NaN where there is none
+        given: Which sides and angles were given, shape (N, 6)
+        side_labels: Names of the sides in solution steps
+        angle_labels: Names of the angles in solution steps
+        unit: Unit symbol of the sides in solution steps
+    """
+
+    sides: NDArray[np.float64]
+    angles: NDArray[np.float64]
+    case: NDArray[np.str_]
+    valid: NDArray[np.bool_]
+    ambiguous: NDArray[np.bool_]
+    alternate_sides: NDArray[np.float64]
+    alternate_angles: NDArray[np.float64]
+    given: NDArray[np.bool_]
+    side_labels: tuple[str, str, str] = ("a", "b", "c")
+    angle_labels: tuple[str, str, str] = ("A", "B", "C")
+    unit: str = ""
+
+    def __len__(self) -> int:
+        return len(self.sides)
+
+    def angles_in(self, unit: str = "degree") -> NDArray[np.float64]:
+        """Angles A, B, C in the given angle unit."""
+        return self.angles / resolve_unit(unit, dim.D).si_factor
+
+    def solution_steps(self, row: int) -> list[dict]:
+        """Law of cosines / law of sines steps for one triangle, formatted on request."""
+        return _triangle_steps(self, row)
+
+
+@dataclass(frozen=True)
+class ForceTriangleCases:
+    """
+    Two-force triangles for N cases, from ``TriangleSolver.solve_resultant_cases``
+    or ``TriangleSolver.solve_decomposition_cases``.
+
+    Columns are force 1, force 2 and the resultant. Magnitudes keep the unit
+    they were given in; angles are CCW from +x in radians.
+
+    Attributes:
+        names: Names of the two forces and the resultant
+        magnitude: Magnitudes, shape (N, 3)
+        angle: Directions, shape (N, 3)
+        triangles: The force triangles (sides: force 1, force 2, resultant)
+    """
+
+    names: tuple[str, str, str]
+    magnitude: NDArray[np.float64]
+    angle: NDArray[np.float64]
+    triangles: TriangleResults
+
+    def __len__(self) -> int:
+        return len(self.magnitude)
+
+    @property
+    def valid(self) -> NDArray[np.bool_]:
+        """Cases whose forces form a triangle."""
+        return self.triangles.valid
+
+    def angle_in(self, unit: str = "degree") -> NDArray[np.float64]:
+        """Directions in the given angle unit, shape (N, 3)."""
+        return self.angle / resolve_unit(unit, dim.D).si_factor
+
+    def solution_steps(self, case: int) -> list[dict]:
+        """Force triangle steps for one case, formatted on request."""
+        return self.triangles.solution_steps(case)
+
+
+def _columns(count: int, *values: ArrayLike | None) -> NDArray[np.float64]:
+    """Stack scalars, length-N arrays and None (unknown) into an (N, len(values)) array."""
+    arrays = [np.atleast_1d(np.asarray(np.nan if value is None else value, dtype=float)) for value in values]
+    for array in arrays:
+        if array.ndim != 1:
+            raise ValueError(f"Expected scalars or 1-D arrays, got shape {array.shape}")
+    lengths = {len(array) for array in arrays if len(array) != 1}
+    if len(lengths) > 1:
+        raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+    n = lengths.pop() if lengths else count
+    return np.column_stack([np.broadcast_to(array, (n,)) for array in arrays])
+
+
+def _between(theta1: NDArray[np.float64], theta2: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Angle between two directions, in [0, π]."""
+    return np.abs((theta2 - theta1 + math.pi) % (2 * math.pi) - math.pi)
+
+
+def _solve_triangle_rows(sides: NDArray[np.float64], angles: NDArray[np.float64], **labels: Any) -> TriangleResults:
+    """
+    Solve every row of (N, 3) sides and angles, where NaN marks an unknown.
+
+    Each row is classified once from its known values, then every case is
+    solved for all of its rows at once.
+    """
+    sides = sides.copy()
+    angles = angles.copy()
+    n = len(sides)
+    rows = np.arange(n)
+    given_sides = ~np.isnan(sides)
+    given_angles = ~np.isnan(angles)
+    side_count = given_sides.sum(axis=1)
+    angle_count = given_angles.sum(axis=1)
+
+    case = np.full(n, "", dtype="<U3")
+    valid = np.zeros(n, dtype=bool)
+    alternate_sides = np.full((n, 3), np.nan)
+    alternate_angles = np.full((n, 3), np.nan)
+    ambiguous = np.zeros(n, dtype=bool)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Two angles and a side: the angle sum gives the third angle, the law of sines the sides
+        r = rows[(angle_count >= 2) & (side_count >= 1) & (side_count < 3)]
+        if len(r):
+            third = math.pi - np.nansum(angles[r], axis=1)
+            angles[r] = np.where(given_angles[r], angles[r], third[:, None])
+            known = np.argmax(given_sides[r], axis=1)
+            ratio = sides[r, known] / np.sin(angles[r, known])
+            sides[r] = ratio[:, None] * np.sin(angles[r])
+            case[r] = np.where(given_angles[r, known], "AAS", "ASA")
+            valid[r] = np.all(angles[r] > _EPS, axis=1) & np.isclose(angles[r].sum(axis=1), math.pi) & (sides[r, known] > 0)
+
+        # Two sides and one angle: SAS when the angle is between the sides, SSA otherwise
+        r = rows[(side_count == 2) & (angle_count == 1)]
+        missing = np.argmin(given_sides[r], axis=1)
+        known_angle = np.argmax(given_angles[r], axis=1)
+        sas = missing == known_angle
+
+        s = r[sas]
+        if len(s):
+            m = missing[sas]
+            s1, s2, gamma = sides[s, (m + 1) % 3], sides[s, (m + 2) % 3], angles[s, m]
+            sides[s, m] = np.sqrt(s1 * s1 + s2 * s2 - 2 * s1 * s2 * np.cos(gamma))
+            case[s] = "SAS"
+
+        s = r[~sas]
+        if len(s):
+            j, m = known_angle[~sas], missing[~sas]
+            k = 3 - j - m
+            theta = angles[s, j]
+            sine = sides[s, k] * np.sin(theta) / sides[s, j]
+            angle_k = np.arcsin(np.clip(sine, -1.0, 1.0))
+            angle_m = math.pi - theta - angle_k
+            ok = (theta > _EPS) & (theta < math.pi) & (sine <= 1.0 + _EPS) & (angle_m > _EPS) & (sides[s, j] > 0) & (sides[s, k] > 0)
+            angles[s, k] = angle_k
+            angles[s, m] = angle_m
+            sides[s, m] = sides[s, j] * np.sin(angle_m) / np.sin(theta)
+            case[s] = "SSA"
+            valid[s] = ok
+
+            # The obtuse angle opposite side k gives a second triangle when it still fits
+            second_k = math.pi - angle_k
+            second_m = math.pi - theta - second_k
+            two = ok & (sine < 1.0 - _EPS) & (second_m > _EPS)
+            t = s[two]
+            alternate_angles[t, j[two]] = theta[two]
+            alternate_angles[t, k[two]] = second_k[two]
+            alternate_angles[t, m[two]] = second_m[two]
+            alternate_sides[t, j[two]] = sides[t, j[two]]
+            alternate_sides[t, k[two]] = sides[t, k[two]]
+            alternate_sides[t, m[two]] = sides[t, j[two]] * np.sin(second_m[two]) / np.sin(theta[two])
+            ambiguous[t] = True
+
+        # Three sides (given, or completed by SAS): the law of cosines gives every angle
+        r = rows[(side_count == 3) | (case == "SAS")]
+        if len(r):
+            a = sides[r]
+            b, c = np.roll(a, -1, axis=1), np.roll(a, -2, axis=1)
+            cosine = (b * b + c * c - a * a) / (2 * b * c)
+            angles[r] = np.arccos(np.clip(cosine, -1.0, 1.0))
+            case[r] = np.where(case[r] == "SAS", "SAS", "SSS")
+            valid[r] = np.all(a > 0, axis=1) & np.all(np.abs(cosine) < 1.0 - _EPS, axis=1)
+
+    sides[~valid] = np.nan
+    angles[~valid] = np.nan
+    return TriangleResults(
+        sides=sides,
+        angles=angles,
+        case=case,
+        valid=valid,
+        ambiguous=ambiguous,
+        alternate_sides=alternate_sides,
+        alternate_angles=alternate_angles,
+        given=np.hstack((given_sides, given_angles)),
+        **labels,
+    )
+
+
+def _triangle_steps(results: TriangleResults, row: int) -> list[dict]:
+    """Solution steps for one row of a triangle batch."""
+    case = str(results.case[row])
+    if not results.valid[row]:
+        return [{"method": f"Triangle ({case or 'undetermined'})", "description": "The given sides and angles do not form a unique triangle"}]
+
+    s = [float(v) for v in results.sides[row]]
+    t = [float(v) for v in results.angles[row]]
+    deg = [math.degrees(v) for v in t]
+    given = results.given[row]
+    sl, al = results.side_labels, results.angle_labels
+    unit = f" {results.unit}" if results.unit else ""
+
+    def cosine_angle(i: int) -> dict:
+        j, k = (i + 1) % 3, (i + 2) % 3
+        return {
+            "target": al[i],
+            "method": "Law of Cosines",
+            "equation": f"cos({al[i]}) = ({sl[j]}^2 + {sl[k]}^2 - {sl[i]}^2)/(2*{sl[j]}*{sl[k]})",
+            "substitution": f"cos({al[i]}) = ({s[j]:.2f}^2 + {s[k]:.2f}^2 - {s[i]:.2f}^2)/(2 * {s[j]:.2f} * {s[k]:.2f})",
+            "result_value": f"{deg[i]:.2f}",
+            "result_unit": "°",
+        }
+
+    def cosine_side(i: int) -> dict:
+        j, k = (i + 1) % 3, (i + 2) % 3
+        return {
+            "target": f"|{sl[i]}|",
+            "method": "Law of Cosines",
+            "equation": f"{sl[i]}^2 = {sl[j]}^2 + {sl[k]}^2 - 2*{sl[j]}*{sl[k]}*cos({al[i]})",
+            "substitution": f"{sl[i]}^2 = ({s[j]:.2f}{unit})^2 + ({s[k]:.2f}{unit})^2 - 2 * ({s[j]:.2f}{unit}) * ({s[k]:.2f}{unit}) * cos({deg[i]:.1f}°)",
+            "result_value": f"{s[i]:.2f}",
+            "result_unit": results.unit,
+        }
+
+    def sine_side(i: int, ref: int) -> dict:
+        return {
+            "target": f"|{sl[i]}|",
+            "method": "Law of Sines",
+            "equation": f"{sl[i]}/sin({al[i]}) = {sl[ref]}/sin({al[ref]})",
+            "substitution": f"{sl[i]}/sin({deg[i]:.1f}°) = {s[ref]:.2f}{unit}/sin({deg[ref]:.1f}°)",
+            "result_value": f"{s[i]:.2f}",
+            "result_unit": results.unit,
+        }
+
+    def angle_sum(i: int) -> dict:
+        j, k = (i + 1) % 3, (i + 2) % 3
+        return {
+            "target": al[i],
+            "method": "Angle Sum",
+            "equation": f"{al[i]} = 180° - {al[j]} - {al[k]}",
+            "substitution": f"{al[i]} = 180° - {deg[j]:.1f}° - {deg[k]:.1f}°",
+            "result_value": f"{deg[i]:.2f}",
+            "result_unit": "°",
+        }
+
+    if case == "SSS":
+        return [cosine_angle(0), cosine_angle(1), angle_sum(2)]
+    if case == "SAS":
+        m = int(np.argmax(given[3:]))
+        j, k = (m + 1) % 3, (m + 2) % 3
+        return [cosine_side(m), cosine_angle(j), angle_sum(k)]
+    if case == "SSA":
+        j = int(np.argmax(given[3:]))
+        m = int(np.argmin(given[:3]))
+        k = 3 - j - m
+        step = {
+            "target": al[k],
+            "method": "Law of Sines",
+            "equation": f"sin({al[k]})/{sl[k]} = sin({al[j]})/{sl[j]}",
+            "substitution": f"sin({al[k]})/{s[k]:.2f} = sin({deg[j]:.1f}°)/{s[j]:.2f}",
+            "result_value": f"{deg[k]:.2f}",
+            "result_unit": "°",
+        }
+        if results.ambiguous[row]:
+            step["note"] = f"Ambiguous case: {al[k]} = {math.degrees(results.alternate_angles[row, k]):.2f}° also forms a triangle"
+        return [step, angle_sum(m), sine_side(m, j)]
+
+    # ASA / AAS: complete the angles, then scale every unknown side from a known one
+    steps = [angle_sum(i) for i in range(3) if not given[3 + i]]
+    ref = int(np.argmax(given[:3]))
+    steps.extend(sine_side(i, ref) for i in range(3) if not given[i])
+    return steps
+
 
 class TriangleSolver:
     """
@@ -614,3 +912,155 @@ class TriangleSolver:
         unknown_force.copy_coords_from(unknown_vector)
         unknown_force._compute_magnitude_and_angle()
         unknown_force.is_known = True
+
+    def solve_triangles(
+        self,
+        a: ArrayLike | None = None,
+        b: ArrayLike | None = None,
+        c: ArrayLike | None = None,
+        A: ArrayLike | None = None,
+        B: ArrayLike | None = None,
+        C: ArrayLike | None = None,
+        angle_unit: str = "degree",
+        unit: str = "",
+    ) -> TriangleResults:
+        """
+        Solve N triangles at once from columns of known sides and angles.
+
+        Side a is opposite angle A, and so on. Each column is a scalar, an
+        array of length N or None (unknown in every row); NaN marks an unknown
+        in a single row. Every row is classified once (SSS, SAS, SSA, ASA or
+        AAS) and each case is solved for all of its rows with array math. SSA
+        rows with two solutions are flagged in ``ambiguous``; the acute
+        solution is the primary one and the obtuse one is kept in
+        ``alternate_sides``/``alternate_angles``.
+
+        Args:
+            a, b, c: Known sides (any consistent unit)
+            A, B, C: Known angles
+            angle_unit: Unit of the given angles (default "degree")
+            unit: Unit symbol of the sides, used in solution steps
+
+        Returns:
+            TriangleResults with every side and angle (radians)
+
+        Raises:
+            ValueError: If the columns have different lengths
+
+        Examples:
+            >>> tri = solver.solve_triangles(a=np.linspace(5, 15, 1000), b=10, C=60)
+            >>> tri.sides[:, 2]  # side c for every row
+            >>> tri.solution_steps(0)
+        """
+        sides = _columns(1, a, b, c)
+        angles = _columns(len(sides), A, B, C) * resolve_unit(angle_unit, dim.D).si_factor
+        if len(angles) != len(sides):
+            sides = _columns(len(angles), a, b, c)
+        if len(angles) != len(sides):
+            raise ValueError(f"Columns have different lengths: {len(sides)} sides vs {len(angles)} angles")
+        return _solve_triangle_rows(sides, angles, unit=unit)
+
+    def solve_resultant_cases(
+        self,
+        F1: ArrayLike,
+        theta1: ArrayLike,
+        F2: ArrayLike,
+        theta2: ArrayLike,
+        angle_unit: str = "degree",
+        unit: str = "N",
+        names: tuple[str, str, str] = ("F_1", "F_2", "F_R"),
+    ) -> ForceTriangleCases:
+        """
+        Resultants of N two-force systems with the law of cosines and law of sines.
+
+        The batched form of ``solve_resultant_from_two_forces`` for parametric
+        studies. The force triangle has sides F1, F2 and FR, with the angle
+        180° - γ opposite FR (γ is the angle between the forces). Collinear
+        forces do not form a triangle and are not ``valid``.
+
+        Args:
+            F1, F2: Force magnitudes (scalars or arrays of length N)
+            theta1, theta2: Force directions CCW from +x
+            angle_unit: Unit of the directions (default "degree")
+            unit: Unit symbol of the magnitudes, used in solution steps
+            names: Names of the two forces and the resultant
+
+        Returns:
+            ForceTriangleCases with the resultant in the last column
+        """
+        directions = _columns(1, theta1, theta2) * resolve_unit(angle_unit, dim.D).si_factor
+        magnitudes = _columns(len(directions), F1, F2)
+        if len(directions) != len(magnitudes):
+            directions = _columns(len(magnitudes), *directions.T)
+        t1, t2 = directions.T
+
+        angles = np.full((len(magnitudes), 3), np.nan)
+        angles[:, 2] = math.pi - _between(t1, t2)
+        sides = np.column_stack((magnitudes, np.full(len(magnitudes), np.nan)))
+        triangles = _solve_triangle_rows(sides, angles, **_force_labels(names, unit))
+
+        # The resultant turns from F1 towards F2 by the angle opposite F2
+        theta_R = t1 + np.sign(np.sin(t2 - t1)) * triangles.angles[:, 1]
+        return ForceTriangleCases(
+            names=names,
+            magnitude=triangles.sides.copy(),
+            angle=np.column_stack((t1, t2, theta_R)),
+            triangles=triangles,
+        )
+
+    def solve_decomposition_cases(
+        self,
+        FR: ArrayLike,
+        theta_R: ArrayLike,
+        theta1: ArrayLike,
+        theta2: ArrayLike,
+        angle_unit: str = "degree",
+        unit: str = "N",
+        names: tuple[str, str, str] = ("F_1", "F_2", "F_R"),
+    ) -> ForceTriangleCases:
+        """
+        Decompose N resultants into two forces along known directions.
+
+        The batched form of ``solve_two_unknowns_with_known_resultant``: the
+        angles opposite F1 and F2 come from the directions and the law of sines
+        gives both magnitudes. Rows where the resultant does not lie between the
+        two force directions have no positive decomposition and are not ``valid``.
+
+        Args:
+            FR: Resultant magnitudes (scalars or arrays of length N)
+            theta_R: Resultant directions CCW from +x
+            theta1, theta2: Directions of the two unknown forces
+            angle_unit: Unit of the directions (default "degree")
+            unit: Unit symbol of the magnitudes, used in solution steps
+            names: Names of the two forces and the resultant
+
+        Returns:
+            ForceTriangleCases with the two force magnitudes in the first columns
+        """
+        directions = _columns(1, theta1, theta2, theta_R) * resolve_unit(angle_unit, dim.D).si_factor
+        magnitude = _columns(len(directions), FR)
+        if len(directions) != len(magnitude):
+            directions = _columns(len(magnitude), *directions.T)
+        t1, t2, tR = directions.T
+
+        opposite_1, opposite_2 = _between(t2, tR), _between(t1, tR)
+        inside = np.isclose(opposite_1 + opposite_2, _between(t1, t2))
+        angles = np.column_stack((np.where(inside, opposite_1, np.nan), np.where(inside, opposite_2, np.nan), np.full(len(tR), np.nan)))
+        sides = np.column_stack((np.full((len(tR), 2), np.nan), np.abs(magnitude[:, 0])))
+        triangles = _solve_triangle_rows(sides, angles, **_force_labels(names, unit))
+
+        return ForceTriangleCases(
+            names=names,
+            magnitude=triangles.sides.copy(),
+            angle=np.column_stack((t1, t2, tR)),
+            triangles=triangles,
+        )
+
+
+def _force_labels(names: tuple[str, str, str], unit: str) -> dict[str, Any]:
+    """Side and angle labels of a force triangle, in the style of the single-triangle steps."""
+    return {
+        "side_labels": names,
+        "angle_labels": tuple(f"\\alpha_{{opp,{name}}}" for name in names),
+        "unit": unit,
+    }
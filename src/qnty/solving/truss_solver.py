@@ -0,0 +1,471 @@
+"""
+Sparse equilibrium solver for pin-jointed trusses.
+
+Every member is a two-force member, so the joint equilibrium equations of the
+whole truss form one linear system. It is solved in displacement form: the
+equilibrium matrix A (one row per joint degree of freedom, one column per
+member, holding the member direction cosines) gives the stiffness matrix
+
+    K = A · diag(k / L) · Aᵀ
+
+over the unrestrained degrees of freedom. K u = F is solved for the joint
+displacements, and the member forces are recovered as
+
+    N = (k / L) · e · (u_j − u_i)
+
+with tension positive. For a statically determinate truss these are exactly
+the method-of-joints forces and do not depend on the relative axial
+stiffnesses k. For an indeterminate truss k distributes the redundant forces.
+
+Assembly is done with array operations over all members at once. The solve
+uses SciPy's sparse LU factorization when SciPy is installed. Otherwise it
+orders the joints with reverse Cuthill–McKee, so that K is banded, and
+factorizes K block by block with NumPy.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ..core.dimension_catalog import dim
+from ..core.quantity import Quantity
+from ..core.unit import Unit, resolve_unit
+
+try:
+    from scipy.sparse import coo_matrix  # type: ignore[import-untyped]
+    from scipy.sparse.linalg import splu  # type: ignore[import-untyped]
+
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+    coo_matrix = None
+    splu = None
+
+# Smallest pivot, relative to the unit diagonal of the scaled stiffness matrix,
+# accepted before the truss is reported as a mechanism
+_PIVOT_TOLERANCE = 1e-12
+
+# Smallest block used by the banded solver; narrower blocks only add Python overhead
+_MIN_BLOCK = 48
+
+# Refinement steps after the first solve, each reusing the factorization
+_REFINEMENT_STEPS = 2
+
+_SINGULAR = "Truss is unstable: the stiffness matrix is singular (mechanism or missing supports)"
+
+_AXES = "xyz"
+
+
+@dataclass(frozen=True)
+class TrussSystem:
+    """
+    Assembled stiffness system over the unrestrained degrees of freedom.
+
+    The matrix is kept in coordinate (COO) form. Duplicate entries are summed.
+
+    Attributes:
+        rows: Row index of every entry
+        cols: Column index of every entry
+        values: Stiffness entries, in N/m per unit relative axial stiffness
+        load: Applied joint loads at the free degrees of freedom, in N
+        free: Global degree of freedom (joint * dimensions + axis) of every row
+        dimensions: 2 for a planar truss, 3 for a space truss
+    """
+
+    rows: NDArray[np.intp]
+    cols: NDArray[np.intp]
+    values: NDArray[np.float64]
+    load: NDArray[np.float64]
+    free: NDArray[np.intp]
+    dimensions: int
+
+    @property
+    def size(self) -> int:
+        """Number of equations."""
+        return len(self.free)
+
+    def toarray(self) -> NDArray[np.float64]:
+        """Dense copy of the stiffness matrix, for small systems and checks."""
+        dense = np.zeros((self.size, self.size))
+        np.add.at(dense, (self.rows, self.cols), self.values)
+        return dense
+
+
+@dataclass(frozen=True)
+class TrussResults:
+    """
+    Member forces and support reactions of a solved truss.
+
+    All arrays are in SI units (N), with tension positive.
+
+    Attributes:
+        members: Member names, in column order
+        forces: Axial force in every member, shape (M,)
+        supports: Names of the supported joints
+        reactions: Reaction components at every support, shape (S, 3)
+        unit: Display unit of the forces
+    """
+
+    members: tuple[str, ...]
+    forces: NDArray[np.float64]
+    supports: tuple[str, ...]
+    reactions: NDArray[np.float64]
+    unit: Unit
+
+    def __len__(self) -> int:
+        return len(self.forces)
+
+    def forces_in(self, unit: Unit | str) -> NDArray[np.float64]:
+        """Member forces in the given force unit."""
+        return self.forces / resolve_unit(unit, dim.force).si_factor
+
+    def reactions_in(self, unit: Unit | str) -> NDArray[np.float64]:
+        """Support reactions in the given force unit, shape (S, 3)."""
+        return self.reactions / resolve_unit(unit, dim.force).si_factor
+
+    @property
+    def is_tension(self) -> NDArray[np.bool_]:
+        """Whether each member is in tension (zero-force members count as tension)."""
+        return self.forces >= 0.0
+
+    def force(self, member: str) -> Quantity:
+        """
+        Axial force of one member as a Quantity in the display unit.
+
+        Raises:
+            KeyError: If there is no member with that name
+        """
+        try:
+            index = self.members.index(member)
+        except ValueError:
+            raise KeyError(f"Unknown member '{member}'") from None
+        return Quantity(name=f"F_{member}", dim=self.unit.dim, value=float(self.forces[index]), preferred=self.unit)
+
+    def reaction(self, joint: str) -> tuple[Quantity, Quantity, Quantity]:
+        """
+        Reaction components (x, y, z) at one support as Quantities.
+
+        Raises:
+            KeyError: If the joint is not a support
+        """
+        try:
+            index = self.supports.index(joint)
+        except ValueError:
+            raise KeyError(f"Joint '{joint}' is not a support") from None
+        return tuple(
+            Quantity(name=f"{joint}_{axis}", dim=self.unit.dim, value=float(value), preferred=self.unit)
+            for axis, value in zip(_AXES, self.reactions[index], strict=True)
+        )  # type: ignore[return-value]
+
+
+class TrussSolver:
+    """
+    Sparse direct solver for the joint equilibrium of pin-jointed trusses.
+
+    Examples:
+        >>> coordinates = np.array([[0, 0, 0], [4, 0, 0], [2, 2, 0]])
+        >>> ends = np.array([[0, 1], [0, 2], [1, 2]])
+        >>> restrained = np.array([[True, True, False], [False, True, False], [False, False, False]])
+        >>> loads = np.array([[0, 0, 0], [0, 0, 0], [0, -1000, 0]])
+        >>> forces, reactions = TrussSolver().solve(coordinates, ends, restrained, loads)
+    """
+
+    def __init__(self, method: str = "auto"):
+        """
+        Args:
+            method: "sparse" for SciPy's sparse LU, "banded" for the NumPy
+                band solver, or "auto" to use SciPy when it is installed
+
+        Raises:
+            ValueError: If the method is unknown or SciPy is requested but missing
+        """
+        if method not in ("auto", "sparse", "banded"):
+            raise ValueError(f"Unknown truss solver method '{method}'")
+        if method == "sparse" and not HAS_SCIPY:
+            raise ValueError("The 'sparse' method requires SciPy")
+        if method == "auto":
+            method = "sparse" if HAS_SCIPY else "banded"
+        self.method = method
+        self.system: TrussSystem | None = None  # Last assembled system
+
+    def assemble(
+        self,
+        coordinates: NDArray[np.float64],
+        ends: NDArray[np.intp],
+        restrained: NDArray[np.bool_],
+        loads: NDArray[np.float64],
+        axial_stiffness: ArrayLike = 1.0,
+        order: NDArray[np.intp] | None = None,
+    ) -> TrussSystem:
+        """
+        Assemble the stiffness system of a truss with array operations.
+
+        Args:
+            coordinates: Joint coordinates in m, shape (J, 3)
+            ends: Start and end joint of every member, shape (M, 2)
+            restrained: Restrained axes of every joint, shape (J, 3)
+            loads: Applied joint loads in N, shape (J, 3)
+            axial_stiffness: Relative axial stiffness k of every member, or one for all
+            order: Joint numbering used for the equations (a permutation of the
+                joints); the input order is used when omitted
+
+        Raises:
+            ValueError: If a member has zero length or joins a joint to itself
+        """
+        dimensions = 2 if not coordinates[:, 2].any() and not loads[:, 2].any() else 3
+        start, end = ends[:, 0], ends[:, 1]
+        delta = coordinates[end, :dimensions] - coordinates[start, :dimensions]
+        length = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+        if np.any(length == 0):
+            member = int(np.flatnonzero(length == 0)[0])
+            raise ValueError(f"Member {member} has zero length")
+        cosines = delta / length[:, None]
+        stiffness = np.broadcast_to(np.asarray(axial_stiffness, dtype=float), length.shape) / length
+
+        # Equation number of every global degree of freedom: joints in the given
+        # order, restrained axes removed
+        count = len(coordinates)
+        rank = np.arange(count) if order is None else np.empty(count, dtype=np.intp)
+        if order is not None:
+            rank[order] = np.arange(count)
+        is_free = ~restrained[:, :dimensions]
+        global_dofs = (np.arange(count)[:, None] * dimensions + np.arange(dimensions)).ravel()
+        ranked = (rank[:, None] * dimensions + np.arange(dimensions)).ravel()
+        free = global_dofs[np.argsort(ranked)]
+        free = free[is_free.ravel()[free]]
+        equation = np.full(count * dimensions, -1, dtype=np.intp)
+        equation[free] = np.arange(len(free))
+
+        # Element matrices k/L · [[eeᵀ, −eeᵀ], [−eeᵀ, eeᵀ]] for all members at once
+        offsets = np.arange(dimensions)
+        dofs = np.concatenate([start[:, None] * dimensions + offsets, end[:, None] * dimensions + offsets], axis=1)
+        signed = np.concatenate([cosines, -cosines], axis=1)
+        blocks = stiffness[:, None, None] * signed[:, :, None] * signed[:, None, :]
+        rows = np.broadcast_to(equation[dofs][:, :, None], blocks.shape).ravel()
+        cols = np.broadcast_to(equation[dofs][:, None, :], blocks.shape).ravel()
+        keep = (rows >= 0) & (cols >= 0)
+
+        return TrussSystem(
+            rows=rows[keep],
+            cols=cols[keep],
+            values=blocks.ravel()[keep],
+            load=loads[:, :dimensions].ravel()[free],
+            free=free,
+            dimensions=dimensions,
+        )
+
+    def solve(
+        self,
+        coordinates: ArrayLike,
+        ends: ArrayLike,
+        restrained: ArrayLike,
+        loads: ArrayLike,
+        axial_stiffness: ArrayLike = 1.0,
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Solve a truss for its member forces and joint reactions.
+
+        Args:
+            coordinates: Joint coordinates in m, shape (J, 3)
+            ends: Start and end joint index of every member, shape (M, 2)
+            restrained: Restrained axes of every joint, shape (J, 3)
+            loads: Applied joint loads in N, shape (J, 3)
+            axial_stiffness: Relative axial stiffness of every member, or one for all
+
+        Returns:
+            Member forces in N (tension positive), shape (M,), and the reaction
+            components in N at every joint, shape (J, 3), zero where unrestrained
+
+        Raises:
+            ValueError: If the truss is unstable (a mechanism or not enough supports)
+        """
+        coordinates = np.asarray(coordinates, dtype=float)
+        ends = np.asarray(ends, dtype=np.intp).reshape(-1, 2)
+        restrained = np.asarray(restrained, dtype=bool)
+        loads = np.asarray(loads, dtype=float)
+
+        order = _reverse_cuthill_mckee(len(coordinates), ends) if self.method == "banded" else None
+        system = self.assemble(coordinates, ends, restrained, loads, axial_stiffness, order)
+        self.system = system
+        displacement = np.zeros(coordinates.shape)
+        if system.size:
+            solution = self._solve_system(system)
+            free = np.zeros(len(coordinates) * system.dimensions)
+            free[system.free] = solution
+            displacement[:, : system.dimensions] = free.reshape(-1, system.dimensions)
+
+        start, end = ends[:, 0], ends[:, 1]
+        delta = coordinates[end] - coordinates[start]
+        length = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+        cosines = delta / length[:, None]
+        stiffness = np.broadcast_to(np.asarray(axial_stiffness, dtype=float), length.shape) / length
+        forces = stiffness * np.einsum("ij,ij->i", cosines, displacement[end] - displacement[start])
+
+        # Joint equilibrium: load + reaction + Σ member pulls = 0
+        pulls = forces[:, None] * cosines
+        internal = np.zeros(coordinates.shape)
+        for axis in range(3):
+            internal[:, axis] = np.bincount(start, pulls[:, axis], len(coordinates)) - np.bincount(end, pulls[:, axis], len(coordinates))
+        reactions = np.where(restrained, -(loads + internal), 0.0)
+        return forces, reactions
+
+    def _solve_system(self, system: TrussSystem) -> NDArray[np.float64]:
+        """
+        Solve K u = F through the Jacobi-scaled matrix, with iterative refinement.
+
+        Each refinement step reuses the factorization and reduces the joint
+        equilibrium residual K u − F, which long or slender trusses leave
+        well above round-off after a single solve.
+        """
+        scale = _jacobi_scale(system)
+        values = system.values * scale[system.rows] * scale[system.cols]
+        if self.method == "sparse":
+            solve = _sparse_factor(system, values)
+        else:
+            solve = _BandedCholesky(system.rows, system.cols, values, system.size).solve
+        rhs = system.load * scale
+        solution = solve(rhs)
+        for _ in range(_REFINEMENT_STEPS):
+            residual = rhs - np.bincount(system.rows, values * solution[system.cols], system.size)
+            if not residual.any():
+                break
+            solution += solve(residual)
+        return solution * scale
+
+
+def _sparse_factor(system: TrussSystem, values: NDArray[np.float64]) -> Callable[[NDArray[np.float64]], NDArray[np.float64]]:
+    """SciPy sparse LU factorization of the scaled matrix, as a solve function."""
+    matrix = coo_matrix((values, (system.rows, system.cols)), shape=(system.size, system.size))
+    try:
+        factor = splu(matrix.tocsc())
+    except RuntimeError:
+        raise ValueError(_SINGULAR) from None
+    pivots = np.abs(factor.U.diagonal())
+    if pivots.min() <= _PIVOT_TOLERANCE * pivots.max():
+        raise ValueError(_SINGULAR)
+    return factor.solve
+
+
+def _jacobi_scale(system: TrussSystem) -> NDArray[np.float64]:
+    """
+    Factors s = 1/√diag(K) that give the scaled matrix a unit diagonal.
+
+    Raises:
+        ValueError: If a free degree of freedom has no stiffness at all
+    """
+    on_diagonal = system.rows == system.cols
+    diagonal = np.bincount(system.rows[on_diagonal], system.values[on_diagonal], system.size)
+    if np.any(diagonal <= 0):
+        dof = int(system.free[np.flatnonzero(diagonal <= 0)[0]])
+        joint, axis = divmod(dof, system.dimensions)
+        raise ValueError(f"Truss is unstable: joint {joint} is not restrained in {_AXES[axis]} by any member or support")
+    return 1.0 / np.sqrt(diagonal)
+
+
+def _reverse_cuthill_mckee(count: int, ends: NDArray[np.intp]) -> NDArray[np.intp]:
+    """
+    Reverse Cuthill–McKee ordering of the joints, for a narrow band.
+
+    Each connected part of the truss is searched breadth-first from a joint of
+    lowest degree, visiting neighbours in order of increasing degree.
+    """
+    heads = np.concatenate([ends[:, 0], ends[:, 1]])
+    tails = np.concatenate([ends[:, 1], ends[:, 0]])
+    degree = np.bincount(heads, minlength=count)
+    by_head = np.lexsort((degree[tails], heads))
+    neighbours = tails[by_head].tolist()
+    pointer = np.concatenate([[0], np.cumsum(degree)]).tolist()
+
+    visited = bytearray(count)
+    ordering: list[int] = []
+    for seed in np.argsort(degree, kind="stable").tolist():
+        if visited[seed]:
+            continue
+        visited[seed] = 1
+        ordering.append(seed)
+        head = len(ordering) - 1
+        while head < len(ordering):
+            node = ordering[head]
+            head += 1
+            for neighbour in neighbours[pointer[node] : pointer[node + 1]]:
+                if not visited[neighbour]:
+                    visited[neighbour] = 1
+                    ordering.append(neighbour)
+    return np.array(ordering[::-1], dtype=np.intp)
+
+
+class _BandedCholesky:
+    """
+    Cholesky factorization of a banded symmetric positive definite matrix with NumPy.
+
+    The matrix is cut into square blocks at least as wide as its
+    half-bandwidth, which makes it block tridiagonal. The factorization then
+    needs one dense Cholesky factorization per diagonal block.
+    """
+
+    def __init__(self, rows: NDArray[np.intp], cols: NDArray[np.intp], values: NDArray[np.float64], size: int):
+        """
+        Raises:
+            ValueError: If the matrix is not positive definite (the truss is a mechanism)
+        """
+        width = min(max(int(np.max(np.abs(rows - cols), initial=0)), _MIN_BLOCK), size)
+        count = -(-size // width)
+        self._size = size
+        self._width = width
+
+        # Diagonal blocks D[b] and sub-diagonal blocks B[b] = K[block b + 1, block b]
+        block_row, local_row = np.divmod(rows, width)
+        block_col, local_col = np.divmod(cols, width)
+        on_diagonal = block_row == block_col
+        below = block_row == block_col + 1
+        diagonal = np.bincount(
+            (block_row[on_diagonal] * width + local_row[on_diagonal]) * width + local_col[on_diagonal], values[on_diagonal], count * width * width
+        ).reshape(count, width, width)
+        lower = np.bincount((block_col[below] * width + local_row[below]) * width + local_col[below], values[below], (count - 1) * width * width).reshape(
+            count - 1, width, width
+        )
+        padding = np.arange(size, count * width) - (count - 1) * width
+        diagonal[-1, padding, padding] = 1.0
+
+        self._factors: list[NDArray[np.float64]] = []
+        self._couplings: list[NDArray[np.float64]] = []
+        for block in range(count):
+            schur = diagonal[block] - self._couplings[-1] @ self._couplings[-1].T if block else diagonal[block]
+            try:
+                factor = np.linalg.cholesky(schur)
+            except np.linalg.LinAlgError:
+                raise ValueError(_SINGULAR) from None
+            if np.min(np.diag(factor)) ** 2 <= _PIVOT_TOLERANCE:
+                raise ValueError(_SINGULAR)
+            self._factors.append(factor)
+            if block < count - 1:
+                self._couplings.append(np.linalg.solve(factor, lower[block].T).T)
+
+    def solve(self, rhs: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Forward substitution with L, then back substitution with Lᵀ."""
+        factors, couplings = self._factors, self._couplings
+        count = len(factors)
+        padded = np.zeros(count * self._width)
+        padded[: self._size] = rhs
+        padded = padded.reshape(count, self._width)
+
+        forward = np.empty_like(padded)
+        for block in range(count):
+            value = padded[block] - couplings[block - 1] @ forward[block - 1] if block else padded[block]
+            forward[block] = np.linalg.solve(factors[block], value)
+        solution = np.empty_like(padded)
+        for block in reversed(range(count)):
+            value = forward[block] - couplings[block].T @ solution[block + 1] if block < count - 1 else forward[block]
+            solution[block] = np.linalg.solve(factors[block].T, value)
+        return solution.ravel()[: self._size]
+
+
+__all__ = [
+    "TrussResults",
+    "TrussSolver",
+    "TrussSystem",
+]
@@ -0,0 +1,361 @@
+"""
+Monte Carlo uncertainty propagation through a solved system.
+
+Known inputs are replaced by distributions, sampled in chunks into arrays of SI
+values, and pushed through the solved equations with the ``ARRAY`` compiler
+backend: each unknown is computed for a whole chunk with one vectorized call
+(closed-form where the equation can be inverted, an element-wise secant
+iteration otherwise). Per-variable statistics are accumulated across chunks,
+so memory stays bounded by the chunk size whatever the sample count.
+
+Percentiles come from a uniform reservoir of at most
+``PERCENTILE_RESERVOIR_SIZE`` samples per variable; they are exact when the
+sample count fits in the reservoir.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from ..algebra import Equation, VariableReference
+from ..algebra.compiler import ARRAY, CompiledExpression, try_compile
+from ..core.quantity import Quantity
+from ..core.unit import Unit, ureg
+from .roots import find_root, secant_array
+
+# Samples drawn and solved per vectorized pass
+DEFAULT_CHUNK_SIZE = 100_000
+
+# Samples kept per variable for percentile estimates
+PERCENTILE_RESERVOIR_SIZE = 100_000
+
+DEFAULT_PERCENTILES = (5.0, 50.0, 95.0)
+
+
+# ========== DISTRIBUTIONS ==========
+
+
+@dataclass(frozen=True)
+class Distribution(ABC):
+    """Base class for input distributions; parameters are in ``unit`` (the variable's preferred unit if None)."""
+
+    unit: Unit | str | None = field(default=None, kw_only=True)
+
+    def sample(self, rng: np.random.Generator, size: int, variable: Quantity) -> np.ndarray:
+        """Draw ``size`` samples as SI values for the given variable."""
+        unit = self._resolve_unit(variable)
+        factor, offset = (unit.si_factor, unit.si_offset) if unit is not None else (1.0, 0.0)
+        return self._draw(rng, size) * factor + offset
+
+    @abstractmethod
+    def _draw(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """Draw ``size`` samples in the distribution's own unit."""
+
+    def _resolve_unit(self, variable: Quantity) -> Unit | None:
+        unit = self.unit
+        if unit is None:
+            return variable.preferred or ureg.si_unit_for(variable.dim)
+        if isinstance(unit, str):
+            resolved = ureg.resolve(unit, dim=variable.dim)
+            if resolved is None:
+                raise ValueError(f"Unknown unit '{unit}' for variable '{variable.symbol}'")
+            return resolved
+        if unit.dim != variable.dim:
+            raise ValueError(f"Unit '{unit.symbol}' does not match the dimension of variable '{variable.symbol}'")
+        return unit
+
+
+@dataclass(frozen=True)
+class Normal(Distribution):
+    """Normal distribution with the given mean and standard deviation."""
+
+    mean: float
+    std: float
+
+    def _draw(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return rng.normal(self.mean, self.std, size)
+
+
+@dataclass(frozen=True)
+class Uniform(Distribution):
+    """Uniform distribution on [low, high)."""
+
+    low: float
+    high: float
+
+    def _draw(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return rng.uniform(self.low, self.high, size)
+
+
+@dataclass(frozen=True)
+class Triangular(Distribution):
+    """Triangular distribution on [low, high] with the given mode."""
+
+    low: float
+    mode: float
+    high: float
+
+    def _draw(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return rng.triangular(self.low, self.mode, self.high, size)
+
+
+# ========== RESULTS ==========
+
+
+@dataclass
+class VariableStatistics:
+    """
+    Summary of the sampled values of one variable, in SI units.
+
+    Attributes:
+        symbol: Variable symbol
+        count: Number of valid (finite) samples
+        invalid: Number of samples where the variable could not be computed
+        mean: Sample mean
+        std: Sample standard deviation
+        minimum: Smallest sample
+        maximum: Largest sample
+        percentiles: Percentile (0-100) to value
+    """
+
+    symbol: str
+    count: int
+    invalid: int
+    mean: float
+    std: float
+    minimum: float
+    maximum: float
+    percentiles: dict[float, float]
+    variable: Quantity | None = field(default=None, repr=False)
+
+    def quantity(self, value: float) -> Quantity:
+        """Wrap one of the SI statistics (e.g. ``stats.mean``) as a Quantity in the variable's unit."""
+        if self.variable is None:
+            raise ValueError(f"No variable information for '{self.symbol}'")
+        return Quantity(name=self.symbol, dim=self.variable.dim, value=value, preferred=self.variable.preferred)
+
+
+@dataclass
+class UncertaintyResult:
+    """
+    Outcome of a Monte Carlo propagation.
+
+    Attributes:
+        samples: Number of samples drawn
+        statistics: Statistics per solved variable
+        rule_failure_probability: Fraction of samples in which each rule triggered
+            or could not be evaluated (e.g. on an unsolvable sample), keyed by rule name
+        rule_errors: Error warning dict of each rule that could not be compiled or
+            evaluated at all, keyed by rule name; such rules have no failure probability
+    """
+
+    samples: int
+    statistics: dict[str, VariableStatistics]
+    rule_failure_probability: dict[str, float] = field(default_factory=dict)
+    rule_errors: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def __getitem__(self, symbol: str) -> VariableStatistics:
+        return self.statistics[symbol]
+
+
+class _RunningStatistics:
+    """Streaming mean/variance (Chan et al. merge), extrema and a percentile reservoir for one variable."""
+
+    __slots__ = ("count", "invalid", "mean", "m2", "minimum", "maximum", "reservoir", "priorities")
+
+    def __init__(self):
+        self.count = 0
+        self.invalid = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+        self.reservoir = np.empty(0)
+        self.priorities = np.empty(0)
+
+    def add(self, values: np.ndarray, rng: np.random.Generator) -> None:
+        valid = values[np.isfinite(values)]
+        self.invalid += values.size - valid.size
+        if valid.size == 0:
+            return
+
+        count = valid.size
+        mean = float(valid.mean())
+        m2 = float(((valid - mean) ** 2).sum())
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.minimum = min(self.minimum, float(valid.min()))
+        self.maximum = max(self.maximum, float(valid.max()))
+
+        # Bottom-k sampling on random priorities keeps a uniform sample of everything seen
+        priorities = np.concatenate((self.priorities, rng.random(count)))
+        reservoir = np.concatenate((self.reservoir, valid))
+        if reservoir.size > PERCENTILE_RESERVOIR_SIZE:
+            keep = np.argpartition(priorities, PERCENTILE_RESERVOIR_SIZE)[:PERCENTILE_RESERVOIR_SIZE]
+            priorities, reservoir = priorities[keep], reservoir[keep]
+        self.priorities, self.reservoir = priorities, reservoir
+
+    def summary(self, symbol: str, percentiles: Sequence[float], variable: Quantity | None) -> VariableStatistics:
+        empty = self.count == 0
+        std = float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else 0.0
+        points = np.percentile(self.reservoir, list(percentiles)) if not empty else [np.nan] * len(percentiles)
+        return VariableStatistics(
+            symbol=symbol,
+            count=self.count,
+            invalid=self.invalid,
+            mean=self.mean if not empty else np.nan,
+            std=std if not empty else np.nan,
+            minimum=self.minimum if not empty else np.nan,
+            maximum=self.maximum if not empty else np.nan,
+            percentiles={float(p): float(v) for p, v in zip(percentiles, points, strict=True)},
+            variable=variable,
+        )
+
+
+# ========== ENGINE ==========
+
+
+def _array_solver(symbol: str, equation: Equation, variable: Quantity, nominal: float) -> Callable[[dict[str, np.ndarray]], np.ndarray]:
+    """Vectorized evaluator for one solved unknown of a chunk."""
+    explicit = None
+    if isinstance(equation.lhs, VariableReference) and equation.lhs.name == symbol and symbol not in equation.rhs.get_variables():
+        explicit = equation.rhs
+    elif equation.inversion_for(symbol) is not None:
+        explicit = equation.inversion_for(symbol)
+
+    if explicit is not None:
+        compiled = try_compile(explicit, ARRAY)
+        if compiled is None:
+            raise ValueError(f"Equation '{equation.name}' cannot be evaluated on arrays")
+        return lambda columns: compiled(columns)
+
+    sides = equation.compiled_sides(ARRAY)
+    scalar_sides = equation.compiled_sides()
+    if sides is None or scalar_sides is None:
+        raise ValueError(f"Equation '{equation.name}' cannot be evaluated on arrays")
+    unit = variable.preferred or ureg.preferred_for(variable.dim)
+    scale = abs(unit.si_factor) if unit is not None else 1.0
+    bracket = getattr(variable, "_search_range", None)
+    return lambda columns: _solve_implicit(symbol, columns, sides, scalar_sides, nominal, scale, bracket)
+
+
+def _solve_implicit(
+    symbol: str,
+    columns: dict[str, np.ndarray],
+    sides: tuple[CompiledExpression, CompiledExpression],
+    scalar_sides: tuple[CompiledExpression, CompiledExpression],
+    nominal: float,
+    scale: float,
+    bracket: tuple[float, float] | None,
+) -> np.ndarray:
+    """Roots of lhs - rhs for every item of a chunk, starting from the nominal solution."""
+    lhs, rhs = sides
+
+    def residual(x: np.ndarray) -> np.ndarray:
+        return lhs({**columns, symbol: x}) - rhs({**columns, symbol: x})
+
+    size = len(next(iter(columns.values())))
+    roots = secant_array(residual, np.full(size, nominal), scale)
+
+    # Items the batch iteration could not settle get the bracketed scalar search
+    scalar_lhs, scalar_rhs = scalar_sides
+    for row in np.flatnonzero(np.isnan(roots)):
+        values = {name: float(column[row]) for name, column in columns.items()}
+        if any(np.isnan(value) for value in values.values()):
+            continue
+
+        def scalar_residual(x: float, values: dict[str, float] = values) -> float:
+            values[symbol] = x
+            return scalar_lhs(values) - scalar_rhs(values)
+
+        result = find_root(scalar_residual, nominal, bracket=bracket, scale=scale)
+        if result is not None:
+            roots[row] = result.root
+    return roots
+
+
+def propagate(
+    steps: Sequence[tuple[str, Equation]],
+    variables: Mapping[str, Quantity],
+    distributions: Mapping[str, Distribution],
+    samples: int,
+    seed: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    rule_set: Any = None,
+) -> UncertaintyResult:
+    """
+    Propagate input distributions through solved equations.
+
+    Args:
+        steps: (solved symbol, equation it was solved from), in solving order
+        variables: Problem variables keyed by symbol, holding the nominal solution
+        distributions: Distribution per sampled input symbol
+        samples: Total number of samples
+        seed: Seed for reproducible draws
+        chunk_size: Samples solved per vectorized pass
+        percentiles: Percentiles (0-100) to report per variable
+        rule_set: Optional RuleSet evaluated for every sample
+
+    Returns:
+        UncertaintyResult with statistics per solved variable, rule failure probabilities
+        and the errors of rules that could not be evaluated
+    """
+    if samples <= 0:
+        raise ValueError("samples must be positive")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    rng = np.random.default_rng(seed)
+    solvers = [(symbol, _array_solver(symbol, equation, variables[symbol], variables[symbol].value)) for symbol, equation in steps]
+    fixed = {symbol: var.value for symbol, var in variables.items() if var.value is not None and symbol not in distributions}
+    running = {symbol: _RunningStatistics() for symbol, _ in steps}
+    rule_names = [rule.name or str(rule.condition) for rule in rule_set.rules] if rule_set is not None else []
+    rule_counts = np.zeros(len(rule_names))
+    rule_errors: dict[str, dict[str, Any]] = {}
+
+    remaining = samples
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        remaining -= size
+
+        columns = {symbol: np.full(size, value) for symbol, value in fixed.items()}
+        for symbol, distribution in distributions.items():
+            columns[symbol] = distribution.sample(rng, size, variables[symbol])
+
+        with np.errstate(all="ignore"):
+            for symbol, solver in solvers:
+                columns[symbol] = np.broadcast_to(np.asarray(solver(columns), dtype=float), (size,)).copy()
+
+        for symbol, stats in running.items():
+            stats.add(columns[symbol], rng)
+        if rule_names:
+            results = rule_set.evaluate_batch(columns)
+            rule_counts += (results.triggered | results.failed).sum(axis=0)
+            # A raised error is a broken rule, not a failing sample
+            for (_, index), error in results.errors.items():
+                rule_errors.setdefault(rule_names[index], error)
+
+    statistics = {symbol: stats.summary(symbol, percentiles, variables.get(symbol)) for symbol, stats in running.items()}
+    probabilities = {name: float(count / samples) for name, count in zip(rule_names, rule_counts, strict=True) if name not in rule_errors}
+    return UncertaintyResult(samples=samples, statistics=statistics, rule_failure_probability=probabilities, rule_errors=rule_errors)
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "Distribution",
+    "Normal",
+    "Triangular",
+    "UncertaintyResult",
+    "Uniform",
+    "VariableStatistics",
+    "propagate",
+]
@@ -30,9 +30,11 @@ Examples:
 """
 
 from .point import _Point, Point
+from .point_cloud import PointCloud
 from .points import create_point_along, create_point_cartesian, create_point_direction_angles, create_point_from_ratio, create_point_polar, create_point_spherical
 from .vector import _Vector, _Vector, _Vector
-from .vectors import _VectorWithUnknowns, create_point_at_midpoint, create_vector_along, create_vector_cartesian, create_vector_direction_angles, create_vector_from_points, create_vector_from_ratio, create_vector_in_plane, create_vector_polar, create_vector_resultant, create_vector_resultant_cartesian, create_vector_spherical, create_vector_with_magnitude
+from .vector_array import VectorArray
+from .vectors import _VectorWithUnknowns, create_point_at_midpoint, create_vector_along, create_vector_cartesian, create_vector_direction_angles, create_vector_from_points, create_vector_from_ratio, create_vector_in_plane, create_vector_polar, create_vector_resultant, create_vector_resultant_cartesian, create_vector_spherical, create_vector_with_magnitude, create_vectors_in_plane
 from .vector_direction_ratios import VectorDirectionRatios
 from .vector_between import VectorBetween
 from .plane import Plane, create_plane_rotated_x, create_plane_rotated_y, create_plane_rotated_z
@@ -40,6 +42,7 @@ from .plane import Plane, create_plane_rotated_x, create_plane_rotated_y, create
 __all__ = [
     "_Point",
     "Point",
+    "PointCloud",
     "create_point_along",
     "create_point_at_midpoint",
     "create_point_cartesian",
@@ -61,8 +64,10 @@ __all__ = [
     "create_vector_resultant_cartesian",
     "create_vector_spherical",
     "create_vector_with_magnitude",
+    "create_vectors_in_plane",
     "VectorDirectionRatios",
     "_Vector",
+    "VectorArray",
     "VectorBetween",
     "Plane",
     "create_plane_rotated_x",
@@ -9,14 +9,22 @@ Supports:
 Engineering statics convention:
 - Counterclockwise (CCW) angles are positive
 - Clockwise (CW) angles are negative
+
+Identical references built through ``standard()``, ``from_axis()``,
+``from_coordinate_system()`` or ``interned()`` share one instance.
+References are treated as immutable.
 """
 
 from __future__ import annotations
 
+import functools
 import math
 from enum import Enum
 from typing import TYPE_CHECKING
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
 if TYPE_CHECKING:
     pass
 
@@ -55,7 +63,7 @@ class AngleReference:
         >>> ref5 = AngleReference(axis_angle=30, direction=AngleDirection.COUNTERCLOCKWISE)
     """
 
-    __slots__ = ("axis_angle", "direction", "axis_label", "_description")
+    __slots__ = ("axis_angle", "direction", "axis_label", "_description", "_sign")
 
     def __init__(
         self,
@@ -95,6 +103,29 @@ class AngleReference:
 
         self.axis_label = axis_label
         self._description = description
+        # Clockwise angles run opposite to the standard direction
+        self._sign = -1.0 if self.direction == AngleDirection.CLOCKWISE else 1.0
+
+    @classmethod
+    def interned(
+        cls,
+        axis_angle: float = 0.0,
+        direction: AngleDirection | str = AngleDirection.COUNTERCLOCKWISE,
+        axis_label: str = "+x",
+        angle_unit: str = "degree",
+        description: str = "",
+    ) -> AngleReference:
+        """
+        Shared instance of an angle reference; same arguments as the constructor.
+
+        References with the same axis angle, direction, label and description
+        are created once and reused.
+        """
+        if angle_unit == "degree":
+            axis_angle = math.radians(axis_angle)
+        if isinstance(direction, AngleDirection):
+            direction = direction.value
+        return _interned(cls, axis_angle, direction.lower(), axis_label, description)
 
     @classmethod
     def standard(cls) -> AngleReference:
@@ -104,9 +135,9 @@ class AngleReference:
         This is the default convention in engineering statics.
 
         Returns:
-            AngleReference for CCW from +x-axis
+            AngleReference for CCW from +x-axis (a shared instance)
         """
-        return cls(axis_angle=0.0, direction=AngleDirection.COUNTERCLOCKWISE, axis_label="+x", angle_unit="degree", description="counterclockwise from +x-axis")
+        return cls.interned(axis_angle=0.0, direction=AngleDirection.COUNTERCLOCKWISE, axis_label="+x", angle_unit="degree", description="counterclockwise from +x-axis")
 
     @classmethod
     def from_axis(cls, axis_label: str, direction: AngleDirection | str = AngleDirection.COUNTERCLOCKWISE, angle_unit: str = "degree") -> AngleReference:
@@ -150,7 +181,7 @@ class AngleReference:
         direction_str = direction.value if isinstance(direction, AngleDirection) else direction
         description = f"{direction_str} from {axis_label}-axis"
 
-        return cls(axis_angle=axis_angle, direction=direction, axis_label=axis_label, angle_unit="degree", description=description)
+        return cls.interned(axis_angle=axis_angle, direction=direction, axis_label=axis_label, angle_unit="degree", description=description)
 
     @classmethod
     def from_coordinate_system(cls, coord_system, axis_index: int = 0, direction: AngleDirection | str = AngleDirection.COUNTERCLOCKWISE) -> AngleReference:
@@ -182,7 +213,7 @@ class AngleReference:
         direction_str = direction.value if isinstance(direction, AngleDirection) else direction
         description = f"{direction_str} from {axis_label}-axis"
 
-        return cls(axis_angle=axis_angle, direction=direction, axis_label=axis_label, angle_unit="radian", description=description)
+        return cls.interned(axis_angle=axis_angle, direction=direction, axis_label=axis_label, angle_unit="radian", description=description)
 
     def to_standard(self, angle: float, angle_unit: str = "radian") -> float:
         """
@@ -202,22 +233,24 @@ class AngleReference:
             >>> # standard_angle ≈ 5.759 radians (330°)
         """
         # Convert to radians if needed
-        if angle_unit == "degree":
-            angle_rad = math.radians(angle)
-        else:
-            angle_rad = angle
+        angle_rad = math.radians(angle) if angle_unit == "degree" else angle
 
-        # Apply direction (clockwise inverts the angle)
-        if self.direction == AngleDirection.CLOCKWISE:
-            angle_rad = -angle_rad
+        # Apply direction, add the reference axis offset and normalize to [0, 2π)
+        return (self.axis_angle + self._sign * angle_rad) % (2 * math.pi)
 
-        # Add reference axis offset
-        standard_angle = self.axis_angle + angle_rad
+    def to_standard_array(self, angles: ArrayLike, angle_unit: str = "radian") -> NDArray[np.float64]:
+        """
+        Convert many angles in this reference system to standard at once.
 
-        # Normalize to [0, 2π)
-        standard_angle = standard_angle % (2 * math.pi)
+        Args:
+            angles: Angle values in this reference system
+            angle_unit: Unit of the input angles ("degree" or "radian")
 
-        return standard_angle
+        Returns:
+            Angles in radians, CCW from +x-axis, in [0, 2π)
+        """
+        angles_rad = np.radians(angles) if angle_unit == "degree" else np.asarray(angles, dtype=float)
+        return (self.axis_angle + self._sign * angles_rad) % (2 * math.pi)
 
     def from_standard(self, standard_angle: float, angle_unit: str = "radian") -> float:
         """
@@ -236,15 +269,8 @@ class AngleReference:
             >>> ref_angle = ref.from_standard(math.radians(330), angle_unit="degree")
             >>> # ref_angle ≈ 30.0
         """
-        # Subtract reference axis offset
-        relative_angle = standard_angle - self.axis_angle
-
-        # Apply direction (clockwise inverts the angle)
-        if self.direction == AngleDirection.CLOCKWISE:
-            relative_angle = -relative_angle
-
-        # Normalize to [0, 2π)
-        relative_angle = relative_angle % (2 * math.pi)
+        # Subtract the reference axis offset, apply direction and normalize to [0, 2π)
+        relative_angle = (self._sign * (standard_angle - self.axis_angle)) % (2 * math.pi)
 
         # Convert to desired unit
         if angle_unit == "degree":
@@ -252,6 +278,20 @@ class AngleReference:
         else:
             return relative_angle
 
+    def from_standard_array(self, standard_angles: ArrayLike, angle_unit: str = "radian") -> NDArray[np.float64]:
+        """
+        Convert many standard angles (CCW from +x-axis, in radians) to this reference system at once.
+
+        Args:
+            standard_angles: Angles in radians, measured CCW from +x-axis
+            angle_unit: Desired output unit ("degree" or "radian")
+
+        Returns:
+            Angles in this reference system, in [0, 2π) or [0°, 360°)
+        """
+        relative = (self._sign * (np.asarray(standard_angles, dtype=float) - self.axis_angle)) % (2 * math.pi)
+        return np.degrees(relative) if angle_unit == "degree" else relative
+
     @property
     def description(self) -> str:
         """Human-readable description of this angle reference."""
@@ -277,3 +317,9 @@ class AngleReference:
         # Two angle references are equal if they produce the same conversion
         # for any given angle
         return math.isclose(self.axis_angle, other.axis_angle, abs_tol=1e-9) and self.direction == other.direction
+
+
+@functools.lru_cache(maxsize=256)
+def _interned(cls: type[AngleReference], axis_angle: float, direction: str, axis_label: str, description: str) -> AngleReference:
+    """One shared instance per class, axis angle in radians, direction, label and description."""
+    return cls(axis_angle=axis_angle, direction=direction, axis_label=axis_label, angle_unit="radian", description=description)
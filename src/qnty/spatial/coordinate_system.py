@@ -5,14 +5,20 @@ Supports:
 - Standard orthogonal (x, y) with 90° separation
 - Non-orthogonal systems (e.g., u, v with arbitrary angle between axes)
 - Conversion between custom coordinate systems and standard x-y system
+
+The 2×2 basis matrix and its inverse are computed once per system, and
+identical systems built through ``standard()``, ``from_angle_between()`` or
+``interned()`` share one instance. Systems are treated as immutable.
 """
 
 from __future__ import annotations
 
+import functools
 import math
 from typing import TYPE_CHECKING
 
 import numpy as np
+from numpy.typing import ArrayLike, NDArray
 
 if TYPE_CHECKING:
     from ..core.unit import Unit
@@ -49,7 +55,7 @@ class CoordinateSystem:
         >>> force_xy = uv_system.to_cartesian(force_uv[0], force_uv[1])
     """
 
-    __slots__ = ("axis1_label", "axis2_label", "axis1_angle", "axis2_angle", "_is_orthogonal")
+    __slots__ = ("axis1_label", "axis2_label", "axis1_angle", "axis2_angle", "_is_orthogonal", "_transform", "_inverse", "_basis", "_inverse_basis")
 
     def __init__(self, axis1_label: str = "x", axis2_label: str = "y", axis1_angle: float = 0.0, axis2_angle: float = 90.0, angle_unit: str = "degree"):
         """
@@ -77,15 +83,43 @@ class CoordinateSystem:
         angle_diff = abs(self.axis2_angle - self.axis1_angle)
         self._is_orthogonal = math.isclose(angle_diff, math.pi / 2, abs_tol=1e-6)
 
+        # Basis [[cos θ1, cos θ2], [sin θ1, sin θ2]] and its inverse, as floats for
+        # scalar conversions and as read-only arrays for batches
+        cos1, cos2 = math.cos(self.axis1_angle), math.cos(self.axis2_angle)
+        sin1, sin2 = math.sin(self.axis1_angle), math.sin(self.axis2_angle)
+        self._transform = (cos1, cos2, sin1, sin2)
+        self._basis = np.array([[cos1, cos2], [sin1, sin2]])
+        self._basis.flags.writeable = False
+        det = cos1 * sin2 - cos2 * sin1
+        if abs(det) < 1e-12:
+            # Parallel axes: components along them are not unique
+            self._inverse = None
+            self._inverse_basis = None
+        else:
+            self._inverse = (sin2 / det, -cos2 / det, -sin1 / det, cos1 / det)
+            self._inverse_basis = np.array(self._inverse).reshape(2, 2)
+            self._inverse_basis.flags.writeable = False
+
+    @classmethod
+    def interned(cls, axis1_label: str = "x", axis2_label: str = "y", axis1_angle: float = 0.0, axis2_angle: float = 90.0, angle_unit: str = "degree") -> CoordinateSystem:
+        """
+        Shared instance of a coordinate system; same arguments as the constructor.
+
+        Systems with the same labels and axis angles are created once and reused.
+        """
+        if angle_unit == "degree":
+            axis1_angle, axis2_angle = math.radians(axis1_angle), math.radians(axis2_angle)
+        return _interned(cls, axis1_label, axis2_label, axis1_angle, axis2_angle)
+
     @classmethod
     def standard(cls) -> CoordinateSystem:
         """
-        Create standard orthogonal x-y coordinate system.
+        Standard orthogonal x-y coordinate system (a shared instance).
 
         Returns:
             CoordinateSystem with x at 0° and y at 90°
         """
-        return cls(axis1_label="x", axis2_label="y", axis1_angle=0.0, axis2_angle=90.0, angle_unit="degree")
+        return cls.interned(axis1_label="x", axis2_label="y", axis1_angle=0.0, axis2_angle=90.0, angle_unit="degree")
 
     @classmethod
     def from_angle_between(cls, axis1_label: str, axis2_label: str, axis1_angle: float = 0.0, angle_between: float = 90.0, angle_unit: str = "degree") -> CoordinateSystem:
@@ -115,7 +149,7 @@ class CoordinateSystem:
 
         axis2_angle_rad = axis1_rad + between_rad
 
-        return cls(axis1_label=axis1_label, axis2_label=axis2_label, axis1_angle=math.degrees(axis1_rad), axis2_angle=math.degrees(axis2_angle_rad), angle_unit="degree")
+        return cls.interned(axis1_label=axis1_label, axis2_label=axis2_label, axis1_angle=math.degrees(axis1_rad), axis2_angle=math.degrees(axis2_angle_rad), angle_unit="degree")
 
     @property
     def is_orthogonal(self) -> bool:
@@ -127,6 +161,16 @@ class CoordinateSystem:
         """Angle between the two axes in radians."""
         return self.axis2_angle - self.axis1_angle
 
+    @property
+    def basis(self) -> NDArray[np.float64]:
+        """Read-only 2×2 matrix whose columns are the axis directions in x-y."""
+        return self._basis
+
+    @property
+    def inverse_basis(self) -> NDArray[np.float64] | None:
+        """Read-only inverse of ``basis``, or None when the axes are parallel."""
+        return self._inverse_basis
+
     def to_cartesian(self, component1: float, component2: float) -> tuple[float, float]:
         """
         Convert components in this coordinate system to standard x-y cartesian.
@@ -145,9 +189,8 @@ class CoordinateSystem:
             >>> x, y = uv.to_cartesian(2.07, 2.93)
         """
         # Each component contributes to x and y based on its angle
-        x = component1 * math.cos(self.axis1_angle) + component2 * math.cos(self.axis2_angle)
-        y = component1 * math.sin(self.axis1_angle) + component2 * math.sin(self.axis2_angle)
-        return (x, y)
+        cos1, cos2, sin1, sin2 = self._transform
+        return (component1 * cos1 + component2 * cos2, component1 * sin1 + component2 * sin2)
 
     def from_cartesian(self, x: float, y: float) -> tuple[float, float]:
         """
@@ -170,16 +213,42 @@ class CoordinateSystem:
             >>> # Force with x=3.5 kN, y=2.0 kN
             >>> u, v = uv.from_cartesian(3.5, 2.0)
         """
-        # Set up the linear system as a matrix equation
+        # Solve the linear system with the cached inverse
         # [cos(θ1)  cos(θ2)] [c1]   [x]
         # [sin(θ1)  sin(θ2)] [c2] = [y]
+        if self._inverse is None:
+            raise np.linalg.LinAlgError("Singular matrix")
+        a, b, c, d = self._inverse
+        return (a * x + b * y, c * x + d * y)
+
+    def to_cartesian_array(self, components: ArrayLike) -> NDArray[np.float64]:
+        """
+        Convert many component pairs to standard x-y cartesian at once.
+
+        Args:
+            components: Components along the two axes, shape (N, 2) or (2,)
+
+        Returns:
+            (x, y) components with the same shape
+        """
+        return np.asarray(components, dtype=float) @ self._basis.T
+
+    def from_cartesian_array(self, xy: ArrayLike) -> NDArray[np.float64]:
+        """
+        Convert many standard x-y component pairs to this coordinate system at once.
 
-        A = np.array([[math.cos(self.axis1_angle), math.cos(self.axis2_angle)], [math.sin(self.axis1_angle), math.sin(self.axis2_angle)]])
-        b = np.array([x, y])
+        Args:
+            xy: Cartesian components, shape (N, 2) or (2,)
 
-        # Solve for [c1, c2]
-        components = np.linalg.solve(A, b)
-        return (float(components[0]), float(components[1]))
+        Returns:
+            Components along the two axes, with the same shape
+
+        Raises:
+            LinAlgError: If the axes are parallel
+        """
+        if self._inverse_basis is None:
+            raise np.linalg.LinAlgError("Singular matrix")
+        return np.asarray(xy, dtype=float) @ self._inverse_basis.T
 
     def angle_to_axis1(self, angle_from_x: float) -> float:
         """
@@ -219,3 +288,9 @@ class CoordinateSystem:
     def __repr__(self) -> str:
         """Representation."""
         return self.__str__()
+
+
+@functools.lru_cache(maxsize=256)
+def _interned(cls: type[CoordinateSystem], axis1_label: str, axis2_label: str, axis1_angle: float, axis2_angle: float) -> CoordinateSystem:
+    """One shared instance per class, labels and axis angles in radians."""
+    return cls(axis1_label=axis1_label, axis2_label=axis2_label, axis1_angle=axis1_angle, axis2_angle=axis2_angle, angle_unit="radian")
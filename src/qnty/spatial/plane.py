@@ -3,15 +3,22 @@ Plane class for 3D spatial calculations.
 
 Provides Plane object and factory functions for creating planes
 oriented around coordinate axes.
+
+Plane queries accept a single point of shape (3,) or many points of shape
+(N, 3) and work on the whole array at once, so section cuts and projections
+of large point sets do not loop in Python.
 """
 
 from __future__ import annotations
 
+import functools
 import math
 
 import numpy as np
+from numpy.typing import ArrayLike, NDArray
 
-from ..core.unit import Unit
+from ..core.unit import Unit, resolve_unit
+from .point_cloud import PointCloud
 
 
 class Plane:
@@ -28,7 +35,7 @@ class Plane:
         name: Optional name for the plane
     """
 
-    __slots__ = ("_normal", "_point", "_unit", "name")
+    __slots__ = ("_normal", "_point", "_unit", "_rotation", "name")
 
     def __init__(
         self,
@@ -60,6 +67,7 @@ class Plane:
             self._point = np.asarray(point, dtype=float)
 
         self._unit = unit
+        self._rotation: NDArray[np.float64] | None = None
         self.name = name
 
     @property
@@ -77,48 +85,101 @@ class Plane:
         """Unit for point coordinates."""
         return self._unit
 
-    def distance_to_point(self, point: np.ndarray) -> float:
+    @property
+    def rotation_matrix(self) -> NDArray[np.float64]:
+        """
+        Rotation from the global axes to the plane's axes, computed once.
+
+        The columns are two orthonormal in-plane directions followed by the
+        normal. Planes from the ``create_plane_rotated_*`` helpers keep the
+        in-plane directions of their rotated starting plane; other planes
+        take the first in-plane direction from the global axis that is most
+        nearly parallel to the plane.
+        """
+        if self._rotation is None:
+            normal = self._normal
+            axis = np.zeros(3)
+            axis[np.argmin(np.abs(normal))] = 1.0
+            first = axis - np.dot(axis, normal) * normal
+            first /= np.linalg.norm(first)
+            self._rotation = _read_only(np.column_stack((first, np.cross(normal, first), normal)))
+        return self._rotation
+
+    def distance_to_point(self, point: ArrayLike | PointCloud) -> float | NDArray[np.float64]:
         """
-        Calculate signed distance from a point to the plane.
+        Calculate signed distance from a point, or from many points, to the plane.
 
         Positive distance means the point is on the side of the normal.
 
         Args:
-            point: Point coordinates (in same units as plane)
+            point: Point coordinates of shape (3,), an (N, 3) array or a PointCloud
+                (in same units as plane)
 
         Returns:
-            Signed distance to the plane
+            Signed distance to the plane, or an (N,) array of distances
         """
-        point = np.asarray(point, dtype=float)
-        return np.dot(self._normal, point - self._point)
+        return (_coordinates(point) - self._point) @ self._normal
 
-    def project_point(self, point: np.ndarray) -> np.ndarray:
+    def project_point(self, point: ArrayLike | PointCloud) -> NDArray[np.float64] | PointCloud:
         """
-        Project a point onto the plane.
+        Project a point, or many points, onto the plane.
 
         Args:
-            point: Point coordinates
+            point: Point coordinates of shape (3,), an (N, 3) array or a PointCloud
 
         Returns:
-            Projected point on the plane
+            Projected point on the plane, an (N, 3) array of projected points,
+            or a PointCloud when a PointCloud is given
         """
-        point = np.asarray(point, dtype=float)
-        dist = self.distance_to_point(point)
-        return point - dist * self._normal
-
-    def contains_point(self, point: np.ndarray, tol: float = 1e-9) -> bool:
+        coords = _coordinates(point)
+        dist = (coords - self._point) @ self._normal
+        projected = coords - np.expand_dims(dist, -1) * self._normal
+        if isinstance(point, PointCloud):
+            return PointCloud._from_si(projected, point.dim, point.unit)
+        return projected
+
+    def contains_point(self, point: ArrayLike | PointCloud, tol: float = 1e-9) -> bool | NDArray[np.bool_]:
         """
-        Check if a point lies on the plane.
+        Check if a point, or each of many points, lies on the plane.
 
         Args:
-            point: Point coordinates
+            point: Point coordinates of shape (3,), an (N, 3) array or a PointCloud
             tol: Tolerance for distance check
 
         Returns:
-            True if point is on the plane
+            True if point is on the plane, or an (N,) boolean mask
         """
         return abs(self.distance_to_point(point)) < tol
 
+    def to_plane_coordinates(self, point: ArrayLike | PointCloud) -> NDArray[np.float64]:
+        """
+        Express points in the plane's own axes (see ``rotation_matrix``).
+
+        Args:
+            point: Point coordinates of shape (3,), an (N, 3) array or a PointCloud
+
+        Returns:
+            Coordinates of shape (3,) or (N, 3) along the two in-plane axes and
+            the normal, measured from the plane's reference point. The last
+            column is the signed distance to the plane.
+        """
+        return (_coordinates(point) - self._point) @ self.rotation_matrix
+
+    def from_plane_coordinates(self, coordinates: ArrayLike) -> NDArray[np.float64]:
+        """
+        Global coordinates of points given in the plane's own axes.
+
+        Args:
+            coordinates: In-plane coordinates of shape (2,) or (N, 2), or
+                (3,) or (N, 3) including the distance along the normal
+
+        Returns:
+            Point coordinates of shape (3,) or (N, 3)
+        """
+        coords = np.asarray(coordinates, dtype=float)
+        rotation = self.rotation_matrix
+        return self._point + coords @ rotation[:, : coords.shape[-1]].T
+
     def __str__(self) -> str:
         """String representation."""
         name_str = f"'{self.name}' " if self.name else ""
@@ -164,26 +225,11 @@ def create_plane_rotated_x(
         >>> # Plane rotated 90° (becomes xz-plane with normal +y)
         >>> p2 = create_plane_rotated_x(angle=90)
     """
-    # Convert angle to radians
-    if angle_unit.lower() in ("degree", "degrees", "deg"):
-        angle_rad = math.radians(float(angle))
-    elif angle_unit.lower() in ("radian", "radians", "rad"):
-        angle_rad = float(angle)
-    else:
-        raise ValueError(f"Invalid angle_unit '{angle_unit}'. Use 'degree' or 'radian'")
+    angle_rad = _to_radians(angle, angle_unit)
 
-    # Rotation around x-axis
-    # Starting normal: [0, 0, 1] (z-axis)
+    # Rotation around x-axis, starting from the xy-plane (normal [0, 0, 1])
     # After rotation: normal_y = sin(angle), normal_z = cos(angle)
-    normal = np.array([0.0, math.sin(angle_rad), math.cos(angle_rad)])
-
-    # Resolve unit
-    resolved_unit = _resolve_unit(unit)
-
-    # Convert point to numpy array
-    point_arr = _convert_point(point, resolved_unit)
-
-    return Plane(normal, point_arr, resolved_unit, name)
+    return _rotated_plane(_axis_rotation("x", -angle_rad), (0, 1, 2), point, unit, name)
 
 
 def create_plane_rotated_y(
@@ -219,34 +265,19 @@ def create_plane_rotated_y(
         >>> # zy-plane rotated -30° around y-axis (normal goes from +x toward +z)
         >>> p2 = create_plane_rotated_y(angle=-30, start_plane="zy")
     """
-    # Convert angle to radians
-    if angle_unit.lower() in ("degree", "degrees", "deg"):
-        angle_rad = math.radians(float(angle))
-    elif angle_unit.lower() in ("radian", "radians", "rad"):
-        angle_rad = float(angle)
-    else:
-        raise ValueError(f"Invalid angle_unit '{angle_unit}'. Use 'degree' or 'radian'")
+    angle_rad = _to_radians(angle, angle_unit)
 
     # Rotation around y-axis
     if start_plane.lower() == "xy":
         # Starting normal: [0, 0, 1] (z-axis)
         # After rotation: normal_x = -sin(angle), normal_z = cos(angle)
-        normal = np.array([-math.sin(angle_rad), 0.0, math.cos(angle_rad)])
-    elif start_plane.lower() == "zy":
-        # Starting normal: [1, 0, 0] (x-axis)
+        return _rotated_plane(_axis_rotation("y", -angle_rad), (0, 1, 2), point, unit, name)
+    if start_plane.lower() == "zy":
+        # Starting normal: [1, 0, 0] (x-axis), in-plane axes y and z
         # After rotation: normal_x = cos(angle), normal_z = -sin(angle)
         # Positive angle rotates normal from +x toward -z (consistent with right-hand rule)
-        normal = np.array([math.cos(angle_rad), 0.0, -math.sin(angle_rad)])
-    else:
-        raise ValueError(f"Invalid start_plane '{start_plane}'. Must be 'xy' or 'zy'")
-
-    # Resolve unit
-    resolved_unit = _resolve_unit(unit)
-
-    # Convert point to numpy array
-    point_arr = _convert_point(point, resolved_unit)
-
-    return Plane(normal, point_arr, resolved_unit, name)
+        return _rotated_plane(_axis_rotation("y", angle_rad), (1, 2, 0), point, unit, name)
+    raise ValueError(f"Invalid start_plane '{start_plane}'. Must be 'xy' or 'zy'")
 
 
 def create_plane_rotated_z(
@@ -281,38 +312,66 @@ def create_plane_rotated_z(
         >>> # Plane rotated 90° (becomes yz-plane with normal -x)
         >>> p2 = create_plane_rotated_z(angle=90)
     """
-    # Convert angle to radians
+    angle_rad = _to_radians(angle, angle_unit)
+
+    # Rotation around z-axis, starting from the xz-plane (normal [0, 1, 0], in-plane axes z and x)
+    # After rotation: normal_x = -sin(angle), normal_y = cos(angle)
+    return _rotated_plane(_axis_rotation("z", angle_rad), (2, 0, 1), point, unit, name)
+
+
+def _to_radians(angle: float, angle_unit: str) -> float:
+    """Convert an angle in degrees or radians to radians."""
     if angle_unit.lower() in ("degree", "degrees", "deg"):
-        angle_rad = math.radians(float(angle))
-    elif angle_unit.lower() in ("radian", "radians", "rad"):
-        angle_rad = float(angle)
+        return math.radians(float(angle))
+    if angle_unit.lower() in ("radian", "radians", "rad"):
+        return float(angle)
+    raise ValueError(f"Invalid angle_unit '{angle_unit}'. Use 'degree' or 'radian'")
+
+
+@functools.lru_cache(maxsize=256)
+def _axis_rotation(axis: str, angle_rad: float) -> NDArray[np.float64]:
+    """Right-handed rotation matrix about a coordinate axis, shared between calls."""
+    c, s = math.cos(angle_rad), math.sin(angle_rad)
+    if axis == "x":
+        rotation = [[1.0, 0.0, 0.0], [0.0, c, -s], [0.0, s, c]]
+    elif axis == "y":
+        rotation = [[c, 0.0, s], [0.0, 1.0, 0.0], [-s, 0.0, c]]
     else:
-        raise ValueError(f"Invalid angle_unit '{angle_unit}'. Use 'degree' or 'radian'")
+        rotation = [[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]]
+    return _read_only(np.array(rotation))
 
-    # Rotation around z-axis
-    # Starting normal: [0, 1, 0] (y-axis)
-    # After rotation: normal_x = -sin(angle), normal_y = cos(angle)
-    normal = np.array([-math.sin(angle_rad), math.cos(angle_rad), 0.0])
 
-    # Resolve unit
-    resolved_unit = _resolve_unit(unit)
+def _rotated_plane(
+    rotation: NDArray[np.float64],
+    start_axes: tuple[int, int, int],
+    point: tuple[float, float, float] | np.ndarray | None,
+    unit: Unit | str | None,
+    name: str | None,
+) -> Plane:
+    """
+    Plane whose axes are the rotated starting axes.
 
-    # Convert point to numpy array
-    point_arr = _convert_point(point, resolved_unit)
+    ``start_axes`` picks the global axes that span the starting plane,
+    followed by its normal, e.g. (1, 2, 0) for the zy-plane.
+    """
+    resolved_unit = resolve_unit(unit)
+    plane = Plane(rotation[:, start_axes[2]], _convert_point(point, resolved_unit), resolved_unit, name)
+    axes = rotation[:, start_axes]
+    axes[:, 2] = plane._normal
+    plane._rotation = _read_only(axes)
+    return plane
 
-    return Plane(normal, point_arr, resolved_unit, name)
 
+def _read_only(array: NDArray[np.float64]) -> NDArray[np.float64]:
+    array.flags.writeable = False
+    return array
 
-def _resolve_unit(unit: Unit | str | None) -> Unit | None:
-    """Resolve unit string to Unit object."""
-    if isinstance(unit, str):
-        from ..core.unit import ureg
 
-        resolved = ureg.resolve(unit)
-        if resolved is None:
-            raise ValueError(f"Unknown unit '{unit}'")
-        return resolved
-    return unit
+def _coordinates(point: ArrayLike | PointCloud) -> NDArray[np.float64]:
+    """SI coordinates of a point, an (N, 3) array of points or a PointCloud."""
+    if isinstance(point, PointCloud):
+        return point.si_coords
+    return np.asarray(point, dtype=float)
 
 
 def _convert_point(
@@ -7,16 +7,15 @@ Internally stores values in SI units for consistency with qnty's architecture.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Generic, TypeVar
+import math
+from typing import Generic, TypeVar
 
 import numpy as np
 from numpy.typing import NDArray
 
 from ..core.quantity import Quantity
 from ..core.unit import Unit
-
-if TYPE_CHECKING:
-    from .vector import _Vector
+from .vector import _COMPONENT_SLOTS, _is_close, _Vector
 
 D = TypeVar("D")
 
@@ -44,7 +43,7 @@ class _Point(Generic[D]):
         26.9258 m
     """
 
-    __slots__ = ("_coords", "_dim", "_unit", "_is_unknown", "_distance")
+    __slots__ = ("_x", "_y", "_z", "_dim", "_unit", "_is_unknown", "_distance")
 
     def __init__(self, x: float, y: float, z: float = 0.0, unit: Unit[D] | str | None = None):
         """
@@ -68,16 +67,16 @@ class _Point(Generic[D]):
                 raise ValueError(f"Unknown length unit '{unit}'")
             unit = resolved
 
-        # Store as numpy array for vectorized operations
+        # Store as three floats; NumPy is only used for batches and to_array()
         if unit is None:
             # Store directly as dimensionless SI values
-            self._coords = np.array([x, y, z], dtype=float)
+            self._x, self._y, self._z = float(x), float(y), float(z)
             self._dim = None
             self._unit = None
         else:
             # Convert to SI for internal storage
-            si_values = unit.si_factor * np.array([x, y, z], dtype=float) + unit.si_offset
-            self._coords = si_values
+            factor, offset = unit.si_factor, unit.si_offset
+            self._x, self._y, self._z = factor * float(x) + offset, factor * float(y) + offset, factor * float(z) + offset
             self._dim = unit.dim
             self._unit = unit  # Preferred display unit
 
@@ -105,13 +104,27 @@ class _Point(Generic[D]):
 
         # Create point with NaN coordinates to indicate unknown
         result = object.__new__(cls)
-        result._coords = np.array([np.nan, np.nan, np.nan], dtype=float)
+        result._x, result._y, result._z = math.nan, math.nan, math.nan
         result._dim = unit.dim
         result._unit = unit
         result._is_unknown = True
         result._distance = distance  # Distance from reference point
         return result
 
+    @property
+    def _coords(self) -> NDArray[np.float64]:
+        """SI coordinates as a new array (see ``_Vector._coords``)."""
+        return np.array((self._x, self._y, self._z))
+
+    @_coords.setter
+    def _coords(self, values) -> None:
+        x, y, z = values
+        self._x, self._y, self._z = float(x), float(y), float(z)
+
+    def _set_component(self, index: int, value_si: float) -> None:
+        """Set one SI coordinate (0, 1 or 2)."""
+        setattr(self, _COMPONENT_SLOTS[index], float(value_si))
+
     @property
     def is_unknown(self) -> bool:
         """Whether this point has unknown coordinates to be solved for."""
@@ -149,7 +162,7 @@ class _Point(Generic[D]):
 
         # Create point directly from SI values
         result = object.__new__(cls)
-        result._coords = np.array([x.value, y.value, z.value], dtype=float)
+        result._x, result._y, result._z = float(x.value), float(y.value), float(z.value)
         result._dim = x.dim
         result._unit = x.preferred or y.preferred or z.preferred
         return result
@@ -180,7 +193,7 @@ class _Point(Generic[D]):
         q = object.__new__(Quantity)
         q.name = name
         q.dim = self._dim
-        q.value = self._coords[index]
+        q.value = (self._x, self._y, self._z)[index]
         q.preferred = self._unit
         q._symbol = None
         q._output_unit = None
@@ -206,15 +219,9 @@ class _Point(Generic[D]):
         if self._dim != other._dim:
             raise ValueError(f"Cannot subtract points with different dimensions: {self._dim} vs {other._dim}")
 
-        # Import here to avoid circular imports
-        from .vector import _Vector
-
-        # Vectorized subtraction (SI values)
-        delta = self._coords - other._coords
-
-        # Create _Vector directly
+        # Create _Vector directly from the SI difference
         result = object.__new__(_Vector)
-        result._coords = delta
+        result._x, result._y, result._z = self._x - other._x, self._y - other._y, self._z - other._z
         result._dim = self._dim
         result._unit = self._unit
         return result
@@ -233,20 +240,17 @@ class _Point(Generic[D]):
         Raises:
             ValueError: If vector has different dimension than point
         """
-        from .vector import _Vector
-
         if not isinstance(vector, _Vector):
             raise TypeError(f"Expected _Vector, got {type(vector)}")
 
         if self._dim != vector._dim:
             raise ValueError(f"Cannot displace point with vector of different dimension: {self._dim} vs {vector._dim}")
 
-        # Vectorized displacement (SI values)
-        new_coords = self._coords + times * vector._coords
-
-        # Create new _Point directly
+        # Create new _Point directly from the displaced SI values
         result = object.__new__(_Point)
-        result._coords = new_coords
+        result._x = self._x + times * vector._x
+        result._y = self._y + times * vector._y
+        result._z = self._z + times * vector._z
         result._dim = self._dim
         result._unit = self._unit
         return result
@@ -270,9 +274,8 @@ class _Point(Generic[D]):
         if self._dim != other._dim:
             raise ValueError(f"Cannot compute distance between points with different dimensions: {self._dim} vs {other._dim}")
 
-        # Vectorized distance calculation (SI values)
-        delta = self._coords - other._coords
-        distance_si = float(np.sqrt(np.sum(delta**2)))
+        # Distance from the SI values
+        distance_si = math.hypot(self._x - other._x, self._y - other._y, self._z - other._z)
 
         # Return as Quantity
         q = object.__new__(Quantity)
@@ -304,7 +307,7 @@ class _Point(Generic[D]):
 
         # Create new _Point with same SI values, different display unit
         result = object.__new__(_Point)
-        result._coords = self._coords.copy()  # Copy to avoid aliasing
+        result._x, result._y, result._z = self._x, self._y, self._z
         result._dim = self._dim
         result._unit = unit
         return result
@@ -317,8 +320,9 @@ class _Point(Generic[D]):
             Array of [x, y, z] coordinates in display units
         """
         if self._unit is None:
-            return self._coords.copy()
-        return (self._coords - self._unit.si_offset) / self._unit.si_factor
+            return np.array((self._x, self._y, self._z))
+        offset, factor = self._unit.si_offset, self._unit.si_factor
+        return np.array(((self._x - offset) / factor, (self._y - offset) / factor, (self._z - offset) / factor))
 
     def __eq__(self, other: object) -> bool:
         """
@@ -337,7 +341,7 @@ class _Point(Generic[D]):
             return False
 
         # Use small tolerance for floating point comparison
-        return bool(np.allclose(self._coords, other._coords, rtol=1e-10, atol=1e-10))
+        return _is_close(self._x, other._x) and _is_close(self._y, other._y) and _is_close(self._z, other._z)
 
     def __str__(self) -> str:
         """String representation of the point."""
@@ -0,0 +1,351 @@
+"""
+Batch of 3D points stored as one array.
+
+``PointCloud`` is the point counterpart of ``VectorArray``: N points held as a
+single (N, 3) float64 buffer of SI values with one dimension and display unit
+shared by all rows. Distances, displacements and position vectors are
+computed for the whole batch in one NumPy call, and nearest-neighbour queries
+go through a k-d tree built on first use.
+
+The buffer is read-only, so the cached tree always matches the points.
+Individual rows are available as ``_Point`` copies on demand.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Iterator, Sequence
+from typing import Generic, TypeVar
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ..core.dimension import Dimension
+from ..core.dimension_catalog import dim
+from ..core.unit import Unit, resolve_unit
+from .point import _Point
+from .vector import _Vector
+from .vector_array import VectorArray, _scale_column
+
+D = TypeVar("D")
+
+# Points per k-d tree leaf; leaves are searched with one NumPy call
+_LEAF_SIZE = 16
+
+
+class PointCloud(Generic[D]):
+    """
+    N points with uniform units, stored as an (N, 3) array of SI values.
+
+    Examples:
+        >>> anchors = PointCloud(np.random.rand(5000, 3) * 20, unit="ft")
+        >>> spans = anchors.distance_matrix(unit="ft")
+        >>> distance, index = anchors.nearest(_Point(3, 4, 0, unit="ft"))
+        >>> r = anchors.position_vectors([0, 1, 2], [10, 11, 12])  # VectorArray
+    """
+
+    __slots__ = ("_coords", "_dim", "_unit", "_tree")
+
+    def __init__(self, coordinates: ArrayLike, unit: Unit[D] | str | None = None):
+        """
+        Create a point cloud from coordinates in a display unit.
+
+        Args:
+            coordinates: Array of shape (N, 3), or (N, 2) for points in the xy-plane
+            unit: Unit of the coordinates, shared by every point
+
+        Raises:
+            ValueError: If the coordinates do not have 2 or 3 columns or the unit is unknown
+        """
+        array = np.array(coordinates, dtype=float, ndmin=2)
+        if array.ndim != 2 or array.shape[1] not in (2, 3):
+            raise ValueError(f"Expected coordinates of shape (N, 3) or (N, 2), got {array.shape}")
+        if array.shape[1] == 2:
+            array = np.column_stack((array, np.zeros(len(array))))
+
+        unit = resolve_unit(unit, dim.length)
+        if unit is not None:
+            array *= unit.si_factor
+            if unit.si_offset:
+                array += unit.si_offset
+        array.flags.writeable = False
+        self._coords = array
+        self._dim = unit.dim if unit is not None else None
+        self._unit = unit
+        self._tree: _KDTree | None = None
+
+    @classmethod
+    def _from_si(cls, coords: NDArray[np.float64], dim: Dimension | None, unit: Unit | None) -> PointCloud:
+        """Wrap an (N, 3) SI array, which becomes read-only."""
+        result = object.__new__(cls)
+        coords.flags.writeable = False
+        result._coords = coords
+        result._dim = dim
+        result._unit = unit
+        result._tree = None
+        return result
+
+    @classmethod
+    def from_points(cls, points: Sequence[_Point[D]]) -> PointCloud[D]:
+        """
+        Pack individual points into one cloud.
+
+        The display unit of the first point is used for the cloud.
+
+        Raises:
+            ValueError: If the list is empty or the points have different dimensions
+        """
+        if not points:
+            raise ValueError("Cannot create a PointCloud from an empty list")
+        dim = points[0]._dim
+        for point in points:
+            if point._dim != dim:
+                raise ValueError(f"Cannot pack points with different dimensions: {dim} vs {point._dim}")
+        coords = np.array([(point._x, point._y, point._z) for point in points], dtype=float)
+        return cls._from_si(coords, dim, points[0]._unit)
+
+    # ---- Attributes ----
+    @property
+    def dim(self) -> Dimension | None:
+        """Dimension shared by every point."""
+        return self._dim
+
+    @property
+    def unit(self) -> Unit[D] | None:
+        """Display unit shared by every point."""
+        return self._unit
+
+    @property
+    def si_coords(self) -> NDArray[np.float64]:
+        """The read-only (N, 3) buffer of SI coordinates."""
+        return self._coords
+
+    def to_array(self) -> NDArray[np.float64]:
+        """Coordinates in the display unit, shape (N, 3)."""
+        if self._unit is None:
+            return self._coords.copy()
+        return (self._coords - self._unit.si_offset) / self._unit.si_factor
+
+    def to_unit(self, unit: Unit[D] | str) -> PointCloud[D]:
+        """Same points with another display unit; the SI buffer and k-d tree are shared."""
+        result = PointCloud._from_si(self._coords, self._dim, resolve_unit(unit, self._dim))
+        result._tree = self._tree
+        return result
+
+    # ---- Element access ----
+    def __len__(self) -> int:
+        return len(self._coords)
+
+    def __getitem__(self, index):
+        """A row as a ``_Point`` copy, or a sub-cloud for slices, masks and index arrays."""
+        if isinstance(index, int | np.integer):
+            return self._row(self._coords[index])
+        return PointCloud._from_si(self._coords[index], self._dim, self._unit)
+
+    def __iter__(self) -> Iterator[_Point[D]]:
+        for row in self._coords:
+            yield self._row(row)
+
+    def _row(self, row: NDArray[np.float64]) -> _Point[D]:
+        point = object.__new__(_Point)
+        point._x, point._y, point._z = float(row[0]), float(row[1]), float(row[2])
+        point._dim = self._dim
+        point._unit = self._unit
+        point._is_unknown = False
+        point._distance = None
+        return point
+
+    # ---- Displacements ----
+    def __sub__(self, other: PointCloud[D] | _Point[D]) -> VectorArray[D]:
+        """Row-wise displacement vectors from other to self, as for ``_Point.__sub__``."""
+        if not isinstance(other, PointCloud | _Point):
+            return NotImplemented
+        if self._dim != other._dim:
+            raise ValueError(f"Cannot subtract points with different dimensions: {self._dim} vs {other._dim}")
+        other_coords = other._coords if isinstance(other, PointCloud) else np.array((other._x, other._y, other._z))
+        return VectorArray._from_si(self._coords - other_coords, self._dim, self._unit)
+
+    def displaced(self, vectors: VectorArray[D] | _Vector[D], times: float | ArrayLike = 1.0) -> PointCloud[D]:
+        """
+        New cloud with every point displaced by vector * times.
+
+        Args:
+            vectors: One displacement per point, or one ``_Vector`` for all
+            times: Scaling factor, for all points or one per point
+
+        Raises:
+            ValueError: If the vectors have a different dimension than the points
+        """
+        if not isinstance(vectors, VectorArray | _Vector):
+            raise TypeError(f"Expected VectorArray or _Vector, got {type(vectors)}")
+        if self._dim != vectors._dim:
+            raise ValueError(f"Cannot displace points with vectors of different dimension: {self._dim} vs {vectors._dim}")
+        return PointCloud._from_si(self._coords + _scale_column(times) * vectors._coords, self._dim, self._unit)
+
+    def position_vectors(self, start: ArrayLike, end: ArrayLike) -> VectorArray[D]:
+        """
+        Position vectors r = P[end] − P[start] for many index pairs at once.
+
+        Args:
+            start: Indices of the points the vectors start at
+            end: Indices of the points the vectors point to
+
+        Returns:
+            One vector per pair, with the dimension and unit of the cloud
+        """
+        start = np.asarray(start, dtype=np.intp)
+        end = np.asarray(end, dtype=np.intp)
+        return VectorArray._from_si(self._coords[end] - self._coords[start], self._dim, self._unit)
+
+    # ---- Distances ----
+    def distance_matrix(self, other: PointCloud[D] | None = None, unit: Unit[D] | str | None = None) -> NDArray[np.float64]:
+        """
+        Distances between every pair of points, shape (N, M).
+
+        Uses |a − b|² = |a|² + |b|² − 2 a·b about the common centroid, so the
+        (N, M, 3) differences are never formed.
+
+        Args:
+            other: Second cloud (default: this cloud, giving a symmetric matrix)
+            unit: Unit of the result (default: SI)
+
+        Raises:
+            ValueError: If the clouds have different dimensions
+        """
+        if other is not None and other._dim != self._dim:
+            raise ValueError(f"Cannot compute distance between points with different dimensions: {self._dim} vs {other._dim}")
+        first = self._coords
+        second = first if other is None else other._coords
+        center = np.concatenate((first, second)).mean(axis=0) if len(first) + len(second) else np.zeros(3)
+        a, b = first - center, second - center
+        squared = np.einsum("ij,ij->i", a, a)[:, None] + np.einsum("ij,ij->i", b, b)[None, :] - 2.0 * (a @ b.T)
+        if other is None:
+            # The product is not exactly symmetric in floating point
+            squared = 0.5 * (squared + squared.T)
+            np.fill_diagonal(squared, 0.0)
+        distances = np.sqrt(np.maximum(squared, 0.0, out=squared), out=squared)
+        if unit is not None:
+            distances /= resolve_unit(unit, self._dim).si_factor
+        return distances
+
+    def nearest(self, query: _Point[D] | PointCloud[D], k: int = 1) -> tuple:
+        """
+        The k nearest points of this cloud to each query point, via a k-d tree.
+
+        The tree is built on the first query and reused afterwards.
+
+        Args:
+            query: One point, or a cloud of query points
+            k: Number of neighbours
+
+        Returns:
+            SI distances and indices, nearest first. For a single point and
+            k = 1 these are a float and an int. Otherwise they are arrays of
+            shape (k,) for one point, (Q,) for a cloud with k = 1, and (Q, k)
+            for a cloud with k > 1.
+
+        Raises:
+            ValueError: If k is not between 1 and the number of points, or the dimensions differ
+        """
+        if not 1 <= k <= len(self._coords):
+            raise ValueError(f"k must be between 1 and {len(self._coords)}, got {k}")
+        if query._dim != self._dim:
+            raise ValueError(f"Cannot compare points with different dimensions: {self._dim} vs {query._dim}")
+        if self._tree is None:
+            self._tree = _KDTree(self._coords)
+
+        single = isinstance(query, _Point)
+        queries = np.array([(query._x, query._y, query._z)]) if single else query._coords
+        distances = np.empty((len(queries), k))
+        indices = np.empty((len(queries), k), dtype=np.intp)
+        for row, point in enumerate(queries):
+            distances[row], indices[row] = self._tree.query(point, k)
+
+        if single:
+            return (float(distances[0, 0]), int(indices[0, 0])) if k == 1 else (distances[0], indices[0])
+        return (distances[:, 0], indices[:, 0]) if k == 1 else (distances, indices)
+
+    def __repr__(self) -> str:
+        unit_str = f" {self._unit.symbol}" if self._unit else ""
+        return f"PointCloud({len(self)} points{unit_str})"
+
+
+class _KDTree:
+    """
+    Static k-d tree over an (N, 3) array for k-nearest-neighbour queries.
+
+    Nodes split at the median of their widest axis. The points are stored in
+    tree order, so every leaf is one contiguous slice.
+    """
+
+    __slots__ = ("_axis", "_split", "_children", "_bounds", "_points", "_order")
+
+    def __init__(self, points: NDArray[np.float64]):
+        order = np.arange(len(points))
+        self._axis: list[int] = []
+        self._split: list[float] = []
+        self._children: list[tuple[int, int]] = []
+        self._bounds: list[tuple[int, int]] = []
+
+        pending = [(self._add_node(), 0, len(points))]
+        while pending:
+            node, start, end = pending.pop()
+            self._bounds[node] = (start, end)
+            if end - start <= _LEAF_SIZE:
+                continue
+            block = order[start:end]
+            coords = points[block]
+            axis = int(np.argmax(coords.max(axis=0) - coords.min(axis=0)))
+            middle = (end - start) // 2
+            order[start:end] = block[np.argpartition(coords[:, axis], middle)]
+            left, right = self._add_node(), self._add_node()
+            self._axis[node] = axis
+            self._split[node] = float(points[order[start + middle], axis])
+            self._children[node] = (left, right)
+            pending.append((left, start, start + middle))
+            pending.append((right, start + middle, end))
+
+        self._points = points[order]
+        self._order = order
+
+    def _add_node(self) -> int:
+        self._axis.append(-1)
+        self._split.append(0.0)
+        self._children.append((-1, -1))
+        self._bounds.append((0, 0))
+        return len(self._axis) - 1
+
+    def query(self, point: NDArray[np.float64], k: int) -> tuple[list[float], list[int]]:
+        """Distances and indices of the k nearest points, nearest first."""
+        best: list[tuple[float, int]] = []  # max-heap of (−squared distance, position)
+        coordinates = point.tolist()
+
+        def visit(node: int) -> None:
+            axis = self._axis[node]
+            if axis < 0:
+                start, end = self._bounds[node]
+                delta = self._points[start:end] - point
+                squared = np.einsum("ij,ij->i", delta, delta)
+                limit = -best[0][0] if len(best) == k else math.inf
+                for offset in np.flatnonzero(squared < limit).tolist():
+                    entry = (-float(squared[offset]), start + offset)
+                    if len(best) < k:
+                        heapq.heappush(best, entry)
+                    elif entry[0] > best[0][0]:
+                        heapq.heapreplace(best, entry)
+                return
+            gap = coordinates[axis] - self._split[node]
+            near, far = self._children[node] if gap < 0 else self._children[node][::-1]
+            visit(near)
+            if len(best) < k or gap * gap < -best[0][0]:
+                visit(far)
+
+        visit(0)
+        ranked = sorted(best, reverse=True)
+        return [math.sqrt(-squared) for squared, _ in ranked], [int(self._order[position]) for _, position in ranked]
+
+
+__all__ = [
+    "PointCloud",
+]
@@ -74,9 +74,9 @@ class _PointWithUnknowns(_Point):
 
         # Convert value to SI
         if self._unit is not None:
-            self._coords[idx] = value * self._unit.si_factor
+            self._set_component(idx, value * self._unit.si_factor)
         else:
-            self._coords[idx] = value
+            self._set_component(idx, value)
 
     def unlock_coordinate(self, coord: str) -> None:
         """
@@ -93,7 +93,7 @@ class _PointWithUnknowns(_Point):
 
         # Set coordinate to 0 (placeholder)
         idx = {'x': 0, 'y': 1, 'z': 2}[coord]
-        self._coords[idx] = 0.0
+        self._set_component(idx, 0.0)
 
     def to_cartesian(self) -> _Point:
         """Convert to Cartesian _Point."""
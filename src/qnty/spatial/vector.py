@@ -11,7 +11,7 @@ Also serves as the unified class for ForceVector and PositionVector functionalit
 from __future__ import annotations
 
 import math
-from typing import TYPE_CHECKING, Generic, Protocol, TypeVar, runtime_checkable
+from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar, runtime_checkable
 
 import numpy as np
 from numpy.typing import NDArray
@@ -26,6 +26,18 @@ if TYPE_CHECKING:
 
 D = TypeVar("D")
 
+_COMPONENT_SLOTS = ("_x", "_y", "_z")
+
+
+def _cross(ax: float, ay: float, az: float, bx: float, by: float, bz: float) -> tuple[float, float, float]:
+    """Cross product of two float triples."""
+    return (float(ay * bz - az * by), float(az * bx - ax * bz), float(ax * by - ay * bx))
+
+
+def _is_close(a: float, b: float) -> bool:
+    """Component comparison with the tolerances of ``np.allclose(rtol=1e-10, atol=1e-10)``."""
+    return abs(a - b) <= 1e-10 + 1e-10 * abs(b)
+
 
 @runtime_checkable
 class PointLike(Protocol):
@@ -61,14 +73,16 @@ class _Vector(Generic[D]):
     """
 
     __slots__ = (
-        "_coords", "_dim", "_unit",
+        "_x", "_y", "_z", "_dim", "_unit",
         # ForceVector attributes
         "_magnitude", "_angle", "name", "is_known", "is_resultant", "_description",
         "coordinate_system", "angle_reference", "_relative_to_force", "_relative_angle",
         # PositionVector attributes
         "_from_point", "_to_point", "_constraint_magnitude",
         # Original polar coordinates for reporting
-        "_original_angle", "_original_wrt"
+        "_original_angle", "_original_wrt",
+        # Cached Quantity views of the current components
+        "_views",
     )
 
     def __init__(
@@ -144,6 +158,7 @@ class _Vector(Generic[D]):
         self._from_point = None
         self._to_point = None
         self._constraint_magnitude = None
+        self._views = None
 
         # Import coordinate system lazily
         if coordinate_system is None:
@@ -203,7 +218,7 @@ class _Vector(Generic[D]):
         # Determine construction mode
         # Mode 0: From existing vector
         if vector is not None:
-            self._coords = vector._coords.copy()
+            self._x, self._y, self._z = vector._x, vector._y, vector._z
             self._dim = vector._dim
             self._unit = vector._unit
             self._compute_magnitude_and_angle()
@@ -212,12 +227,12 @@ class _Vector(Generic[D]):
         # Mode 1: Basic u, v, w construction
         if u is not None and v is not None:
             if unit is None:
-                self._coords = np.array([u, v, w], dtype=float)
+                self._x, self._y, self._z = float(u), float(v), float(w)
                 self._dim = None
                 self._unit = None
             else:
-                si_values = unit.si_factor * np.array([u, v, w], dtype=float) + unit.si_offset
-                self._coords = si_values
+                factor, offset = unit.si_factor, unit.si_offset
+                self._x, self._y, self._z = factor * float(u) + offset, factor * float(v) + offset, factor * float(w) + offset
                 self._dim = unit.dim
                 self._unit = unit
             return
@@ -254,7 +269,7 @@ class _Vector(Generic[D]):
 
         # Mode 6: Unknown vector
         if not is_known:
-            self._coords = np.array([0.0, 0.0, 0.0], dtype=float)
+            self._x, self._y, self._z = 0.0, 0.0, 0.0
             self._dim = unit.dim if unit else None
             self._unit = unit
             self._magnitude = None
@@ -262,7 +277,7 @@ class _Vector(Generic[D]):
             return
 
         # Default: zero vector
-        self._coords = np.array([0.0, 0.0, 0.0], dtype=float)
+        self._x, self._y, self._z = 0.0, 0.0, 0.0
         self._dim = unit.dim if unit else None
         self._unit = unit
 
@@ -298,7 +313,7 @@ class _Vector(Generic[D]):
 
         # Create vector directly from SI values
         result = object.__new__(cls)
-        result._coords = np.array([u.value, v.value, w.value], dtype=float)
+        result._x, result._y, result._z = float(u.value), float(v.value), float(w.value)
         result._dim = u.dim
         result._unit = u.preferred or v.preferred or w.preferred
         # Initialize other slots
@@ -317,6 +332,26 @@ class _Vector(Generic[D]):
         result._constraint_magnitude = None
         return result
 
+    @property
+    def _coords(self) -> NDArray[np.float64]:
+        """
+        SI components as a new array.
+
+        Components are stored as three floats, so single-vector math avoids
+        creating tiny NumPy arrays. Writes to the returned array do not
+        change the vector; assign a whole array or use ``_set_component``.
+        """
+        return np.array((self._x, self._y, self._z))
+
+    @_coords.setter
+    def _coords(self, values) -> None:
+        x, y, z = values
+        self._x, self._y, self._z = float(x), float(y), float(z)
+
+    def _set_component(self, index: int, value_si: float) -> None:
+        """Set one SI component (0, 1 or 2)."""
+        setattr(self, _COMPONENT_SLOTS[index], float(value_si))
+
     # Helper methods for different construction modes
     def _parse_wrt(self, wrt: str) -> "AngleReference":
         """Parse wrt parameter into AngleReference."""
@@ -380,13 +415,13 @@ class _Vector(Generic[D]):
         if axis == coord_sys.axis1_label or axis_without_sign == coord_sys.axis1_label:
             if is_negative:
                 axis_angle_deg = math.degrees(coord_sys.axis1_angle) + 180.0
-                return AngleReference(axis_angle=axis_angle_deg, direction=direction, axis_label=axis, angle_unit="degree")
+                return AngleReference.interned(axis_angle=axis_angle_deg, direction=direction, axis_label=axis, angle_unit="degree")
             else:
                 return AngleReference.from_coordinate_system(coord_sys, axis_index=0, direction=direction)
         elif axis == coord_sys.axis2_label or axis_without_sign == coord_sys.axis2_label:
             if is_negative:
                 axis_angle_deg = math.degrees(coord_sys.axis2_angle) + 180.0
-                return AngleReference(axis_angle=axis_angle_deg, direction=direction, axis_label=axis, angle_unit="degree")
+                return AngleReference.interned(axis_angle=axis_angle_deg, direction=direction, axis_label=axis, angle_unit="degree")
             else:
                 return AngleReference.from_coordinate_system(coord_sys, axis_index=1, direction=direction)
         else:
@@ -449,7 +484,7 @@ class _Vector(Generic[D]):
         y_val = mag_val * math.cos(beta_rad)
         z_val = mag_val * math.cos(gamma_rad)
 
-        self._coords = np.array([x_val, y_val, z_val], dtype=float)
+        self._x, self._y, self._z = x_val, y_val, z_val
         self._dim = unit.dim if unit else None
         self._unit = unit
         self._magnitude = mag_qty
@@ -483,7 +518,7 @@ class _Vector(Generic[D]):
         y_val = mag_val * math.sin(phi_rad) * math.sin(theta_rad)
         z_val = mag_val * math.cos(phi_rad)
 
-        self._coords = np.array([x_val, y_val, z_val], dtype=float)
+        self._x, self._y, self._z = x_val, y_val, z_val
         self._dim = unit.dim if unit else None
         self._unit = unit
         self._magnitude = mag_qty
@@ -523,11 +558,11 @@ class _Vector(Generic[D]):
             angle_rad = angle_qty.value
             x_val = mag_qty.value * math.cos(angle_rad)
             y_val = mag_qty.value * math.sin(angle_rad)
-            self._coords = np.array([x_val, y_val, 0.0], dtype=float)
+            self._x, self._y, self._z = x_val, y_val, 0.0
             self._dim = unit.dim if unit else None
             self._unit = unit
         else:
-            self._coords = np.array([0.0, 0.0, 0.0], dtype=float)
+            self._x, self._y, self._z = 0.0, 0.0, 0.0
             self._dim = unit.dim if unit else None
             self._unit = unit
 
@@ -554,7 +589,7 @@ class _Vector(Generic[D]):
 
         self._angle = angle_qty
         self._magnitude = None
-        self._coords = np.array([0.0, 0.0, 0.0], dtype=float)
+        self._x, self._y, self._z = 0.0, 0.0, 0.0
         self._dim = unit.dim if unit else None
         self._unit = unit
 
@@ -570,7 +605,7 @@ class _Vector(Generic[D]):
 
         self._magnitude = mag_qty
         self._angle = None
-        self._coords = np.array([0.0, 0.0, 0.0], dtype=float)
+        self._x, self._y, self._z = 0.0, 0.0, 0.0
         self._dim = unit.dim if unit else None
         self._unit = unit
 
@@ -593,12 +628,12 @@ class _Vector(Generic[D]):
         z_qty = to_qty(z, "z")
 
         if x_qty.value is not None and y_qty.value is not None and z_qty.value is not None:
-            self._coords = np.array([x_qty.value, y_qty.value, z_qty.value], dtype=float)
+            self._x, self._y, self._z = float(x_qty.value), float(y_qty.value), float(z_qty.value)
             self._dim = unit.dim
             self._unit = unit
             self._compute_magnitude_and_angle()
         else:
-            self._coords = np.array([0.0, 0.0, 0.0], dtype=float)
+            self._x, self._y, self._z = 0.0, 0.0, 0.0
             self._dim = unit.dim
             self._unit = unit
 
@@ -607,7 +642,7 @@ class _Vector(Generic[D]):
         from ..core.dimension_catalog import dim
         from ..core.unit import ureg
 
-        mag_si = float(np.sqrt(np.sum(self._coords**2)))
+        mag_si = math.hypot(self._x, self._y, self._z)
 
         mag_qty = object.__new__(Quantity)
         mag_qty.name = f"{self.name}_magnitude"
@@ -618,7 +653,7 @@ class _Vector(Generic[D]):
         mag_qty._output_unit = None
         self._magnitude = mag_qty
 
-        angle_rad = math.atan2(self._coords[1], self._coords[0])
+        angle_rad = math.atan2(self._y, self._x)
         degree_unit = ureg.resolve("degree", dim=dim.D)
 
         angle_qty = object.__new__(Quantity)
@@ -646,26 +681,98 @@ class _Vector(Generic[D]):
         """Third component as Quantity."""
         return self._make_quantity(2, "w")
 
+    @property
+    def u_si(self) -> float:
+        """First component in SI units, as a plain float."""
+        return self._x
+
+    @property
+    def v_si(self) -> float:
+        """Second component in SI units, as a plain float."""
+        return self._y
+
+    @property
+    def w_si(self) -> float:
+        """Third component in SI units, as a plain float."""
+        return self._z
+
+    @property
+    def magnitude_si(self) -> float | None:
+        """
+        Magnitude in SI units, as a plain float.
+
+        The length of the vector without creating a Quantity, or None for
+        unknown vectors. A stored magnitude may be signed (a negative one
+        points the vector the other way); its size is returned here.
+        """
+        if getattr(self, "_magnitude", None) is not None:
+            return None if self._magnitude.value is None else abs(self._magnitude.value)
+        if not getattr(self, "is_known", True):
+            return None
+        return self._views_cache()["|v|"]
+
+    def _views_cache(self) -> dict[str, Any]:
+        """
+        Values derived from the components, computed once per coordinate change.
+
+        Components are assigned directly in many places, so the cache is keyed
+        on the current components, dimension and unit and starts over when any
+        of them differ. Properties return the same Quantity objects until then;
+        these are read-only views (see _cached_view).
+        """
+        key = (self._x, self._y, self._z, self._dim, self._unit)
+        try:
+            views = self._views
+        except AttributeError:
+            views = None
+        if views is None or views[0] != key:
+            views = (key, {"|v|": math.hypot(self._x, self._y, self._z)})
+            self._views = views
+        return views[1]
+
+    @staticmethod
+    def _cached_view(views: dict[str, Any], name: str) -> Quantity | None:
+        """
+        The cached Quantity view ``name``, or None if it must be (re)built.
+
+        Views are shared between callers and must be treated as read-only. A
+        view whose value or unit was changed anyway is not handed out again.
+        """
+        entry = views.get(name)
+        if entry is None:
+            return None
+        value, preferred, q = entry
+        return q if q.value == value and q.preferred is preferred else None
+
+    @staticmethod
+    def _store_view(views: dict[str, Any], name: str, dim: Any, value: float, preferred: Unit | None) -> Quantity:
+        """Build a view Quantity, bypassing dataclass overhead, and cache it."""
+        q = object.__new__(Quantity)
+        q.name = name
+        q.dim = dim
+        q.value = value
+        q.preferred = preferred
+        q._symbol = None
+        q._output_unit = None
+        views[name] = (value, preferred, q)
+        return q
+
     def _make_quantity(self, index: int, name: str) -> Quantity[D]:
         """Create Quantity from component index."""
         if self._dim is None:
             raise ValueError("Cannot create Quantity from dimensionless vector components")
 
+        views = self._views_cache()
+        q = self._cached_view(views, name)
+        if q is not None:
+            return q
+
         # Get component value and apply tolerance for near-zero values
         # This prevents floating-point precision errors like 3.06e-14 appearing as non-zero
-        value = self._coords[index]
+        value = (self._x, self._y, self._z)[index]
         if abs(value) < 1e-10:  # Tolerance: ~10 orders of magnitude below typical engineering values
             value = 0.0
-
-        # Optimized Quantity creation - bypass dataclass overhead
-        q = object.__new__(Quantity)
-        q.name = name
-        q.dim = self._dim
-        q.value = value
-        q.preferred = self._unit
-        q._symbol = None
-        q._output_unit = None
-        return q
+        return self._store_view(views, name, self._dim, value, self._unit)
 
     @property
     def magnitude(self) -> Quantity[D] | None:
@@ -686,16 +793,10 @@ class _Vector(Generic[D]):
         if self._dim is None:
             raise ValueError("Cannot compute magnitude of dimensionless vector")
 
-        mag_si = float(np.sqrt(np.sum(self._coords**2)))
-
-        # Return as Quantity
-        q = object.__new__(Quantity)
-        q.name = "magnitude"
-        q.dim = self._dim
-        q.value = mag_si
-        q.preferred = self._unit
-        q._symbol = None
-        q._output_unit = None
+        views = self._views_cache()
+        q = self._cached_view(views, "magnitude")
+        if q is None:
+            q = self._store_view(views, "magnitude", self._dim, views["|v|"], self._unit)
         return q
 
     @property
@@ -706,67 +807,30 @@ class _Vector(Generic[D]):
     @property
     def alpha(self) -> Quantity | None:
         """Coordinate direction angle from +x axis."""
-        import math
-        from ..core.dimension_catalog import dim
-        from ..core.unit import ureg
-
-        mag_si = float(np.sqrt(np.sum(self._coords**2)))
-        if mag_si == 0:
-            return None
-        cos_alpha = self._coords[0] / mag_si
-        alpha_rad = math.acos(max(-1.0, min(1.0, cos_alpha)))
-        degree_unit = ureg.resolve("degree", dim=dim.D)
-        q = object.__new__(Quantity)
-        q.name = "alpha"
-        q.dim = dim.D
-        q.value = alpha_rad
-        q.preferred = degree_unit
-        q._symbol = None
-        q._output_unit = None
-        return q
+        return self._direction_angle(0, "alpha")
 
     @property
     def beta(self) -> Quantity | None:
         """Coordinate direction angle from +y axis."""
-        import math
-        from ..core.dimension_catalog import dim
-        from ..core.unit import ureg
-
-        mag_si = float(np.sqrt(np.sum(self._coords**2)))
-        if mag_si == 0:
-            return None
-        cos_beta = self._coords[1] / mag_si
-        beta_rad = math.acos(max(-1.0, min(1.0, cos_beta)))
-        degree_unit = ureg.resolve("degree", dim=dim.D)
-        q = object.__new__(Quantity)
-        q.name = "beta"
-        q.dim = dim.D
-        q.value = beta_rad
-        q.preferred = degree_unit
-        q._symbol = None
-        q._output_unit = None
-        return q
+        return self._direction_angle(1, "beta")
 
     @property
     def gamma(self) -> Quantity | None:
         """Coordinate direction angle from +z axis."""
-        import math
-        from ..core.dimension_catalog import dim
-        from ..core.unit import ureg
+        return self._direction_angle(2, "gamma")
 
-        mag_si = float(np.sqrt(np.sum(self._coords**2)))
-        if mag_si == 0:
+    def _direction_angle(self, index: int, name: str) -> Quantity | None:
+        """Coordinate direction angle from the x, y or z axis, or None for a zero vector."""
+        views = self._views_cache()
+        if views["|v|"] == 0:
             return None
-        cos_gamma = self._coords[2] / mag_si
-        gamma_rad = math.acos(max(-1.0, min(1.0, cos_gamma)))
-        degree_unit = ureg.resolve("degree", dim=dim.D)
-        q = object.__new__(Quantity)
-        q.name = "gamma"
-        q.dim = dim.D
-        q.value = gamma_rad
-        q.preferred = degree_unit
-        q._symbol = None
-        q._output_unit = None
+        q = self._cached_view(views, name)
+        if q is None:
+            from ..core.dimension_catalog import dim
+            from ..core.unit import ureg
+
+            cosine = (self._x, self._y, self._z)[index] / views["|v|"]
+            q = self._store_view(views, name, dim.D, math.acos(max(-1.0, min(1.0, cosine))), ureg.resolve("degree", dim=dim.D))
         return q
 
     def magnitude_in(self, unit: Unit[D] | str) -> float:
@@ -819,13 +883,13 @@ class _Vector(Generic[D]):
         Raises:
             ValueError: If vector is zero (cannot normalize)
         """
-        mag = np.sqrt(np.sum(self._coords**2))
+        mag = math.hypot(self._x, self._y, self._z)
         if mag == 0:
             raise ValueError("Cannot normalize zero vector")
 
         # Create normalized vector
         result = object.__new__(_Vector)
-        result._coords = self._coords / mag
+        result._x, result._y, result._z = self._x / mag, self._y / mag, self._z / mag
         result._dim = self._dim
         result._unit = self._unit
         self._init_result_slots(result)
@@ -846,10 +910,10 @@ class _Vector(Generic[D]):
             >>> v = create_vector_cartesian(u=3, v=4, w=0, unit="m")
             >>> u = v.unit_vector()  # [0.6, 0.8, 0.0]
         """
-        mag = np.sqrt(np.sum(self._coords**2))
+        mag = math.hypot(self._x, self._y, self._z)
         if mag == 0:
             raise ValueError("Cannot compute unit vector for zero vector")
-        return self._coords / mag
+        return np.array((self._x / mag, self._y / mag, self._z / mag))
 
     def dot(self, other: "_Vector | NDArray[np.float64] | tuple[float, float, float]") -> "Quantity":
         """
@@ -877,8 +941,8 @@ class _Vector(Generic[D]):
 
         if isinstance(other, (np.ndarray, tuple)):
             # Dot with unit vector (dimensionless array or tuple)
-            other_arr = np.array(other) if isinstance(other, tuple) else other
-            dot_product = float(np.dot(self._coords, other_arr))
+            ox, oy, oz = other
+            dot_product = float(self._x * ox + self._y * oy + self._z * oz)
 
             # Return as Quantity with same dimension as self
             q = object.__new__(Quantity)
@@ -891,7 +955,7 @@ class _Vector(Generic[D]):
             return q
         elif isinstance(other, _Vector):
             # Dot with another vector
-            dot_product = float(np.dot(self._coords, other._coords))
+            dot_product = self._x * other._x + self._y * other._y + self._z * other._z
 
             # Result dimension is product of vector dimensions
             if self._dim is None or other._dim is None:
@@ -934,12 +998,11 @@ class _Vector(Generic[D]):
         """
         if isinstance(other, (np.ndarray, tuple)):
             # Cross with unit vector (dimensionless array or tuple)
-            other_arr = np.array(other) if isinstance(other, tuple) else other
-            result = np.cross(self._coords, other_arr)
+            result = _cross(self._x, self._y, self._z, *other)
             return _Vector(result[0], result[1], result[2], unit=self._unit)
         elif isinstance(other, _Vector):
             # Cross with another vector
-            result = np.cross(self._coords, other._coords)
+            result = _cross(self._x, self._y, self._z, other._x, other._y, other._z)
             # Note: resulting unit would be product of units, but for simplicity
             # we return with self's unit (caller should handle unit multiplication)
             return _Vector(result[0], result[1], result[2], unit=self._unit)
@@ -971,22 +1034,22 @@ class _Vector(Generic[D]):
             raise TypeError(f"Expected _Vector, got {type(other)}")
 
         # Get magnitudes
-        mag_self = np.sqrt(np.sum(self._coords**2))
-        mag_other = np.sqrt(np.sum(other._coords**2))
+        mag_self = math.hypot(self._x, self._y, self._z)
+        mag_other = math.hypot(other._x, other._y, other._z)
 
         if mag_self == 0 or mag_other == 0:
             raise ValueError("Cannot compute angle with zero-length vector")
 
         # Compute dot product and cos(theta)
-        dot_product = float(np.dot(self._coords, other._coords))
+        dot_product = self._x * other._x + self._y * other._y + self._z * other._z
         cos_theta = dot_product / (mag_self * mag_other)
 
         # Clamp to [-1, 1] to handle floating point errors
         cos_theta = max(-1.0, min(1.0, cos_theta))
 
         # Compute angle in degrees
-        angle_rad = np.arccos(cos_theta)
-        angle_deg = np.degrees(angle_rad)
+        angle_rad = math.acos(cos_theta)
+        angle_deg = math.degrees(angle_rad)
 
         # Return as Quantity with degree unit
         deg_unit = ureg.resolve("deg")
@@ -1047,12 +1110,7 @@ class _Vector(Generic[D]):
                 return False
 
             if compare_components:
-                if self._coords is None or other._coords is None:
-                    return False
-
-                for i in range(3):
-                    si_val1 = self._coords[i]
-                    si_val2 = other._coords[i]
+                for si_val1, si_val2 in ((self._x, other._x), (self._y, other._y), (self._z, other._z)):
                     max_val = max(abs(si_val1), abs(si_val2))
                     tolerance = magnitude_abs_tol + magnitude_rel_tol * max_val
                     if abs(si_val1 - si_val2) > tolerance:
@@ -1088,9 +1146,7 @@ class _Vector(Generic[D]):
             return angle_diff <= angle_tolerance_rad
 
         # Simple mode - compare components
-        for i in range(3):
-            a = self._coords[i]
-            b = other._coords[i]
+        for a, b in ((self._x, other._x), (self._y, other._y), (self._z, other._z)):
             if b == 0:
                 if abs(a) > rtol:
                     return False
@@ -1111,7 +1167,7 @@ class _Vector(Generic[D]):
         Raises:
             ValueError: If vector is zero (no direction to scale)
         """
-        current_mag = np.sqrt(np.sum(self._coords**2))
+        current_mag = math.hypot(self._x, self._y, self._z)
         if current_mag == 0:
             raise ValueError("Cannot scale zero vector")
 
@@ -1128,7 +1184,7 @@ class _Vector(Generic[D]):
 
         # Create scaled vector
         result = object.__new__(_Vector)
-        result._coords = self._coords * scale
+        result._x, result._y, result._z = self._x * scale, self._y * scale, self._z * scale
         result._dim = self._dim
         result._unit = self._unit
         self._init_result_slots(result)
@@ -1149,10 +1205,11 @@ class _Vector(Generic[D]):
         result._from_point = None
         result._to_point = None
         result._constraint_magnitude = None
+        result._views = None
 
     def copy_coords_from(self, other: "_Vector") -> None:
         """Copy coordinates, dimension, and unit from another vector."""
-        self._coords = other._coords.copy()
+        self._x, self._y, self._z = other._x, other._y, other._z
         self._dim = other._dim
         self._unit = other._unit
 
@@ -1167,18 +1224,15 @@ class _Vector(Generic[D]):
         from ..core.dimension_catalog import dim
         from ..core.unit import ureg
 
-        if self._coords is None:
-            return
-
         # Check if we had a negative magnitude before
         had_negative_magnitude = self._magnitude is not None and self._magnitude.value is not None and self._magnitude.value < 0
 
         # Compute magnitude from vector (always positive from sqrt)
-        mag_si = float(np.sqrt(np.sum(self._coords**2)))
+        mag_si = math.hypot(self._x, self._y, self._z)
         self._magnitude = Quantity(name=f"{self.name}_magnitude", dim=self._dim, value=mag_si, preferred=self._unit)
 
         # Compute angle
-        angle_rad = math.atan2(self._coords[1], self._coords[0])
+        angle_rad = math.atan2(self._y, self._x)
 
         # If we had a negative magnitude, flip it back and adjust angle
         if had_negative_magnitude and self._magnitude.value is not None:
@@ -1198,12 +1252,9 @@ class _Vector(Generic[D]):
         Returns:
             Tuple of (component1, component2) as Quantity objects
         """
-        if self._coords is None:
-            return (None, None)
-
         # Get cartesian components
-        x_val = self._coords[0]
-        y_val = self._coords[1]
+        x_val = self._x
+        y_val = self._y
 
         # Convert to coordinate system components
         comp1, comp2 = self.coordinate_system.from_cartesian(x_val, y_val)
@@ -1240,7 +1291,7 @@ class _Vector(Generic[D]):
 
         # Vectorized subtraction (SI values)
         result = object.__new__(_Vector)
-        result._coords = self._coords - other._coords
+        result._x, result._y, result._z = self._x - other._x, self._y - other._y, self._z - other._z
         result._dim = self._dim
         result._unit = self._unit
         self._init_result_slots(result)
@@ -1257,7 +1308,8 @@ class _Vector(Generic[D]):
             Scaled vector
         """
         result = object.__new__(_Vector)
-        result._coords = self._coords * float(scalar)
+        scalar = float(scalar)
+        result._x, result._y, result._z = self._x * scalar, self._y * scalar, self._z * scalar
         result._dim = self._dim
         result._unit = self._unit
         self._init_result_slots(result)
@@ -1282,7 +1334,8 @@ class _Vector(Generic[D]):
             raise ZeroDivisionError("Cannot divide vector by zero")
 
         result = object.__new__(_Vector)
-        result._coords = self._coords / float(scalar)
+        scalar = float(scalar)
+        result._x, result._y, result._z = self._x / scalar, self._y / scalar, self._z / scalar
         result._dim = self._dim
         result._unit = self._unit
         self._init_result_slots(result)
@@ -1296,7 +1349,7 @@ class _Vector(Generic[D]):
             Vector pointing in opposite direction
         """
         result = object.__new__(_Vector)
-        result._coords = -self._coords
+        result._x, result._y, result._z = -self._x, -self._y, -self._z
         result._dim = self._dim
         result._unit = self._unit
         self._init_result_slots(result)
@@ -1318,8 +1371,8 @@ class _Vector(Generic[D]):
         """
         # Handle numpy array or tuple (unit vector)
         if isinstance(other, (np.ndarray, tuple)):
-            other_arr = np.array(other) if isinstance(other, tuple) else other
-            dot_product = float(np.dot(self._coords, other_arr))
+            ox, oy, oz = other
+            dot_product = float(self._x * ox + self._y * oy + self._z * oz)
 
             # Return as Quantity with same dimension as self (unit vector is dimensionless)
             q = object.__new__(Quantity)
@@ -1335,7 +1388,7 @@ class _Vector(Generic[D]):
             raise TypeError(f"Expected _Vector, got {type(other)}")
 
         # Dot product of SI values
-        dot_product = float(np.sum(self._coords * other._coords))
+        dot_product = self._x * other._x + self._y * other._y + self._z * other._z
 
         # Result dimension is product of vector dimensions
         if self._dim is None or other._dim is None:
@@ -1370,11 +1423,9 @@ class _Vector(Generic[D]):
         """
         # Handle tuple/array (unit vector)
         if isinstance(other, (np.ndarray, tuple)):
-            other_arr = np.array(other) if isinstance(other, tuple) else other
-            cross_coords = np.cross(self._coords, other_arr)
             # Create result with same dimension as self (cross with dimensionless)
             result = object.__new__(_Vector)
-            result._coords = cross_coords
+            result._x, result._y, result._z = _cross(self._x, self._y, self._z, *other)
             result._dim = self._dim
             result._unit = self._unit
             self._init_result_slots(result)
@@ -1384,7 +1435,7 @@ class _Vector(Generic[D]):
             raise TypeError(f"Expected _Vector, got {type(other)}")
 
         # Cross product of SI values
-        cross_coords = np.cross(self._coords, other._coords)
+        cross_coords = _cross(self._x, self._y, self._z, other._x, other._y, other._z)
 
         # Result dimension is product of vector dimensions
         if self._dim is None or other._dim is None:
@@ -1394,7 +1445,7 @@ class _Vector(Generic[D]):
 
         # Create result vector
         result = object.__new__(_Vector)
-        result._coords = cross_coords
+        result._x, result._y, result._z = cross_coords
         result._dim = result_dim
         result._unit = None  # Cross product may have different units
         self._init_result_slots(result)
@@ -1414,8 +1465,7 @@ class _Vector(Generic[D]):
         if not isinstance(other, _Vector):
             raise TypeError(f"Expected _Vector, got {type(other)}")
 
-        cross_coords = np.cross(self._coords, other._coords)
-        cross_magnitude = np.sqrt(np.sum(cross_coords**2))
+        cross_magnitude = math.hypot(*_cross(self._x, self._y, self._z, other._x, other._y, other._z))
 
         return bool(cross_magnitude < tolerance)
 
@@ -1433,7 +1483,7 @@ class _Vector(Generic[D]):
         if not isinstance(other, _Vector):
             raise TypeError(f"Expected _Vector, got {type(other)}")
 
-        dot_product = np.sum(self._coords * other._coords)
+        dot_product = self._x * other._x + self._y * other._y + self._z * other._z
 
         return bool(abs(dot_product) < tolerance)
 
@@ -1453,19 +1503,19 @@ class _Vector(Generic[D]):
         if not isinstance(other, _Vector):
             raise TypeError(f"Expected _Vector, got {type(other)}")
 
-        mag_self = np.sqrt(np.sum(self._coords**2))
-        mag_other = np.sqrt(np.sum(other._coords**2))
+        mag_self = math.hypot(self._x, self._y, self._z)
+        mag_other = math.hypot(other._x, other._y, other._z)
 
         if mag_self == 0 or mag_other == 0:
             raise ValueError("Cannot compute angle with zero vector")
 
         # Compute angle using dot product
-        cos_angle = np.sum(self._coords * other._coords) / (mag_self * mag_other)
+        cos_angle = (self._x * other._x + self._y * other._y + self._z * other._z) / (mag_self * mag_other)
 
         # Clamp to [-1, 1] to handle numerical errors
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
+        cos_angle = max(-1.0, min(1.0, cos_angle))
 
-        angle_rad = float(np.arccos(cos_angle))
+        angle_rad = math.acos(cos_angle)
 
         # Return as dimensionless Quantity
         from ..core.dimension_catalog import dim
@@ -1495,16 +1545,16 @@ class _Vector(Generic[D]):
         if not isinstance(other, _Vector):
             raise TypeError(f"Expected _Vector, got {type(other)}")
 
-        mag_other_sq = np.sum(other._coords**2)
+        mag_other_sq = other._x * other._x + other._y * other._y + other._z * other._z
         if mag_other_sq == 0:
             raise ValueError("Cannot project onto zero vector")
 
         # Projection formula: proj = (v · u / |u|²) * u
-        dot_product = np.sum(self._coords * other._coords)
+        dot_product = self._x * other._x + self._y * other._y + self._z * other._z
         scale = dot_product / mag_other_sq
 
         result = object.__new__(_Vector)
-        result._coords = scale * other._coords
+        result._x, result._y, result._z = scale * other._x, scale * other._y, scale * other._z
         result._dim = self._dim
         result._unit = self._unit
         self._init_result_slots(result)
@@ -1530,7 +1580,7 @@ class _Vector(Generic[D]):
 
         # Create new _Vector with same SI values, different display unit
         result = object.__new__(_Vector)
-        result._coords = self._coords.copy()  # Copy to avoid aliasing
+        result._x, result._y, result._z = self._x, self._y, self._z
         result._dim = self._dim
         result._unit = unit
         self._init_result_slots(result)
@@ -1544,8 +1594,9 @@ class _Vector(Generic[D]):
             Array of [u, v, w] components in display units
         """
         if self._unit is None:
-            return self._coords.copy()
-        return (self._coords - self._unit.si_offset) / self._unit.si_factor
+            return np.array((self._x, self._y, self._z))
+        offset, factor = self._unit.si_offset, self._unit.si_factor
+        return np.array(((self._x - offset) / factor, (self._y - offset) / factor, (self._z - offset) / factor))
 
     def __eq__(self, other: object) -> bool:
         """
@@ -1564,7 +1615,7 @@ class _Vector(Generic[D]):
             return False
 
         # Use small tolerance for floating point comparison
-        return bool(np.allclose(self._coords, other._coords, rtol=1e-10, atol=1e-10))
+        return _is_close(self._x, other._x) and _is_close(self._y, other._y) and _is_close(self._z, other._z)
 
     def __str__(self) -> str:
         """String representation of the vector."""
@@ -1590,7 +1641,7 @@ class _Vector(Generic[D]):
             return False
 
         # Use small tolerance for floating point comparison
-        return bool(np.allclose(self._coords, other._coords, rtol=1e-10, atol=1e-10))
+        return _is_close(self._x, other._x) and _is_close(self._y, other._y) and _is_close(self._z, other._z)
 
     def __hash__(self) -> int:
         """Hash based on name for use in sets/dicts."""
@@ -1638,13 +1689,13 @@ class _Vector(Generic[D]):
                             unit: Unit | str | None = None, name: str | None = None, **kwargs) -> "_Vector":
         """Create vector directed along a position vector."""
         # Get unit vector (direction cosines)
-        mag = np.sqrt(np.sum(pos_vector._coords**2))
+        mag = math.hypot(pos_vector._x, pos_vector._y, pos_vector._z)
         if mag == 0:
             raise ValueError("Cannot create vector from zero position vector")
 
-        cos_alpha = pos_vector._coords[0] / mag
-        cos_beta = pos_vector._coords[1] / mag
-        cos_gamma = pos_vector._coords[2] / mag
+        cos_alpha = pos_vector._x / mag
+        cos_beta = pos_vector._y / mag
+        cos_gamma = pos_vector._z / mag
 
         # Convert magnitude to SI
         if isinstance(magnitude, int | float):
@@ -1690,10 +1741,8 @@ class _Vector(Generic[D]):
         if from_pt._dim != to_pt._dim:
             raise ValueError(f"Points must have same dimension: {from_pt._dim} vs {to_pt._dim}")
 
-        delta = to_pt._coords - from_pt._coords
-
         result = object.__new__(cls)
-        result._coords = delta
+        result._x, result._y, result._z = to_pt._x - from_pt._x, to_pt._y - from_pt._y, to_pt._z - from_pt._z
         result._dim = from_pt._dim
         result._unit = from_pt._unit or to_pt._unit
         result.name = name or "r"
@@ -1727,28 +1776,28 @@ class _Vector(Generic[D]):
     @property
     def x(self) -> Quantity | None:
         """X-component."""
-        if not hasattr(self, '_coords') or self._coords is None or self._dim is None:
+        if not hasattr(self, '_x') or self._dim is None:
             return None
         return self._make_quantity(0, "x")
 
     @property
     def y(self) -> Quantity | None:
         """Y-component."""
-        if not hasattr(self, '_coords') or self._coords is None or self._dim is None:
+        if not hasattr(self, '_x') or self._dim is None:
             return None
         return self._make_quantity(1, "y")
 
     @property
     def z(self) -> Quantity | None:
         """Z-component."""
-        if not hasattr(self, '_coords') or self._coords is None or self._dim is None:
+        if not hasattr(self, '_x') or self._dim is None:
             return None
         return self._make_quantity(2, "z")
 
     @property
     def vector(self) -> "_Vector | None":
         """Return self for compatibility with ForceVector API."""
-        return self if hasattr(self, '_coords') else None
+        return self if hasattr(self, '_x') else None
 
     @property
     def description(self) -> str:
@@ -1779,13 +1828,13 @@ class _Vector(Generic[D]):
     @property
     def direction_cosines(self) -> tuple[float, float, float] | None:
         """Direction cosines (cos α, cos β, cos γ)."""
-        mag = np.sqrt(np.sum(self._coords**2))
+        mag = self._views_cache()["|v|"]
         if mag == 0:
             return None
         return (
-            float(self._coords[0] / mag),
-            float(self._coords[1] / mag),
-            float(self._coords[2] / mag),
+            float(self._x / mag),
+            float(self._y / mag),
+            float(self._z / mag),
         )
 
     def unit_vector(self) -> tuple[float, float, float]:
@@ -1798,7 +1847,7 @@ class _Vector(Generic[D]):
     def to_cartesian(self) -> "_Vector":
         """Convert to Cartesian _Vector."""
         result = object.__new__(_Vector)
-        result._coords = self._coords.copy()
+        result._x, result._y, result._z = self._x, self._y, self._z
         result._dim = self._dim
         result._unit = self._unit
         result._magnitude = None
@@ -1901,7 +1950,7 @@ class _Vector(Generic[D]):
             mag_si = self._magnitude.value
             x_val = mag_si * math.cos(absolute_angle_rad)
             y_val = mag_si * math.sin(absolute_angle_rad)
-            self._coords = np.array([x_val, y_val, 0.0], dtype=float)
+            self._x, self._y, self._z = x_val, y_val, 0.0
             self.is_known = True
 
     def has_relative_angle(self) -> bool:
@@ -1921,7 +1970,7 @@ class _Vector(Generic[D]):
             unit = resolved
 
         result = object.__new__(_Vector)
-        result._coords = self._coords.copy()
+        result._x, result._y, result._z = self._x, self._y, self._z
         result._dim = self._dim
         result._unit = self._unit
         result._magnitude = self._magnitude.to_unit(unit) if self._magnitude else None
@@ -1953,7 +2002,7 @@ class _Vector(Generic[D]):
             unit = resolved
 
         result = object.__new__(_Vector)
-        result._coords = self._coords.copy()
+        result._x, result._y, result._z = self._x, self._y, self._z
         result._dim = self._dim
         result._unit = self._unit
         result._magnitude = self._magnitude
@@ -1979,7 +2028,7 @@ class _Vector(Generic[D]):
             new_angle_ref = wrt
 
         result = object.__new__(_Vector)
-        result._coords = self._coords.copy()
+        result._x, result._y, result._z = self._x, self._y, self._z
         result._dim = self._dim
         result._unit = self._unit
         result._magnitude = self._magnitude
@@ -2006,7 +2055,7 @@ class _Vector(Generic[D]):
             raise ValueError(f"Cannot add vectors with different dimensions: {self._dim} vs {other._dim}")
 
         result = object.__new__(_Vector)
-        result._coords = self._coords + other._coords
+        result._x, result._y, result._z = self._x + other._x, self._y + other._y, self._z + other._z
         result._dim = self._dim
         result._unit = self._unit
         # Initialize other slots
@@ -0,0 +1,318 @@
+"""
+Batch of 3D vectors stored as one array.
+
+A ``_Vector`` keeps its own small coordinate array plus force/position
+metadata, so operating on many vectors one at a time is dominated by
+per-object overhead. ``VectorArray`` holds N vectors as a single (N, 3)
+float64 buffer of SI values with one dimension and display unit shared by
+all rows, and performs every operation as one NumPy call over the batch.
+
+Individual rows are available as ``_Vector`` objects on demand. A
+``_Vector`` stores its components as three floats, so a row is a copy:
+writes to it do not reach the batch.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import Generic, TypeVar
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ..core.dimension import Dimension
+from ..core.unit import Unit, resolve_unit
+from .vector import _Vector
+
+D = TypeVar("D")
+
+
+class VectorArray(Generic[D]):
+    """
+    N vectors with uniform units, stored as an (N, 3) array of SI values.
+
+    Examples:
+        >>> loads = VectorArray(np.random.rand(10_000, 3), unit="lbf")
+        >>> R = loads.resultant()
+        >>> magnitudes = loads.magnitude_in("lbf")
+        >>> F0 = loads[0]  # _Vector copy of the first row
+    """
+
+    __slots__ = ("_coords", "_dim", "_unit")
+
+    def __init__(self, components: ArrayLike, unit: Unit[D] | str | None = None):
+        """
+        Create a batch of vectors from components in a display unit.
+
+        Args:
+            components: Array of shape (N, 3), or (N, 2) for planar vectors (w = 0)
+            unit: Unit of the components, shared by every vector
+
+        Raises:
+            ValueError: If the components do not have 2 or 3 columns or the unit is unknown
+        """
+        array = np.array(components, dtype=float, ndmin=2)
+        if array.ndim != 2 or array.shape[1] not in (2, 3):
+            raise ValueError(f"Expected components of shape (N, 3) or (N, 2), got {array.shape}")
+        if array.shape[1] == 2:
+            array = np.column_stack((array, np.zeros(len(array))))
+
+        unit = resolve_unit(unit)
+        if unit is not None:
+            array *= unit.si_factor
+            if unit.si_offset:
+                array += unit.si_offset
+        self._coords = array
+        self._dim = unit.dim if unit is not None else None
+        self._unit = unit
+
+    @classmethod
+    def _from_si(cls, coords: NDArray[np.float64], dim: Dimension | None, unit: Unit | None) -> VectorArray:
+        """Wrap an (N, 3) SI array without copying it."""
+        result = object.__new__(cls)
+        result._coords = coords
+        result._dim = dim
+        result._unit = unit
+        return result
+
+    @classmethod
+    def from_vectors(cls, vectors: Sequence[_Vector[D]]) -> VectorArray[D]:
+        """
+        Pack individual vectors into one batch.
+
+        The display unit of the first vector is used for the batch.
+
+        Raises:
+            ValueError: If the list is empty or the vectors have different dimensions
+        """
+        if not vectors:
+            raise ValueError("Cannot create a VectorArray from an empty list")
+        dim = vectors[0]._dim
+        for vector in vectors:
+            if vector._dim != dim:
+                raise ValueError(f"Cannot pack vectors with different dimensions: {dim} vs {vector._dim}")
+        coords = np.array([(vector._x, vector._y, vector._z) for vector in vectors], dtype=float)
+        return cls._from_si(coords, dim, vectors[0]._unit)
+
+    @classmethod
+    def zeros(cls, count: int, unit: Unit[D] | str | None = None) -> VectorArray[D]:
+        """Batch of zero vectors."""
+        unit = resolve_unit(unit)
+        return cls._from_si(np.zeros((count, 3)), unit.dim if unit is not None else None, unit)
+
+    # ---- Attributes ----
+    @property
+    def dim(self) -> Dimension | None:
+        """Dimension shared by every vector."""
+        return self._dim
+
+    @property
+    def unit(self) -> Unit[D] | None:
+        """Display unit shared by every vector."""
+        return self._unit
+
+    @property
+    def si_coords(self) -> NDArray[np.float64]:
+        """The (N, 3) buffer of SI components (not a copy)."""
+        return self._coords
+
+    def to_array(self) -> NDArray[np.float64]:
+        """Components in the display unit, shape (N, 3)."""
+        if self._unit is None:
+            return self._coords.copy()
+        return (self._coords - self._unit.si_offset) / self._unit.si_factor
+
+    def to_unit(self, unit: Unit[D] | str) -> VectorArray[D]:
+        """Same vectors with another display unit; the SI buffer is shared."""
+        resolved = resolve_unit(unit, self._dim)
+        return VectorArray._from_si(self._coords, self._dim, resolved)
+
+    # ---- Element access ----
+    def __len__(self) -> int:
+        return len(self._coords)
+
+    def __getitem__(self, index):
+        """
+        A row as a ``_Vector``, or a sub-batch for slices, masks and index arrays.
+
+        Writes through a basic slice change this batch; a row is a copy.
+        """
+        if isinstance(index, int | np.integer):
+            return self._row(self._coords[index])
+        return VectorArray._from_si(self._coords[index], self._dim, self._unit)
+
+    def __iter__(self) -> Iterator[_Vector[D]]:
+        for row in self._coords:
+            yield self._row(row)
+
+    def _row(self, row: NDArray[np.float64]) -> _Vector[D]:
+        vector = object.__new__(_Vector)
+        vector._x, vector._y, vector._z = float(row[0]), float(row[1]), float(row[2])
+        vector._dim = self._dim
+        vector._unit = self._unit
+        vector._init_result_slots(vector)
+        return vector
+
+    # ---- Arithmetic ----
+    def _other_coords(self, other: VectorArray | _Vector, operation: str) -> NDArray[np.float64]:
+        """SI components of the other operand, broadcastable against this batch."""
+        if isinstance(other, VectorArray | _Vector):
+            if self._dim != other._dim:
+                raise ValueError(f"Cannot {operation} vectors with different dimensions: {self._dim} vs {other._dim}")
+            return other._coords
+        raise TypeError(f"Cannot {operation} VectorArray and {type(other).__name__}")
+
+    def __add__(self, other: VectorArray[D] | _Vector[D]) -> VectorArray[D]:
+        if not isinstance(other, VectorArray | _Vector):
+            return NotImplemented
+        return VectorArray._from_si(self._coords + self._other_coords(other, "add"), self._dim, self._unit)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: VectorArray[D] | _Vector[D]) -> VectorArray[D]:
+        if not isinstance(other, VectorArray | _Vector):
+            return NotImplemented
+        return VectorArray._from_si(self._coords - self._other_coords(other, "subtract"), self._dim, self._unit)
+
+    def __rsub__(self, other: _Vector[D]) -> VectorArray[D]:
+        if not isinstance(other, _Vector):
+            return NotImplemented
+        return VectorArray._from_si(self._other_coords(other, "subtract") - self._coords, self._dim, self._unit)
+
+    def __neg__(self) -> VectorArray[D]:
+        return VectorArray._from_si(-self._coords, self._dim, self._unit)
+
+    def __mul__(self, scalar: float | ArrayLike) -> VectorArray[D]:
+        """Scale every vector by a scalar, or each vector by its own factor (array of length N)."""
+        return VectorArray._from_si(self._coords * _scale_column(scalar), self._dim, self._unit)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar: float | ArrayLike) -> VectorArray[D]:
+        factor = _scale_column(scalar)
+        if np.any(factor == 0):
+            raise ZeroDivisionError("Cannot divide vector by zero")
+        return VectorArray._from_si(self._coords / factor, self._dim, self._unit)
+
+    # ---- Geometry ----
+    @property
+    def magnitude(self) -> NDArray[np.float64]:
+        """Length of every vector, in SI units."""
+        return np.sqrt(np.einsum("ij,ij->i", self._coords, self._coords))
+
+    def magnitude_in(self, unit: Unit[D] | str) -> NDArray[np.float64]:
+        """Length of every vector in the given unit."""
+        resolved = resolve_unit(unit, self._dim)
+        return self.magnitude / resolved.si_factor
+
+    def normalized(self) -> VectorArray[D]:
+        """
+        Unit vectors in the same directions.
+
+        Raises:
+            ValueError: If any vector is zero
+        """
+        magnitude = self.magnitude
+        if np.any(magnitude == 0):
+            raise ValueError("Cannot normalize zero vector")
+        return VectorArray._from_si(self._coords / magnitude[:, None], self._dim, self._unit)
+
+    def dot(self, other: VectorArray | _Vector | ArrayLike) -> NDArray[np.float64]:
+        """
+        Row-wise dot products.
+
+        Args:
+            other: Vectors of the same length, one vector for every row, or a
+                dimensionless direction (array or tuple of 3)
+
+        Returns:
+            SI values, of dimension ``self.dim * other.dim`` for vectors and
+            ``self.dim`` for a direction
+        """
+        other_coords = self._operand_coords(other)
+        return np.einsum("ij,ij->i", self._coords, np.broadcast_to(other_coords, self._coords.shape))
+
+    def cross(self, other: VectorArray | _Vector | ArrayLike) -> VectorArray:
+        """
+        Row-wise cross products.
+
+        With vectors the result has dimension ``self.dim * other.dim`` and no
+        display unit; with a dimensionless direction it keeps this batch's
+        dimension and unit, as for ``_Vector.cross``.
+        """
+        other_coords = self._operand_coords(other)
+        coords = np.cross(self._coords, other_coords)
+        if isinstance(other, VectorArray | _Vector):
+            dim = self._dim * other._dim if self._dim is not None and other._dim is not None else None
+            return VectorArray._from_si(coords, dim, None)
+        return VectorArray._from_si(coords, self._dim, self._unit)
+
+    def angle_between(self, other: VectorArray | _Vector) -> NDArray[np.float64]:
+        """
+        Row-wise angle to other vectors, in radians.
+
+        Raises:
+            ValueError: If any vector is zero
+        """
+        other_coords = np.broadcast_to(self._operand_coords(other), self._coords.shape)
+        magnitudes = self.magnitude * np.sqrt(np.einsum("ij,ij->i", other_coords, other_coords))
+        if np.any(magnitudes == 0):
+            raise ValueError("Cannot compute angle with zero-length vector")
+        cosine = np.einsum("ij,ij->i", self._coords, other_coords) / magnitudes
+        return np.arccos(np.clip(cosine, -1.0, 1.0))
+
+    def projection_onto(self, other: VectorArray | _Vector) -> VectorArray[D]:
+        """
+        Row-wise projection onto other vectors (or onto one vector for every row).
+
+        Raises:
+            ValueError: If any vector projected onto is zero
+        """
+        other_coords = np.broadcast_to(self._operand_coords(other), self._coords.shape)
+        squared = np.einsum("ij,ij->i", other_coords, other_coords)
+        if np.any(squared == 0):
+            raise ValueError("Cannot project onto zero vector")
+        scale = np.einsum("ij,ij->i", self._coords, other_coords) / squared
+        return VectorArray._from_si(scale[:, None] * other_coords, self._dim, self._unit)
+
+    def _operand_coords(self, other: VectorArray | _Vector | ArrayLike) -> NDArray[np.float64]:
+        if isinstance(other, VectorArray | _Vector):
+            return other._coords
+        coords = np.asarray(other, dtype=float)
+        if coords.shape[-1:] != (3,):
+            raise TypeError(f"Cannot combine VectorArray with {type(other).__name__} of shape {coords.shape}")
+        return coords
+
+    # ---- Reductions ----
+    def resultant(self, name: str | None = None) -> _Vector[D]:
+        """
+        Sum of all vectors as a single resultant ``_Vector``.
+
+        Raises:
+            ValueError: If the batch is empty
+        """
+        if not len(self._coords):
+            raise ValueError("Cannot compute resultant of empty list")
+        result = self._row(self._coords.sum(axis=0))
+        result.name = name or "R"
+        result.is_resultant = True
+        return result
+
+    def __repr__(self) -> str:
+        unit_str = f" {self._unit.symbol}" if self._unit else ""
+        return f"VectorArray({len(self)} vectors{unit_str})"
+
+
+def _scale_column(scalar: float | ArrayLike) -> float | NDArray[np.float64]:
+    """A scalar as a float, or per-vector factors as a column for broadcasting."""
+    factor = np.asarray(scalar, dtype=float)
+    if factor.ndim == 0:
+        return float(factor)
+    if factor.ndim != 1:
+        raise ValueError(f"Expected a scalar or one factor per vector, got shape {factor.shape}")
+    return factor[:, None]
+
+
+__all__ = [
+    "VectorArray",
+]
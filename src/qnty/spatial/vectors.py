@@ -11,9 +11,11 @@ from types import EllipsisType
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
+from numpy.typing import ArrayLike
 
 from ..core.unit import Unit
 from .vector import _Vector
+from .vector_array import VectorArray
 
 if TYPE_CHECKING:
     from .point import _Point
@@ -99,9 +101,9 @@ class _VectorWithUnknowns(_Vector):
 
         # Convert value to SI
         if self._unit is not None:
-            self._coords[idx] = value * self._unit.si_factor
+            self._set_component(idx, value * self._unit.si_factor)
         else:
-            self._coords[idx] = value
+            self._set_component(idx, value)
 
         # Check if all unknowns are resolved
         if not self._unknowns:
@@ -122,7 +124,7 @@ class _VectorWithUnknowns(_Vector):
 
         # Set component to 0 (placeholder)
         idx = {'u': 0, 'v': 1, 'w': 2}[comp]
-        self._coords[idx] = 0.0
+        self._set_component(idx, 0.0)
         self.is_known = False
 
     def __str__(self) -> str:
@@ -994,7 +996,7 @@ def create_vector_resultant_cartesian(
 
 
 def create_vector_in_plane(
-    plane: "Any",
+    plane: Any,
     magnitude: float,
     angle: float,
     from_axis: str = "+y",
@@ -1043,21 +1045,98 @@ def create_vector_in_plane(
     else:
         raise ValueError(f"Invalid angle_unit '{angle_unit}'. Use 'degree' or 'radian'")
 
-    # Get axis vectors
-    axis_vectors = {
-        "+x": np.array([1.0, 0.0, 0.0]),
-        "-x": np.array([-1.0, 0.0, 0.0]),
-        "+y": np.array([0.0, 1.0, 0.0]),
-        "-y": np.array([0.0, -1.0, 0.0]),
-        "+z": np.array([0.0, 0.0, 1.0]),
-        "-z": np.array([0.0, 0.0, -1.0]),
-    }
+    u1, u2 = _in_plane_axes(plane, from_axis, toward_axis)
+
+    # Create vector: magnitude * (cos(angle) * u1 + sin(angle) * u2)
+    direction = math.cos(angle_rad) * u1 + math.sin(angle_rad) * u2
+    components = magnitude * direction
+
+    # Resolve unit
+    resolved_unit = None
+    if isinstance(unit, str):
+        from ..core.unit import ureg
+        resolved = ureg.resolve(unit)
+        if resolved is None:
+            raise ValueError(f"Unknown unit '{unit}'")
+        resolved_unit = resolved
+    elif unit is not None:
+        resolved_unit = unit
+
+    return _Vector(
+        float(components[0]),
+        float(components[1]),
+        float(components[2]),
+        unit=resolved_unit,
+        name=name,
+    )
+
+
+def create_vectors_in_plane(
+    plane: Any,
+    magnitudes: ArrayLike,
+    angles: ArrayLike,
+    from_axis: str = "+y",
+    toward_axis: str | None = None,
+    unit: Unit | str | None = None,
+    angle_unit: str = "degree",
+) -> VectorArray:
+    """
+    Create many vectors lying in one plane, as a VectorArray.
+
+    Batch form of ``create_vector_in_plane``: the in-plane axes are found
+    once and every vector is built in the same NumPy operation.
+
+    Args:
+        plane: Plane object the vectors lie in
+        magnitudes: Vector magnitudes, shape (N,) or one for all
+        angles: Angles from reference axis, shape (N,) or one for all
+        from_axis: Reference axis to measure angles from ("+x", "+y", "+z", etc.)
+        toward_axis: Axis to rotate toward (auto-determined if None)
+        unit: Unit for magnitudes
+        angle_unit: Angle unit ("degree" or "radian")
+
+    Returns:
+        VectorArray with one row per magnitude/angle pair
 
+    Examples:
+        >>> plane = create_plane_rotated_y(angle=-30)
+        >>> F = create_vectors_in_plane(plane, magnitudes=450, angles=np.linspace(0, 90, 1000), unit="N")
+    """
+    if angle_unit.lower() in ("degree", "degrees", "deg"):
+        angles_rad = np.radians(np.asarray(angles, dtype=float))
+    elif angle_unit.lower() in ("radian", "radians", "rad"):
+        angles_rad = np.asarray(angles, dtype=float)
+    else:
+        raise ValueError(f"Invalid angle_unit '{angle_unit}'. Use 'degree' or 'radian'")
+
+    u1, u2 = _in_plane_axes(plane, from_axis, toward_axis)
+    magnitudes, angles_rad = np.broadcast_arrays(np.asarray(magnitudes, dtype=float), angles_rad)
+    directions = np.cos(angles_rad.ravel())[:, None] * u1 + np.sin(angles_rad.ravel())[:, None] * u2
+    return VectorArray(magnitudes.ravel()[:, None] * directions, unit=unit)
+
+
+_AXIS_VECTORS = {
+    "+x": np.array([1.0, 0.0, 0.0]),
+    "-x": np.array([-1.0, 0.0, 0.0]),
+    "+y": np.array([0.0, 1.0, 0.0]),
+    "-y": np.array([0.0, -1.0, 0.0]),
+    "+z": np.array([0.0, 0.0, 1.0]),
+    "-z": np.array([0.0, 0.0, -1.0]),
+}
+
+
+def _in_plane_axes(plane: Any, from_axis: str, toward_axis: str | None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Orthonormal in-plane directions for angles measured from ``from_axis``.
+
+    Returns the reference axis projected onto the plane and the direction
+    90° from it, toward ``toward_axis`` when given.
+    """
     from_lower = from_axis.lower()
-    if from_lower not in axis_vectors:
-        raise ValueError(f"Invalid from_axis '{from_axis}'. Must be one of: {set(axis_vectors.keys())}")
+    if from_lower not in _AXIS_VECTORS:
+        raise ValueError(f"Invalid from_axis '{from_axis}'. Must be one of: {set(_AXIS_VECTORS.keys())}")
 
-    from_vec = axis_vectors[from_lower]
+    from_vec = _AXIS_VECTORS[from_lower]
     normal = plane.normal
 
     # Project the reference axis onto the plane
@@ -1079,35 +1158,14 @@ def create_vector_in_plane(
     # If toward_axis is specified, check if u2 points toward it
     if toward_axis is not None:
         toward_lower = toward_axis.lower()
-        if toward_lower not in axis_vectors:
-            raise ValueError(f"Invalid toward_axis '{toward_axis}'. Must be one of: {set(axis_vectors.keys())}")
-        toward_vec = axis_vectors[toward_lower]
+        if toward_lower not in _AXIS_VECTORS:
+            raise ValueError(f"Invalid toward_axis '{toward_axis}'. Must be one of: {set(_AXIS_VECTORS.keys())}")
+        toward_vec = _AXIS_VECTORS[toward_lower]
         # If u2 points away from toward_axis, flip it
         if np.dot(u2, toward_vec) < 0:
             u2 = -u2
 
-    # Create vector: magnitude * (cos(angle) * u1 + sin(angle) * u2)
-    direction = math.cos(angle_rad) * u1 + math.sin(angle_rad) * u2
-    components = magnitude * direction
-
-    # Resolve unit
-    resolved_unit = None
-    if isinstance(unit, str):
-        from ..core.unit import ureg
-        resolved = ureg.resolve(unit)
-        if resolved is None:
-            raise ValueError(f"Unknown unit '{unit}'")
-        resolved_unit = resolved
-    elif unit is not None:
-        resolved_unit = unit
-
-    return _Vector(
-        float(components[0]),
-        float(components[1]),
-        float(components[2]),
-        unit=resolved_unit,
-        name=name,
-    )
+    return u1, u2
 
 
 def create_vector_direction_angles(
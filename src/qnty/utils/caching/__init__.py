@@ -12,10 +12,12 @@ from .manager import (
     get_cache_statistics,
     get_memory_usage,
 )
+from .solution_cache import SolutionCache
 
 __all__ = [
     "UnifiedCacheManager",
     "CacheStats",
+    "SolutionCache",
     "get_cache_manager",
     "clear_all_caches",
     "get_cache_statistics",
@@ -59,7 +59,6 @@ class UnifiedCacheManager:
     # Cache size limits (tuned based on typical usage patterns)
     UNIT_PROPERTY_CACHE_SIZE = 200
     AVAILABLE_UNITS_CACHE_SIZE = 50
-    EXPRESSION_CACHE_SIZE = 300
     TYPE_CHECK_CACHE_SIZE = 100
     DIMENSIONLESS_CACHE_SIZE = 50
     DIMENSION_SIGNATURE_CACHE_SIZE = 500
@@ -72,7 +71,6 @@ class UnifiedCacheManager:
         # Core caches with different policies
         self._unit_property_cache: dict[tuple[type, str], str | None] = {}
         self._available_units_cache: dict[type, list[str]] = {}
-        self._expression_result_cache: dict[str, Any] = {}
         self._type_check_cache: dict[type, bool] = {}
         self._dimensionless_cache: dict[float, Any] = {}
         self._validation_cache: dict[tuple[type, str], bool] = {}
@@ -93,7 +91,6 @@ class UnifiedCacheManager:
         self._stats = {
             "unit_property": CacheStats("Unit Property"),
             "available_units": CacheStats("Available Units"),
-            "expression_result": CacheStats("Expression Result"),
             "type_check": CacheStats("Type Check"),
             "dimensionless": CacheStats("Dimensionless"),
             "validation": CacheStats("Validation"),
@@ -195,23 +192,6 @@ class UnifiedCacheManager:
         if len(self._validation_cache) > self.VALIDATION_CACHE_SIZE:
             self._evict_oldest("validation", self._validation_cache, self.VALIDATION_CACHE_SIZE // 4)
 
-    # Expression Result Cache Operations (for future use)
-    def get_expression_result(self, expression_key: str) -> Any | None:
-        """Get cached expression evaluation result."""
-        if expression_key in self._expression_result_cache:
-            self._stats["expression_result"].hit()
-            return self._expression_result_cache[expression_key]
-
-        self._stats["expression_result"].miss()
-        return None
-
-    def cache_expression_result(self, expression_key: str, result: Any) -> None:
-        """Cache expression evaluation result."""
-        self._expression_result_cache[expression_key] = result
-
-        if len(self._expression_result_cache) > self.EXPRESSION_CACHE_SIZE:
-            self._evict_oldest("expression_result", self._expression_result_cache, self.EXPRESSION_CACHE_SIZE // 4)
-
     # Quantity-specific Cache Operations
     def get_cached_quantity(self, value: int | float, unit_name: str) -> Any | None:
         """Get cached quantity for small integers."""
@@ -310,7 +290,6 @@ class UnifiedCacheManager:
             # Clear all internal caches
             self._unit_property_cache.clear()
             self._available_units_cache.clear()
-            self._expression_result_cache.clear()
             self._type_check_cache.clear()
             self._dimensionless_cache.clear()
             self._validation_cache.clear()
@@ -332,7 +311,6 @@ class UnifiedCacheManager:
             cache_map = {
                 "unit_property": self._unit_property_cache,
                 "available_units": self._available_units_cache,
-                "expression_result": self._expression_result_cache,
                 "type_check": self._type_check_cache,
                 "dimensionless": self._dimensionless_cache,
                 "validation": self._validation_cache,
@@ -358,7 +336,6 @@ class UnifiedCacheManager:
         return {
             "unit_property": len(self._unit_property_cache),
             "available_units": len(self._available_units_cache),
-            "expression_result": len(self._expression_result_cache),
             "type_check": len(self._type_check_cache),
             "dimensionless": len(self._dimensionless_cache),
             "validation": len(self._validation_cache),
@@ -375,7 +352,6 @@ class UnifiedCacheManager:
         estimates = {
             "unit_property": len(self._unit_property_cache) * 200,  # tuple keys + string values
             "available_units": len(self._available_units_cache) * 500,  # type keys + list values
-            "expression_result": len(self._expression_result_cache) * 300,  # string keys + object values
             "type_check": len(self._type_check_cache) * 100,  # type keys + bool values
             "dimensionless": len(self._dimensionless_cache) * 150,  # float keys + quantity values
             "validation": len(self._validation_cache) * 150,  # tuple keys + bool values
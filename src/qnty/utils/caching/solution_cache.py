@@ -0,0 +1,183 @@
+"""
+Solution Cache
+==============
+
+Content-addressed memoization of Problem solves.
+
+Entries are keyed by an opaque string (a stable hash of a problem's structure
+and inputs, see ``Problem._solution_cache_key``) and hold JSON-compatible
+payloads; anything else is rejected on ``put``, so memory and disk hits
+return the same plain JSON values. Lookups go through an in-memory LRU tier first and then an optional
+SQLite file that several worker processes can share.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from .manager import CacheStats
+
+# Bump when the payload layout changes; entries written by other versions are ignored
+SOLUTION_CACHE_FORMAT_VERSION = 2
+
+DEFAULT_MAX_ENTRIES = 256
+SQLITE_TIMEOUT_SECONDS = 30.0
+
+_CREATE_TABLE = "CREATE TABLE IF NOT EXISTS solutions (key TEXT PRIMARY KEY, version INTEGER NOT NULL, payload TEXT NOT NULL)"
+_SELECT = "SELECT payload FROM solutions WHERE key = ? AND version = ?"
+_UPSERT = "INSERT OR REPLACE INTO solutions (key, version, payload) VALUES (?, ?, ?)"
+
+
+class SolutionCache:
+    """
+    Two-tier cache for solved problem states.
+
+    Args:
+        max_entries: Capacity of the in-memory LRU tier
+        path: Optional SQLite database file for the persistent tier. The file can
+            be shared between processes; each process opens its own connection.
+
+    Examples:
+        >>> cache = SolutionCache(max_entries=1024, path="solutions.db")
+        >>> MyProblem.solution_cache = cache  # every instance shares it
+        >>> problem = MyProblem()
+        >>> problem.solve()  # miss: solved and stored
+        >>> MyProblem().solve()  # hit: restored without running the solver
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, path: str | Path | None = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.path = Path(path) if path is not None else None
+        self.stats = CacheStats("Solution")
+        self.disk_hits = 0
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._connection_pid: int | None = None
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Look up a payload, promoting disk hits into the memory tier.
+
+        Returns:
+            The stored payload, or None on a miss
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.stats.hit()
+                return payload
+
+        payload = self._read_disk(key)
+        if payload is None:
+            self.stats.miss()
+            return None
+
+        self.stats.hit()
+        self.disk_hits += 1
+        self._remember(key, payload)
+        return payload
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        """
+        Store a JSON-compatible payload in both tiers.
+
+        Raises:
+            ValueError: If the payload cannot be encoded as JSON
+        """
+        try:
+            text = json.dumps(payload)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Solution cache payload is not JSON-compatible: {e}") from e
+        # Keep the decoded form in memory too, so both tiers return the same values
+        self._remember(key, json.loads(text))
+        self._write_disk(key, text)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._entries.clear()
+        connection = self._get_connection()
+        if connection is not None:
+            with connection:
+                connection.execute("DELETE FROM solutions")
+
+    def close(self) -> None:
+        """Close the SQLite connection held by this process."""
+        if self._connection is not None:
+            self._connection.close()
+        self._connection = None
+        self._connection_pid = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries or self._read_disk(key) is not None
+
+    def __deepcopy__(self, memo: dict) -> SolutionCache:
+        # A cache is a shared resource: copies of a problem keep using the same one
+        return self
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        state["_connection"] = None
+        state["_connection_pid"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"SolutionCache(entries={len(self)}, max_entries={self.max_entries}, path={str(self.path) if self.path else None!r})"
+
+    def _remember(self, key: str, payload: dict[str, Any]) -> None:
+        """Insert into the LRU tier, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evict()
+
+    def _get_connection(self) -> sqlite3.Connection | None:
+        """Open (or reopen after a fork) the SQLite connection for this process."""
+        if self.path is None:
+            return None
+        pid = os.getpid()
+        if self._connection is None or self._connection_pid != pid:
+            connection = sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT_SECONDS, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            with connection:
+                connection.execute(_CREATE_TABLE)
+            self._connection = connection
+            self._connection_pid = pid
+        return self._connection
+
+    def _read_disk(self, key: str) -> dict[str, Any] | None:
+        connection = self._get_connection()
+        if connection is None:
+            return None
+        row = connection.execute(_SELECT, (key, SOLUTION_CACHE_FORMAT_VERSION)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def _write_disk(self, key: str, text: str) -> None:
+        connection = self._get_connection()
+        if connection is None:
+            return
+        with connection:
+            connection.execute(_UPSERT, (key, SOLUTION_CACHE_FORMAT_VERSION, text))
+
+
+__all__ = ["SOLUTION_CACHE_FORMAT_VERSION", "SolutionCache"]
@@ -0,0 +1,103 @@
+"""
+Tests for select-variable branch specialization.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from qnty import Length, Problem
+from qnty.algebra import MatchExpression, SelectOption, SelectVariable, Summation, cond_expr, equation, match_expr, summation
+from qnty.algebra.branches import BranchSpecializer, collect_select_variables, specialize_expression
+
+
+@dataclass(frozen=True)
+class Facing(SelectOption):
+    raised: str = "raised"
+    flat: str = "flat"
+
+
+@dataclass(frozen=True)
+class Bolting(SelectOption):
+    light: str = "light"
+    heavy: str = "heavy"
+
+
+facing = SelectVariable("Facing", Facing, Facing.raised)
+bolting = SelectVariable("Bolting", Bolting, Bolting.light)
+
+
+class FlangeProblem(Problem):
+    name = "Flange Problem"
+
+    x = Length("x").set(2).meter
+    w = Length("w")
+
+    w_eqn = equation(w, match_expr(facing, Facing.raised, x * 2, Facing.flat, x * 3) + match_expr(bolting, Bolting.light, x, Bolting.heavy, x * 10))
+
+
+def test_specialize_expression_removes_matches():
+    rhs = FlangeProblem().equations[0].rhs
+    symbols = set(collect_select_variables(rhs))
+    assert len(symbols) == 2
+
+    specialized = specialize_expression(rhs, dict(zip(sorted(symbols), ("heavy", "flat"), strict=True)))
+
+    assert not collect_select_variables(specialized)
+    assert "match" not in str(specialized).lower()
+
+
+def test_specialize_folds_conditions_decided_by_selection():
+    x = Length("x").set(1).meter
+    x._symbol = "x"
+    expr = cond_expr(match_expr(facing, Facing.raised, 1, Facing.flat, 0) > 0.5, x * 2, x * 3)
+    symbol = next(iter(collect_select_variables(expr)))
+
+    raised = specialize_expression(expr, {symbol: Facing.raised})
+    flat = specialize_expression(expr, {symbol: Facing.flat})
+
+    assert raised.evaluate({"x": x}).value == pytest.approx(2.0)
+    assert flat.evaluate({"x": x}).value == pytest.approx(3.0)
+    assert "if" not in str(flat).lower()
+
+
+def test_branches_inside_summation_terms_are_specialized():
+    x = Length("x").set(1).meter
+    x._symbol = "x"
+    expr = summation(lambda i, x: match_expr(facing, Facing.raised, x * i, Facing.flat, x), (1, 5), x=x)
+    symbols = collect_select_variables(expr)
+    assert len(symbols) == 1
+
+    flat = specialize_expression(expr, dict.fromkeys(symbols, Facing.flat))
+
+    assert isinstance(flat, Summation) and not collect_select_variables(flat)
+    assert flat.evaluate({"x": x}).value == pytest.approx(4.0)
+    assert specialize_expression(expr, dict.fromkeys(symbols, Facing.raised)).evaluate({"x": x}).value == pytest.approx(10.0)
+
+
+def test_specialized_equations_are_cached_per_selection():
+    problem = FlangeProblem()
+    specializer = problem.get_branch_specializer()
+    facing_symbol, bolting_symbol = specializer.symbols
+
+    first = problem.specialized_equations(**{facing_symbol: Facing.flat, bolting_symbol: Bolting.heavy})
+
+    assert problem.specialized_equations(**{facing_symbol: Facing.flat, bolting_symbol: Bolting.heavy}) is first
+    assert not isinstance(first[0].rhs, MatchExpression)
+    assert first[0].rhs.evaluate(problem.variables).value == pytest.approx(26.0)
+
+
+def test_batch_groups_rows_by_selection():
+    problem = FlangeProblem()
+    specializer = BranchSpecializer([problem.equations[0].rhs])
+    facing_symbol, bolting_symbol = specializer.symbols
+
+    result = specializer.evaluate_batch(
+        {"x": np.array([1.0, 2.0, 3.0, 4.0])},
+        {facing_symbol: [Facing.raised, Facing.flat, Facing.raised, Facing.flat], bolting_symbol: [Bolting.light, Bolting.light, Bolting.heavy, Bolting.heavy]},
+    )
+
+    assert result[:, 0].tolist() == pytest.approx([3.0, 8.0, 36.0, 52.0])
+    assert len(specializer._batch_variants) == 4
+    assert specializer({"x": 1.0}) == [pytest.approx(3.0)]
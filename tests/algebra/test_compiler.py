@@ -0,0 +1,71 @@
+"""
+Tests for compiling expression trees into numeric closures.
+"""
+
+import numpy as np
+import pytest
+
+from qnty import Dimensionless, Length
+from qnty.algebra import BinaryOperation, ConditionalExpression, Constant, VariableReference, sqrt
+from qnty.algebra.compiler import ARRAY, CompilationError, compile_expression
+from qnty.core.quantity import Q
+
+
+def make_refs():
+    x = Length("x").set(2).meter
+    x._symbol = "x"
+    k = Dimensionless("k").set(3).dimensionless
+    k._symbol = "k"
+    return x, k, VariableReference(x), VariableReference(k)
+
+
+def test_compiled_matches_evaluate():
+    x, k, x_ref, k_ref = make_refs()
+    expr = (x_ref * k_ref + x_ref) / (k_ref - 1) + x_ref**2 / x_ref
+
+    compiled = compile_expression(expr)
+    expected = expr.evaluate({"x": x, "k": k})
+
+    assert compiled({"x": x.value, "k": k.value}) == pytest.approx(expected.value)
+
+
+def test_compiled_uses_si_values():
+    x = Length("x").set(500).millimeter
+    x._symbol = "x"
+    compiled = compile_expression(VariableReference(x) + Constant(Q(1, "m")))
+
+    assert compiled({"x": x.value}) == pytest.approx(1.5)
+
+
+def test_conditional_and_functions():
+    _, k, _, k_ref = make_refs()
+    expr = ConditionalExpression(BinaryOperation(">", k_ref, Constant(Q(2, ""))), sqrt(k_ref), k_ref)
+
+    compiled = compile_expression(expr)
+
+    assert compiled({"k": 3.0}) == pytest.approx(3.0**0.5)
+    assert compiled({"k": 1.0}) == pytest.approx(1.0)
+
+
+def test_division_by_zero_raises_like_evaluate():
+    _, _, x_ref, k_ref = make_refs()
+    compiled = compile_expression(x_ref / k_ref)
+
+    with pytest.raises(ValueError):
+        compiled({"x": 1.0, "k": 0.0})
+
+
+def test_array_backend_evaluates_batches():
+    _, _, x_ref, k_ref = make_refs()
+    compiled = compile_expression(x_ref / k_ref, ARRAY)
+
+    result = compiled({"x": np.array([1.0, 2.0, 3.0]), "k": np.array([2.0, 0.0, 4.0])})
+
+    assert result[0] == pytest.approx(0.5)
+    assert np.isnan(result[1])
+    assert result[2] == pytest.approx(0.75)
+
+
+def test_unsupported_nodes_raise_compilation_error():
+    with pytest.raises(CompilationError):
+        compile_expression(Constant(Length("unknown")))
@@ -0,0 +1,95 @@
+"""
+Tests for static dimension inference on expression trees.
+"""
+
+import pytest
+
+from qnty import Area, Length, Pressure, Problem
+from qnty.algebra import DimensionMismatchError, cond_expr, equation, sqrt
+from qnty.algebra.nodes import VariableReference
+from qnty.core.dimension_catalog import AREA, LENGTH, D
+from qnty.core.quantity import Quantity
+
+
+def reference(quantity):
+    quantity._symbol = quantity.name
+    return VariableReference(quantity)
+
+
+def test_infers_dimensions_without_values():
+    length, area = reference(Length("L")), reference(Area("A"))
+
+    assert (area / length + length).infer_dimension() == LENGTH
+    assert (length**2).infer_dimension() == AREA
+    assert sqrt(area).infer_dimension() == LENGTH
+    assert (length > area / length).infer_dimension() == D
+
+
+def test_dimension_is_cached_per_node():
+    length = reference(Length("L"))
+    expr = length * 3 + length
+
+    first = expr.infer_dimension()
+
+    assert expr._inferred_dim is first
+    assert expr.left._inferred_dim == LENGTH
+
+
+def test_evaluate_uses_inferred_dimension(monkeypatch):
+    length, area = reference(Length("L").set(2).meter), reference(Area("A").set(12).meter2)
+    expr = area / length * 3
+    values = {"L": length.variable, "A": area.variable}
+    expected = expr.evaluate(values)
+
+    expr.infer_dimension()
+    # Quantity arithmetic (and its dimension products) is no longer needed
+    monkeypatch.setattr(Quantity, "__mul__", None)
+    monkeypatch.setattr(Quantity, "__truediv__", None)
+    result = expr.evaluate(values)
+
+    assert result.value == pytest.approx(expected.value) == pytest.approx(18.0)
+    assert result.dim == expected.dim == LENGTH
+
+
+def test_mismatch_reports_offending_subexpression():
+    length, area, pressure = reference(Length("L")), reference(Area("A")), reference(Pressure("P"))
+    expr = pressure * (length + area)
+
+    with pytest.raises(DimensionMismatchError, match=r"Dimension mismatch in addition 'L \+ A': \[m\] and \[m²\]") as info:
+        expr.infer_dimension()
+
+    assert info.value.location == "L + A"
+
+
+def test_disagreeing_branches_are_not_inferred():
+    length, area = reference(Length("L")), reference(Area("A"))
+
+    assert cond_expr(length > 0, length, area).infer_dimension() is None
+    assert cond_expr(length > 0, length, 0).infer_dimension() == LENGTH
+
+
+class MismatchedProblem(Problem):
+    name = "Mismatched Problem"
+
+    L = Length("L").set(2).meter
+    A = Area("A").set(3, "meter2")
+    y = Length("y")
+
+    y_eqn = equation(y, L * 2 + A)
+
+
+def test_equation_records_mismatch_and_solve_raises_it():
+    problem = MismatchedProblem()
+
+    with pytest.raises(DimensionMismatchError, match="Dimension mismatch in addition") as info:
+        problem.solve()
+
+    assert info.value.location == "L * 2  + A"
+
+
+def test_equation_sides_compared_statically():
+    length, area = reference(Length("L")), reference(Area("A"))
+
+    assert equation(length, area / length).dimensions_match() is True
+    assert equation(length, area).dimensions_match() is False
+    assert equation(length, area * 0).infer_dimensions() == (LENGTH, None)
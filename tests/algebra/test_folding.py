@@ -0,0 +1,83 @@
+"""
+Tests for the constant folding pass applied at equation construction.
+"""
+
+from dataclasses import dataclass
+
+import pytest
+
+from qnty import Length
+from qnty.algebra import Constant, SelectOption, SelectVariable, cond_expr, equation, match_expr, wrap_operand
+from qnty.algebra.compiler import expression_fingerprint
+from qnty.algebra.folding import fold_constants
+from qnty.algebra.nodes import VariableReference
+from qnty.core import Q
+from qnty.core.dimension_catalog import LENGTH
+
+
+@dataclass(frozen=True)
+class Facing(SelectOption):
+    raised: str = "raised"
+    flat: str = "flat"
+
+
+facing = SelectVariable("Facing", Facing, Facing.raised)
+
+
+def reference(symbol):
+    quantity = Length(symbol)
+    quantity._symbol = symbol
+    return VariableReference(quantity)
+
+
+def test_folds_constant_subtrees_and_identities():
+    x, y = reference("x"), reference("y")
+
+    folded = fold_constants(x * (wrap_operand(2) * 3) + y * 1)
+
+    assert str(folded) == "x * 6  + y"
+    assert fold_constants(x**1 / 1) is x
+
+
+def test_folds_unit_conversion_factors():
+    x = reference("x")
+    offset = Constant(Q(12, "inch")) * 2
+
+    assert fold_constants(x * (Constant(Q(12, "inch")) / Constant(Q(1, "foot")))) is x
+    folded = fold_constants(offset + x)
+    assert folded.left.value.value == pytest.approx(0.6096)
+    assert folded.left.infer_dimension() == LENGTH
+
+
+def test_zero_only_dropped_when_dimensions_allow():
+    x = reference("x")
+    ratio = x / reference("y")
+
+    assert fold_constants(ratio + 0) is ratio
+    assert str(fold_constants(x + 0)) == "x + 0 "
+
+
+def test_keeps_selection_dependent_branches():
+    x = reference("x")
+    expr = match_expr(facing, Facing.raised, x * 1, Facing.flat, x * 2)
+
+    folded = fold_constants(expr)
+
+    assert set(folded.cases) == {Facing.raised, Facing.flat}
+    assert folded.cases[Facing.raised] is x
+    assert fold_constants(cond_expr(wrap_operand(1) > 0, x, x * 2)) is x
+
+
+def test_equation_is_folded_once_at_construction():
+    x, y = reference("x"), reference("y")
+
+    eq = equation(y, x * (wrap_operand(1) * 1))
+
+    assert eq.rhs is x
+
+
+def test_fingerprint_ignores_commutative_operand_order():
+    x, y = reference("x"), reference("y")
+
+    assert expression_fingerprint(x * y + 2) == expression_fingerprint(2 + y * x)
+    assert expression_fingerprint(x - y) != expression_fingerprint(y - x)
@@ -0,0 +1,104 @@
+"""
+Tests for closed-form inversion and the numeric fallback in Equation.solve_for.
+"""
+
+import pytest
+
+from qnty import Area, Dimensionless, Length, Problem
+from qnty.algebra import equation, log10, sqrt
+from qnty.algebra.inversion import _FUNCTION_INVERSES, count_occurrences, invert_for
+from qnty.algebra.nodes import BinaryOperation, VariableReference, wrap_operand
+from qnty.solving.roots import brent, find_root
+
+
+def reference(quantity):
+    quantity._symbol = quantity.name
+    return VariableReference(quantity)
+
+
+def test_inverts_nested_operations():
+    a, b, c, x = (reference(Length(name)) for name in ("a", "b", "c", "x"))
+
+    inversion = invert_for(a, sqrt((x - b) * 2) / c, "x")
+
+    assert str(inversion) == "(a * c) ** 2  / 2  + b"
+
+
+def test_repeated_or_missing_target_has_no_inversion():
+    a, x = reference(Length("a")), reference(Length("x"))
+
+    assert count_occurrences(x * x + a, "x") == 2
+    assert invert_for(a, x * x + x, "x") is None
+    assert invert_for(a, a * 2, "x") is None
+
+
+def test_inversion_is_cached_per_target():
+    a, b, x = reference(Length("a")), reference(Length("b")), reference(Length("x"))
+    eq = equation(a, x * 3 - b)
+
+    assert eq.inversion_for("x") is eq.inversion_for("x")
+    assert eq.inversion_for("x") is not eq.inversion_for("b")
+
+
+class InvertedProblem(Problem):
+    name = "Inverted Problem"
+
+    A = Area("A").set(12).meter2
+    w = Length("w")
+    h = Length("h").set(2).meter
+
+    A_eqn = equation(A, (w + h) * h)
+
+
+def test_problem_solves_non_lhs_target():
+    problem = InvertedProblem()
+    problem.solve()
+
+    assert problem.w.value == pytest.approx(4.0)
+    assert problem.equations[0].inversion_for("w") is not None
+
+
+def test_root_search_solves_repeated_target():
+    y, x = reference(Dimensionless("y").set(6).dimensionless), reference(Dimensionless("x"))
+    eq = equation(y, x * x + x)
+
+    result = eq._solve_numerically("x", {"x": x.variable, "y": y.variable})
+
+    assert result.value == pytest.approx(2.0)
+
+
+def test_root_helpers():
+    assert find_root(lambda x: x**3 - 8.0).root == pytest.approx(2.0)
+    assert brent(lambda x: x - 1.0, 2.0, 3.0) is None
+    assert find_root(lambda x: x * x + 1.0) is None
+
+
+def test_log10_inverts_for_non_integer_powers():
+    y, x = reference(Dimensionless("y").set(2.5).dimensionless), reference(Dimensionless("x"))
+    eq = equation(y, log10(x))
+
+    result = eq._solve_by_inversion("x", {"x": x.variable, "y": y.variable})
+
+    assert result.value == pytest.approx(10**2.5)
+
+
+def test_inversion_evaluation_errors_fall_back_to_root_search(monkeypatch):
+    # An inverse that cannot be evaluated (10 ** 2.5 with integer-only powers) must not stop solve_for
+    monkeypatch.setitem(_FUNCTION_INVERSES, "log10", lambda r: BinaryOperation("**", wrap_operand(10), r))
+    y, x = reference(Dimensionless("y").set(2.5).dimensionless), reference(Dimensionless("x"))
+    eq = equation(y, log10(x))
+    variables = {"x": x.variable, "y": y.variable}
+
+    assert eq._solve_by_inversion("x", variables) is None
+    assert eq.solve_for("x", variables).value == pytest.approx(10**2.5)
+
+
+def test_inverted_result_keeps_the_target_unit():
+    a, x = reference(Length("a").set(30).millimeter), reference(Length("x"))
+    x.variable.preferred = a.variable.preferred
+    eq = equation(a, x * 3)
+
+    result = eq._solve_by_inversion("x", {"a": a.variable, "x": x.variable})
+
+    assert result.value == pytest.approx(0.01)
+    assert result.preferred == a.variable.preferred
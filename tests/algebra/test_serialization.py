@@ -0,0 +1,126 @@
+"""
+Tests for the binary expression, equation and solve plan format.
+"""
+
+import math
+import time
+
+import pytest
+
+from qnty import Dimensionless, Length, Pressure, Problem
+from qnty.algebra import cond_expr, equation, sqrt, summation
+from qnty.algebra.compiler import compile_expression
+from qnty.algebra.nodes import VariableReference
+from qnty.algebra.serialization import SerializationError, dump_equations, dump_expression, load_equations, load_expression
+from qnty.core.unit import ureg
+from qnty.solving.plan import SolvePlan
+from qnty.solving.uncertainty import Normal, propagate
+
+
+def reference(quantity, symbol):
+    quantity._symbol = symbol
+    return VariableReference(quantity)
+
+
+def test_expression_round_trip_preserves_structure_and_values():
+    x = reference(Length("x").set(2).inch, "x")
+    y = reference(Dimensionless("y").set(3).dimensionless, "y")
+    limit = reference(Length("limit").set(1).inch, "limit")
+    expr = cond_expr(x > limit, sqrt(x * x) * y + 0.5, x / y)
+
+    loaded = load_expression(dump_expression(expr))
+
+    assert str(loaded) == str(expr)
+    assert loaded.get_variables() == {"x", "y", "limit"}
+    values = {"x": 0.0508, "y": 3.0, "limit": 0.0254}
+    assert compile_expression(loaded)(values) == pytest.approx(compile_expression(expr)(values))
+    # Placeholders keep dimension, preferred unit and value
+    variable = loaded.condition.left.variable
+    assert variable.dim == Length("x").dim and variable.preferred is ureg.resolve("inch") and variable.value == pytest.approx(0.0508)
+
+
+def test_constants_are_stored_bit_exact():
+    x = reference(Dimensionless("x"), "x")
+    expr = x * (1 / 3) + math.pi
+
+    loaded = load_expression(dump_expression(expr))
+
+    assert loaded.left.right.value.value == (1 / 3)
+    assert loaded.right.value.value == math.pi
+
+
+def test_summation_loads_as_summation_over_its_terms():
+    items = [reference(Length(f"L{i}").set(i + 1).inch, f"L{i}") for i in range(4)]
+    expr = summation(lambda i: items[i] * 2, range(4))
+
+    loaded = load_expression(dump_expression(expr))
+
+    assert type(loaded).__name__ == "Summation" and loaded.term_count == 4
+    assert compile_expression(loaded)({f"L{i}": float(i) for i in range(4)}) == pytest.approx(12.0)
+
+
+def test_rejects_foreign_and_corrupt_payloads():
+    data = dump_expression(reference(Dimensionless("x"), "x") + 1)
+
+    with pytest.raises(SerializationError, match="Not a qnty"):
+        load_expression(b"XXXX" + data[4:])
+    with pytest.raises(SerializationError, match="version"):
+        load_expression(data[:4] + b"\xff\xff" + data[6:])
+    with pytest.raises(SerializationError, match="kind"):
+        load_equations(data)
+    with pytest.raises(SerializationError):
+        load_expression(data[:-3])
+
+
+class PipeWall(Problem):
+    name = "Pipe Wall"
+
+    P = Pressure("P").set(1000).psi
+    S = Pressure("S").set(20000).psi
+    Y = Dimensionless("Y").set(0.4).dimensionless
+    D = Length("D").set(6.625).inch
+    c = Length("c").set(0.0625).inch
+    t = Length("t").search_range(0, 1, "inch")
+    t_m = Length("t_m")
+
+    P_eqn = equation(P, 2 * S * t / (D - 2 * t * Y))
+    t_m_eqn = equation(t_m, t + c)
+
+
+def test_equations_share_variables_after_loading():
+    problem = PipeWall()
+
+    loaded = load_equations(dump_equations(problem.equations))
+
+    assert [eq.name for eq in loaded] == [eq.name for eq in problem.equations]
+    assert [str(eq) for eq in loaded] == [str(eq) for eq in problem.equations]
+    t_refs = [loaded[0].rhs.left.right, loaded[1].rhs.left]
+    assert t_refs[0].variable is t_refs[1].variable
+    assert t_refs[0].variable._search_range == pytest.approx((0.0, 0.0254))
+
+
+def test_solve_plan_round_trip_replays_in_another_problem_free_context():
+    problem = PipeWall()
+    problem.solve()
+    plan = problem.solve_plan()
+
+    loaded = SolvePlan.from_bytes(plan.to_bytes())
+
+    assert loaded.unknowns == plan.unknowns == ["t", "t_m"]
+    assert set(loaded.inputs) == {"P", "S", "Y", "D", "c"}
+    result = propagate(loaded.steps, loaded.variables, {"P": Normal(1000, 1e-9, unit="psi")}, samples=10, seed=0)
+    assert result["t_m"].mean == pytest.approx(problem.t_m.value, rel=1e-9)
+
+
+def test_solve_plan_loads_in_microseconds():
+    problem = PipeWall()
+    data = problem.solve_plan().to_bytes()
+
+    rounds = 200
+    start = time.perf_counter()
+    for _ in range(rounds):
+        SolvePlan.from_bytes(data)
+    per_load = (time.perf_counter() - start) / rounds
+
+    print(f"\nSolve plan: {len(data)} bytes, {per_load * 1e6:.1f} us per load")
+    assert per_load < 2e-3
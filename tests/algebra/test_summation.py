@@ -9,7 +9,8 @@ import numpy as np
 import pytest
 
 from qnty import Dimensionless, Length, Problem
-from qnty.algebra import equation, summation
+from qnty.algebra import Summation, equation, summation
+from qnty.algebra.compiler import ARRAY, compile_expression
 
 
 class TestBasicSummations:
@@ -379,5 +380,91 @@ class TestEdgeCases:
         assert problem.result.value == 20.0
 
 
+class TestLazySummation:
+    """Test the lazy Summation node and its vectorized evaluation."""
+
+    M = np.linspace(-1.0, 1.0, 2500).reshape(50, 50)
+
+    def make_problem(self):
+        class LargeSeries(Problem):
+            M = TestLazySummation.M
+
+            x = Dimensionless("x").set(0.9).dimensionless
+            y = Dimensionless("y").set(0.8).dimensionless
+
+            result = Dimensionless("result")
+            result_eqn = equation(
+                result,
+                summation(lambda i, j, M, x, y: M[i, j] * x**i * y**j, 50, 50, M=M, x=x, y=y)
+            )
+
+        return LargeSeries()
+
+    def test_large_summation_stays_a_single_node(self):
+        problem = self.make_problem()
+        rhs = problem.equations[0].rhs
+
+        assert isinstance(rhs, Summation)
+        assert rhs.term_count == 2500
+        assert len(rhs.groups()) == 1
+        assert rhs.get_variables() == {"x", "y"}
+
+        problem.solve()
+        i, j = np.indices(self.M.shape)
+        assert problem.result.value == pytest.approx(np.sum(self.M * 0.9**i * 0.8**j))
+
+    def test_vectorized_matches_streaming(self):
+        problem = self.make_problem()
+        rhs = problem.equations[0].rhs
+
+        vectorized = rhs.evaluate(problem.variables)
+        streamed = rhs._evaluate_streaming(problem.variables)
+
+        assert vectorized.value == pytest.approx(streamed.value, rel=1e-12)
+        assert vectorized.dim == streamed.dim
+
+    def test_batch_evaluation_over_inputs(self):
+        problem = self.make_problem()
+        compiled = compile_expression(problem.equations[0].rhs, ARRAY)
+
+        xs = np.array([0.5, 0.9])
+        totals = compiled({"x": xs, "y": np.array([0.8, 0.8])})
+
+        i, j = np.indices(self.M.shape)
+        expected = [np.sum(self.M * x**i * 0.8**j) for x in xs]
+        assert totals == pytest.approx(expected)
+
+    def test_mixed_term_structures_are_grouped(self):
+        """Terms whose shape changes with the index form separate groups."""
+        class Piecewise(Problem):
+            base = Length("base").set(2).meter
+            total = Length("total")
+            total_eqn = equation(
+                total,
+                summation(lambda i, base: base if i % 2 else i * base, (1, 7), base=base)
+            )
+
+        problem = Piecewise()
+        problem.solve()
+
+        # Odd i contribute base, even i contribute i * base: 2 * (1 + 2 + 1 + 4 + 1 + 6)
+        assert problem.total.to_unit("meter").value == pytest.approx(30.0)
+
+    def test_rewritten_terms_are_compiled_afresh(self):
+        """Changing the terms after a compile must not reuse the old plan."""
+        problem = self.make_problem()
+        rhs = problem.equations[0].rhs
+        values = {"x": 0.9, "y": 0.8}
+        original = compile_expression(rhs, ARRAY)(values)
+
+        doubled = rhs.map_terms(lambda term: term * 2)
+        assert compile_expression(doubled, ARRAY)(values) == pytest.approx(2 * original)
+
+        rhs.term_transform = lambda term: term * 3
+        assert rhs.groups() is not None
+        assert compile_expression(rhs, ARRAY)(values) == pytest.approx(3 * original)
+        assert rhs.evaluate(problem.variables).value == pytest.approx(3 * original)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -8,7 +8,9 @@ Tests the angle reference system that allows specifying:
 """
 
 import math
+import time
 
+import numpy as np
 import pytest
 
 from qnty.spatial.angle_reference import AngleDirection, AngleReference
@@ -344,3 +346,64 @@ class TestForceVectorWrtParameter:
         # Using w should fail
         with pytest.raises(ValueError, match="Invalid wrt axis 'w'"):
             _Vector(magnitude=100, angle=30, unit="N", wrt="w", coordinate_system=uv_system)
+
+
+class TestCachedTransforms:
+    """Cached conversions, batch conversions and shared instances."""
+
+    def test_batch_conversions_match_scalar_conversions(self):
+        rng = np.random.default_rng(4)
+        angles = rng.uniform(-400, 400, 50)
+
+        for ref in (AngleReference.standard(), AngleReference.from_axis("-y", direction="cw"), AngleReference(axis_angle=30, direction="clockwise", axis_label="u")):
+            standard = ref.to_standard_array(angles, angle_unit="degree")
+            assert standard == pytest.approx([ref.to_standard(a, angle_unit="degree") for a in angles])
+            assert ref.from_standard_array(standard, angle_unit="degree") == pytest.approx([ref.from_standard(s, angle_unit="degree") for s in standard])
+
+    def test_coordinate_system_batch_and_cached_inverse(self):
+        from qnty.spatial.coordinate_system import CoordinateSystem
+
+        uv = CoordinateSystem.from_angle_between("u", "v", axis1_angle=10, angle_between=75)
+        components = np.random.default_rng(8).normal(size=(40, 2))
+
+        xy = uv.to_cartesian_array(components)
+        assert xy[7] == pytest.approx(uv.to_cartesian(*components[7]))
+        assert uv.from_cartesian(*xy[7]) == pytest.approx(tuple(components[7]))
+        assert uv.from_cartesian_array(xy) == pytest.approx(components)
+        assert uv.basis @ uv.inverse_basis == pytest.approx(np.eye(2))
+
+        parallel = CoordinateSystem("a", "b", axis1_angle=20, axis2_angle=200)
+        assert parallel.inverse_basis is None
+        with pytest.raises(np.linalg.LinAlgError):
+            parallel.from_cartesian(1.0, 2.0)
+
+    def test_identical_systems_are_shared(self):
+        from qnty.spatial.coordinate_system import CoordinateSystem
+
+        assert CoordinateSystem.standard() is CoordinateSystem.standard()
+        assert CoordinateSystem.from_angle_between("u", "v", 0, 75) is CoordinateSystem.from_angle_between("u", "v", 0, 75)
+        assert CoordinateSystem.from_angle_between("u", "v", 0, 75) is not CoordinateSystem.from_angle_between("u", "v", 0, 80)
+        assert AngleReference.standard() is AngleReference.standard()
+        assert AngleReference.from_axis("+y", direction="cw") is AngleReference.from_axis("+y", direction="cw")
+
+        F1 = _Vector(magnitude=100, angle=30, unit="N", wrt="cw:+y")
+        F2 = _Vector(magnitude=200, angle=45, unit="N", wrt="cw:+y")
+        assert F1.angle_reference is F2.angle_reference
+        assert F1.coordinate_system is F2.coordinate_system is CoordinateSystem.standard()
+
+    def test_batch_conversion_outpaces_scalar_loop(self):
+        from qnty.spatial.coordinate_system import CoordinateSystem
+
+        uv = CoordinateSystem.from_angle_between("u", "v", axis1_angle=0, angle_between=105)
+        xy = np.random.default_rng(0).normal(size=(20_000, 2))
+
+        start = time.perf_counter()
+        uv.from_cartesian_array(xy)
+        batch = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for x, y in xy[:1000].tolist():
+            uv.from_cartesian(x, y)
+        single = (time.perf_counter() - start) / 1000
+
+        assert batch / len(xy) * 10 < single, f"{batch / len(xy) * 1e9:.1f} ns per batched pair vs {single * 1e9:.0f} ns per call"
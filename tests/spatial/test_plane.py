@@ -0,0 +1,111 @@
+"""
+Tests for Plane queries on single points and point arrays, and in-plane vectors.
+"""
+
+import math
+import os
+import time
+
+import numpy as np
+import pytest
+
+from qnty.spatial import Plane, PointCloud, VectorArray, create_plane_rotated_x, create_plane_rotated_y, create_plane_rotated_z, create_vector_in_plane, create_vectors_in_plane
+
+# Wall-clock comparisons depend on the machine and its load; set QNTY_BENCH=1 to run them
+RUN_TIMINGS = os.environ.get("QNTY_BENCH") == "1"
+
+
+@pytest.fixture
+def points():
+    return np.random.default_rng(21).uniform(-5, 5, size=(500, 3))
+
+
+def test_rotated_plane_normals_and_axes():
+    t = math.radians(35)
+    planes = {
+        (0.0, math.sin(t), math.cos(t)): create_plane_rotated_x(35),
+        (-math.sin(t), 0.0, math.cos(t)): create_plane_rotated_y(35),
+        (math.cos(t), 0.0, -math.sin(t)): create_plane_rotated_y(35, start_plane="zy"),
+        (-math.sin(t), math.cos(t), 0.0): create_plane_rotated_z(35),
+    }
+    for normal, plane in planes.items():
+        rotation = plane.rotation_matrix
+        assert plane.normal == pytest.approx(normal, abs=1e-15)
+        assert rotation[:, 2] == pytest.approx(plane.normal)
+        assert rotation.T @ rotation == pytest.approx(np.eye(3), abs=1e-15)
+        assert np.linalg.det(rotation) == pytest.approx(1.0)
+
+    # The zy-plane keeps y as its first in-plane axis when rotated about y
+    assert create_plane_rotated_y(-30, start_plane="zy").rotation_matrix[:, 0] == pytest.approx([0.0, 1.0, 0.0])
+    with pytest.raises(ValueError):
+        create_plane_rotated_x(35).rotation_matrix[0, 0] = 2.0
+
+
+def test_batch_queries_match_single_point_queries(points):
+    plane = Plane([1.0, -2.0, 0.5], point=[0.3, 0.1, -0.2])
+
+    distances = plane.distance_to_point(points)
+    projected = plane.project_point(points)
+
+    assert distances.shape == (500,) and projected.shape == (500, 3)
+    for i in (0, 99, 499):
+        assert distances[i] == pytest.approx(plane.distance_to_point(points[i]))
+        assert projected[i] == pytest.approx(plane.project_point(points[i]))
+    assert np.all(plane.contains_point(projected))
+    assert plane.contains_point(points) == pytest.approx(np.abs(distances) < 1e-9)
+    assert plane.contains_point(plane.point) is np.True_
+
+
+def test_plane_coordinates_round_trip(points):
+    plane = create_plane_rotated_z(25, point=(1, 2, 3), unit="m")
+
+    local = plane.to_plane_coordinates(points)
+
+    assert local[:, 2] == pytest.approx(plane.distance_to_point(points))
+    assert plane.from_plane_coordinates(local) == pytest.approx(points)
+    assert plane.from_plane_coordinates(local[:, :2]) == pytest.approx(plane.project_point(points))
+    assert plane.from_plane_coordinates([0.0, 0.0]) == pytest.approx(plane.point)
+
+
+def test_point_clouds_project_to_point_clouds(points):
+    cloud = PointCloud(points, unit="ft")
+    plane = Plane([0.0, 0.0, 1.0])
+
+    flat = plane.project_point(cloud)
+
+    assert isinstance(flat, PointCloud) and flat.unit == cloud.unit
+    assert flat.si_coords[:, 2] == pytest.approx(np.zeros(500))
+    assert plane.distance_to_point(cloud) == pytest.approx(points[:, 2] * 0.3048)
+
+
+def test_vectors_in_plane_match_single_vectors():
+    plane = create_plane_rotated_y(-30, start_plane="zy")
+    angles = np.linspace(-90, 90, 37)
+
+    forces = create_vectors_in_plane(plane, magnitudes=300, angles=angles, from_axis="+y", toward_axis="+z", unit="N")
+
+    assert isinstance(forces, VectorArray) and len(forces) == 37
+    assert forces.magnitude == pytest.approx(np.full(37, 300.0))
+    assert forces.dot(plane.normal) == pytest.approx(np.zeros(37), abs=1e-12)
+    single = create_vector_in_plane(plane, magnitude=300, angle=30, from_axis="+y", toward_axis="+z", unit="N")
+    assert forces.si_coords[24] == pytest.approx([single._x, single._y, single._z])
+    with pytest.raises(ValueError, match="perpendicular"):
+        create_vectors_in_plane(Plane([0, 1, 0]), [1.0, 2.0], [0.0, 10.0], from_axis="-y")
+
+
+@pytest.mark.skipif(not RUN_TIMINGS, reason="timing comparison; set QNTY_BENCH=1 to run")
+def test_batch_projection_outpaces_point_loop():
+    plane = create_plane_rotated_x(40, point=(0, 0, 1))
+    points = np.random.default_rng(3).normal(size=(200_000, 3))
+
+    start = time.perf_counter()
+    projected = plane.project_point(points)
+    batch = (time.perf_counter() - start) / len(points)
+
+    start = time.perf_counter()
+    for row in points[:2000]:
+        plane.project_point(row)
+    single = (time.perf_counter() - start) / 2000
+
+    assert projected[7] == pytest.approx(plane.project_point(points[7]))
+    assert batch * 20 < single, f"{batch * 1e9:.1f} ns per point in batch vs {single * 1e9:.0f} ns per call"
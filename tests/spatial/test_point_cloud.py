@@ -0,0 +1,101 @@
+"""
+Tests for PointCloud, the batched counterpart of _Point.
+"""
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+from qnty.spatial import PointCloud, VectorArray, _Point, _Vector
+
+# Wall-clock comparisons depend on the machine and its load; set QNTY_BENCH=1 to run them
+RUN_TIMINGS = os.environ.get("QNTY_BENCH") == "1"
+
+
+@pytest.fixture
+def anchors():
+    rng = np.random.default_rng(11)
+    return rng.uniform(-20, 20, size=(300, 3))
+
+
+def test_matches_single_point_operations(anchors):
+    cloud = PointCloud(anchors, unit="ft")
+    shift = VectorArray(anchors[::-1], unit="ft")
+    distances = cloud.distance_matrix()
+
+    for i, j in ((0, 1), (17, 250), (299, 3)):
+        a = _Point(*anchors[i], unit="ft")
+        b = _Point(*anchors[j], unit="ft")
+        assert distances[i, j] == pytest.approx(a.distance_to(b).value)
+        assert (cloud - b)[i]._coords == pytest.approx((a - b)._coords)
+        assert cloud.displaced(shift, 2.0)[i] == a.displaced(shift[i], 2.0)
+
+    assert cloud[5] == _Point(*anchors[5], unit="ft")
+    assert np.all(np.diag(distances) == 0) and np.array_equal(distances, distances.T)
+    assert cloud.distance_matrix(unit="ft") == pytest.approx(distances / 0.3048)
+    assert cloud.to_array() == pytest.approx(anchors)
+
+
+def test_position_vectors_between_index_pairs(anchors):
+    cloud = PointCloud(anchors, unit="m")
+    start, end = np.arange(0, 100), np.arange(100, 200)
+
+    r = cloud.position_vectors(start, end)
+
+    assert isinstance(r, VectorArray) and len(r) == 100
+    assert r.si_coords == pytest.approx(anchors[end] - anchors[start])
+    assert r.magnitude == pytest.approx(cloud.distance_matrix()[start, end])
+    assert cloud[start].displaced(r)[42] == cloud[142]
+
+
+def test_cross_distances_and_validation(anchors):
+    cloud = PointCloud(anchors, unit="m")
+    hooks = PointCloud(anchors[:7] + 0.5, unit="m")
+
+    assert cloud.distance_matrix(hooks).shape == (300, 7)
+    assert cloud.distance_matrix(hooks)[3, 3] == pytest.approx(np.sqrt(0.75))
+    with pytest.raises(ValueError, match="different dimension"):
+        cloud.displaced(_Vector(1, 0, 0, unit="N"))
+    with pytest.raises(ValueError, match="k must be"):
+        cloud.nearest(hooks, k=301)
+    with pytest.raises(ValueError):
+        cloud.si_coords[0, 0] = 1.0
+
+
+def test_nearest_neighbours_match_brute_force(anchors):
+    cloud = PointCloud(anchors, unit="m")
+    queries = PointCloud(np.random.default_rng(5).uniform(-25, 25, size=(40, 3)), unit="m")
+
+    distances, indices = cloud.nearest(queries, k=4)
+
+    brute = queries.distance_matrix(cloud)
+    expected = np.argsort(brute, axis=1)[:, :4]
+    assert np.array_equal(indices, expected)
+    assert distances == pytest.approx(np.take_along_axis(brute, expected, axis=1))
+
+    distance, index = cloud.nearest(_Point(*anchors[123], unit="m"))
+    assert (distance, index) == (0.0, 123)
+    nearest_distances, nearest_indices = cloud.nearest(queries)
+    assert np.array_equal(nearest_indices, expected[:, 0])
+
+
+@pytest.mark.skipif(not RUN_TIMINGS, reason="timing comparison; set QNTY_BENCH=1 to run")
+def test_bulk_distances_outpace_point_by_point():
+    rng = np.random.default_rng(2)
+    coords = rng.uniform(0, 50, size=(2000, 3))
+    points = [_Point(*row, unit="m") for row in coords]
+    cloud = PointCloud.from_points(points)
+
+    start = time.perf_counter()
+    matrix = cloud.distance_matrix()
+    bulk_per_pair = (time.perf_counter() - start) / matrix.size
+
+    start = time.perf_counter()
+    for other in points:
+        points[0].distance_to(other)
+    single = (time.perf_counter() - start) / len(points)
+
+    assert matrix[0] == pytest.approx(np.linalg.norm(coords - coords[0], axis=1))
+    assert bulk_per_pair * 20 < single, f"{bulk_per_pair * 1e9:.1f} ns per pair in bulk vs {single * 1e9:.0f} ns per distance_to"
@@ -0,0 +1,86 @@
+"""
+Tests for VectorArray, the batched counterpart of _Vector.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from qnty.spatial import VectorArray, _Vector
+
+
+@pytest.fixture
+def loads():
+    rng = np.random.default_rng(3)
+    return rng.normal(size=(50, 3))
+
+
+def test_matches_single_vector_operations(loads):
+    batch = VectorArray(loads, unit="lbf")
+    other = VectorArray(loads[::-1], unit="lbf")
+
+    for i in (0, 17, 49):
+        a = _Vector(*loads[i], unit="lbf")
+        b = _Vector(*loads[::-1][i], unit="lbf")
+        assert batch.magnitude[i] == pytest.approx(a.magnitude.value)
+        assert batch.dot(other)[i] == pytest.approx(a.dot(b).value)
+        assert batch.cross(other)[i]._coords == pytest.approx(a.cross(b)._coords)
+        assert batch.angle_between(other)[i] == pytest.approx(a.angle_between(b).value)
+        assert batch.projection_onto(other)[i]._coords == pytest.approx(a.projection_onto(b)._coords)
+        assert batch.normalized()[i]._coords == pytest.approx(a.normalized()._coords)
+        assert (batch + other)[i]._coords == pytest.approx((a + b)._coords)
+        assert (batch - b)[i]._coords == pytest.approx((a - b)._coords)
+
+    assert batch.cross(other).dim == batch.dim * other.dim
+
+
+def test_units_and_scaling(loads):
+    batch = VectorArray(loads, unit="lbf")
+
+    assert batch.to_array() == pytest.approx(loads)
+    assert batch.si_coords == pytest.approx(loads * 4.4482216152605)
+    assert batch.magnitude_in("lbf") == pytest.approx(np.linalg.norm(loads, axis=1))
+    assert (2 * batch).to_array() == pytest.approx(2 * loads)
+    factors = np.arange(1, 51)
+    assert (batch * factors).to_array() == pytest.approx(loads * factors[:, None])
+    assert batch.to_unit("N").si_coords is batch.si_coords
+    with pytest.raises(ZeroDivisionError):
+        batch / 0
+
+
+def test_resultant_and_round_trip(loads):
+    vectors = [_Vector(*row, unit="N") for row in loads]
+    batch = VectorArray.from_vectors(vectors)
+
+    resultant = batch.resultant()
+
+    assert resultant._coords == pytest.approx(_Vector.resultant(vectors)._coords)
+    assert resultant.is_resultant and resultant.name == "R"
+    assert len(batch[10:20]) == 10 and len(batch[batch.magnitude > 1.0]) == int((np.linalg.norm(loads, axis=1) > 1.0).sum())
+
+
+def test_rows_are_copies_and_slices_are_views(loads):
+    batch = VectorArray(loads, unit="N")
+
+    row = batch[3]
+    row._set_component(0, 42.0)
+    batch[3:5].si_coords[1, 1] = -7.0
+
+    assert batch.si_coords[3, 0] == loads[3, 0]
+    assert batch.si_coords[4, 1] == -7.0
+    assert [v._coords[1] for v in batch][:2] == pytest.approx(loads[:2, 1])
+
+
+def test_planar_components_and_errors():
+    batch = VectorArray([[3.0, 4.0], [0.0, 1.0]], unit="m")
+
+    assert batch.magnitude == pytest.approx([5.0, 1.0])
+    assert batch.dot((1.0, 0.0, 0.0)) == pytest.approx([3.0, 0.0])
+    assert batch.angle_between(_Vector(1.0, 0.0, 0.0, unit="m")) == pytest.approx([math.atan2(4, 3), math.pi / 2])
+    with pytest.raises(ValueError, match="different dimensions"):
+        batch + VectorArray([[1.0, 0.0, 0.0]], unit="N")
+    with pytest.raises(ValueError, match="zero vector"):
+        VectorArray.zeros(2, "m").normalized()
+    with pytest.raises(ValueError, match="shape"):
+        VectorArray(np.zeros((2, 4)), unit="m")
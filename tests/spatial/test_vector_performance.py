@@ -0,0 +1,79 @@
+"""
+Benchmarks for single-vector math on the float-triple representation.
+
+Each statics operation on ``_Vector``/``_Point`` is timed against the bare
+NumPy kernel it used to run on length-3 arrays. The qnty operation includes
+building its result object, so beating the bare kernel shows the per-call
+NumPy overhead is gone.
+
+The timing comparisons only run with QNTY_BENCH=1, since wall-clock
+results depend on the machine and its load. Customize iteration count with
+QNTY_BENCH_ITER (default 5000).
+"""
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+from qnty.spatial import _Point, _Vector
+
+ITERATIONS = int(os.environ.get("QNTY_BENCH_ITER", "5000"))
+RUN_TIMINGS = os.environ.get("QNTY_BENCH") == "1"
+
+F1 = _Vector(3.0, 4.0, 1.0, unit="N")
+F2 = _Vector(-1.0, 2.0, 5.0, unit="N")
+A = _Point(1.0, 2.0, 3.0, unit="m")
+B = _Point(4.0, -2.0, 0.5, unit="m")
+
+X1 = np.array([3.0, 4.0, 1.0])
+X2 = np.array([-1.0, 2.0, 5.0])
+
+
+def _ns_per_call(operation) -> float:
+    """Best of three timings, in nanoseconds per call."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            operation()
+        best = min(best, time.perf_counter() - start)
+    return best / ITERATIONS * 1e9
+
+
+BENCHMARKS = {
+    "magnitude": (lambda: F1.magnitude, lambda: float(np.sqrt(np.sum(X1**2)))),
+    "normalized": (lambda: F1.normalized(), lambda: X1 / np.sqrt(np.sum(X1**2))),
+    "cross": (lambda: F1.cross(F2), lambda: np.cross(X1, X2)),
+    "angle_between": (lambda: F1.angle_between(F2), lambda: np.arccos(np.dot(X1, X2) / (np.sqrt(np.sum(X1**2)) * np.sqrt(np.sum(X2**2))))),
+    "projection_onto": (lambda: F1.projection_onto(F2), lambda: np.sum(X1 * X2) / np.sum(X2**2) * X2),
+    "distance_to": (lambda: A.distance_to(B), lambda: float(np.sqrt(np.sum((X1 - X2) ** 2)))),
+}
+
+
+@pytest.mark.skipif(not RUN_TIMINGS, reason="timing comparison; set QNTY_BENCH=1 to run")
+@pytest.mark.parametrize("name", sorted(BENCHMARKS))
+def test_single_vector_ops_beat_numpy_kernels(name):
+    qnty_op, numpy_kernel = BENCHMARKS[name]
+
+    qnty_ns = _ns_per_call(qnty_op)
+    numpy_ns = _ns_per_call(numpy_kernel)
+
+    print(f"{name}: qnty {qnty_ns:.0f} ns/op, numpy kernel alone {numpy_ns:.0f} ns/op")
+    assert qnty_ns < numpy_ns, f"{name} took {qnty_ns:.0f} ns/op, slower than the bare NumPy kernel ({numpy_ns:.0f} ns/op)"
+
+
+def test_statics_workload_results():
+    # Resultant of a force system and the position vector between two points,
+    # through the float path, checked against NumPy
+    forces = [_Vector(float(i), 2.0 * i, -1.0, unit="N") for i in range(1, 6)]
+
+    resultant = _Vector.resultant(forces)
+    r_AB = B - A
+    moment = r_AB.cross(resultant)
+
+    coords = np.array([f._coords for f in forces])
+    assert resultant._coords == pytest.approx(coords.sum(axis=0))
+    assert moment._coords == pytest.approx(np.cross(B._coords - A._coords, coords.sum(axis=0)))
+    assert A.displaced(r_AB) == B
@@ -0,0 +1,112 @@
+"""
+Tests for ComponentSolver.solve_cases, batched load cases over one force system.
+"""
+
+import math
+import os
+import time
+
+import numpy as np
+import pytest
+
+from qnty.solving.component_solver import ComponentSolver
+from qnty.spatial import _Vector
+
+# Wall-clock comparisons depend on the machine and its load; set QNTY_BENCH=1 to run them
+RUN_TIMINGS = os.environ.get("QNTY_BENCH") == "1"
+
+
+def force_system():
+    return [
+        _Vector(magnitude=600, angle=30, unit="N", name="F_1"),
+        _Vector(magnitude=400, angle=45, unit="N", name="F_2", wrt="cw:+y"),
+        _Vector(magnitude=250, angle=60, unit="N", name="F_3", wrt="F_1"),
+    ]
+
+
+def test_cases_match_one_at_a_time_solving():
+    rng = np.random.default_rng(7)
+    matrix = np.stack([rng.uniform(50, 800, (20, 3)), rng.uniform(0, 360, (20, 3))], axis=-1)
+
+    cases = ComponentSolver().solve_cases(matrix, force_system())
+
+    for k in (0, 9, 19):
+        forces = [
+            _Vector(magnitude=matrix[k, 0, 0], angle=matrix[k, 0, 1], unit="N", name="F_1"),
+            _Vector(magnitude=matrix[k, 1, 0], angle=matrix[k, 1, 1], unit="N", name="F_2", wrt="cw:+y"),
+            _Vector(magnitude=matrix[k, 2, 0], angle=matrix[k, 2, 1], unit="N", name="F_3", wrt="F_1"),
+        ]
+        expected = ComponentSolver().solve(forces)["F_R"]
+        assert cases.magnitude_in("N")[k] == pytest.approx(expected.magnitude.value)
+        assert math.cos(cases.angle[k]) == pytest.approx(math.cos(expected.angle.value))
+        assert math.sin(cases.angle[k]) == pytest.approx(math.sin(expected.angle.value))
+
+    assert cases.direction_cosines[:, :2] == pytest.approx(np.column_stack([np.cos(cases.angle), np.sin(cases.angle)]))
+    assert cases.direction_angles()[:, 2] == pytest.approx(np.full(20, math.pi / 2))
+
+
+def test_nan_entries_keep_the_force_values():
+    forces = force_system() + [_Vector(x=10, y=-20, z=30, unit="N", name="F_4")]
+    matrix = np.full((2, 4, 2), np.nan)
+    matrix[1, 0] = (1200, 30)  # double F_1 in the second case; F_3 follows its angle
+
+    cases = ComponentSolver().solve_cases(matrix, forces)
+
+    base = ComponentSolver().solve_resultant(force_system()[:2] + [_Vector(magnitude=250, angle=90, unit="N"), forces[3]])
+    assert cases.components[0] == pytest.approx(base._coords)
+    assert cases.components[1] - cases.components[0] == pytest.approx(forces[0]._coords)
+    assert cases.force_components[:, 3] == pytest.approx(np.array([[10.0, -20.0, 30.0]] * 2))
+    assert len(cases) == 2 and cases.names[3] == "F_4"
+
+
+def test_rejects_mismatched_matrices_and_unknown_forces():
+    solver = ComponentSolver()
+    with pytest.raises(ValueError, match="shape"):
+        solver.solve_cases(np.zeros((5, 2, 2)), force_system())
+    with pytest.raises(ValueError, match="unknown"):
+        solver.solve_cases(np.zeros((5, 2, 2)), [force_system()[0], _Vector.unknown("F_R", is_resultant=True)])
+
+
+def test_solution_steps_are_built_on_request():
+    solver = ComponentSolver()
+    cases = solver.solve_cases(np.array([[[100, 0], [100, 0], [100, 0]], [[500, 0], [100, 0], [100, 0]]]), force_system())
+
+    assert solver._pending_steps is not None
+    steps = solver.get_solution_steps()
+    assert solver._pending_steps is None
+    assert "governing case 1" in steps[0]["description"]
+    assert steps[1:] == cases.solution_steps(1)
+
+    # Single solves defer their steps the same way, with unchanged content
+    forces = force_system()
+    solver.solve_resultant(forces[:2])
+    assert solver._pending_steps is not None
+    assert solver.solution_steps[0]["method"] == "Component Method (Scalar Notation)"
+    assert solver.solution_steps[1]["components"][0] == "F_1: Fx = 519.615 N, Fy = 300.000 N"
+
+
+def test_zero_cases_have_a_summary_step():
+    solver = ComponentSolver()
+
+    cases = solver.solve_cases(np.empty((0, 3, 2)), force_system())
+
+    assert len(cases) == 0
+    assert [step["description"] for step in solver.solution_steps] == ["0 load cases"]
+
+
+@pytest.mark.skipif(not RUN_TIMINGS, reason="timing comparison; set QNTY_BENCH=1 to run")
+def test_thousands_of_cases_outpace_single_solves():
+    rng = np.random.default_rng(1)
+    matrix = np.stack([rng.uniform(50, 800, (5000, 3)), rng.uniform(0, 360, (5000, 3))], axis=-1)
+    solver = ComponentSolver()
+
+    start = time.perf_counter()
+    cases = solver.solve_cases(matrix, force_system())
+    batch_per_case = (time.perf_counter() - start) / len(cases)
+
+    start = time.perf_counter()
+    for _ in range(20):
+        solver.solve(force_system())
+    single = (time.perf_counter() - start) / 20
+
+    assert batch_per_case * 20 < single, f"{batch_per_case * 1e6:.2f} µs per batched case vs {single * 1e6:.1f} µs per solve"
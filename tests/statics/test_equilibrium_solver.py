@@ -0,0 +1,115 @@
+"""
+Tests for EquilibriumSolver and the equilibrium path of ParallelogramLawProblem.
+"""
+
+import cmath
+import math
+
+import pytest
+
+from qnty.problems.parallelogram_law import ParallelogramLawProblem
+from qnty.solving.equilibrium_solver import EquilibriumSolver, EquilibriumTerm
+from qnty.spatial import _Vector
+
+LBF = 4.4482216152605
+
+
+def residual(solution):
+    sign = {name: -1.0 if name.startswith("F_R") else 1.0 for name in solution.magnitudes}
+    return abs(sum(sign[n] * m * cmath.exp(1j * solution.angles[n]) for n, m in solution.magnitudes.items()))
+
+
+CONFIGURATIONS = {
+    "two magnitudes": [EquilibriumTerm("F_1", 8000.0, math.radians(270)), EquilibriumTerm("F_2", None, 0.0), EquilibriumTerm("F_R", None, math.radians(30), sign=-1.0)],
+    "angle and magnitude": [EquilibriumTerm("F_A", 8000.0, None), EquilibriumTerm("F_B", 6000.0, math.radians(310)), EquilibriumTerm("F_R", None, 0.0, sign=-1.0)],
+    "two angles": [EquilibriumTerm("F_1", 30.0, None), EquilibriumTerm("F_2", 40.0, None), EquilibriumTerm("F_R", 60.0, 0.0, sign=-1.0)],
+    "unknown force": [EquilibriumTerm("F_1", 400.0, 1.0), EquilibriumTerm("F_2", None, None), EquilibriumTerm("F_R", 600.0, 2.5, sign=-1.0)],
+    "parametric": [
+        EquilibriumTerm("F_AB", None, None),
+        EquilibriumTerm("F_AC", 500.0, None, relative_to="F_AB", offset=math.radians(-40)),
+        EquilibriumTerm("F_R", 400.0, math.pi, sign=-1.0),
+    ],
+    "parametric resultant": [
+        EquilibriumTerm("F_BA", 650.0, None, relative_to="F_R", offset=math.radians(-30)),
+        EquilibriumTerm("F_BC", None, math.radians(315)),
+        EquilibriumTerm("F_R", 850.0, None, sign=-1.0),
+    ],
+}
+
+
+@pytest.mark.parametrize("name", sorted(CONFIGURATIONS))
+def test_branches_close_from_analytic_starts(name):
+    solver = EquilibriumSolver()
+
+    solutions = solver.solve(CONFIGURATIONS[name])
+
+    assert solutions
+    assert solutions == solver.solve(CONFIGURATIONS[name])  # deterministic branch order
+    for solution in solutions:
+        assert residual(solution) < 1e-9 * 1000
+        assert solution.iterations <= 1
+    assert len(solutions) == (1 if name in ("two magnitudes", "unknown force") else 2)
+
+
+def test_two_angle_branches_mirror_the_closing_direction():
+    first, second = EquilibriumSolver().solve(CONFIGURATIONS["two angles"])
+
+    assert math.degrees(first.angles["F_1"]) == pytest.approx(36.34, abs=0.01)
+    assert math.degrees(first.angles["F_2"]) == pytest.approx(-26.38, abs=0.01)
+    assert first.angles["F_1"] == pytest.approx(-second.angles["F_1"])
+
+
+def test_impossible_and_underdetermined_systems():
+    short = [EquilibriumTerm("F_1", 10.0, None), EquilibriumTerm("F_2", 10.0, None), EquilibriumTerm("F_R", 60.0, 0.0, sign=-1.0)]
+    assert EquilibriumSolver().solve(short) == []
+
+    with pytest.raises(ValueError, match="3 unknowns"):
+        EquilibriumSolver().solve([EquilibriumTerm("F_1", None, None), EquilibriumTerm("F_R", None, 0.0, sign=-1.0)])
+    with pytest.raises(ValueError, match="circular"):
+        EquilibriumSolver().solve([EquilibriumTerm("F_1", 1.0, None, relative_to="F_2"), EquilibriumTerm("F_2", 1.0, None, relative_to="F_1")])
+
+
+def solve_problem(**forces):
+    problem = ParallelogramLawProblem("Equilibrium")
+    for name, force in forces.items():
+        problem.add_force(force, name)
+    problem.solve()
+    return problem
+
+
+def test_problem_2_12_angle_and_resultant_magnitude():
+    problem = solve_problem(
+        F_A=_Vector.unknown("F_A", magnitude=8000, wrt="+y", unit="N"),
+        F_B=_Vector(magnitude=6000, unit="N", angle=40, wrt="-y", name="F_B"),
+        F_R=_Vector.unknown("F_R", angle=0, wrt="+x", unit="N", is_resultant=True),
+    )
+
+    assert problem.forces["F_R"].magnitude.value == pytest.approx(10404.6, abs=0.1)
+    assert math.degrees(problem.forces["F_A"].angle.value) == pytest.approx(35.07, abs=0.01)
+    assert problem.solution_steps[0]["method"] == "Component Equilibrium"
+    assert "θ_F_A" in problem.solution_steps[0]["description"]
+
+
+def test_problem_2_19_parametric_angle():
+    problem = solve_problem(
+        F_AB=_Vector.unknown(name="F_AB", wrt="+x", unit="lbf"),
+        F_AC=_Vector(name="F_AC", magnitude=500, angle=-40, wrt="+F_AB", unit="lbf"),
+        F_R=_Vector(magnitude=400, angle=0, wrt="-x", unit="lbf", name="F_R", is_resultant=True),
+    )
+
+    F_AB, F_AC = problem.forces["F_AB"], problem.forces["F_AC"]
+    assert F_AB.magnitude.value / LBF == pytest.approx(-621.15, abs=0.01)
+    assert math.degrees(F_AB.angle.value - F_AC.angle.value) == pytest.approx(40)
+    assert F_AC._relative_to_force is None
+
+
+def test_solved_forces_satisfy_equilibrium():
+    problem = solve_problem(
+        F_BA=_Vector(name="F_BA", magnitude=650, angle=-30, wrt="+F_R", unit="lbf"),
+        F_BC=_Vector.unknown(name="F_BC", angle=-45, wrt="+x", unit="lbf"),
+        F_R=_Vector(magnitude=850, wrt="-x", unit="lbf", name="F_R", is_resultant=True),
+    )
+
+    F_BA, F_BC, F_R = (problem.forces[name] for name in ("F_BA", "F_BC", "F_R"))
+    assert F_BC.magnitude.value / LBF == pytest.approx(433.64, abs=0.01)
+    assert (F_BA._x + F_BC._x, F_BA._y + F_BC._y) == pytest.approx((F_R._x, F_R._y))
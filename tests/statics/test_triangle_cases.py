@@ -0,0 +1,102 @@
+"""
+Tests for the batched triangle engine of TriangleSolver.
+"""
+
+import math
+import os
+import time
+
+import numpy as np
+import pytest
+
+from qnty.solving.triangle_solver import TriangleSolver
+from qnty.spatial import _Vector
+
+# Wall-clock comparisons depend on the machine and its load; set QNTY_BENCH=1 to run them
+RUN_TIMINGS = os.environ.get("QNTY_BENCH") == "1"
+
+
+def test_rows_are_classified_and_solved_together():
+    nan = np.nan
+    tri = TriangleSolver().solve_triangles(
+        a=[3, 3, 6, 3, nan, 10, 10],
+        b=[4, 4, 8, 8, nan, nan, 3],
+        c=[5, nan, nan, nan, 10, nan, nan],
+        A=[nan, nan, 30, 30, 30, 30, nan],
+        B=[nan, nan, nan, nan, 60, 60, nan],
+        C=[nan, 90, nan, nan, nan, nan, nan],
+    )
+
+    assert list(tri.case) == ["SSS", "SAS", "SSA", "SSA", "ASA", "AAS", ""]
+    assert list(tri.valid) == [True, True, True, False, True, True, False]
+    assert tri.sides[1] == pytest.approx([3, 4, 5])
+    assert tri.angles_in("degree")[0] == pytest.approx([math.degrees(math.atan2(3, 4)), math.degrees(math.atan2(4, 3)), 90])
+    assert tri.sides[4] == pytest.approx([5, 10 * math.sin(math.pi / 3), 10])
+    assert tri.sides[5] == pytest.approx([10, 10 * math.sqrt(3), 20])
+    assert np.isnan(tri.sides[[3, 6]]).all()
+
+
+def test_ssa_keeps_both_triangles_of_the_ambiguous_case():
+    tri = TriangleSolver().solve_triangles(a=6, b=[8, 12, 4], A=30)
+
+    assert list(tri.ambiguous) == [True, False, False]
+    assert tri.angles_in()[1, 1] == pytest.approx(90)  # right triangle: one solution
+    for sides, angles in ((tri.sides[0], tri.angles[0]), (tri.alternate_sides[0], tri.alternate_angles[0])):
+        assert angles.sum() == pytest.approx(math.pi)
+        assert sides / np.sin(angles) == pytest.approx(np.full(3, 12.0))
+    assert math.degrees(tri.alternate_angles[0, 1]) == pytest.approx(180 - math.degrees(tri.angles[0, 1]))
+    assert "Ambiguous case" in tri.solution_steps(0)[0]["note"]
+
+
+def test_resultant_cases_match_single_solves():
+    rng = np.random.default_rng(5)
+    F1, F2 = rng.uniform(10, 900, 50), rng.uniform(10, 900, 50)
+    theta1, theta2 = rng.uniform(0, 360, 50), rng.uniform(0, 360, 50)
+
+    cases = TriangleSolver().solve_resultant_cases(F1, theta1, F2, theta2)
+
+    for i in (0, 21, 49):
+        resultant = _Vector.unknown("F_R", is_resultant=True)
+        TriangleSolver().solve_resultant_from_two_forces(
+            _Vector(magnitude=F1[i], angle=theta1[i], unit="N", name="F_1"), _Vector(magnitude=F2[i], angle=theta2[i], unit="N", name="F_2"), resultant
+        )
+        assert cases.magnitude[i, 2] == pytest.approx(resultant.magnitude.value)
+        assert math.cos(cases.angle[i, 2]) == pytest.approx(math.cos(resultant.angle.value))
+        assert math.sin(cases.angle[i, 2]) == pytest.approx(math.sin(resultant.angle.value))
+    assert cases.valid.all()
+
+
+def test_decomposition_cases_invert_resultant_cases():
+    theta1 = np.array([60.0, 0.0, 350.0, 0.0])
+    theta2 = np.array([165.0, 90.0, 40.0, 30.0])
+    resultants = TriangleSolver().solve_resultant_cases([450, 100, 300, 10], theta1, [700, 700, 200, 10], theta2)
+    theta_R = resultants.angle_in()[:, 2]
+    theta_R[3] = -10.0  # outside the wedge of the two directions
+
+    cases = TriangleSolver().solve_decomposition_cases(resultants.magnitude[:, 2], theta_R, theta1, theta2)
+
+    assert list(cases.valid) == [True, True, True, False]
+    assert cases.magnitude[:3, :2] == pytest.approx(np.array([[450, 700], [100, 700], [300, 200]]))
+    steps = cases.solution_steps(0)
+    assert [step["method"] for step in steps] == ["Angle Sum", "Law of Sines", "Law of Sines"]
+    assert steps[1]["equation"] == "F_1/sin(\\alpha_{opp,F_1}) = F_R/sin(\\alpha_{opp,F_R})"
+
+
+@pytest.mark.skipif(not RUN_TIMINGS, reason="timing comparison; set QNTY_BENCH=1 to run")
+def test_parametric_study_outpaces_single_solves():
+    rng = np.random.default_rng(2)
+    n = 10_000
+    F1, theta1, theta2 = rng.uniform(10, 900, n), rng.uniform(0, 360, n), rng.uniform(0, 360, n)
+    solver = TriangleSolver()
+
+    start = time.perf_counter()
+    cases = solver.solve_resultant_cases(F1, theta1, 500.0, theta2)
+    batch_per_case = (time.perf_counter() - start) / len(cases)
+
+    start = time.perf_counter()
+    for i in range(20):
+        forces = _Vector(magnitude=F1[i], angle=theta1[i], unit="N", name="F_1"), _Vector(magnitude=500.0, angle=theta2[i], unit="N", name="F_2")
+        solver.solve_resultant_from_two_forces(*forces, _Vector.unknown("F_R", is_resultant=True))
+    single = (time.perf_counter() - start) / 20
+
+    assert batch_per_case * 20 < single, f"{batch_per_case * 1e6:.2f} µs per batched case vs {single * 1e6:.1f} µs per solve"
@@ -0,0 +1,211 @@
+"""
+Tests for TrussProblem and the sparse TrussSolver behind it.
+"""
+
+import math
+import os
+import time
+
+import numpy as np
+import pytest
+
+from qnty.problems import TrussProblem
+from qnty.solving.truss_solver import TrussSolver
+from qnty.spatial import _Point, _Vector
+
+# Wall-clock comparisons depend on the machine and its load; set QNTY_BENCH=1 to run them
+RUN_TIMINGS = os.environ.get("QNTY_BENCH") == "1"
+
+
+class SimpleTruss(TrussProblem):
+    # Hibbeler Example 6.1: 500 N horizontal load at B, pin at A, roller at C
+    A = _Point(0, 0, unit="m")
+    B = _Point(0, 2, unit="m")
+    C = _Point(2, 0, unit="m")
+    members = [("B", "A"), ("B", "C"), ("C", "A")]
+    supports = {"A": "xy", "C": "y"}
+    loads = {"B": _Vector(500, 0, 0, unit="N")}
+
+
+def pratt_truss(panels: int, height: float) -> TrussProblem:
+    """Simply supported Pratt truss with a 1000 N load at every interior bottom joint."""
+    bottom = {f"L{i}": _Point(i, 0, unit="m") for i in range(panels + 1)}
+    top = {f"U{i}": _Point(i, height, unit="m") for i in range(1, panels)}
+    problem = TrussProblem(f"Pratt truss, {panels} panels")
+    problem.add_joints(bottom | top)
+
+    def upper(i):
+        return panels + i
+
+    ends = [(i, i + 1) for i in range(panels)]
+    ends += [(upper(i), upper(i + 1)) for i in range(1, panels - 1)]
+    ends += [(i, upper(i)) for i in range(1, panels)]
+    ends += [(0, upper(1)), (panels, upper(panels - 1))]
+    ends += [(upper(i), i + 1) if i < panels // 2 else (i, upper(i + 1)) for i in range(1, panels - 1)]
+    problem.add_members(np.array(ends))
+    problem.add_support("L0", "xy")
+    problem.add_support(f"L{panels}", "y")
+    problem.add_loads([f"L{i}" for i in range(1, panels)], np.tile([0.0, -1000.0], (panels - 1, 1)), unit="N")
+    return problem
+
+
+def test_textbook_truss_by_method_of_joints():
+    problem = SimpleTruss()
+    results = problem.solve()
+
+    assert results.forces_in("N") == pytest.approx([500.0, -707.107, 500.0], rel=1e-5)
+    assert list(results.is_tension) == [True, False, True]
+    assert results.supports == ("A", "C")
+    assert results.reactions_in("N") == pytest.approx(np.array([[-500.0, -500.0, 0.0], [0.0, 500.0, 0.0]]), abs=1e-9)
+
+    F_BC = results.force("BC")
+    assert F_BC.value == pytest.approx(-707.107, rel=1e-5)
+    assert F_BC.preferred.symbol == "N"
+    assert results.reaction("C")[1].value == pytest.approx(500.0)
+    assert problem.is_solved and "3 joints and 3 members" in problem.solution_steps[0]["description"]
+    with pytest.raises(KeyError):
+        results.force("AD")
+
+
+def test_units_and_index_connectivity():
+    problem = TrussProblem("Roof truss", unit="lbf")
+    problem.add_joints({"A": _Point(0, 0, unit="ft"), "B": _Point(6, 8, unit="ft"), "C": _Point(12, 0, unit="ft")})
+    problem.add_members(np.array([[0, 1], [1, 2], [0, 2]]), names=["AB", "BC", "AC"])
+    problem.add_support("A", "pin")
+    problem.add_support("C", "y")
+    problem.add_loads(["B"], [[0.0, -600.0]], unit="lbf")
+
+    results = problem.solve()
+
+    # Joint B: 2 F sin(53.13°) = 600 lbf, so F = 375 lbf in compression
+    assert results.forces_in("lbf") == pytest.approx([-375.0, -375.0, 225.0])
+    assert results.forces == pytest.approx(results.forces_in("lbf") * 4.4482216152605)
+    assert results.reactions_in("lbf")[:, 1] == pytest.approx([300.0, 300.0])
+    assert results.force("AC").preferred.symbol == "lbf"
+
+
+def test_indeterminate_truss_distributes_load_by_stiffness():
+    # Three bars from a ceiling to one joint, 45° diagonals: N_vertical = P / (1 + 2 cos³θ)
+    problem = TrussProblem("Three-bar hanger")
+    problem.add_joints({"A": _Point(-1, 1, unit="m"), "B": _Point(0, 1, unit="m"), "C": _Point(1, 1, unit="m"), "D": _Point(0, 0, unit="m")})
+    for joint in "ABC":
+        problem.add_support(joint, "xy")
+    problem.add_members([("A", "D"), ("B", "D"), ("C", "D")])
+    problem.add_load("D", _Vector(0, -1000, 0, unit="N"))
+
+    forces = problem.solve().forces
+    denominator = 1 + 2 * math.cos(math.pi / 4) ** 3
+    assert forces == pytest.approx([500 / denominator, 1000 / denominator, 500 / denominator])
+
+    stiff = TrussProblem("Stiff vertical")
+    stiff.add_joints({"A": _Point(-1, 1, unit="m"), "B": _Point(0, 1, unit="m"), "C": _Point(1, 1, unit="m"), "D": _Point(0, 0, unit="m")})
+    stiff.add_members([("A", "D"), ("B", "D"), ("C", "D")], axial_stiffness=[1.0, 4.0, 1.0])
+    for joint in "ABC":
+        stiff.add_support(joint, "xy")
+    stiff.add_load("D", _Vector(0, -1000, 0, unit="N"))
+    stiff_forces = stiff.solve().forces
+    assert stiff_forces[1] > forces[1]
+    assert stiff_forces[1] + 2 * stiff_forces[0] * math.cos(math.pi / 4) == pytest.approx(1000.0)
+
+
+def test_space_truss_tripod():
+    problem = TrussProblem("Tripod")
+    legs = {f"B{k}": _Point(math.cos(2 * math.pi * k / 3), math.sin(2 * math.pi * k / 3), 0, unit="m") for k in range(3)}
+    problem.add_joints(legs | {"T": _Point(0, 0, 1, unit="m")})
+    problem.add_members([(leg, "T") for leg in legs])
+    for leg in legs:
+        problem.add_support(leg, "pin")
+    problem.add_load("T", _Vector(0, 0, -300, unit="N"))
+
+    results = problem.solve()
+
+    assert problem.solver.system.dimensions == 3
+    assert results.forces == pytest.approx(np.full(3, -100 * math.sqrt(2)))
+    assert results.reactions[:, 2] == pytest.approx(np.full(3, 100.0))
+    assert "ΣFz = 0" in problem.solution_steps[0]["equations"][0]
+
+
+def test_unstable_and_invalid_trusses_are_rejected():
+    square = TrussProblem("Square without a diagonal")
+    square.add_joints({"A": _Point(0, 0, unit="m"), "B": _Point(1, 0, unit="m"), "C": _Point(1, 1, unit="m"), "D": _Point(0, 1, unit="m")})
+    square.add_members([("A", "B"), ("B", "C"), ("C", "D"), ("D", "A")])
+    square.add_support("A", "xy")
+    square.add_support("B", "y")
+    square.add_load("C", _Vector(100, 0, 0, unit="N"))
+    with pytest.raises(ValueError, match="unstable"):
+        square.solve()
+
+    unsupported = SimpleTruss()
+    unsupported._restraints.clear()
+    with pytest.raises(ValueError, match="unstable"):
+        unsupported.solve()
+
+    problem = SimpleTruss()
+    with pytest.raises(ValueError, match="Unknown joint"):
+        problem.add_member("A", "Z")
+    with pytest.raises(ValueError, match="restraint"):
+        problem.add_support("A", "uv")
+    with pytest.raises(ValueError, match="force"):
+        problem.add_load("B", _Vector(1, 0, 0, unit="m"))
+    with pytest.raises(ValueError, match="already exists"):
+        problem.add_joint("A", _Point(5, 5, unit="m"))
+
+
+def test_banded_solve_matches_dense_solve_in_any_joint_order():
+    # Braced grid with shuffled joint numbering, statically indeterminate
+    n = 12
+    index = np.arange(n * n).reshape(n, n)
+    xs, ys = np.meshgrid(np.arange(n, dtype=float), np.arange(n, dtype=float))
+    coordinates = np.column_stack([xs.ravel(), ys.ravel(), np.zeros(n * n)])
+    ends = np.vstack([
+        np.column_stack([index[:, :-1].ravel(), index[:, 1:].ravel()]),
+        np.column_stack([index[:-1, :].ravel(), index[1:, :].ravel()]),
+        np.column_stack([index[:-1, :-1].ravel(), index[1:, 1:].ravel()]),
+    ])
+    restrained = np.zeros(coordinates.shape, dtype=bool)
+    restrained[index[0], :2] = True
+    loads = np.zeros(coordinates.shape)
+    loads[index[-1], 0] = 1000.0
+
+    shuffle = np.random.default_rng(3).permutation(n * n)
+    rank = np.argsort(shuffle)
+    solver = TrussSolver("banded")
+    forces, reactions = solver.solve(coordinates[shuffle], rank[ends], restrained[shuffle], loads[shuffle])
+
+    system = solver.assemble(coordinates, ends, restrained, loads)
+    displacement = np.zeros((n * n, 2))
+    displacement.ravel()[system.free] = np.linalg.solve(system.toarray(), system.load)
+    delta = coordinates[ends[:, 1], :2] - coordinates[ends[:, 0], :2]
+    length = np.linalg.norm(delta, axis=1)
+    expected = np.einsum("ij,ij->i", delta / length[:, None], displacement[ends[:, 1]] - displacement[ends[:, 0]]) / length
+
+    assert forces == pytest.approx(expected, abs=1e-8 * np.abs(expected).max())
+    assert reactions.sum(axis=0) == pytest.approx(-loads.sum(axis=0), abs=1e-6)
+
+
+@pytest.mark.parametrize("panels", [250, 2504])
+def test_pratt_truss_forces_and_reactions(panels):
+    results = pratt_truss(panels, height=panels / 10).solve()
+
+    # Largest chord force P n² / (8 h) and vertical reactions P (n - 1) / 2
+    assert np.abs(results.forces).max() == pytest.approx(1000 * panels**2 / (8 * panels / 10), rel=1e-9)
+    assert results.reactions[:, 1] == pytest.approx(np.full(2, 1000 * (panels - 1) / 2), rel=1e-9)
+    if panels > 2500:
+        assert len(results) >= 10_000
+
+
+@pytest.mark.skipif(not RUN_TIMINGS, reason="timing comparison; set QNTY_BENCH=1 to run")
+def test_ten_thousand_members_scale_linearly():
+    timings = {}
+    for panels in (250, 2504):
+        problem = pratt_truss(panels, height=panels / 10)
+        best = math.inf
+        for _ in range(3):
+            start = time.perf_counter()
+            results = problem.solve()
+            best = min(best, time.perf_counter() - start)
+        timings[len(results)] = best
+
+    small, large = sorted(timings)
+    print(f"{small} members: {timings[small] * 1e3:.1f} ms, {large} members: {timings[large] * 1e3:.1f} ms")
+    assert timings[large] < 25 * timings[small], f"{large} members took {timings[large] / timings[small]:.1f}x as long as {small}"
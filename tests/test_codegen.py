@@ -0,0 +1,105 @@
+"""
+Tests for standalone Python modules generated from problems.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from qnty import Dimensionless, Length, Pressure, Problem
+from qnty.algebra import cond_expr, equation, geq, sqrt
+
+
+class PipeWall(Problem):
+    name = "Pipe Wall"
+
+    P = Pressure("P").set(1000).psi
+    S = Pressure("S").set(20000).psi
+    Y = Dimensionless("Y").set(0.4).dimensionless
+    D = Length("D").set(6.625).inch
+    c = Length("c").set(0.0625).inch
+    t = Length("t").search_range(0, 1, "inch").output_unit("inch")
+    t_m = Length("t_m").output_unit("inch")
+    d = Length("d").output_unit("inch")
+
+    # t by root search, t_m by direct assignment, d by inversion
+    P_eqn = equation(P, 2 * S * t / (D - 2 * t * Y))
+    t_m_eqn = equation(t_m, cond_expr(geq(t, c), t + c, 2 * c))
+    d_eqn = equation(D, d + 2 * t_m)
+
+
+def thickness(P, S, D, Y=0.4):
+    return P * D / (2 * (S + P * Y))
+
+
+def test_generated_module_matches_the_solver():
+    problem = PipeWall()
+    module = problem.compile_module()
+
+    problem.solve()
+    result = module.solve_si()
+    for symbol in ("t", "t_m", "d"):
+        assert result[symbol] == pytest.approx(getattr(problem, symbol).value, rel=1e-12)
+
+    # Display units in and out, with the conversion factors inlined
+    assert module.UNITS["P"] == "psi" and module.UNITS["t"] == "in"
+    display = module.solve(P=1200.0)
+    assert display["t"] == pytest.approx(thickness(1200, 20000, 6.625), rel=1e-12)
+    assert display["d"] == pytest.approx(6.625 - 2 * (display["t"] + 0.0625), rel=1e-12)
+    assert module.OUTPUTS == ("t", "t_m", "d")
+
+
+def test_source_runs_without_qnty(tmp_path):
+    source = PipeWall().to_python_source()
+    assert "qnty" not in source.split('"""', 2)[2]
+    (tmp_path / "pipe_wall.py").write_text(source)
+
+    # -S -I: no site-packages and no working directory, so qnty cannot be imported
+    driver = f"import sys; sys.path.insert(0, {str(tmp_path)!r}); import pipe_wall; print(pipe_wall.solve(P=1500.0)['t'])"
+    output = subprocess.run([sys.executable, "-S", "-I", "-c", driver], capture_output=True, text=True, check=True).stdout
+
+    assert float(output) == pytest.approx(thickness(1500, 20000, 6.625), rel=1e-12)
+
+
+def test_compile_module_caches_source_on_disk(tmp_path):
+    path = tmp_path / "generated" / "pipe_wall.py"
+    first = PipeWall().compile_module(path)
+    written = path.stat().st_mtime_ns
+
+    second = PipeWall().compile_module(path)
+
+    assert path.stat().st_mtime_ns == written
+    assert second.solve() == first.solve()
+
+
+class Closed(Problem):
+    name = "Closed"
+
+    a = Length("a").set(3).inch
+    b = Length("b").set(4).inch
+    c = Length("c")
+
+    c_eqn = equation(c, sqrt(a**2 + b**2))
+
+
+def test_closed_form_problem_has_no_root_search():
+    source = Closed().to_python_source()
+
+    assert "_root" not in source
+    assert Closed().compile_module().solve()["c"] == pytest.approx(5 * 0.0254)  # reported in m
+
+
+class Underdetermined(Problem):
+    name = "Underdetermined"
+
+    a = Length("a").set(3).inch
+    b = Length("b")
+    c = Length("c")
+
+    c_eqn = equation(c, a + b)
+
+
+def test_rejects_undetermined_unknowns():
+    with pytest.raises(ValueError, match="No equation determines"):
+        Underdetermined().to_python_source()
@@ -0,0 +1,129 @@
+"""
+Tests for incremental maintenance of the solving-order dependency graph.
+"""
+
+import pytest
+
+from qnty import Dimensionless, Length, Problem
+from qnty.algebra import equation
+from qnty.solving.order import Order
+
+
+class ChainProblem(Problem):
+    name = "Chain Problem"
+
+    a = Length("a").set(2).meter
+    k = Dimensionless("k").set(3).dimensionless
+
+    b = Length("b")
+    c = Length("c")
+    d = Length("d")
+
+    b_eqn = equation(b, a * k)
+    c_eqn = equation(c, b + a)
+    d_eqn = equation(d, c * k - a)
+
+
+def snapshot(order: Order) -> tuple:
+    """Structural view of an Order that ignores list ordering."""
+    edges = {(src, dst) for src, dsts in order.graph.items() for dst in dsts}
+    in_degree = {var: count for var, count in order.in_degree.items() if count}
+    solvers = {var: [id(eq) for eq in eqs] for var, eqs in order.solvers.items() if eqs}
+    return edges, in_degree, solvers
+
+
+def rebuilt(problem: Problem) -> Order:
+    order = Order()
+    known = problem.get_known_symbols()
+    for eq in problem.equations:
+        order.add_equation(eq, known)
+    return order
+
+
+def test_solve_reuses_dependency_graph():
+    problem = ChainProblem()
+    problem.solve()
+    graph = problem.dependency_graph
+
+    problem.solve()
+
+    assert problem.dependency_graph is graph
+    assert problem.d.value == pytest.approx(22.0)
+
+
+def test_known_state_flip_matches_rebuild():
+    problem = ChainProblem()
+    problem._build_dependency_graph()
+    order = problem.dependency_graph
+
+    problem.mark_unknown("a")
+    assert snapshot(order) == snapshot(rebuilt(problem))
+
+    problem.mark_known(a=Length("a").set(4).meter)
+    assert snapshot(order) == snapshot(rebuilt(problem))
+
+
+def test_update_known_variables_touches_only_affected_equations():
+    problem = ChainProblem()
+    problem._build_dependency_graph()
+    order = problem.dependency_graph
+
+    # Only d_eqn references "d", so it is the only equation re-analyzed
+    assert order.mark_known("d") == 1
+    assert "d" not in order.solvers
+    assert order.update_known_variables(order.known_variables) == 0
+
+
+def test_add_equation_applies_a_changed_known_set():
+    problem = ChainProblem()
+    order = Order()
+    order.add_equation(problem.equations[0], {"a", "k"})
+
+    # "b" becomes known with the second equation: b_eqn no longer solves for it
+    order.add_equation(problem.equations[1], {"a", "k", "b"})
+
+    expected = Order()
+    for eq in problem.equations[:2]:
+        expected.add_equation(eq, {"a", "k", "b"})
+    assert snapshot(order) == snapshot(expected)
+    assert order.known_variables == {"a", "k", "b"}
+
+
+def test_solving_order_is_cached_until_structure_changes():
+    problem = ChainProblem()
+    problem._build_dependency_graph()
+    order = problem.dependency_graph
+    known = problem.get_known_symbols()
+
+    first = order.get_solving_order(known)
+    assert first == ["b", "c", "d"]
+    assert order.get_solving_order(known) == first
+    assert order._order_cache
+
+    order.remove_equation(problem.equations[-1])
+    assert not order._order_cache
+    assert order.get_solving_order(known) == ["b", "c"]
+
+
+def test_strongly_connected_components_recomputed_incrementally():
+    order = Order()
+    order.add_dependency("x", "y")
+    order.add_dependency("p", "q")
+    assert order.get_strongly_connected_components() == []
+
+    order.add_dependency("y", "x")
+    assert order.get_strongly_connected_components() == [{"x", "y"}]
+
+    order.remove_dependency("y", "x")
+    order.add_dependency("q", "p")
+    assert order.get_strongly_connected_components() == [{"p", "q"}]
+
+
+def test_get_solvable_variables_uses_dependencies():
+    problem = ChainProblem()
+    problem._build_dependency_graph()
+    order = problem.dependency_graph
+
+    assert order.get_dependencies("c") == {"a", "b"}
+    assert order.get_solvable_variables({"a", "k"}) == ["b"]
+    assert sorted(order.get_solvable_variables({"a", "k", "b"})) == ["c"]
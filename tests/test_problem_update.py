@@ -0,0 +1,83 @@
+"""
+Tests for targeted re-solving with Problem.update().
+"""
+
+import pytest
+
+from qnty import Dimensionless, Length, Pressure, Problem
+from qnty.algebra import DimensionMismatchError, equation
+from qnty.problems.problem import VariableNotFoundError
+
+
+class BranchingProblem(Problem):
+    name = "Branching Problem"
+
+    a = Length("a").set(2).meter
+    k = Dimensionless("k").set(3).dimensionless
+
+    b = Length("b")
+    c = Length("c")
+    e = Dimensionless("e")
+
+    b_eqn = equation(b, a * k)
+    c_eqn = equation(c, b + a)
+    e_eqn = equation(e, k * 2)
+
+
+def test_update_matches_full_solve():
+    problem = BranchingProblem()
+    problem.solve()
+
+    problem.update(a=Length("a").set(5).meter)
+
+    reference = BranchingProblem()
+    reference.mark_known(a=Length("a").set(5).meter)
+    reference.solve()
+
+    assert problem.is_solved
+    assert problem.b.value == pytest.approx(reference.b.value)
+    assert problem.c.value == pytest.approx(reference.c.value)
+    assert problem.c.value == pytest.approx(20.0)
+
+
+def test_update_only_recomputes_dependents():
+    problem = BranchingProblem()
+    problem.solve()
+    e_before = problem.variables["e"]
+    history_length = len(problem.solving_history)
+
+    problem.update(a=Length("a").set(5).meter)
+
+    assert problem.variables["e"] is e_before
+    new_steps = problem.solving_history[history_length:]
+    assert [step["variable"] for step in new_steps] == ["b", "c"]
+
+
+def test_update_before_solve_performs_full_solve():
+    problem = BranchingProblem()
+
+    problem.update(k=Dimensionless("k").set(4).dimensionless)
+
+    assert problem.is_solved
+    assert problem.b.value == pytest.approx(8.0)
+    assert problem.e.value == pytest.approx(8.0)
+
+
+def test_update_rejects_solved_and_missing_symbols():
+    problem = BranchingProblem()
+    problem.solve()
+
+    with pytest.raises(ValueError):
+        problem.update(b=Length("b").set(1).meter)
+    with pytest.raises(VariableNotFoundError):
+        problem.update(z=Length("z").set(1).meter)
+
+
+def test_update_rejects_values_of_another_dimension():
+    problem = BranchingProblem()
+    problem.solve()
+
+    with pytest.raises(DimensionMismatchError, match="'a'"):
+        problem.update(a=Pressure("a").set(5).psi)
+    assert problem.a.value == pytest.approx(2.0)
+    assert problem.is_solved
@@ -0,0 +1,90 @@
+"""
+Tests for the numeric root search used by non-invertible single-unknown equations.
+"""
+
+import math
+
+import pytest
+
+from qnty import Dimensionless, Length, Pressure, Problem
+from qnty.algebra import When, equation, range_expr
+from qnty.algebra.nodes import VariableReference
+from qnty.solving.roots import brent, find_root, scan_bracket
+
+
+def test_brent_converges_inside_bracket():
+    result = brent(lambda x: math.cos(x) - x, 0.0, 1.0)
+
+    assert result.root == pytest.approx(0.7390851332151607, abs=1e-12)
+    assert result.method == "brent"
+    assert result.bracket == (0.0, 1.0)
+    assert result.iterations < 10
+
+
+def test_brent_rejects_bracket_without_sign_change_or_with_pole():
+    assert brent(lambda x: x - 1.0, 2.0, 3.0) is None
+    assert brent(lambda x: 1.0 / (x - 1.0), 0.0, 3.0) is None
+
+
+def test_scan_bracket_finds_interior_sign_change():
+    # No sign change between the ends: both roots lie inside the range
+    assert scan_bracket(lambda x: (x - 1.0) * (x - 3.0), 0.0, 4.0) == (0.75, 1.0)
+
+
+def test_find_root_prefers_hinted_bracket():
+    result = find_root(lambda x: x * x - 4.0, x0=-5.0, bracket=(0.0, 10.0))
+
+    assert result.root == pytest.approx(2.0)
+    assert result.method == "brent"
+    assert find_root(lambda x: x * x + 1.0) is None
+
+
+def test_tolerance_follows_unit_scale():
+    coarse = find_root(lambda x: x**3 - 2.0, bracket=(0.0, 2.0), scale=1e6)
+    fine = find_root(lambda x: x**3 - 2.0, bracket=(0.0, 2.0), scale=1e-3)
+
+    assert coarse.root == pytest.approx(2 ** (1 / 3), abs=1e-6)
+    assert fine.root == pytest.approx(2 ** (1 / 3), abs=1e-11)
+    assert coarse.evaluations <= fine.evaluations
+
+
+class PipeWallThickness(Problem):
+    """Wall thickness from the pressure design equation, with t on both sides of the fraction."""
+
+    name = "Pipe Wall Thickness"
+
+    P = Pressure("P").set(1000).psi
+    S = Pressure("S").set(20000).psi
+    E = Dimensionless("E").set(1).dimensionless
+    Y = Dimensionless("Y").set(0.4).dimensionless
+    D = Length("D").set(6.625).inch
+    t = Length("t").search_range(0, 2, "inch")
+
+    P_eqn = equation(P, 2 * S * E * t / (D - 2 * t * Y))
+
+
+def test_problem_solves_repeated_unknown_and_records_stats():
+    problem = PipeWallThickness()
+    problem.solve()
+
+    expected = 1000 * 6.625 / (2 * (20000 + 1000 * 0.4))
+    assert problem.t.value == pytest.approx(expected * 0.0254, rel=1e-9)
+
+    step = next(step for step in problem.solving_history if step["variable"] == "t")
+    assert step["root_search"]["method"] == "brent"
+    assert step["root_search"]["bracket"] == pytest.approx((0.0, 0.0508))
+    assert step["root_search"]["evaluations"] > 0
+
+
+def test_range_expr_bounds_hint_the_search():
+    x = Dimensionless("x")
+    y = Dimensionless("y").set(0.09).dimensionless
+    x._symbol, y._symbol = "x", "y"
+    x_ref = VariableReference(x)
+    eq = equation(VariableReference(y), range_expr(x_ref, When.between(0.1, 0.5).then(x_ref * x_ref), When.gt(0.5).and_leq(2.0).then(x_ref * x_ref * x_ref)))
+
+    result = eq._solve_numerically("x", {"x": x, "y": y})
+
+    assert eq._bracket_hint("x", x) == (0.1, 0.5)
+    assert result.value == pytest.approx(0.3)
+    assert eq.root_search("x").method == "brent"
@@ -0,0 +1,105 @@
+"""
+Tests for the fused RuleSet evaluator.
+"""
+
+import numpy as np
+
+from qnty import Length, Pressure, Problem
+from qnty.algebra import equation, geq, gt
+from qnty.problems.rules import SEVERITY_CODES, SEVERITY_NONE, RuleSet, add_rule
+
+
+class WallProblem(Problem):
+    name = "Wall Problem"
+
+    P = Pressure("P").set(100).psi
+    S = Pressure("S").set(20000).psi
+    D = Length("D").set(1.0).inch
+    t_min = Length("t_min").set(0.05).inch
+
+    t = Length("t")
+
+    t_eqn = equation(t, (P * D) / (2 * S) + t_min)
+
+    thick_wall_check = add_rule(geq(t, D / 6), "Thick wall", warning_type="CODE_COMPLIANCE", severity="WARNING")
+    pressure_check = add_rule(gt(P, S * 0.385), "High pressure ratio", warning_type="CODE_COMPLIANCE", severity="ERROR")
+
+
+def solved(pressure_psi: float) -> WallProblem:
+    problem = WallProblem()
+    problem.mark_known(P=Pressure("P").set(pressure_psi).psi)
+    problem.solve()
+    return problem
+
+
+def test_rule_set_matches_rule_by_rule_evaluation():
+    problem = solved(10000)
+    rule_set = problem.rule_set()
+
+    expected = [warning for rule in rule_set.rules if (warning := rule.evaluate(problem.variables)) is not None]
+    results = problem.evaluate_rules()
+
+    assert results.triggered.tolist() == [True, True]
+    assert results.warnings() == expected
+    assert problem.validate() == expected
+    assert results.max_severity == SEVERITY_CODES["ERROR"]
+
+
+def test_rule_set_is_shared_per_class():
+    assert WallProblem().rule_set() is RuleSet.for_problem_class(WallProblem)
+    assert WallProblem().copy().rule_set() is WallProblem().rule_set()
+
+
+def test_batch_over_problems_matches_single_evaluations():
+    problems = [solved(pressure) for pressure in (100, 5000, 10000)]
+    rule_set = RuleSet.for_problem_class(WallProblem)
+
+    batch = rule_set.evaluate_batch(problems)
+
+    assert batch.triggered.shape == (3, 2)
+    for row, problem in enumerate(problems):
+        single = rule_set.evaluate(problem.variables)
+        assert batch.triggered[row].tolist() == single.triggered.tolist()
+        assert batch.warnings(row) == single.warnings()
+    assert batch.severity[0].tolist() == [SEVERITY_NONE, SEVERITY_NONE]
+
+
+def test_batch_over_si_arrays_flags_invalid_entries():
+    problem = solved(100)
+    columns = {symbol: np.full(4, var.value) for symbol, var in problem.variables.items()}
+    columns["t"] = np.array([0.0, 1.0, np.nan, 0.0])
+
+    batch = RuleSet.for_problem_class(WallProblem).evaluate_batch(columns)
+
+    assert batch.triggered[:, 0].tolist() == [False, True, False, False]
+    assert batch.failed[:, 0].tolist() == [False, False, True, False]
+    assert batch.warnings(2)[0]["type"] == "EVALUATION_ERROR"
+
+
+def test_missing_variables_fall_back_to_bound_quantities():
+    problem = solved(10000)
+    variables = {symbol: var for symbol, var in problem.variables.items() if symbol != "P"}
+
+    results = problem.rule_set().evaluate(variables)
+
+    # P falls back to the class-level 100 psi the condition was written with
+    expected = [warning for rule in problem.rule_set().rules if (warning := rule.evaluate(variables)) is not None]
+    assert results.failed.tolist() == [False, False]
+    assert results.triggered.tolist() == [True, False]
+    assert results.warnings() == expected
+
+
+def test_evaluation_errors_keep_their_traceback():
+    problem = solved(100)
+    variables = dict(problem.variables)
+    variables["t"] = Length("t")
+
+    error = problem.rule_set().evaluate(variables).warnings()[0]
+    assert error["type"] == "EVALUATION_ERROR"
+    assert error["traceback"].startswith("Traceback") and error["message"].split(": ", 1)[1] in error["traceback"]
+
+    columns = {symbol: np.full(2, var.value) for symbol, var in problem.variables.items()}
+    columns["t"] = np.array([np.nan, 0.0])
+    invalid = RuleSet.for_problem_class(WallProblem).evaluate_batch(columns).warnings(0)[0]
+    assert invalid["traceback"] != "NoneType: None\n"
+    assert "invalid value" in invalid["traceback"]
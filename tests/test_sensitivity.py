@@ -0,0 +1,101 @@
+"""
+Tests for dual-number evaluation and Problem.sensitivities.
+"""
+
+import math
+
+import pytest
+
+from qnty import Area, Dimensionless, Length, Pressure, Problem
+from qnty.algebra import cond_expr, equation, sqrt
+from qnty.algebra.compiler import DUAL, compile_expression
+from qnty.algebra.dual import Dual
+from qnty.algebra.nodes import BinaryOperation, VariableReference, wrap_operand
+from qnty.core.unit import ureg
+
+
+def reference(symbol):
+    quantity = Dimensionless(symbol)
+    quantity._symbol = symbol
+    return VariableReference(quantity)
+
+
+def test_dual_backend_propagates_gradients():
+    x, y = reference("x"), reference("y")
+    compiled = compile_expression(sqrt(x * y) + x**2 / y, DUAL)
+
+    result = compiled({"x": Dual.seed(4.0, 0, 2), "y": Dual.seed(1.0, 1, 2)})
+
+    assert result.value == pytest.approx(18.0)
+    # d/dx = sqrt(y)/(2 sqrt(x)) + 2x/y, d/dy = sqrt(x)/(2 sqrt(y)) - x^2/y^2
+    assert result.grad == pytest.approx([0.25 + 8.0, 1.0 - 16.0])
+
+
+def test_dual_backend_differentiates_constant_base_powers():
+    x = reference("x")
+    compiled = compile_expression(BinaryOperation("**", wrap_operand(2.0), x * 3), DUAL)
+
+    result = compiled({"x": Dual.seed(0.5, 0, 1)})
+
+    assert result.value == pytest.approx(2.0**1.5)
+    assert result.grad[0] == pytest.approx(2.0**1.5 * math.log(2.0) * 3)
+
+
+def test_dual_backend_follows_selected_branch():
+    x = reference("x")
+    compiled = compile_expression(cond_expr(x > 1, x * 3, x * x), DUAL)
+
+    assert compiled({"x": Dual.seed(2.0, 0, 1)}).grad[0] == 3.0
+    assert compiled({"x": Dual.seed(0.5, 0, 1)}).grad[0] == 1.0
+
+
+class PipeWall(Problem):
+    name = "Pipe Wall"
+
+    P = Pressure("P").set(1000).psi
+    S = Pressure("S").set(20000).psi
+    Y = Dimensionless("Y").set(0.4).dimensionless
+    D = Length("D").set(6.625).inch
+    c = Length("c").set(0.0625).inch
+    t = Length("t").search_range(0, 1, "inch")
+    t_m = Length("t_m")
+    A = Area("A")
+
+    # t occurs twice (root search), t_m is found by inversion, A by direct assignment
+    P_eqn = equation(P, 2 * S * t / (D - 2 * t * Y))
+    t_m_eqn = equation(c, t_m - t)
+    A_eqn = equation(A, math.pi * D * t_m)
+
+
+def thickness(P, S, D, Y=0.4):
+    return P * D / (2 * (S + P * Y))
+
+
+def test_sensitivities_match_finite_differences():
+    problem = PipeWall()
+    problem.solve()
+
+    jacobian = problem.sensitivities(wrt=["P", "S", "D"])
+
+    assert set(jacobian.of) == {"A", "t", "t_m"}
+    h = 1e-3
+    dt_dP = (thickness(1000 + h, 20000, 6.625) - thickness(1000 - h, 20000, 6.625)) / (2 * h)
+    dt_dD = (thickness(1000, 20000, 6.625 + h) - thickness(1000, 20000, 6.625 - h)) / (2 * h)
+    in_per_psi = ureg.resolve("inch") / ureg.resolve("psi")
+    assert jacobian["t", "P"].magnitude(in_per_psi) == pytest.approx(dt_dP, rel=1e-6)
+    assert jacobian["t_m", "P"].magnitude(in_per_psi) == pytest.approx(dt_dP, rel=1e-6)
+    assert jacobian["t", "D"].value == pytest.approx(dt_dD, rel=1e-6)
+
+    # dA/dD = pi * (t_m + D * dt/dD)
+    t_m = thickness(1000, 20000, 6.625) + 0.0625
+    assert jacobian["A", "D"].magnitude("inch") == pytest.approx(math.pi * (t_m + 6.625 * dt_dD), rel=1e-6)
+    assert str(jacobian["t", "P"]).endswith("m/psi")
+
+
+def test_sensitivities_reject_non_inputs():
+    problem = PipeWall()
+
+    with pytest.raises(ValueError, match="solved for"):
+        problem.sensitivities(wrt=["t"])
+    with pytest.raises(ValueError, match="known input"):
+        problem.sensitivities(wrt=["P"], of=["S"])
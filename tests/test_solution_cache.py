@@ -0,0 +1,169 @@
+"""
+Tests for the opt-in content-addressed solution cache.
+"""
+
+from dataclasses import dataclass
+
+import pytest
+
+from qnty import Dimensionless, Length, Problem
+from qnty.algebra import SelectOption, SelectVariable, equation, match_expr
+from qnty.utils.caching import SolutionCache
+
+
+@dataclass(frozen=True)
+class Mode(SelectOption):
+    double: str = "double"
+    triple: str = "triple"
+
+
+class CachedProblem(Problem):
+    name = "Cached Problem"
+
+    a = Length("a").set(2).meter
+    k = Dimensionless("k").set(3).dimensionless
+
+    b = Length("b")
+    c = Length("c")
+
+    b_eqn = equation(b, a * k)
+    c_eqn = equation(c, b + a)
+
+
+def make_problem(cache: SolutionCache) -> CachedProblem:
+    problem = CachedProblem()
+    problem.solution_cache = cache
+    return problem
+
+
+def fail_solver(*args, **kwargs):
+    raise AssertionError("solver should not run on a cache hit")
+
+
+def test_cache_hit_skips_solver():
+    cache = SolutionCache()
+    first = make_problem(cache)
+    first.solve()
+    assert len(cache) == 1
+
+    second = make_problem(cache)
+    second.solver_manager.solve = fail_solver
+    second.solve()
+
+    assert second.is_solved
+    assert second.c.value == pytest.approx(8.0)
+    assert second.c.preferred == first.c.preferred
+    assert second.solving_history == first.solving_history
+    assert cache.stats.hits == 1
+
+
+def test_cache_key_follows_inputs():
+    cache = SolutionCache()
+    make_problem(cache).solve()
+
+    problem = make_problem(cache)
+    problem.mark_known(a=Length("a").set(5).meter)
+    problem.solve()
+
+    assert len(cache) == 2
+    assert problem.c.value == pytest.approx(20.0)
+
+
+def test_cache_key_follows_verification_sample_size():
+    cache = SolutionCache()
+    make_problem(cache).solve()
+
+    problem = make_problem(cache)
+    problem.verification_sample_size = 1
+    problem.solve()
+
+    assert len(cache) == 2 and cache.stats.hits == 0
+
+
+def test_cache_hit_restores_verification_report():
+    cache = SolutionCache()
+    first = make_problem(cache)
+    first.solve()
+
+    second = make_problem(cache)
+    second.solver_manager.solve = fail_solver
+    second.solve()
+
+    report, expected = second.verification_report(), first.verification_report()
+    assert report is not None and report.passed
+    assert report.as_dict() == expected.as_dict()
+    assert second._changed_since_verification() == set()
+
+
+def test_rejects_payloads_that_are_not_json():
+    cache = SolutionCache()
+
+    with pytest.raises(ValueError, match="JSON"):
+        cache.put("key", {"history": [{"value": object()}]})
+    assert cache.get("key") is None
+
+    cache.put("key", {"history": [{"bracket": (1.0, 2.0)}]})
+    assert cache.get("key") == {"history": [{"bracket": [1.0, 2.0]}]}
+
+
+def test_cache_key_follows_selection():
+    mode = SelectVariable("Mode", Mode, Mode.double)
+
+    class SelectProblem(Problem):
+        x = Length("x").set(1).meter
+        y = Length("y")
+        y_eqn = equation(y, match_expr(mode, Mode.double, x * 2, Mode.triple, x * 3))
+
+    cache = SolutionCache()
+    problem = SelectProblem()
+    problem.solution_cache = cache
+    problem.solve()
+    assert problem.y.value == pytest.approx(2.0)
+
+    mode.select(Mode.triple)
+    problem.solve()
+    assert problem.y.value == pytest.approx(3.0)
+    assert len(cache) == 2
+
+
+def test_lru_eviction():
+    cache = SolutionCache(max_entries=2)
+    cache.put("a", {"value": 1})
+    cache.put("b", {"value": 2})
+    assert cache.get("a") == {"value": 1}
+
+    cache.put("c", {"value": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats.evictions == 1
+
+
+def test_disk_tier_shared_between_caches(tmp_path):
+    path = tmp_path / "solutions.db"
+    make_problem(SolutionCache(path=path)).solve()
+
+    fresh = SolutionCache(path=path)
+    problem = make_problem(fresh)
+    problem.solver_manager.solve = fail_solver
+    problem.solve()
+
+    assert fresh.disk_hits == 1
+    assert problem.c.value == pytest.approx(8.0)
+    fresh.close()
+
+
+def test_update_after_cache_hit_recomputes_dependents():
+    cache = SolutionCache()
+    make_problem(cache).solve()
+
+    problem = make_problem(cache)
+    problem.solve()
+    assert cache.stats.hits == 1
+
+    problem.update(a=Length("a").set(5).meter)
+
+    assert problem.is_solved
+    assert problem.b.value == pytest.approx(15.0)
+    assert problem.c.value == pytest.approx(20.0)
+    assert problem.verification_report().failures == {}
@@ -598,3 +598,54 @@ class TestVectorEdgeCases:
         v = _Vector(small_val, small_val, small_val, unit=u.meter)
 
         assert abs(v.u.magnitude() - small_val) < 1e-20
+
+
+class TestVectorCachedViews:
+    """Test that Quantity views are built once per coordinate change."""
+
+    def test_views_are_reused_until_components_change(self):
+        """Test repeated access returns the same Quantity until the vector changes."""
+        v = _Vector(3.0, 4.0, 0.0, unit=u.meter)
+
+        assert v.u is v.u and v.magnitude is v.magnitude and v.alpha is v.alpha
+        magnitude, first = v.magnitude, v.u
+
+        v._set_component(0, 6.0)
+        assert v.u is not first and v.u.value == 6.0
+        assert v.magnitude is not magnitude and v.magnitude.value == pytest.approx(math.hypot(6.0, 4.0))
+        assert v.alpha.value == pytest.approx(math.acos(6.0 / math.hypot(6.0, 4.0)))
+
+        v._coords = (0.0, 0.0, 2.0)
+        assert v.gamma.value == 0.0 and v.direction_cosines == (0.0, 0.0, 1.0)
+
+        v.copy_coords_from(_Vector(0.0, 0.0, 2.0, unit=u.foot))
+        assert v.w.preferred is not None and v.w.preferred.symbol == "ft"
+
+    def test_changed_views_are_rebuilt(self):
+        """Test a view changed by a caller is not handed out again."""
+        v = _Vector(3.0, 4.0, 0.0, unit=u.meter)
+
+        v.u.value = 99.0
+        v.magnitude.value = -1.0
+        v.alpha.value = 2.0
+        v.w.preferred = u.foot
+
+        assert v.w.preferred is u.meter
+        assert v.u.value == 3.0 and v.magnitude.value == pytest.approx(5.0)
+        assert v.alpha.value == pytest.approx(math.acos(0.6))
+
+    def test_raw_si_accessors(self):
+        """Test float accessors match the Quantity views without the near-zero clamp."""
+        v = _Vector(1.0, 1e-12, -2.0, unit=u.foot)
+
+        assert (v.u_si, v.v_si, v.w_si) == (v._x, v._y, v._z)
+        assert v.v_si != 0.0 and v.v.value == 0.0
+        assert v.magnitude_si == pytest.approx(v.magnitude.value)
+        assert isinstance(v.magnitude_si, float)
+
+        assert _Vector(name="R", is_known=False, unit=u.meter).magnitude_si is None
+        # A negative stored magnitude flips the direction; the length stays positive
+        reversed_force = _Vector(magnitude=-50.0, angle=30.0, unit="N")
+        assert reversed_force.magnitude_si == pytest.approx(50.0)
+        assert reversed_force.magnitude_si == pytest.approx(math.hypot(reversed_force._x, reversed_force._y))
+        assert _Vector(0.0, 0.0, 0.0, unit=u.meter).alpha is None
@@ -0,0 +1,103 @@
+"""
+Tests for Monte Carlo uncertainty propagation.
+"""
+
+import numpy as np
+import pytest
+
+from qnty import Dimensionless, Length, Pressure, Problem
+from qnty.algebra import equation, geq
+from qnty.problems.rules import RuleSet, add_rule
+from qnty.solving.roots import secant_array
+from qnty.solving.uncertainty import Distribution, Normal, Triangular, Uniform, propagate
+
+
+class PipeWall(Problem):
+    name = "Pipe Wall"
+
+    P = Pressure("P").set(1000).psi
+    S = Pressure("S").set(20000).psi
+    Y = Dimensionless("Y").set(0.4).dimensionless
+    D = Length("D").set(6.625).inch
+    c = Length("c").set(0.0625).inch
+    t = Length("t").search_range(0, 1, "inch")
+    t_m = Length("t_m")
+    limit = Length("limit").set(0.25).inch
+
+    P_eqn = equation(P, 2 * S * t / (D - 2 * t * Y))
+    t_m_eqn = equation(t_m, t + c)
+
+    thick_check = add_rule(geq(t_m, limit), "Wall too thick", name="thick")
+
+
+def thickness(P, S, D, Y=0.4):
+    return P * D / (2 * (S + P * Y))
+
+
+def test_propagates_distributions_through_implicit_equation():
+    problem = PipeWall()
+
+    result = problem.propagate({"P": Uniform(900, 1100, unit="psi"), "D": Normal(6.625, 0.05, unit="inch")}, samples=20_000, seed=7, chunk_size=3_000)
+
+    # Draw the same inputs to compare against the closed form
+    rng = np.random.default_rng(7)
+    expected = []
+    for size in [3_000] * 6 + [2_000]:
+        P = rng.uniform(900, 1100, size)
+        D = rng.normal(6.625, 0.05, size)
+        expected.append(thickness(P, 20000, D) * 0.0254)
+        rng.random(size)  # reservoir priorities for t
+        rng.random(size)  # and for t_m
+    expected = np.concatenate(expected)
+
+    stats = result["t"]
+    assert stats.count == 20_000 and stats.invalid == 0
+    assert stats.mean == pytest.approx(expected.mean(), rel=1e-9)
+    assert stats.std == pytest.approx(expected.std(ddof=1), rel=1e-6)
+    assert stats.percentiles[95.0] == pytest.approx(np.percentile(expected, 95), rel=1e-9)
+    assert result["t_m"].mean == pytest.approx(expected.mean() + 0.0625 * 0.0254, rel=1e-9)
+    assert str(stats.quantity(stats.maximum)).endswith("m")
+
+
+def test_reports_rule_failure_probability():
+    problem = PipeWall()
+
+    result = problem.propagate({"P": Triangular(1000, 2000, 4000, unit="psi")}, samples=5_000, seed=1)
+
+    # t_m >= 0.25 in  <=>  P >= about 1158 psi
+    threshold = next(P for P in np.linspace(1000, 4000, 30001) if thickness(P, 20000, 6.625) + 0.0625 >= 0.25)
+    exact = 1 - (threshold - 1000) ** 2 / ((4000 - 1000) * (2000 - 1000)) if threshold < 2000 else (4000 - threshold) ** 2 / ((4000 - 1000) * (4000 - 2000))
+    assert result.rule_failure_probability["thick"] == pytest.approx(exact, abs=0.01)
+
+
+def test_reports_rules_that_cannot_be_evaluated_as_errors():
+    problem = PipeWall()
+    problem.solve()
+    # "missing" is not a problem variable, so the rule raises for every sample
+    missing = Length("missing")
+    missing._symbol = "missing"
+    broken = add_rule(geq(problem.t_m, missing), "Cannot be checked", name="broken")
+    rule_set = RuleSet([*problem.rule_set().rules, broken])
+
+    result = propagate(problem._solving_steps(), problem.variables, {"P": Uniform(900, 1100, unit="psi")}, samples=1_000, seed=3, rule_set=rule_set)
+
+    assert "broken" not in result.rule_failure_probability
+    assert "missing" in result.rule_errors["broken"]["message"]
+    assert result.rule_failure_probability["thick"] == 0.0
+
+
+def test_distribution_requires_draw():
+    with pytest.raises(TypeError):
+        Distribution()
+
+
+def test_rejects_unknown_targets():
+    with pytest.raises(ValueError, match="solved for"):
+        PipeWall().propagate({"t": Normal(0.1, 0.01, unit="inch")}, samples=10)
+
+
+def test_secant_array_marks_failures():
+    roots = secant_array(lambda x: x * x - np.array([4.0, -1.0]), np.ones(2))
+
+    assert roots[0] == pytest.approx(2.0)
+    assert np.isnan(roots[1])
@@ -6,9 +6,11 @@ import sys
 import time
 from pathlib import Path
 
+import pytest
+
 from qnty.core import u
 from qnty.core.dimension_catalog import dim
-from qnty.core.unit import attach_composed, ureg
+from qnty.core.unit import attach_composed, resolve_unit, ureg
 
 
 def test_base_units_and_dimensions():
@@ -81,6 +83,15 @@ def test_attach_composed_reuse_and_resolve():
     assert ureg.resolve("m/s2") is mps2
 
 
+def test_resolve_unit_checks_names_and_dimensions():
+    assert resolve_unit("mm", dim.L) is u.millimeter
+    assert resolve_unit(u.meter) is u.meter and resolve_unit(None) is None
+    with pytest.raises(ValueError, match="Unknown unit 'mm'"):
+        resolve_unit("mm", dim.M)
+    with pytest.raises(ValueError, match="Unknown unit"):
+        resolve_unit("not-a-unit")
+
+
 def test_prefix_exposure_and_preferred_units():
     # Prefixed exposure
     assert hasattr(u, "millimeter")
@@ -0,0 +1,87 @@
+"""
+Tests for verification modes and residual reports after solving.
+"""
+
+import pytest
+
+from qnty import Dimensionless, Length, Problem
+from qnty.algebra import equation
+
+
+class ChainProblem(Problem):
+    name = "Verification Chain"
+
+    a = Length("a").set(2).meter
+    k = Dimensionless("k").set(3).dimensionless
+
+    b = Length("b")
+    c = Length("c")
+    e = Dimensionless("e")
+
+    b_eqn = equation(b, a * k)
+    c_eqn = equation(c, b + a)
+    e_eqn = equation(e, k * 2)
+
+
+def test_full_mode_reports_residual_vector():
+    problem = ChainProblem()
+    problem.solve()
+
+    report = problem.verification_report()
+
+    assert problem.is_solved
+    assert report.passed
+    assert report.checked.all()
+    assert report.norm() == pytest.approx(0.0)
+    assert set(report.as_dict()) == {eq.name for eq in problem.equations}
+
+
+def test_changed_only_mode_checks_affected_equations():
+    problem = ChainProblem()
+    problem.verification_mode = "changed-only"
+    problem.solve()
+    assert problem.verification_report().checked.all()
+
+    problem.update(a=Length("a").set(4).meter)
+
+    checked = problem.verification_report().as_dict()
+    assert problem.is_solved
+    assert "e_equation" not in checked
+    assert len(checked) == 2
+
+
+def test_sampled_mode_limits_checked_equations():
+    problem = ChainProblem()
+    problem.verification_mode = "sampled"
+    problem.verification_sample_size = 1
+    problem.solve()
+
+    assert problem.verification_report().checked.sum() == 1
+
+
+def test_off_mode_skips_residuals():
+    problem = ChainProblem()
+    problem.verification_mode = "off"
+    problem.solve()
+
+    assert problem.is_solved
+    assert not problem.verification_report().checked.any()
+
+
+def test_failures_report_per_equation_residuals():
+    problem = ChainProblem()
+    problem.solve()
+    problem.variables["c"].value = 100.0
+
+    assert not problem.verify_solution()
+    failures = problem.verification_report().failures
+    assert list(failures) == ["c_equation"]
+    assert failures["c_equation"] == pytest.approx(92.0)
+
+
+def test_unknown_mode_raises():
+    problem = ChainProblem()
+    problem.solve()
+
+    with pytest.raises(ValueError):
+        problem._run_verification("everything", None)